@@ -0,0 +1,49 @@
+"""
+Athlete Profiles
+Loads cohort profile files used by the batch exporters and generators
+"""
+
+import json
+import os
+
+
+def load_profiles(path):
+    """Load athlete profiles from a JSON list or newline-delimited JSON file
+
+    Every profile is a dict with at least an 'athlete_id' key.
+    """
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in ('.jsonl', '.ndjson'):
+            return read_profiles(f, path)
+        return _checked(json.load(f), path)
+
+
+def read_profiles(lines, source='<stdin>'):
+    """Load athlete profiles from newline-delimited JSON lines, e.g. sys.stdin"""
+    return list(iter_profiles(lines, source))
+
+
+def iter_profiles(lines, source='<stdin>'):
+    """Yield athlete profiles from newline-delimited JSON lines as each line is read"""
+    number = 0
+    for line in lines:
+        if line.strip():
+            number += 1
+            yield _checked_profile(json.loads(line), number, source)
+
+
+def _checked(profiles, source):
+    for i, profile in enumerate(profiles):
+        _checked_profile(profile, i + 1, source)
+    return profiles
+
+
+def _checked_profile(profile, number, source):
+    if not profile.get('athlete_id'):
+        raise ValueError(f'{source}: profile {number} has no athlete_id')
+    return profile
+
+
+def safe_filename(athlete_id):
+    """Make an athlete id usable as a file name"""
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in str(athlete_id))
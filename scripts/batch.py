@@ -0,0 +1,154 @@
+"""
+Resumable Batch Runs
+Journals every (athlete, document) unit a cohort run completes in SQLite,
+so a run that stops halfway (crash, kill, reboot) resumes where it left
+off:
+
+    python fitness_tracker.py workouts --cohort cohort.json --journal run.db
+    python fitness_tracker.py workouts --cohort cohort.json --journal run.db    # again: only what is missing
+    python batch.py run.db                 # progress and failed units
+
+A unit is one athlete's PDF, e.g. (A-001, Week1_Day4_Upper_Pull.pdf).
+The run renders each cohort variant's missing documents once, copies them
+to the athletes missing them and journals those units as done. Rewriting
+a PDF gives the same document, so a unit finished but not yet committed
+when the run stopped is simply done again. A variant whose render fails,
+or an athlete whose copy fails, is retried up to RETRIES times with
+exponential backoff (BACKOFF seconds, doubling); each failure is
+journaled with its error, and a later run tries the failed units again.
+
+Units are committed in batches (every COMMIT_UNITS units or
+COMMIT_SECONDS seconds, WAL mode, synchronous=NORMAL), so journaling costs
+one transaction per batch rather than one per PDF. The journal remembers
+which run it belongs to and refuses to resume a different one.
+"""
+
+import argparse
+from datetime import datetime
+import hashlib
+import json
+import sqlite3
+import time
+
+
+RETRIES = 3
+BACKOFF = 1.0            # seconds before the first retry
+COMMIT_UNITS = 1000
+COMMIT_SECONDS = 5.0
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    fingerprint TEXT NOT NULL,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS units (
+    athlete_id TEXT NOT NULL,
+    doc TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (athlete_id, doc)
+) WITHOUT ROWID;
+'''
+
+UPSERT = '''
+INSERT INTO units VALUES (?, ?, ?, 1, ?, ?)
+ON CONFLICT (athlete_id, doc) DO UPDATE SET
+    status = excluded.status, attempts = attempts + 1, error = excluded.error, updated_at = excluded.updated_at
+'''
+
+
+def run_fingerprint(*parameters):
+    """Hash identifying a run by its parameters (JSON-serializable, str() otherwise)"""
+    return hashlib.sha256(json.dumps(parameters, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class Journal:
+    """Checkpoint journal of a batch run: completed and failed units, committed in batches"""
+
+    def __init__(self, path, commit_units=COMMIT_UNITS, commit_seconds=COMMIT_SECONDS):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self.commit_units = commit_units
+        self.commit_seconds = commit_seconds
+        self._pending = []    # unit rows not yet committed
+        self._committed = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def begin(self, fingerprint, restart=False):
+        """Start or resume the run identified by fingerprint; restart forgets what was done"""
+        row = self.conn.execute('SELECT fingerprint FROM runs').fetchone()
+        if row and row[0] != fingerprint and not restart:
+            raise ValueError('The journal belongs to a different run (other profiles, weeks, days or '
+                             'output directory); restart it or use a new journal')
+        if row is None or restart:
+            with self.conn:
+                self.conn.execute('DELETE FROM runs')
+                self.conn.execute('DELETE FROM units')
+                self.conn.execute('INSERT INTO runs VALUES (?, ?)',
+                                  (fingerprint, datetime.now().isoformat(timespec='seconds')))
+
+    def completed(self):
+        """{athlete_id: {doc, ...}} of the units done"""
+        done = {}
+        for athlete_id, doc in self.conn.execute("SELECT athlete_id, doc FROM units WHERE status = 'done'"):
+            done.setdefault(athlete_id, set()).add(doc)
+        return done
+
+    def done(self, athlete_id, docs):
+        self._record(athlete_id, docs, 'done', None)
+
+    def failed(self, athlete_id, docs, error):
+        self._record(athlete_id, docs, 'failed', f'{type(error).__name__}: {error}')
+
+    def _record(self, athlete_id, docs, status, error):
+        now = datetime.now().isoformat(timespec='seconds')
+        self._pending.extend((athlete_id, doc, status, error, now) for doc in docs)
+        if len(self._pending) >= self.commit_units or time.monotonic() - self._committed >= self.commit_seconds:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            with self.conn:
+                self.conn.executemany(UPSERT, self._pending)
+            self._pending = []
+        self._committed = time.monotonic()
+
+    def progress(self):
+        """{status: unit count}"""
+        self.flush()
+        return dict(self.conn.execute('SELECT status, COUNT(*) FROM units GROUP BY status'))
+
+    def failures(self):
+        """[(athlete_id, doc, attempts, error)] of the units still failed"""
+        self.flush()
+        return self.conn.execute("SELECT athlete_id, doc, attempts, error FROM units WHERE status = 'failed' "
+                                 "ORDER BY athlete_id, doc").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Progress of a journaled batch run')
+    parser.add_argument('journal', help='journal database (fitness_tracker.py workouts --journal)')
+    args = parser.parse_args()
+
+    with Journal(args.journal) as journal:
+        progress = journal.progress()
+        print(f"{progress.get('done', 0)} units done, {progress.get('failed', 0)} failed")
+        for athlete_id, doc, attempts, error in journal.failures():
+            print(f'  {athlete_id} {doc}: {error} ({attempts} attempts)')
+
+
+if __name__ == '__main__':
+    main()
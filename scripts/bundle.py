@@ -0,0 +1,120 @@
+"""
+Archive Bundles
+Streams generated documents into one ZIP or TAR archive instead of loose
+files:
+
+    python fitness_tracker.py workouts --bundle zip                    # PDFs/Daily_Exercises.zip
+    python fitness_tracker.py workouts --cohort cohort.json --bundle zip     # <athlete_id>.zip each
+    python fitness_tracker.py workouts --cohort cohort.json --bundle tar.gz --cohort-archive
+    python fitness_tracker.py daily --bundle tar
+
+    with bundled(output_dir, 'zip'):    # output_dir.zip, members named relative to output_dir
+        generate_all_pdfs(output_dir=output_dir)
+
+Inside layout.capture() save() hands each PDF's bytes to the archive as it
+is made, so nothing goes through a temporary file and the archive is
+written front to back. ZIP members are stored (PDF content streams are
+already compressed); TAR archives are opened in stream mode, so a bundle
+can also be written to a pipe or socket (any binary file object).
+"""
+
+from contextlib import contextmanager
+import io
+import os
+import tarfile
+import time
+import zipfile
+
+from layout import capture, dry_running
+
+
+# format -> archive suffix
+FORMATS = {
+    'zip': '.zip',
+    'tar': '.tar',
+    'tar.gz': '.tar.gz',
+}
+
+
+def format_of(path):
+    for format, suffix in sorted(FORMATS.items(), key=lambda item: -len(item[1])):
+        if path.endswith(suffix):
+            return format
+    raise ValueError(f'Unknown archive format: {path} (available: {", ".join(FORMATS)})')
+
+
+def archive_path(directory, format):
+    """The archive that replaces a directory of documents"""
+    if format not in FORMATS:
+        raise ValueError(f'Unknown archive format: {format} (available: {", ".join(FORMATS)})')
+    return os.path.normpath(directory) + FORMATS[format]
+
+
+class Bundle:
+    """One archive written in a single pass; takes (path, data) like the list of a capture
+
+    target is a file path or a binary file object (format required then);
+    member names are the paths relative to root.
+    """
+
+    def __init__(self, target, format=None, root=None):
+        if isinstance(target, str):
+            format = format or format_of(target)
+            os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+        elif format is None:
+            raise ValueError('An archive written to a file object needs a format')
+        self.format = format
+        self.root = root
+        self.mtime = time.time()
+        self.count = 0
+        if format == 'zip':
+            self.archive = zipfile.ZipFile(target, 'w', zipfile.ZIP_STORED)
+        elif format in FORMATS:
+            mode = 'w|gz' if format == 'tar.gz' else 'w|'
+            if isinstance(target, str):
+                self.archive = tarfile.open(target, mode)
+            else:
+                self.archive = tarfile.open(fileobj=target, mode=mode)
+        else:
+            raise ValueError(f'Unknown archive format: {format} (available: {", ".join(FORMATS)})')
+
+    def member(self, path):
+        name = os.path.relpath(path, self.root) if self.root is not None else path
+        return name.replace(os.sep, '/')
+
+    def add(self, name, data):
+        """Write one member"""
+        if self.format == 'zip':
+            info = zipfile.ZipInfo(name, time.localtime(self.mtime)[:6])
+            info.external_attr = 0o644 << 16
+            self.archive.writestr(info, data)
+        else:
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime, info.mode = len(data), int(self.mtime), 0o644
+            self.archive.addfile(info, io.BytesIO(data))
+        self.count += 1
+
+    def append(self, item):
+        path, data = item
+        self.add(self.member(path), data)
+
+    def close(self):
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@contextmanager
+def bundled(directory, format, root=None):
+    """save() inside the block streams into the archive replacing directory when format is
+    given (members relative to root, default directory); yields the Bundle, or None for loose files"""
+    if not format or dry_running():
+        yield None
+        return
+    with Bundle(archive_path(directory, format), root=directory if root is None else root) as archive, \
+            capture(archive):
+        yield archive
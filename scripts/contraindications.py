@@ -0,0 +1,128 @@
+"""
+Pain Contraindications
+Rewrites a day's exercises around the pain an athlete reports, using the
+contraindications in exercise_catalog.py:
+
+    conditions_for(['left knee', 'lower back'])           # ('knee', 'lower_back')
+    conditions_for('left knee')                            # ('knee',)
+    apply_contraindications(rows, ['knee'])                # program rows, rewritten
+    apply_contraindications(rows, ['shoulder'], ['dumbbells'])
+
+An exercise to avoid for a reported condition is swapped for the closest
+alternative (the ranking of substitution.py) that avoids none of them and
+fits the equipment, and left out when there is none; an exercise to
+modify keeps its place, with the condition's technique note added to its
+own. Rows keep their sets, reps and rest.
+
+Each catalog exercise compiles once to an avoid and a modify mask of
+condition bits, and the rewrite of an exercise is memoized per (exercise,
+conditions, equipment), so filtering every athlete's next week costs a dict
+lookup per row.
+"""
+
+import re
+
+from exercise_catalog import CONDITIONS, CONDITION_NOTES, EXERCISE_CONTRAINDICATIONS
+from substitution import get_index as get_substitution_index, merge_row, replace_exercise
+from units import measured
+
+
+# pain location text -> condition
+CONDITION_PATTERNS = {
+    'knee': r'knee|patell|menisc|\bacl\b',
+    'lower_back': r'lower back|low back|lumbar|sciatic|\bspine\b|^back$',
+    'shoulder': r'shoulder|rotator|\bdelt',
+}
+
+
+class ContraindicationIndex:
+    """Avoid / modify masks of the catalog exercises, compiled once"""
+
+    def __init__(self, contraindications=EXERCISE_CONTRAINDICATIONS, conditions=CONDITIONS,
+                 notes=CONDITION_NOTES, patterns=CONDITION_PATTERNS):
+        self.conditions = {condition: i for i, condition in enumerate(conditions)}
+        self.patterns = [(condition, re.compile(patterns[condition], re.I)) for condition in conditions]
+        self.notes = notes
+        # canonical name -> (avoid mask, modify mask)
+        self.masks = {key: (self.mask(avoid), self.mask(modify))
+                      for key, (avoid, modify) in contraindications.items()}
+        self._rewrites = {}
+
+    def mask(self, conditions):
+        unknown = set(conditions) - set(self.conditions)
+        if unknown:
+            raise ValueError(f'Unknown condition: {", ".join(sorted(unknown))} '
+                             f'(available: {", ".join(self.conditions)})')
+        mask = 0
+        for condition in conditions:
+            mask |= 1 << self.conditions[condition]
+        return mask
+
+    def conditions_for(self, locations):
+        """Conditions of free-text pain locations ('left knee', 'lumbar', or a list of them), in CONDITIONS order"""
+        if isinstance(locations, str):
+            locations = [locations]
+        locations = [location.strip() for location in locations or ()]
+        return tuple(condition for condition, pattern in self.patterns
+                     if any(pattern.search(location) for location in locations))
+
+    def _note(self, key, conditions):
+        modify = self.masks.get(key, (0, 0))[1] & conditions
+        for condition, bit in self.conditions.items():
+            if modify >> bit & 1:
+                return self.notes[condition]
+        return None
+
+    def rewrite(self, key, conditions, equipment):
+        """(exercises to choose from, closest first, each with its note or None) for an exercise;
+        conditions and equipment are masks
+        """
+        memo = (key, conditions, equipment)
+        if memo not in self._rewrites:
+            if not self.masks.get(key, (0, 0))[0] & conditions:
+                choices = ((key, self._note(key, conditions)),)
+            else:
+                substitution = get_substitution_index()
+                choices = tuple((other, self._note(other, conditions)) for other in substitution.ranked.get(key, ())
+                                if not substitution.exercises[other][0] & ~equipment
+                                and not self.masks.get(other, (0, 0))[0] & conditions)
+            self._rewrites[memo] = choices
+        return self._rewrites[memo]
+
+
+_index = []
+
+
+def get_index():
+    """The ContraindicationIndex of the catalog, built on first use"""
+    if not _index:
+        _index.append(ContraindicationIndex())
+    return _index[0]
+
+
+def conditions_for(locations):
+    return get_index().conditions_for(locations)
+
+
+def apply_contraindications(rows, conditions, equipment=None):
+    """Program rows (name first, note last) rewritten for the reported conditions;
+    equipment limits the alternatives (None: a full gym)
+    """
+    if not conditions:
+        return list(rows)
+    index, substitution = get_index(), get_substitution_index()
+    conditions, equipment = index.mask(conditions), substitution.equipment_mask(equipment)
+    keys = [substitution.key(row[0]) for row in rows]
+    result, positions, taken = [], {}, set(keys)
+    for row, key in zip(rows, keys):
+        choices = index.rewrite(key, conditions, equipment)
+        if not choices:
+            continue    # nothing safe to do instead
+        other, note = next((choice for choice in choices if choice[0] == key or choice[0] not in taken), choices[0])
+        if other != key:
+            row = replace_exercise(row, other, note)
+        elif note:
+            row = tuple(row[:-1]) + (measured(f'{row[-1]}; {note}') if row[-1] else note,)
+        taken.add(other)
+        merge_row(result, positions, row, other)
+    return result
@@ -0,0 +1,280 @@
+"""
+Exercise Catalog
+Per-exercise metadata for the analysis tools and the equipment
+substitution engine (substitution.py), keyed by canonical name
+(workout_program.canonical) so program rows, logged sets and pre-workout
+rows all resolve to the same entry.
+"""
+
+# Muscle groups, named as in the program docstrings ("CHEST", "SHOULDERS", ...)
+MUSCLES = (
+    'chest', 'shoulders', 'triceps', 'back', 'biceps', 'traps', 'forearms',
+    'quads', 'hamstrings', 'glutes', 'calves', 'core',
+)
+
+# canonical name: (primary muscles, secondary muscles)
+EXERCISE_MUSCLES = {
+    # Pre-workout foundation protocol
+    'pushups': (('chest',), ('shoulders', 'triceps')),
+    'pullups': (('back',), ('biceps',)),
+    'weightedsquats': (('quads',), ('glutes',)),
+
+    # Upper push
+    'barbellbenchpress': (('chest',), ('shoulders', 'triceps')),
+    'inclinedumbbellpress': (('chest',), ('shoulders', 'triceps')),
+    'cableflyes': (('chest',), ()),
+    'seateddbshoulderpress': (('shoulders',), ('triceps',)),
+    'lateralraises': (('shoulders',), ()),
+    'ropetriceppushdowns': (('triceps',), ()),
+    'overheadtricepextension': (('triceps',), ()),
+    'facepulls': (('shoulders',), ('back',)),
+
+    # Lower body
+    'barbellbacksquat': (('quads',), ('glutes', 'core')),
+    'romaniandeadlift': (('hamstrings',), ('glutes', 'back')),
+    'walkinglunges': (('quads', 'glutes'), ()),
+    'legpress': (('quads',), ('glutes',)),
+    'legcurl': (('hamstrings',), ()),
+    'calfraises': (('calves',), ()),
+    'hipthrusts': (('glutes',), ('hamstrings',)),
+    'coredeadbug': (('core',), ()),
+
+    # Upper pull
+    'barbellbentoverrow': (('back',), ('biceps', 'shoulders')),
+    'latpulldown': (('back',), ('biceps',)),
+    'seatedcablerow': (('back',), ('biceps',)),
+    'singlearmdbrow': (('back',), ('biceps',)),
+    'barbellcurls': (('biceps',), ('forearms',)),
+    'inclinedbcurls': (('biceps',), ()),
+    'reverseflyes': (('shoulders',), ('back',)),
+    'shrugs': (('traps',), ('forearms',)),
+
+    # Full body
+    'trapbardeadlift': (('glutes', 'hamstrings'), ('quads', 'back', 'traps', 'forearms')),
+    'dumbbellbenchpress': (('chest',), ('shoulders', 'triceps')),
+    'frontsquat': (('quads',), ('glutes', 'core')),
+    'standingohp': (('shoulders',), ('triceps', 'core')),
+    'bulgariansplitsquat': (('quads', 'glutes'), ()),
+    'farmerswalk': (('forearms', 'traps'), ('core',)),
+    'plankvariations': (('core',), ()),
+
+    # Home / minimal equipment alternatives (EXERCISE_NAMES)
+    'dumbbellfloorpress': (('chest',), ('shoulders', 'triceps')),
+    'widegrippushups': (('chest',), ('shoulders',)),
+    'bandchestfly': (('chest',), ()),
+    'pikepushups': (('shoulders',), ('triceps',)),
+    'bandoverheadpress': (('shoulders',), ('triceps',)),
+    'bandlateralraises': (('shoulders',), ()),
+    'bandtriceppushdowns': (('triceps',), ()),
+    'benchdips': (('triceps',), ('chest', 'shoulders')),
+    'diamondpushups': (('triceps',), ('chest',)),
+    'bandfacepulls': (('shoulders',), ('back',)),
+    'proneytraises': (('shoulders',), ('back',)),
+    'gobletsquat': (('quads',), ('glutes', 'core')),
+    'tempobodyweightsquat': (('quads',), ('glutes',)),
+    'dumbbellromaniandeadlift': (('hamstrings',), ('glutes', 'back')),
+    'singlelegromaniandeadlift': (('hamstrings',), ('glutes', 'core')),
+    'reverselunges': (('quads', 'glutes'), ()),
+    'splitsquat': (('quads', 'glutes'), ()),
+    'slidinglegcurl': (('hamstrings',), ('glutes',)),
+    'standingcalfraises': (('calves',), ()),
+    'glutebridge': (('glutes',), ('hamstrings',)),
+    'dumbbellbentoverrow': (('back',), ('biceps', 'shoulders')),
+    'bandrow': (('back',), ('biceps',)),
+    'invertedrow': (('back',), ('biceps', 'shoulders')),
+    'bandlatpulldown': (('back',), ('biceps',)),
+    'dumbbellpullover': (('back',), ('chest', 'triceps')),
+    'doorframerow': (('back',), ('biceps',)),
+    'dumbbellcurls': (('biceps',), ('forearms',)),
+    'bandcurls': (('biceps',), ()),
+    'towelcurls': (('biceps',), ('forearms',)),
+    'bandpullaparts': (('shoulders',), ('back',)),
+    'dumbbellshrugs': (('traps',), ('forearms',)),
+    'bandshrugs': (('traps',), ()),
+    'dumbbelldeadlift': (('glutes', 'hamstrings'), ('quads', 'back', 'traps', 'forearms')),
+    'bearcrawl': (('core',), ('shoulders',)),
+}
+
+# Equipment an athlete can have; bodyweight work needs none
+EQUIPMENT = ('barbell', 'trap_bar', 'dumbbells', 'bench', 'cable', 'machine', 'pullup_bar', 'bands')
+
+MOVEMENT_PATTERNS = (
+    'horizontal_push', 'vertical_push', 'chest_fly', 'shoulder_raise', 'rear_delt', 'elbow_extension',
+    'horizontal_pull', 'vertical_pull', 'elbow_flexion', 'shrug',
+    'squat', 'hinge', 'lunge', 'knee_flexion', 'hip_extension', 'calf_raise', 'carry', 'core',
+)
+
+# canonical name: (movement pattern, required equipment)
+EXERCISE_MOVEMENTS = {
+    'pushups': ('horizontal_push', ()),
+    'pullups': ('vertical_pull', ('pullup_bar',)),
+    'weightedsquats': ('squat', ('dumbbells',)),
+
+    'barbellbenchpress': ('horizontal_push', ('barbell', 'bench')),
+    'inclinedumbbellpress': ('horizontal_push', ('dumbbells', 'bench')),
+    'cableflyes': ('chest_fly', ('cable',)),
+    'seateddbshoulderpress': ('vertical_push', ('dumbbells', 'bench')),
+    'lateralraises': ('shoulder_raise', ('dumbbells',)),
+    'ropetriceppushdowns': ('elbow_extension', ('cable',)),
+    'overheadtricepextension': ('elbow_extension', ('dumbbells',)),
+    'facepulls': ('rear_delt', ('cable',)),
+
+    'barbellbacksquat': ('squat', ('barbell',)),
+    'romaniandeadlift': ('hinge', ('barbell',)),
+    'walkinglunges': ('lunge', ()),
+    'legpress': ('squat', ('machine',)),
+    'legcurl': ('knee_flexion', ('machine',)),
+    'calfraises': ('calf_raise', ('machine',)),
+    'hipthrusts': ('hip_extension', ('barbell', 'bench')),
+    'coredeadbug': ('core', ()),
+
+    'barbellbentoverrow': ('horizontal_pull', ('barbell',)),
+    'latpulldown': ('vertical_pull', ('cable',)),
+    'seatedcablerow': ('horizontal_pull', ('cable',)),
+    'singlearmdbrow': ('horizontal_pull', ('dumbbells', 'bench')),
+    'barbellcurls': ('elbow_flexion', ('barbell',)),
+    'inclinedbcurls': ('elbow_flexion', ('dumbbells', 'bench')),
+    'reverseflyes': ('rear_delt', ('dumbbells',)),
+    'shrugs': ('shrug', ('dumbbells',)),
+
+    'trapbardeadlift': ('hinge', ('trap_bar',)),
+    'dumbbellbenchpress': ('horizontal_push', ('dumbbells', 'bench')),
+    'frontsquat': ('squat', ('dumbbells',)),
+    'standingohp': ('vertical_push', ('dumbbells',)),
+    'bulgariansplitsquat': ('lunge', ('bench',)),
+    'farmerswalk': ('carry', ('dumbbells',)),
+    'plankvariations': ('core', ()),
+
+    'dumbbellfloorpress': ('horizontal_push', ('dumbbells',)),
+    'widegrippushups': ('chest_fly', ()),
+    'bandchestfly': ('chest_fly', ('bands',)),
+    'pikepushups': ('vertical_push', ()),
+    'bandoverheadpress': ('vertical_push', ('bands',)),
+    'bandlateralraises': ('shoulder_raise', ('bands',)),
+    'bandtriceppushdowns': ('elbow_extension', ('bands',)),
+    'benchdips': ('elbow_extension', ('bench',)),
+    'diamondpushups': ('elbow_extension', ()),
+    'bandfacepulls': ('rear_delt', ('bands',)),
+    'proneytraises': ('rear_delt', ()),
+    'gobletsquat': ('squat', ('dumbbells',)),
+    'tempobodyweightsquat': ('squat', ()),
+    'dumbbellromaniandeadlift': ('hinge', ('dumbbells',)),
+    'singlelegromaniandeadlift': ('hinge', ()),
+    'reverselunges': ('lunge', ()),
+    'splitsquat': ('lunge', ()),
+    'slidinglegcurl': ('knee_flexion', ()),
+    'standingcalfraises': ('calf_raise', ()),
+    'glutebridge': ('hip_extension', ()),
+    'dumbbellbentoverrow': ('horizontal_pull', ('dumbbells',)),
+    'bandrow': ('horizontal_pull', ('bands',)),
+    'invertedrow': ('horizontal_pull', ('pullup_bar',)),
+    'bandlatpulldown': ('vertical_pull', ('bands',)),
+    'dumbbellpullover': ('vertical_pull', ('dumbbells', 'bench')),
+    'doorframerow': ('horizontal_pull', ()),
+    'dumbbellcurls': ('elbow_flexion', ('dumbbells',)),
+    'bandcurls': ('elbow_flexion', ('bands',)),
+    'towelcurls': ('elbow_flexion', ()),
+    'bandpullaparts': ('rear_delt', ('bands',)),
+    'dumbbellshrugs': ('shrug', ('dumbbells',)),
+    'bandshrugs': ('shrug', ('bands',)),
+    'dumbbelldeadlift': ('hinge', ('dumbbells',)),
+    'bearcrawl': ('carry', ()),
+}
+
+# Exercises a substitution may print, as they are printed
+EXERCISE_NAMES = {
+    'pushups': 'Push-ups',
+    'pullups': 'Pull-ups',
+    'dumbbellbenchpress': 'Dumbbell Bench Press',
+    'singlearmdbrow': 'Single Arm DB Row',
+    'dumbbellfloorpress': 'Dumbbell Floor Press',
+    'widegrippushups': 'Wide-Grip Push-ups',
+    'bandchestfly': 'Band Chest Fly',
+    'pikepushups': 'Pike Push-ups',
+    'bandoverheadpress': 'Band Overhead Press',
+    'bandlateralraises': 'Band Lateral Raises',
+    'bandtriceppushdowns': 'Band Tricep Pushdowns',
+    'benchdips': 'Bench Dips',
+    'diamondpushups': 'Diamond Push-ups',
+    'bandfacepulls': 'Band Face Pulls',
+    'proneytraises': 'Prone Y-T Raises',
+    'gobletsquat': 'Goblet Squat',
+    'tempobodyweightsquat': 'Tempo Bodyweight Squat',
+    'dumbbellromaniandeadlift': 'Dumbbell Romanian Deadlift',
+    'singlelegromaniandeadlift': 'Single-Leg Romanian Deadlift',
+    'reverselunges': 'Reverse Lunges',
+    'splitsquat': 'Split Squat',
+    'slidinglegcurl': 'Sliding Leg Curl',
+    'standingcalfraises': 'Standing Calf Raises',
+    'glutebridge': 'Glute Bridge',
+    'dumbbellbentoverrow': 'Dumbbell Bent Over Row',
+    'bandrow': 'Band Row',
+    'invertedrow': 'Inverted Row',
+    'bandlatpulldown': 'Band Lat Pulldown',
+    'dumbbellpullover': 'Dumbbell Pullover',
+    'doorframerow': 'Doorframe Row',
+    'dumbbellcurls': 'Dumbbell Curls',
+    'bandcurls': 'Band Curls',
+    'towelcurls': 'Towel Curls',
+    'bandpullaparts': 'Band Pull-Aparts',
+    'dumbbellshrugs': 'Dumbbell Shrugs',
+    'bandshrugs': 'Band Shrugs',
+    'dumbbelldeadlift': 'Dumbbell Deadlift',
+    'bearcrawl': 'Bear Crawl',
+}
+
+# Conditions an athlete can report pain for (contraindications.py)
+CONDITIONS = ('knee', 'lower_back', 'shoulder')
+
+# canonical name: (conditions to avoid it with, conditions to modify it for)
+EXERCISE_CONTRAINDICATIONS = {
+    'weightedsquats': ((), ('knee',)),
+    'pushups': ((), ('shoulder',)),
+    'pullups': ((), ('shoulder',)),
+
+    'barbellbenchpress': ((), ('shoulder',)),
+    'inclinedumbbellpress': ((), ('shoulder',)),
+    'cableflyes': ((), ('shoulder',)),
+    'seateddbshoulderpress': (('shoulder',), ()),
+    'lateralraises': ((), ('shoulder',)),
+
+    'barbellbacksquat': ((), ('knee', 'lower_back')),
+    'romaniandeadlift': (('lower_back',), ()),
+    'walkinglunges': (('knee',), ()),
+    'legpress': ((), ('knee', 'lower_back')),
+    'hipthrusts': ((), ('lower_back',)),
+
+    'barbellbentoverrow': (('lower_back',), ()),
+    'latpulldown': ((), ('shoulder',)),
+    'shrugs': ((), ('lower_back',)),
+
+    'trapbardeadlift': ((), ('lower_back',)),
+    'dumbbellbenchpress': ((), ('shoulder',)),
+    'frontsquat': ((), ('knee', 'lower_back')),
+    'standingohp': (('shoulder',), ('lower_back',)),
+    'bulgariansplitsquat': (('knee',), ()),
+    'farmerswalk': ((), ('lower_back',)),
+
+    'dumbbellfloorpress': ((), ('shoulder',)),
+    'widegrippushups': (('shoulder',), ()),
+    'pikepushups': (('shoulder',), ()),
+    'bandoverheadpress': ((), ('shoulder',)),
+    'benchdips': (('shoulder',), ()),
+    'diamondpushups': ((), ('shoulder',)),
+    'gobletsquat': ((), ('knee',)),
+    'tempobodyweightsquat': ((), ('knee',)),
+    'dumbbellromaniandeadlift': (('lower_back',), ()),
+    'singlelegromaniandeadlift': ((), ('lower_back',)),
+    'reverselunges': ((), ('knee',)),
+    'splitsquat': (('knee',), ()),
+    'dumbbellbentoverrow': ((), ('lower_back',)),
+    'dumbbellpullover': (('shoulder',), ()),
+    'dumbbelldeadlift': ((), ('lower_back',)),
+}
+
+# Technique note of an exercise modified for a condition
+CONDITION_NOTES = {
+    'knee': 'Knee: pain-free depth, slow lowering',
+    'lower_back': 'Low back: lighter load, neutral spine',
+    'shoulder': 'Shoulder: pain-free range, neutral grip',
+}
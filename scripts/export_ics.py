@@ -0,0 +1,186 @@
+"""
+iCalendar (ICS) Schedule Export
+Maps the 7-day split of the evidence-based program onto real calendar dates
+
+Single athlete:  python export_ics.py --start 2026-11-02 --output program.ics
+Whole cohort:    python export_ics.py --cohort cohort.json --output-dir calendars
+"""
+
+from datetime import date, datetime, time, timedelta, timezone
+import argparse
+import os
+
+from athletes import load_profiles, safe_filename
+from workout_program import WEEKLY_SPLIT, TRAINING_DURATIONS, RECOVERY_DURATION
+
+
+PRODID = '-//Fitness Tracker//Program Schedule//EN'
+DEFAULT_START_TIME = time(7, 0)
+
+
+def parse_minutes(duration):
+    """'30-40 min' -> 40, '2-3 hours' -> 180
+
+    The upper bound is used so a calendar slot never runs short.
+    """
+    value, unit = duration.split()[:2]
+    minutes = int(value.split('-')[-1])
+    return minutes * 60 if unit.startswith('h') else minutes
+
+
+def build_schedule(weeks=4):
+    """Date-independent event list shared by every athlete of a cohort
+
+    Each event is (week, day, day_offset, summary, description, minutes);
+    minutes is None for all-day rest events.
+    """
+    training_minutes = sum(parse_minutes(d) for d in TRAINING_DURATIONS)
+    training_notes = 'Pre-Workout: {} | Main: {} | Post-Workout: {}'.format(*TRAINING_DURATIONS)
+
+    schedule = []
+    for week in range(1, weeks + 1):
+        for day, slug, title, focus, kind, exercises_func, stretches_func in WEEKLY_SPLIT:
+            if kind == 'training':
+                minutes, notes = training_minutes, training_notes
+            elif kind == 'recovery':
+                minutes, notes = parse_minutes(RECOVERY_DURATION), f'Recovery: {RECOVERY_DURATION}'
+            else:
+                minutes, notes = None, 'Complete rest day'
+            summary = f'Week {week} Day {day}: {title}'
+            description = f'{focus}\n{notes}\nPDF: Week{week}_Day{day}_{slug}.pdf'
+            schedule.append((week, day, (week - 1) * 7 + day - 1, summary, description, minutes))
+    return schedule
+
+
+def _escape(text):
+    return (text.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def _fold(line):
+    """Fold a content line at 75 octets (RFC 5545 section 3.1)"""
+    if len(line.encode('utf-8')) <= 75:
+        return line
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = '', 0
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts)
+
+
+def _format_duration(minutes):
+    hours, minutes = divmod(minutes, 60)
+    return 'PT' + (f'{hours}H' if hours else '') + (f'{minutes}M' if minutes else '')
+
+
+def build_calendar(start_date, athlete_id='athlete', name=None, start_time=DEFAULT_START_TIME,
+                   weeks=4, schedule=None, stamp=None):
+    """Return the ICS text for one athlete, Week 1 Day 1 falling on start_date"""
+    if schedule is None:
+        schedule = build_schedule(weeks)
+    if stamp is None:
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    uid_prefix = safe_filename(athlete_id)
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:' + _escape(f'Training Program - {name or athlete_id}'),
+    ]
+    for week, day, offset, summary, description, minutes in schedule:
+        day_date = start_date + timedelta(days=offset)
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:{uid_prefix}-w{week}d{day}@fitness-tracker',
+            f'DTSTAMP:{stamp}',
+        ]
+        if minutes is None:
+            lines += [
+                f'DTSTART;VALUE=DATE:{day_date:%Y%m%d}',
+                f'DTEND;VALUE=DATE:{day_date + timedelta(days=1):%Y%m%d}',
+                'TRANSP:TRANSPARENT',
+            ]
+        else:
+            lines += [
+                f'DTSTART:{datetime.combine(day_date, start_time):%Y%m%dT%H%M%S}',
+                f'DURATION:{_format_duration(minutes)}',
+            ]
+        lines += [
+            'SUMMARY:' + _escape(summary),
+            'DESCRIPTION:' + _escape(description),
+            'END:VEVENT',
+        ]
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
+
+
+def write_calendar(path, start_date, **kwargs):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write(build_calendar(start_date, **kwargs))
+    return path
+
+
+def write_cohort_calendars(profiles, output_dir, weeks=4, default_start=None):
+    """Write one <athlete_id>.ics per profile in a single pass
+
+    Profiles may carry 'start_date' (YYYY-MM-DD), 'start_time' (HH:MM)
+    and 'name'; the event template is built once for the whole cohort.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    schedule = build_schedule(weeks)
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    paths = []
+    for profile in profiles:
+        start = profile.get('start_date')
+        start_date = date.fromisoformat(start) if start else default_start
+        if start_date is None:
+            raise ValueError(f'No start date for athlete {profile["athlete_id"]}')
+        start_time = profile.get('start_time')
+        path = os.path.join(output_dir, f'{safe_filename(profile["athlete_id"])}.ics')
+        paths.append(write_calendar(
+            path, start_date,
+            athlete_id=profile['athlete_id'],
+            name=profile.get('name'),
+            start_time=time.fromisoformat(start_time) if start_time else DEFAULT_START_TIME,
+            schedule=schedule,
+            stamp=stamp,
+        ))
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the training program as iCalendar files')
+    parser.add_argument('--start', type=date.fromisoformat,
+                        help='date of Week 1 Day 1 (YYYY-MM-DD); cohort default when profiles omit it')
+    parser.add_argument('--time', type=time.fromisoformat, default=DEFAULT_START_TIME,
+                        help='session start time (HH:MM, default 07:00)')
+    parser.add_argument('--weeks', type=int, default=4)
+    parser.add_argument('--athlete', default='athlete', help='athlete id for a single calendar')
+    parser.add_argument('--output', default='program.ics', help='single calendar output path')
+    parser.add_argument('--cohort', help='JSON / NDJSON file of athlete profiles (batch mode)')
+    parser.add_argument('--output-dir', default='calendars', help='batch mode output directory')
+    args = parser.parse_args()
+
+    if args.cohort:
+        paths = write_cohort_calendars(load_profiles(args.cohort), args.output_dir,
+                                       weeks=args.weeks, default_start=args.start)
+        print(f'Created {len(paths)} calendars in {args.output_dir}')
+    else:
+        if args.start is None:
+            parser.error('--start is required without --cohort')
+        write_calendar(args.output, args.start, athlete_id=args.athlete,
+                       start_time=args.time, weeks=args.weeks)
+        print(f'Created: {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""
+Fitness Tracker Command Line
+One entry point for the generators and exports:
+
+    python fitness_tracker.py workouts [--week 2 --day 4] [--watch] [--locale es]
+    python fitness_tracker.py workouts --all-locales --workers 4
+    python fitness_tracker.py workouts --units imperial
+    python fitness_tracker.py workouts --week 5 --mesocycle 4     # 2 build, peak, deload
+    python fitness_tracker.py workouts --cohort cohort.json     # each athlete's locale / units
+    python fitness_tracker.py workouts --cohort cohort.json --bundle zip [--cohort-archive]
+    python fitness_tracker.py workouts --cohort cohort.json --store PDFs/store    # content-addressed
+    python fitness_tracker.py workouts --cohort cohort.json --journal run.db      # resumable
+    python fitness_tracker.py pipe --week 1 < cohort.ndjson > week1.tar    # progress as JSON on stderr
+    python fitness_tracker.py daily
+    python fitness_tracker.py meal-plan
+    python fitness_tracker.py weekly
+    python fitness_tracker.py tracker --weeks 4 --start 2026-11-02
+    python fitness_tracker.py workouts --cohort cohort.json --dry-run    # lint the layout, write nothing
+    python fitness_tracker.py export ics --start 2026-11-02
+    python fitness_tracker.py export html --week 2 --day 4
+    python fitness_tracker.py export json --week 2 --day 4
+    python fitness_tracker.py export diff 1 2 [--json | --pdf Week1_to_Week2.pdf]
+    python fitness_tracker.py export schedule --start 2026-11-02 --unavailable sat,sun
+    python fitness_tracker.py bench startup
+    python fitness_tracker.py bench --runs 3 startup export ics --start 2026-11-02
+    python fitness_tracker.py bench render
+    python fitness_tracker.py --font DejaVuSans.ttf workouts
+
+fpdf and the program modules are imported inside the subcommand that
+needs them, so --help and the data exports start without loading the PDF
+backend; `bench startup` checks that with python -X importtime.
+"""
+
+import argparse
+import os
+import sys
+
+
+# Modules --help must not load; the PDF backend must not load for exports either
+HEAVY_MODULES = ('fpdf', 'workout_program', 'workout_document', 'progression', 'session_log', 'sqlite3')
+PDF_BACKEND = 'fpdf'
+BUNDLE_FORMATS = ('zip', 'tar', 'tar.gz')    # bundle.FORMATS, without importing it for --help
+STARTUP_BUDGET_MS = 50
+
+# export formats backed by an existing script's own command line
+EXPORT_SCRIPTS = {
+    'ics': 'export_ics',
+    'html': 'html_renderer',
+    'diff': 'program_diff',
+    'schedule': 'scheduler',
+}
+
+
+def _date(value):
+    from datetime import date
+    return date.fromisoformat(value)
+
+
+# =============================================================================
+# SUBCOMMANDS
+# =============================================================================
+
+def cmd_workouts(args):
+    from generate_improved_workout_pdfs import generate_all_pdfs, generate_all_locales, generate_cohort, OUTPUT_DIR
+    from periodization import use_mesocycle
+    weeks = args.week or range(1, 5)
+    with use_mesocycle(args.mesocycle):
+        if args.cohort and args.journal:
+            from athletes import load_profiles
+            from generate_improved_workout_pdfs import generate_journaled_cohort
+            if generate_journaled_cohort(load_profiles(args.cohort), args.journal, weeks, args.day,
+                                         args.output_dir or OUTPUT_DIR, args.workers, restart=args.restart):
+                sys.exit(1)    # units still failed: run again to retry them
+            return
+        if args.cohort:
+            from athletes import load_profiles
+            generate_cohort(load_profiles(args.cohort), weeks, args.day, args.output_dir or OUTPUT_DIR, args.workers,
+                            args.bundle, args.cohort_archive, args.store)
+            return
+        if args.all_locales:
+            from i18n import LOCALES
+            generate_all_locales(LOCALES, weeks, args.day, args.output_dir or OUTPUT_DIR, args.workers, args.units,
+                                 args.bundle, args.store)
+            return
+        generate_all_pdfs(weeks=weeks, days=args.day, output_dir=args.output_dir or OUTPUT_DIR, locale=args.locale,
+                          units=args.units, bundle=args.bundle, store=args.store)
+        if args.watch:
+            from watch import Watcher
+            Watcher(weeks, args.day, args.output_dir).run()
+
+
+def cmd_pipe(args):
+    from pipe import run_pipe
+    from periodization import use_mesocycle
+    with use_mesocycle(args.mesocycle):
+        try:
+            run_pipe(sys.stdin, sys.stdout.buffer, sys.stderr, args.week or range(1, 5), args.day, args.format)
+        except Exception:
+            sys.exit(1)    # reported on stderr as an error event
+
+
+def cmd_daily(args):
+    from generate_daily_pdfs import generate_all_pdfs
+    generate_all_pdfs(args.locale, args.bundle)
+
+
+def cmd_meal_plan(args):
+    from generate_meal_plan_pdf import generate_meal_plan_pdf
+    generate_meal_plan_pdf(args.locale, args.units)
+
+
+def cmd_weekly(args):
+    from generate_pdfs import generate_weekly_plan
+    print(f'Saved: {generate_weekly_plan(args.output_dir, args.locale, args.units)}')
+
+
+def cmd_tracker(args):
+    from generate_pdfs import generate_daily_tracker
+    print(f'Saved: {generate_daily_tracker(args.output_dir, args.weeks, args.start, args.locale, args.units)}')
+
+
+def cmd_export(args):
+    if args.format == 'json':
+        import json
+        from i18n import localize_document
+        from units import format_document
+        from workout_document import build_split_day
+        document = format_document(build_split_day(args.week, args.day), args.units)
+        json.dump(localize_document(document, args.locale), sys.stdout, indent=1)
+        sys.stdout.write('\n')
+        return
+    module = __import__(EXPORT_SCRIPTS[args.format])
+    sys.argv = [f'{os.path.basename(sys.argv[0])} export {args.format}'] + args.extra
+    module.main()
+
+
+def run_dry(args):
+    """Lay out the subcommand's documents without writing them and print their reports"""
+    import io
+    from contextlib import redirect_stdout
+    from layout import dry_run, format_report
+    args.watch = False
+    with dry_run() as reports, redirect_stdout(io.StringIO()):    # the generators' progress lines
+        args.func(args)
+    problems = 0
+    for report in reports:
+        print('\n'.join(format_report(report)))
+        problems += len(report['overflows']) + len(report['splits'])
+    print(f'{len(reports)} documents, {sum(report["pages"] for report in reports)} pages, {problems} layout problems')
+    if problems:
+        sys.exit(1)
+
+
+def _import_times(argv):
+    """Cumulative top-level import time (ms) and module names for one run
+
+    The command runs in a scratch directory, so files it writes are discarded;
+    a failing command raises RuntimeError.
+    """
+    import subprocess
+    import tempfile
+    with tempfile.TemporaryDirectory() as scratch:
+        result = subprocess.run([sys.executable, '-X', 'importtime', os.path.abspath(__file__)] + argv,
+                                capture_output=True, text=True, cwd=scratch)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(f'exit status {result.returncode}' + (f': {errors[-1]}' if errors else ''))
+    total, modules = 0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.add(name.strip())
+        if not name[1:].startswith(' '):
+            total += int(cumulative_us)
+    return total / 1000, modules
+
+
+def bench_startup(args):
+    argv = args.argv or ['--help']
+    try:
+        runs = [_import_times(argv) for _ in range(args.runs)]
+    except RuntimeError as e:
+        print(f'FAIL: {" ".join(argv)}: {e}')
+        sys.exit(1)
+    best = min(ms for ms, modules in runs)
+    heavy = HEAVY_MODULES if {'-h', '--help'} & set(argv) and 'export' not in argv else (PDF_BACKEND,)
+    loaded = sorted(set(heavy) & runs[0][1])
+    print(f'{" ".join(argv)}: {best:.1f} ms of imports (best of {args.runs}, budget {args.budget_ms} ms)')
+    if loaded:
+        print(f'FAIL: loaded before rendering: {", ".join(loaded)}')
+    if best > args.budget_ms:
+        print('FAIL: over the startup budget')
+    if loaded or best > args.budget_ms:
+        sys.exit(1)
+    print('OK')
+
+
+def bench_render(args):
+    import time
+    from generate_improved_workout_pdfs import create_split_day
+    from html_renderer import render_html
+    from workout_document import build_split_day
+    from workout_program import WEEKLY_SPLIT
+
+    documents = [(week, entry) for week in range(1, 5) for entry in WEEKLY_SPLIT]
+    timings = {'document': 0.0, 'html': 0.0, 'pdf': 0.0}
+    elided = 0
+    for _ in range(args.repeat):
+        for week, (day, slug, title, focus, kind, exercises_func, stretches_func) in documents:
+            start = time.perf_counter()
+            document = build_split_day(week, day)
+            built = time.perf_counter()
+            render_html(document)
+            rendered = time.perf_counter()
+            pdf = create_split_day(week, day, title, focus, kind, exercises_func, stretches_func)
+            pdf.output('', 'S')
+            elided += sum(pdf.elided.values())
+            timings['document'] += built - start
+            timings['html'] += rendered - built
+            timings['pdf'] += time.perf_counter() - rendered
+
+    count = len(documents) * args.repeat
+    for name, seconds in timings.items():
+        print(f'{name:<9} {seconds / count * 1000:8.2f} ms per day ({count} days)')
+    print(f'{"elided":<9} {elided / count:8.1f} state operators per day (graphics.py)')
+
+
+def cmd_bench(args):
+    if args.target == 'startup':
+        bench_startup(args)
+    else:
+        bench_render(args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='fitness-tracker', description='Fitness tracker generators and exports')
+    parser.add_argument('--font', help='TrueType font for non-Latin-1 text (default: core Helvetica), see fonts.py')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    workouts = commands.add_parser('workouts', help='evidence-based day PDFs (PDFs/Daily_Exercises)')
+    workouts.add_argument('--week', type=int, action='append', help='week to render (repeatable, default 1-4)')
+    workouts.add_argument('--day', type=int, action='append', help='day to render (repeatable, default 1-7)')
+    workouts.add_argument('--mesocycle', type=int, help='weeks per build / peak / deload block (default 5, '
+                                                        'a cohort profile\'s "mesocycle" wins)')
+    workouts.add_argument('--output-dir')
+    workouts.add_argument('--watch', action='store_true', help='then re-render the days affected by each edit')
+    workouts.add_argument('--all-locales', action='store_true', help='render every locale into <output-dir>/<locale>')
+    workouts.add_argument('--cohort', help='JSON / NDJSON athlete profiles: render <output-dir>/<athlete_id> '
+                                           'in each profile\'s locale and units')
+    workouts.add_argument('--workers', type=int, help='--all-locales / --cohort: worker processes '
+                                                      '(default: one per CPU)')
+    workouts.add_argument('--cohort-archive', action='store_true',
+                          help='with --cohort --bundle: one archive for the cohort instead of one per athlete')
+    workouts.add_argument('--store', metavar='DIR', help='keep the PDFs in a content-addressed store, one object '
+                                                         'per distinct PDF, indexed per athlete (store.py)')
+    workouts.add_argument('--journal', metavar='FILE', help='with --cohort: checkpoint each athlete\'s PDFs in '
+                                                            'this SQLite journal and resume from it (batch.py)')
+    workouts.add_argument('--restart', action='store_true', help='with --journal: start the run over')
+    workouts.set_defaults(func=cmd_workouts)
+
+    pipe = commands.add_parser('pipe', help='NDJSON profiles on stdin, a PDF archive on stdout (pipe.py)')
+    pipe.add_argument('--week', type=int, action='append', help='week to render (repeatable, default 1-4)')
+    pipe.add_argument('--day', type=int, action='append', help='day to render (repeatable, default 1-7)')
+    pipe.add_argument('--mesocycle', type=int, help='weeks per build / peak / deload block (default 5)')
+    pipe.add_argument('--format', choices=[f for f in BUNDLE_FORMATS if f != 'zip'], default='tar')
+    pipe.set_defaults(func=cmd_pipe)
+
+    daily = commands.add_parser('daily', help='Week_N/Day_M exercise PDFs')
+    daily.set_defaults(func=cmd_daily)
+    meal_plan = commands.add_parser('meal-plan', help='nutrition & meal plan PDF')
+    meal_plan.set_defaults(func=cmd_meal_plan)
+
+    weekly = commands.add_parser('weekly', help='weekly plan PDF')
+    weekly.add_argument('--output-dir')
+    weekly.set_defaults(func=cmd_weekly)
+
+    tracker = commands.add_parser('tracker', help='fillable daily exercise tracker PDF')
+    tracker.add_argument('--weeks', type=int, default=4)
+    tracker.add_argument('--start', type=_date, help='date of Week 1 Day 1 (YYYY-MM-DD)')
+    tracker.add_argument('--output-dir')
+    tracker.set_defaults(func=cmd_tracker)
+
+    for generator in (workouts, daily, meal_plan, weekly, tracker):
+        generator.add_argument('--locale', help='label language: en (default), de, es, fr')
+    for generator in (workouts, meal_plan, weekly, tracker):
+        generator.add_argument('--units', help='metric (default) or imperial')
+    for generator in (workouts, daily):
+        generator.add_argument('--bundle', choices=BUNDLE_FORMATS,
+                               help='stream the PDFs into one archive instead of loose files (bundle.py)')
+    for generator in (workouts, daily, meal_plan, weekly, tracker):
+        generator.add_argument('--dry-run', action='store_true',
+                               help='lay out only: report pages, overflowing cells and split sections')
+
+    export = commands.add_parser('export', help='data exports (no PDF backend)')
+    formats = export.add_subparsers(dest='format', required=True)
+    for name, module in EXPORT_SCRIPTS.items():
+        formats.add_parser(name, add_help=False, help=f'same options as {module}.py')
+    document = formats.add_parser('json', help='day document model as JSON')
+    document.add_argument('--week', type=int, default=1)
+    document.add_argument('--day', type=int, default=1)
+    document.add_argument('--locale')
+    document.add_argument('--units')
+    export.set_defaults(func=cmd_export)
+
+    bench = commands.add_parser('bench', help='startup and rendering benchmarks')
+    bench.add_argument('target', choices=['startup', 'render'])
+    bench.add_argument('--runs', type=int, default=5, help='startup: runs to take the best of')
+    bench.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS)
+    bench.add_argument('--repeat', type=int, default=1, help='render: passes over the 28 days')
+    bench.add_argument('argv', nargs=argparse.REMAINDER,
+                       help='startup: command line to measure, options included (default --help)')
+    bench.set_defaults(func=cmd_bench)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and getattr(args, 'format', None) not in EXPORT_SCRIPTS:
+        parser.error(f'unrecognized arguments: {" ".join(extra)}')
+    args.extra = extra
+    if args.font:
+        os.environ['FITNESS_TRACKER_FONT'] = args.font
+    if getattr(args, 'dry_run', False):
+        run_dry(args)
+        return
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""
+Unicode Fonts
+Lets the PDF classes render with a TrueType font instead of core Helvetica,
+for clients whose text does not fit Latin-1.
+
+    FITNESS_TRACKER_FONT=/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf \
+        python fitness_tracker.py workouts
+
+Bold / italic files next to the regular one are picked up by name
+(DejaVuSans-Bold.ttf, -Oblique, -Italic, -BoldOblique, -BoldItalic).
+Without a configured font the core fonts are used and text is mapped to
+Windows-1252, with ASCII stand-ins ('->' for an arrow) for anything else.
+
+Parsed font metrics are cached on disk keyed by the SHA-1 of the font
+file, so a font is parsed once per machine rather than once per document,
+and in memory so each process reads the cache once. Font subsets are
+cached in memory per (font, character set); every subset includes the
+Latin blocks, so a batch of documents in Latin-script languages builds each
+subset once per process.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+
+from fpdf import FPDF
+import fpdf.fpdf
+from fpdf.ttfonts import TTFontFile
+
+
+FONT_ENV = 'FITNESS_TRACKER_FONT'
+CACHE_DIR = os.path.join(os.environ.get('FITNESS_TRACKER_CACHE', os.path.expanduser('~/.cache/fitness-tracker')),
+                         'fonts')
+FAMILY = 'unicode'
+CORE_FAMILIES = ('helvetica', 'arial')
+STYLE_SUFFIXES = {
+    'B': ('-Bold', 'Bold', '-bold', 'bd'),
+    'I': ('-Oblique', '-Italic', 'Italic', '-italic', 'i'),
+    'BI': ('-BoldOblique', '-BoldItalic', 'BoldItalic', '-bolditalic', 'bi'),
+}
+FALLBACK_STYLES = {'': (), 'B': (), 'I': ('',), 'BI': ('B', 'I', '')}
+
+# Characters outside Windows-1252 that have a readable ASCII stand-in
+ASCII_FALLBACKS = str.maketrans({
+    '→': '->', '←': '<-', '↔': '<->', '⇒': '=>',
+    '≤': '<=', '≥': '>=', '≈': '~', '−': '-', '✓': 'x', '✔': 'x',
+})
+
+_hashes = {}      # (path, size, mtime) -> sha1
+_metrics = {}     # sha1 -> font dict
+_subsets = {}     # (sha1, characters) -> (font program, code to glyph map, max unicode)
+_widths = {}      # (sha1, characters) -> /W array lines
+
+# Always embedded, so documents in Latin-script languages share one subset
+SUBSET_BLOCK = frozenset(range(32, 0x180))    # Basic Latin to Latin Extended-A
+
+
+def core_font_text(txt):
+    """Text as the core fonts encode it: Windows-1252 bytes in a latin-1 str"""
+    try:
+        txt.encode('latin-1')
+        return txt
+    except UnicodeEncodeError:
+        return txt.translate(ASCII_FALLBACKS).encode('cp1252', 'replace').decode('latin-1')
+
+
+def font_hash(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _hashes:
+        with open(path, 'rb') as f:
+            _hashes[key] = hashlib.sha1(f.read()).hexdigest()
+    return _hashes[key]
+
+
+def _parse_metrics(path):
+    ttf = TTFontFile()
+    ttf.getMetrics(path)
+    return {
+        'name': re.sub('[ ()]', '', ttf.fullName),
+        'type': 'TTF',
+        'desc': {
+            'Ascent': int(round(ttf.ascent, 0)),
+            'Descent': int(round(ttf.descent, 0)),
+            'CapHeight': int(round(ttf.capHeight, 0)),
+            'Flags': ttf.flags,
+            'FontBBox': '[%s %s %s %s]' % tuple(int(round(v, 0)) for v in ttf.bbox),
+            'ItalicAngle': int(ttf.italicAngle),
+            'StemV': int(round(ttf.stemV, 0)),
+            'MissingWidth': int(round(ttf.defaultWidth, 0)),
+        },
+        'up': round(ttf.underlinePosition),
+        'ut': round(ttf.underlineThickness),
+        'originalsize': os.stat(path).st_size,
+        'cw': ttf.charWidths,
+    }
+
+
+def load_metrics(path):
+    """Parsed metrics of a TTF file: memory cache, then disk cache, then parse"""
+    digest = font_hash(path)
+    if digest in _metrics:
+        return _metrics[digest]
+    cache_path = os.path.join(CACHE_DIR, digest + '.pkl')
+    try:
+        with open(cache_path, 'rb') as f:
+            metrics = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        metrics = _parse_metrics(path)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(metrics, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass    # read-only cache: keep the parsed copy in memory only
+    _metrics[digest] = metrics
+    return metrics
+
+
+def font_variants(path=None):
+    """{style: path} for the configured regular font and its siblings"""
+    path = path or os.environ.get(FONT_ENV)
+    if not path:
+        return {}
+    if not os.path.exists(path):
+        raise RuntimeError(f'TTF font not found: {path}')
+    base, ext = os.path.splitext(path)
+    variants = {'': path}
+    for style, suffixes in STYLE_SUFFIXES.items():
+        for suffix in suffixes:
+            if os.path.exists(base + suffix + ext):
+                variants[style] = base + suffix + ext
+                break
+    return variants
+
+
+class CachedTTFontFile(TTFontFile):
+    """TTFontFile whose subsets are built once per (font, character set)"""
+
+    def makeSubset(self, file, subset):
+        key = (font_hash(file), tuple(subset))
+        if key not in _subsets:
+            font_program = TTFontFile.makeSubset(self, file, subset)
+            _subsets[key] = (font_program, self.codeToGlyph, self.maxUni)
+        font_program, self.codeToGlyph, self.maxUni = _subsets[key]
+        return font_program
+
+
+class UnicodeFontMixin:
+    """Replaces core Helvetica with the configured TTF family
+
+    The classes keep calling set_font('Helvetica', ...); without a
+    configured font nothing changes except the Windows-1252 mapping.
+    """
+
+    font_path = None    # class-level override of FITNESS_TRACKER_FONT
+
+    def _unicode_styles(self):
+        if not hasattr(self, '_ttf_styles'):
+            self._ttf_styles = set()
+            for style, path in font_variants(self.font_path).items():
+                self.add_cached_font(FAMILY, style, path)
+                self._ttf_styles.add(style)
+        return self._ttf_styles
+
+    def add_cached_font(self, family, style, path):
+        """add_font(uni=True) backed by the metrics cache"""
+        fontkey = family.lower() + style
+        if fontkey in self.fonts:
+            return
+        metrics = load_metrics(path)
+        self.fonts[fontkey] = {
+            'i': len(self.fonts) + 1, 'type': metrics['type'],
+            'name': metrics['name'], 'desc': metrics['desc'],
+            'up': metrics['up'], 'ut': metrics['ut'],
+            'cw': metrics['cw'],
+            'ttffile': path, 'fontkey': fontkey,
+            'subset': list(range(0, 57 if hasattr(self, 'str_alias_nb_pages') else 32)),
+            'unifilename': None,
+        }
+        self.font_files[fontkey] = {'length1': metrics['originalsize'], 'type': 'TTF', 'ttffile': path}
+        self.font_files[path] = {'type': 'TTF'}
+
+    def set_font(self, family, style='', size=0):
+        styles = self._unicode_styles()
+        if styles and family.lower() in CORE_FAMILIES:
+            family = FAMILY
+            underline = 'U' if 'U' in style.upper() else ''
+            style = ''.join(c for c in 'BI' if c in style.upper())
+            if style not in styles:
+                style = next(s for s in FALLBACK_STYLES[style] + ('',) if s in styles)
+            style += underline
+        FPDF.set_font(self, family, style, size)
+
+    def _text(self, txt):
+        if getattr(self, 'unifontsubset', False) or not isinstance(txt, str):
+            return txt
+        return core_font_text(txt)
+
+    def get_string_width(self, s):
+        return FPDF.get_string_width(self, self._text(s))
+
+    def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=0, link=''):
+        super().cell(w, h, self._text(txt), border, ln, align, fill, link)
+
+    def multi_cell(self, w, h, txt='', border=0, align='J', fill=0, split_only=False):
+        return super().multi_cell(w, h, self._text(txt), border, align, fill, split_only)
+
+    def _putTTfontwidths(self, font, maxUni):
+        key = (font_hash(font['ttffile']), tuple(font['subset']))
+        if key not in _widths:
+            lines = []
+            self._out = lines.append
+            try:
+                # a set makes the 'cid in subset' test over every code point cheap
+                FPDF._putTTfontwidths(self, dict(font, subset=set(font['subset'])), maxUni)
+            finally:
+                del self._out
+            _widths[key] = lines
+        for line in _widths[key]:
+            self._out(line)
+
+    def _putfonts(self):
+        for font in self.fonts.values():
+            if font['type'] == 'TTF':
+                font['subset'] = [0] + sorted(SUBSET_BLOCK.union(font['subset']) - {0})
+        # _putfonts builds TTF subsets through the module-level TTFontFile
+        original = fpdf.fpdf.TTFontFile
+        fpdf.fpdf.TTFontFile = CachedTTFontFile
+        try:
+            FPDF._putfonts(self)
+        finally:
+            fpdf.fpdf.TTFontFile = original
@@ -0,0 +1,346 @@
+"""
+Bulk Form Value Extractor
+Reads the filled-in form fields (pdf_forms.py) out of returned PDFs and
+writes them as session-log records (session_log.py), one NDJSON line per
+(athlete, week, day).
+
+    python form_extract.py returned/ -o week2_logs.ndjson
+    python form_extract.py returned/ --ingest logs.db --workers 8
+
+PDFs are read with a small built-in parser that understands incremental
+updates and compressed object streams, which is what viewers write when a
+form is saved. The athlete id is the PDF's parent directory name
+(returned/A-001/Week2_Day4.pdf) unless --athlete is given.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+from session_log import SESSION_FIELDS
+from units import to_metric
+
+
+_OBJ = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_SPACE = re.compile(rb'(?:[ \t\r\n\f\x00]|%[^\r\n]*)*')
+_NAME = re.compile(rb'/([^ \t\r\n\f\x00()<>\[\]{}/%]*)')
+# Only objects with a /T string can be fields; skip parsing everything else
+_MAYBE_FIELD = re.compile(rb'/T\s*[(<]|/ObjStm')
+_NUMBER = re.compile(rb'[+-]?(?:\d+\.?\d*|\.\d+)')
+_REF = re.compile(rb'\s+(\d+)\s+R\b')
+_FIELD = re.compile(r'^w(\d+)d(\d+)\.(.+)$')
+_DECIMAL = re.compile(r'\d+(?:\.\d+)?')
+_SET_VALUE = re.compile(r'(\d+)\s*(?:[/x]\s*([\d.]+))?\s*(?:@\s*(?:RPE\s*)?([\d.]+))?', re.I)
+
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f'}
+
+SESSION_COLUMNS = {name for name, kind in SESSION_FIELDS}
+
+
+class Name(str):
+    """A PDF name object (/Yes); plain str values are PDF strings"""
+
+
+class Ref(int):
+    """An indirect reference (12 0 R) to object 12"""
+
+
+# =============================================================================
+# PDF OBJECT PARSER
+# =============================================================================
+
+def _skip(data, pos):
+    return _SPACE.match(data, pos).end()
+
+
+def _decode(raw):
+    if raw.startswith(b'\xfe\xff'):
+        return raw[2:].decode('utf-16-be', 'replace')
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return raw[3:].decode('utf-8', 'replace')
+    return raw.decode('latin-1')
+
+
+def _literal(data, pos):
+    out, depth = bytearray(), 1
+    pos += 1
+    while pos < len(data):
+        c = data[pos]
+        if c == ord('\\'):
+            pos += 1
+            c = data[pos]
+            if c in _ESCAPES:
+                out += _ESCAPES[c]
+            elif ord('0') <= c <= ord('7'):
+                digits = re.match(rb'[0-7]{1,3}', data[pos:pos + 3]).group()
+                out.append(int(digits, 8) & 0xFF)
+                pos += len(digits) - 1
+            elif c == ord('\r'):
+                if data[pos + 1:pos + 2] == b'\n':
+                    pos += 1
+            elif c != ord('\n'):
+                out.append(c)
+        elif c == ord('('):
+            depth += 1
+            out.append(c)
+        elif c == ord(')'):
+            depth -= 1
+            if depth == 0:
+                return _decode(bytes(out)), pos + 1
+            out.append(c)
+        else:
+            out.append(c)
+        pos += 1
+    raise ValueError('Unterminated string')
+
+
+def parse_value(data, pos=0):
+    """Parse one PDF object at pos -> (value, position after it)"""
+    pos = _skip(data, pos)
+    head = data[pos:pos + 2]
+    if head == b'<<':
+        result, pos = {}, pos + 2
+        while True:
+            pos = _skip(data, pos)
+            if data[pos:pos + 2] == b'>>':
+                return result, pos + 2
+            key, pos = parse_value(data, pos)
+            result[key], pos = parse_value(data, pos)
+    if head[:1] == b'[':
+        result, pos = [], pos + 1
+        while True:
+            pos = _skip(data, pos)
+            if data[pos:pos + 1] == b']':
+                return result, pos + 1
+            value, pos = parse_value(data, pos)
+            result.append(value)
+    if head[:1] == b'(':
+        return _literal(data, pos)
+    if head[:1] == b'<':
+        end = data.index(b'>', pos)
+        digits = re.sub(rb'\s', b'', data[pos + 1:end])
+        return _decode(bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode())), end + 1
+    if head[:1] == b'/':
+        match = _NAME.match(data, pos)
+        name = match.group(1)
+        if b'#' in name:
+            name = re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), name)
+        return Name(name.decode('latin-1')), match.end()
+    match = _NUMBER.match(data, pos)
+    if match:
+        ref = _REF.match(data, match.end())
+        if ref and b'.' not in match.group():
+            return Ref(int(match.group())), ref.end()
+        number = match.group()
+        return (float(number) if b'.' in number else int(number)), match.end()
+    for keyword, value in ((b'true', True), (b'false', False), (b'null', None)):
+        if data.startswith(keyword, pos):
+            return value, pos + len(keyword)
+    raise ValueError(f'Cannot parse PDF object at byte {pos}')
+
+
+def _stream(data, pos, info):
+    """Raw stream data following a dictionary that ends at pos"""
+    pos = _skip(data, pos)
+    if not data.startswith(b'stream', pos):
+        return None
+    pos += 6
+    pos += 2 if data[pos:pos + 2] == b'\r\n' else 1
+    length = info.get('Length')
+    if isinstance(length, int) and not isinstance(length, Ref):
+        return data[pos:pos + length]
+    return data[pos:data.index(b'endstream', pos)].rstrip(b'\r\n')
+
+
+def _unpack_object_stream(info, raw, objects):
+    if info.get('Filter') not in ('FlateDecode', ['FlateDecode']):
+        return
+    raw = zlib.decompress(raw)
+    first = info['First']
+    header = raw[:first].split()
+    offsets = [(int(header[i]), first + int(header[i + 1])) for i in range(0, min(len(header), 2 * info['N']), 2)]
+    for i, (number, start) in enumerate(offsets):
+        end = offsets[i + 1][1] if i + 1 < len(offsets) else len(raw)
+        if not _MAYBE_FIELD.search(raw, start, end):
+            continue
+        try:
+            objects[number] = parse_value(raw, start)[0]
+        except (ValueError, IndexError):
+            continue
+
+
+def read_objects(data):
+    """{object number: value}; later definitions win, as in incremental updates"""
+    objects = {}
+    for match in _OBJ.finditer(data):
+        end = data.find(b'endobj', match.end())
+        if not _MAYBE_FIELD.search(data, match.end(), end if end >= 0 else len(data)):
+            continue
+        try:
+            value, end = parse_value(data, match.end())
+        except (ValueError, IndexError):
+            continue
+        number = int(match.group(1))
+        if isinstance(value, dict) and value.get('Type') == 'ObjStm':
+            try:
+                _unpack_object_stream(value, _stream(data, end, value), objects)
+            except (ValueError, KeyError, TypeError, zlib.error):
+                pass
+            continue
+        objects[number] = value
+    return objects
+
+
+# =============================================================================
+# FORM FIELDS
+# =============================================================================
+
+def _full_name(field, objects):
+    parts = []
+    while isinstance(field, dict):
+        if 'T' in field:
+            parts.append(str(field['T']))
+        parent = field.get('Parent')
+        field = objects.get(parent) if isinstance(parent, Ref) else parent
+    return '.'.join(reversed(parts))
+
+
+def read_fields(path):
+    """{full field name: value} for every terminal field of a PDF
+
+    Text fields give their text ('' when empty), checkboxes True / False.
+    """
+    with open(path, 'rb') as f:
+        objects = read_objects(f.read())
+
+    fields = {}
+    for obj in objects.values():
+        if not isinstance(obj, dict) or 'T' not in obj:
+            continue
+        if any(isinstance(objects.get(kid), dict) and 'T' in objects[kid] for kid in obj.get('Kids', [])):
+            continue
+        value = obj.get('V', obj.get('AS'))
+        if isinstance(value, Ref):
+            value = objects.get(value)
+        if isinstance(value, Name):
+            value = value not in ('Off', '')
+        fields[_full_name(obj, objects)] = '' if value is None else value
+    return fields
+
+
+def parse_set(text):
+    """'10/60', '10 x 60 @8' or '10' -> (reps, load_kg, rpe)"""
+    match = _SET_VALUE.match(text.strip())
+    if not match:
+        return None
+    reps, load, rpe = match.groups()
+    return int(reps), float(load) if load else None, float(rpe) if rpe else None
+
+
+def records_from_fields(fields, athlete_id):
+    """Session-log records, one per (week, day) with any value filled in"""
+    days = {}
+    for name, value in fields.items():
+        match = _FIELD.match(name)
+        if not match or value in ('', False):
+            continue
+        week, day, field = int(match.group(1)), int(match.group(2)), match.group(3)
+        record = days.setdefault((week, day), {'athlete_id': athlete_id, 'week': week, 'day': day})
+        if value is True:
+            record.setdefault('completed', []).append(field)
+        elif field.startswith(('set.', 'set_lb.')):
+            unit, _, exercise_set = field.partition('.')
+            exercise, _, set_no = exercise_set.rpartition('.')
+            logged = parse_set(value)
+            if logged and set_no.isdigit():
+                reps, load_kg, rpe = logged
+                if load_kg and unit == 'set_lb':    # imperial tracker (generate_pdfs.py)
+                    load_kg = round(to_metric(load_kg, 'lb'), 1)
+                record.setdefault('sets', []).append({'exercise': exercise, 'set_no': int(set_no), 'reps': reps,
+                                                      'load_kg': load_kg, 'rpe': rpe})
+        elif field == 'weight_lb':
+            weight = _DECIMAL.search(value)
+            if weight:
+                record['weight_kg'] = round(to_metric(float(weight.group()), 'lb'), 1)
+        elif field in SESSION_COLUMNS:
+            record[field] = value.strip()
+    return [days[key] for key in sorted(days)]
+
+
+def extract_records(path, athlete_id=None):
+    if athlete_id is None:
+        athlete_id = os.path.basename(os.path.dirname(os.path.abspath(path)))
+    return records_from_fields(read_fields(path), athlete_id)
+
+
+def _extract_job(job):
+    path, athlete_id = job
+    try:
+        return path, extract_records(path, athlete_id), None
+    except (OSError, ValueError) as exc:
+        return path, [], str(exc)
+
+
+def find_pdfs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith('.pdf'):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def extract_many(paths, athlete_id=None, workers=None):
+    """Yield (path, records, error) for every PDF, parsed in a process pool"""
+    jobs = [(path, athlete_id) for path in find_pdfs(paths)]
+    if workers == 1 or len(jobs) < 2:
+        yield from map(_extract_job, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_extract_job, jobs, chunksize=max(1, min(64, len(jobs) // 32)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract filled-in form values into session-log records')
+    parser.add_argument('paths', nargs='+', help='PDF files or directories of returned PDFs')
+    parser.add_argument('-o', '--output', help='NDJSON output file (default: stdout)')
+    parser.add_argument('--ingest', metavar='DB', help='load the records straight into a session log')
+    parser.add_argument('--athlete', help='athlete id for every PDF (default: parent directory name)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    args = parser.parse_args()
+
+    records, errors, pdfs = [], 0, 0
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for path, path_records, error in extract_many(args.paths, args.athlete, args.workers):
+            pdfs += 1
+            if error:
+                errors += 1
+                print(f'Skipped: {path} ({error})', file=sys.stderr)
+            for record in path_records:
+                if args.ingest:
+                    records.append(record)
+                if args.output or not args.ingest:
+                    out.write(json.dumps(record) + '\n')
+    finally:
+        if args.output:
+            out.close()
+
+    if args.ingest:
+        from session_log import SessionLog
+        with SessionLog(args.ingest) as log:
+            batch = log.ingest_records(records, source=f'form_extract ({pdfs} PDFs)')
+        print(f'Ingested {len(records)} records from {pdfs} PDFs (batch {batch})', file=sys.stderr)
+    else:
+        print(f'Extracted {pdfs - errors} of {pdfs} PDFs', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
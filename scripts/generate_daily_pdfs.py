@@ -4,11 +4,16 @@ Generates individual PDF files for each day of each week
 """
 
 from fpdf import FPDF
-from datetime import datetime
 import os
 
+from bundle import archive_path, bundled
+from fonts import UnicodeFontMixin
+from graphics import GraphicsStateMixin
+from i18n import LocaleMixin, localized_filename, use_locale
+from layout import LayoutMixin, save, writes_files
 
-class DailyExercisePDF(FPDF):
+
+class DailyExercisePDF(LocaleMixin, UnicodeFontMixin, LayoutMixin, GraphicsStateMixin, FPDF):
     """Generate a PDF for a specific day's exercises"""
     
     def __init__(self, week_num, day_num, day_title):
@@ -34,11 +39,12 @@ class DailyExercisePDF(FPDF):
         self.set_y(-15)
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Page {self.page_no()} | Generated: {datetime.now().strftime("%Y-%m-%d")}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no()} | Generated: {self.render_date.strftime("%Y-%m-%d")}', 0, 0, 'C')
         
     def add_section_title(self, title, color=(30, 60, 114)):
         self.set_font('Helvetica', 'B', 12)
         self.set_text_color(*color)
+        self.begin_section(title)
         self.cell(0, 8, title, 0, 1, 'L')
         self.set_text_color(0, 0, 0)
         
@@ -91,7 +97,7 @@ class DailyExercisePDF(FPDF):
             self.set_fill_color(255, 253, 240) if fill else self.set_fill_color(255, 255, 255)
             self.cell(widths[0], 6, exercise, 1, 0, 'L', fill)
             self.cell(widths[1], 6, duration, 1, 0, 'C', fill)
-            self.cell(widths[2], 6, '[  ]', 1, 0, 'C', fill)
+            self.box_cell(widths[2], 6, 0, 'C', 1, fill)
             self.ln()
         self.ln(3)
         
@@ -113,7 +119,7 @@ class DailyExercisePDF(FPDF):
             self.set_fill_color(232, 245, 233) if fill else self.set_fill_color(255, 255, 255)
             self.cell(widths[0], 6, stretch, 1, 0, 'L', fill)
             self.cell(widths[1], 6, duration, 1, 0, 'C', fill)
-            self.cell(widths[2], 6, '[  ]', 1, 0, 'C', fill)
+            self.box_cell(widths[2], 6, 0, 'C', 1, fill)
             self.ln()
         self.ln(3)
         
@@ -131,12 +137,12 @@ class DailyExercisePDF(FPDF):
         
         for label, line_width in notes_fields:
             self.cell(50, 7, label, 0, 0, 'L')
-            self.cell(line_width, 7, '_' * (line_width // 2), 0, 1, 'L')
+            self.rule_cell(line_width, 7, 1)
             
     def add_checklist(self, items):
         self.set_font('Helvetica', '', 9)
         for item in items:
-            self.cell(8, 6, '[  ]', 0, 0, 'L')
+            self.box_cell(8, 6, 0, 'L')
             self.cell(0, 6, item, 0, 1, 'L')
         self.ln(3)
         
@@ -482,7 +488,7 @@ def create_week1_day7():
         'Goals for next week: _________________________________',
     ]
     for item in reflection_items:
-        pdf.cell(0, 7, item, 0, 1, 'L')
+        pdf.fill_in_cell(0, 7, item, 1)
     
     pdf.ln(5)
     pdf.add_section_title('Progress Check (End of Week 1)', (30, 60, 114))
@@ -792,7 +798,7 @@ def create_week2_day7():
         'Goals for Week 3: _________________________________',
     ]
     for item in reflection_items:
-        pdf.cell(0, 7, item, 0, 1, 'L')
+        pdf.fill_in_cell(0, 7, item, 1)
     
     pdf.ln(5)
     pdf.add_section_title('Progress Check (End of Week 2)', (30, 60, 114))
@@ -1038,9 +1044,9 @@ def create_week3_day5():
     
     pdf.add_section_title('Mid-Program Check-in', (23, 162, 184))
     pdf.set_font('Helvetica', '', 9)
-    pdf.cell(0, 6, '[  ] Great - progressing well', 0, 1, 'L')
-    pdf.cell(0, 6, '[  ] Good - some challenges but managing', 0, 1, 'L')
-    pdf.cell(0, 6, '[  ] Struggling - need to adjust', 0, 1, 'L')
+    pdf.fill_in_cell(0, 6, '[  ] Great - progressing well', 1)
+    pdf.fill_in_cell(0, 6, '[  ] Good - some challenges but managing', 1)
+    pdf.fill_in_cell(0, 6, '[  ] Struggling - need to adjust', 1)
     
     pdf.add_notes_section()
     return pdf
@@ -1111,7 +1117,7 @@ def create_week3_day7():
         'Goals for Week 4 (Final Foundation Week): _________________________________',
     ]
     for item in reflection_items:
-        pdf.cell(0, 7, item, 0, 1, 'L')
+        pdf.fill_in_cell(0, 7, item, 1)
     
     pdf.ln(5)
     pdf.add_section_title('Progress Check (End of Week 3)', (30, 60, 114))
@@ -1371,7 +1377,7 @@ def create_week4_day4():
     ]
     pdf.add_exercise_table(circuit)
     pdf.set_font('Helvetica', 'B', 9)
-    pdf.cell(0, 6, 'RECORD YOUR TOTAL CIRCUIT TIME: ____________', 0, 1, 'L')
+    pdf.fill_in_cell(0, 6, 'RECORD YOUR TOTAL CIRCUIT TIME: ____________', 1)
     pdf.ln(3)
     
     pdf.add_section_title('Cardio Test (30-40 min)', (220, 53, 69))
@@ -1380,7 +1386,7 @@ def create_week4_day4():
     pdf.cell(0, 6, 'Walk breaks as needed | Goal: 15-20 min jogging', 0, 1, 'L')
     pdf.ln(2)
     pdf.set_font('Helvetica', 'B', 9)
-    pdf.cell(0, 6, 'Total jogging time: _____ | Longest continuous jog: _____', 0, 1, 'L')
+    pdf.fill_in_cell(0, 6, 'Total jogging time: _____ | Longest continuous jog: _____', 1)
     pdf.ln(3)
     
     pdf.add_section_title('Progress Test - Record Your Results!', (40, 167, 69))
@@ -1448,7 +1454,7 @@ def create_week4_day5():
         'What are you most proud of? _______________',
     ]
     for q in questions:
-        pdf.cell(0, 7, q, 0, 1, 'L')
+        pdf.fill_in_cell(0, 7, q, 1)
     
     pdf.add_notes_section()
     return pdf
@@ -1517,7 +1523,7 @@ def create_week4_day6():
         pdf.cell(35, 6, duration, 1, 0, 'C', fill)
         pdf.cell(30, 6, '/10', 1, 0, 'C', fill)
         pdf.cell(30, 6, '/10', 1, 0, 'C', fill)
-        pdf.cell(25, 6, '[  ]', 1, 1, 'C', fill)
+        pdf.box_cell(25, 6, 1, 'C', 1, fill)
     
     pdf.add_notes_section()
     return pdf
@@ -1600,7 +1606,7 @@ def create_week4_day7():
         'What will you do differently in Phase 2? _________________________________',
     ]
     for r in reflections:
-        pdf.cell(0, 7, r, 0, 1, 'L')
+        pdf.fill_in_cell(0, 7, r, 1)
     
     pdf.ln(5)
     pdf.add_section_title('Phase 2 Preview: Building (Weeks 5-14)', (220, 53, 69))
@@ -1624,10 +1630,24 @@ def create_week4_day7():
     return pdf
 
 
-def generate_all_pdfs():
-    """Generate all PDF files for weeks 1-4"""
+BUNDLE_NAME = 'Daily_Workouts'    # archive of the Week_N/Day_M folders, next to them
+
+
+def generate_all_pdfs(locale=None, bundle=None):
+    """Generate all PDF files for weeks 1-4
+
+    With bundle (a bundle.py format) the Week_N/Day_M/exercises.pdf files
+    stream into one archive, scripts/Daily_Workouts.zip, instead.
+    """
     
     base_path = os.path.dirname(os.path.abspath(__file__))
+    with bundled(os.path.join(base_path, BUNDLE_NAME), bundle, root=base_path) as archive:
+        _generate_weeks(base_path, locale)
+    if archive:
+        print(f'Bundled: {archive.count} PDFs in {archive_path(os.path.join(base_path, BUNDLE_NAME), bundle)}')
+
+
+def _generate_weeks(base_path, locale):
     
     # Week 1
     week1_creators = [
@@ -1662,20 +1682,21 @@ def generate_all_pdfs():
     
     for week_num, creators in all_weeks:
         week_folder = os.path.join(base_path, f'Week_{week_num}')
-        os.makedirs(week_folder, exist_ok=True)
         
         for day_num, creator in enumerate(creators, 1):
             day_folder = os.path.join(week_folder, f'Day_{day_num}')
-            os.makedirs(day_folder, exist_ok=True)
+            if writes_files():
+                os.makedirs(day_folder, exist_ok=True)
             
-            pdf = creator()
-            pdf_path = os.path.join(day_folder, 'exercises.pdf')
-            pdf.output(pdf_path)
+            with use_locale(locale):
+                pdf = creator()
+            pdf_path = os.path.join(day_folder, localized_filename('exercises.pdf', locale))
+            save(pdf, pdf_path)
             print(f'Generated: Week {week_num} Day {day_num} - {pdf_path}')
             
             # Remove the markdown file if it exists
             md_path = os.path.join(day_folder, 'exercises.md')
-            if os.path.exists(md_path):
+            if os.path.exists(md_path) and writes_files():
                 os.remove(md_path)
                 print(f'Removed: {md_path}')
     
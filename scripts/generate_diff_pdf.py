@@ -0,0 +1,122 @@
+"""
+Program Diff PDF
+One compact page of what changes between two weeks (program_diff.py):
+
+    python program_diff.py 1 2 --pdf Week1_to_Week2.pdf
+
+Modified exercises show their changed fields as 'before -> after' on a
+highlighted cell; added and removed exercises follow in green and red.
+"""
+
+from fpdf import FPDF
+
+from fonts import UnicodeFontMixin
+from graphics import GraphicsStateMixin
+from i18n import LocaleMixin
+from layout import LayoutMixin, save
+from program_diff import FIELDS, PRE_WORKOUT_DAY
+from units import Measured, Quantity, UnitsMixin
+
+
+HEADERS = ['Day', 'Exercise', 'Sets', 'Reps', 'Rest', 'Load']
+WIDTHS = [14, 66, 24, 32, 26, 28]
+ROW_HEIGHT = 5.5
+CHANGED = (255, 243, 205)
+ADDED = (212, 237, 218)
+REMOVED = (248, 215, 218)
+
+
+def _value(field, value):
+    if value is None:
+        return '-'
+    if field == 'load_kg':
+        return Measured('{}', Quantity(value, 'kg', places=None))
+    return str(value)
+
+
+def _change(field, before, after):
+    if field == 'load_kg' and before is not None and after is not None:
+        return Measured('{} -> {}', Quantity(before, 'kg', places=None), Quantity(after, 'kg', places=None))
+    return f'{_value(field, before)} -> {_value(field, after)}'
+
+
+class ProgramDiffPDF(UnitsMixin, LocaleMixin, UnicodeFontMixin, LayoutMixin, GraphicsStateMixin, FPDF):
+    """Week-over-week program changes on one page"""
+
+    def __init__(self, report):
+        super().__init__()
+        self.report = report
+        self.set_auto_page_break(auto=True, margin=15)
+
+    def header(self):
+        self.set_font('Helvetica', 'B', 16)
+        self.set_text_color(30, 60, 114)
+        self.cell(0, 9, f'PROGRAM CHANGES: WEEK {self.report["from_week"]} TO WEEK {self.report["to_week"]}',
+                  0, 1, 'C')
+        if self.report.get('athlete_id'):
+            self.set_font('Helvetica', 'I', 10)
+            self.set_text_color(100, 100, 100)
+            self.cell(0, 6, str(self.report['athlete_id']), 0, 1, 'C')
+        self.ln(2)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Helvetica', 'I', 8)
+        self.set_text_color(128, 128, 128)
+        self.cell(0, 10, f'Page {self.page_no()} | Generated: {self.render_date.strftime("%Y-%m-%d")}', 0, 0, 'C')
+
+    def add_summary(self):
+        report = self.report
+        self.set_font('Helvetica', '', 10)
+        self.set_text_color(0, 0, 0)
+        self.cell(0, 6, f'{len(report["modified"])} modified, {len(report["added"])} added, '
+                        f'{len(report["removed"])} removed (Pre: pre-workout protocol, every training day)',
+                  0, 1, 'L')
+        self.ln(2)
+
+    def add_table_header(self):
+        self.set_font('Helvetica', 'B', 8)
+        self.set_fill_color(30, 60, 114)
+        self.set_text_color(255, 255, 255)
+        for header, width in zip(HEADERS, WIDTHS):
+            self.cell(width, 7, header, 1, 0, 'C', True)
+        self.ln()
+        self.set_text_color(0, 0, 0)
+
+    def add_row(self, day, exercise, cells):
+        """cells: (text, fill colour or None) per field"""
+        self.set_font('Helvetica', '', 8)
+        self.cell(WIDTHS[0], ROW_HEIGHT, 'Pre' if day == PRE_WORKOUT_DAY else str(day), 1, 0, 'C')
+        self.cell(WIDTHS[1], ROW_HEIGHT, exercise, 1, 0, 'L')
+        for (text, fill), width in zip(cells, WIDTHS[2:]):
+            if fill:
+                self.set_fill_color(*fill)
+            self.cell(width, ROW_HEIGHT, text, 1, 0, 'C', bool(fill))
+        self.ln()
+
+    def create_diff(self):
+        self.add_page()
+        self.begin_section('PROGRAM CHANGES')
+        self.add_summary()
+        self.add_table_header()
+        for change in self.report['modified']:
+            changes = change['changes']
+            self.add_row(change['day'], change['exercise'],
+                         [(_change(field, *changes[field]), CHANGED) if field in changes else ('', None)
+                          for field in FIELDS])
+        for kind, fill in (('added', ADDED), ('removed', REMOVED)):
+            for entry in self.report[kind]:
+                self.add_row(entry['day'], entry['exercise'],
+                             [(_value(field, entry[field]), fill) for field in FIELDS])
+
+
+def create_diff_pdf(report):
+    pdf = ProgramDiffPDF(report)
+    pdf.create_diff()
+    return pdf
+
+
+def write_diff_pdf(report, path):
+    """Write a program_diff report as a PDF and return its path"""
+    save(create_diff_pdf(report), path)
+    return path
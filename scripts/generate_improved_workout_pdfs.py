@@ -44,7 +44,8 @@ KEY PRINCIPLES APPLIED (META-ANALYSIS BASED):
 
 3. PROGRESSIVE OVERLOAD: Conservative 2.5% weekly increase
    - Age 38 requires slower progression to prevent injury
-   - Deload every 4th week (this program = build weeks)
+   - Mesocycles of 3 build weeks, a peak week and a deload week
+     (periodization.py; weeks 1-4 are the first block, week 5 deloads)
    
 4. REST INTERVALS (age-adjusted):
    - Compound movements: 2-3 minutes (full ATP recovery)
@@ -67,19 +68,57 @@ KEY PRINCIPLES APPLIED (META-ANALYSIS BASED):
 """
 
 from fpdf import FPDF
-from datetime import datetime
+from datetime import date
+from concurrent.futures import as_completed
+from contextlib import ExitStack
+from functools import partial
 import os
+import shutil
+import time
 
+from workout_program import (
+    get_upper_push_exercises, get_lower_body_exercises, get_upper_pull_exercises,
+    get_full_body_exercises, get_upper_stretches, get_lower_stretches,
+    get_full_body_stretches, get_recovery_stretches,
+    get_pushup_progression, get_pullup_progression, get_squat_progression,
+    WEEKLY_SPLIT, TRAINING_DURATIONS, MAIN_WORKOUT_NOTE, get_split_day, day_subtitle,
+)
+from workout_document import (
+    duration_section, pre_workout_section, main_workout_section, cardio_section,
+    cooldown_section, tracking_section, recovery_section,
+    build_training_day, build_recovery_day, build_split_day,
+)
+from athletes import safe_filename
+from batch import BACKOFF, RETRIES, Journal, run_fingerprint
+from bundle import Bundle, archive_path, bundled
+from contraindications import conditions_for
+from fonts import UnicodeFontMixin
+from graphics import GraphicsStateMixin
+from i18n import LocaleMixin, DEFAULT_LOCALE, LOCALES, use_locale, precompile
+from layout import (LayoutMixin, save, dry_run, collect, add_reports, dry_running, capture, capturing,
+                    capture_sink, collect_files, add_files, writes_files)
+from pdf_forms import FormFieldsMixin
+from periodization import active_mesocycle, precompute, use_mesocycle
+from progression import reported_pain
+from scheduler import logged_days, moved_days, read_manifest, schedule_week, week_start, write_manifest
+from store import OutputStore, document_key, stored
+from substitution import get_index
+from units import UnitsMixin, DEFAULT_SYSTEM, formatter, use_units
+from workers import get_pool
 
-class EnhancedWorkoutPDF(FPDF):
-    """Generate evidence-based workout PDFs"""
+
+class EnhancedWorkoutPDF(FormFieldsMixin, UnitsMixin, LocaleMixin, UnicodeFontMixin, LayoutMixin,
+                         GraphicsStateMixin, FPDF):
+    """Generate evidence-based workout PDFs with fillable tracking fields"""
     
-    def __init__(self, week_num, day_num, day_title, focus_area):
+    def __init__(self, week_num, day_num, day_title, focus_area, day_date=None):
         super().__init__()
         self.week_num = week_num
         self.day_num = day_num
+        self.field_prefix = f'w{week_num}d{day_num}'
         self.day_title = day_title
         self.focus_area = focus_area
+        self.day_date = day_date
         self.set_auto_page_break(auto=True, margin=15)
         
     def header(self):
@@ -91,194 +130,190 @@ class EnhancedWorkoutPDF(FPDF):
         self.cell(0, 8, self.day_title, 0, 1, 'C')
         self.set_font('Helvetica', 'I', 10)
         self.set_text_color(100, 100, 100)
-        self.cell(0, 6, f'{self.focus_area} | Age 38 Optimized | Body Recomposition (95kg -> 80kg)', 0, 1, 'C')
+        self.cell(0, 6, day_subtitle(self.focus_area), 0, 1, 'C')
+        if self.day_date:    # scheduled on the calendar (scheduler.py)
+            self.set_font('Helvetica', 'B', 10)
+            self.cell(0, 6, self.day_date, 0, 1, 'C')
         self.ln(3)
         
     def footer(self):
         self.set_y(-15)
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Page {self.page_no()} | Total Duration: 2-3 Hours | {datetime.now().strftime("%Y-%m-%d")}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no()} | Total Duration: 2-3 Hours | {self.render_date.strftime("%Y-%m-%d")}', 0, 0, 'C')
         
     def add_section_title(self, title, color=(30, 60, 114)):
         self.set_font('Helvetica', 'B', 12)
         self.set_text_color(*color)
+        self.begin_section(title)
         self.cell(0, 8, title, 0, 1, 'L')
         self.set_draw_color(*color)
         self.line(10, self.get_y(), 200, self.get_y())
         self.ln(3)
         self.set_text_color(0, 0, 0)
         
-    def add_duration_box(self, pre_workout, main_workout, post_workout):
-        self.set_fill_color(40, 167, 69)
-        self.set_text_color(255, 255, 255)
-        self.set_font('Helvetica', 'B', 10)
-        self.cell(63, 8, f'Pre-Workout: {pre_workout}', 1, 0, 'C', True)
-        self.set_fill_color(30, 60, 114)
-        self.cell(64, 8, f'Main: {main_workout}', 1, 0, 'C', True)
-        self.set_fill_color(23, 162, 184)
-        self.cell(63, 8, f'Post-Workout: {post_workout}', 1, 1, 'C', True)
-        self.set_text_color(0, 0, 0)
-        self.ln(5)
-        
     def add_science_note(self, note):
         self.set_fill_color(255, 243, 205)
         self.set_draw_color(255, 193, 7)
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(133, 100, 4)
-        self.multi_cell(0, 5, f'SCIENCE: {note}', 1, 'L', True)
+        self.multi_cell(0, 5, f'SCIENCE: {self.format_units(note)}', 1, 'L', True)
         self.set_text_color(0, 0, 0)
         self.ln(3)
         
+    def add_table_header(self, headers, widths, color):
+        self.set_font('Helvetica', 'B', 8)
+        self.set_fill_color(*color)
+        self.set_text_color(255, 255, 255)
+        for i, header in enumerate(headers):
+            self.cell(widths[i], 7, header, 1, 0, 'C', True)
+        self.ln()
+        
+    def wrapped_cell(self, w, h, txt, align='L', fill=False):
+        """Bordered table cell whose text goes on two smaller lines when one is too narrow
+        (program notes with a pain note added, contraindications.py)"""
+        size = self.font_size_pt
+        if self.get_string_width(self.translate(self.format_units(txt))) <= w - 2 * self.c_margin:
+            self.cell(w, h, txt, 1, 0, align, fill)
+            return
+        x, y = self.get_x(), self.get_y()
+        self.cell(w, h, '', 1, 0, align, fill)
+        self.set_font_size(size - 1)
+        self.set_xy(x, y + 0.5)
+        self.multi_cell(w, (h - 1) / 2, txt, 0, align)
+        self.set_font_size(size)
+        self.set_xy(x + w, y)
+
+    def add_bullets(self, items):
+        for item in items:
+            self.cell(5, 5, '*', 0, 0, 'L')
+            self.cell(0, 5, item, 0, 1, 'L')
+            
+    # -------------------------------------------------------------------------
+    # Section builders (public API, kept for existing callers)
+    # -------------------------------------------------------------------------
+    
+    def add_duration_box(self, pre_workout, main_workout, post_workout):
+        self.render_section(duration_section(pre_workout, main_workout, post_workout))
+        
     def add_pre_workout_protocol(self, week_num):
         """User-specified foundation work before main workout - OPTIMIZED FOR AGE 38"""
-        self.add_section_title('PRE-WORKOUT FOUNDATION PROTOCOL (30-40 min)', (40, 167, 69))
-        self.add_science_note('At age 38, extended sport-specific warm-ups are CRITICAL. Research shows: '
-                             '1) Reduces injury risk by 50%+, 2) Improves neural drive and force production, '
-                             '3) Increases joint synovial fluid for better mobility. Never skip!')
+        self.render_section(pre_workout_section(week_num))
         
-        # Progressive reps based on week - OPTIMIZED for 36 pushups, 15-20 pullups, 36 weighted squats
-        pushup_sets = self._get_pushup_progression(week_num)
-        pullup_sets = self._get_pullup_progression(week_num)
-        squat_sets = self._get_squat_progression(week_num)
+    def _get_pushup_progression(self, week):
+        return get_pushup_progression(week)
         
-        widths = [80, 30, 25, 55]
-        headers = ['Exercise', 'Sets x Reps', 'Rest', 'Age 38 Progression Notes']
+    def _get_pullup_progression(self, week):
+        return get_pullup_progression(week)
         
-        self.set_font('Helvetica', 'B', 8)
+    def _get_squat_progression(self, week):
+        return get_squat_progression(week)
+        
+    def add_main_workout(self, exercises, science_note):
+        self.render_section(main_workout_section(exercises, science_note))
+        
+    def add_post_workout_cardio(self, week_num):
+        """2KM walk + 1KM recovery walk - OPTIMIZED for body recomposition at 95kg"""
+        self.render_section(cardio_section(week_num))
+        
+    def add_stretch_cooldown(self, stretches):
+        self.render_section(cooldown_section(stretches))
+        
+    def add_tracking_section(self):
+        self.render_section(tracking_section())
+        
+    def add_recovery_day(self, activities, stretches, tips):
+        """For rest/mobility days"""
+        self.render_section(recovery_section(activities, stretches, tips))
+        
+    # -------------------------------------------------------------------------
+    # Document model rendering (see workout_document.py)
+    # -------------------------------------------------------------------------
+    
+    def render_document(self, document):
+        self.add_page()
+        for section in document['sections']:
+            self.render_section(section)
+            
+    def render_section(self, section):
+        getattr(self, '_render_' + section['type'])(section)
+        
+    def _render_page_break(self, section):
+        self.add_page()
+        
+    def _render_duration(self, section):
+        (pre_label, pre_workout), (main_label, main_workout), (post_label, post_workout) = section['cells']
         self.set_fill_color(40, 167, 69)
         self.set_text_color(255, 255, 255)
-        for i, header in enumerate(headers):
-            self.cell(widths[i], 7, header, 1, 0, 'C', True)
-        self.ln()
-        
-        self.set_font('Helvetica', '', 8)
+        self.set_font('Helvetica', 'B', 10)
+        self.cell(63, 8, f'{pre_label}: {pre_workout}', 1, 0, 'C', True)
+        self.set_fill_color(30, 60, 114)
+        self.cell(64, 8, f'{main_label}: {main_workout}', 1, 0, 'C', True)
+        self.set_fill_color(23, 162, 184)
+        self.cell(63, 8, f'{post_label}: {post_workout}', 1, 1, 'C', True)
         self.set_text_color(0, 0, 0)
+        self.ln(5)
         
-        pre_exercises = [
-            ('1. PUSH-UPS (Full ROM)', pushup_sets, '30-45s', 'Chest to floor, protect shoulders'),
-            ('2. PULL-UPS (Mixed Grip OK)', pullup_sets, '60-90s', 'Dead hang, control eccentric'),
-            ('3. WEIGHTED SQUATS (Goblet)', squat_sets, '45-60s', 'Below parallel, knee health'),
-        ]
+    def _render_pre_workout(self, section):
+        self.add_section_title(section['title'], (40, 167, 69))
+        self.add_science_note(section['note'])
         
-        for i, (exercise, sets, rest, notes) in enumerate(pre_exercises):
+        widths = [80, 30, 25, 55]
+        self.add_table_header(section['headers'], widths, (40, 167, 69))
+        
+        self.set_font('Helvetica', '', 8)
+        self.set_text_color(0, 0, 0)
+        for i, (exercise, sets, rest, notes) in enumerate(section['rows']):
             fill = i % 2 == 0
             self.set_fill_color(232, 245, 233) if fill else self.set_fill_color(255, 255, 255)
             self.cell(widths[0], 8, exercise, 1, 0, 'L', fill)
             self.cell(widths[1], 8, sets, 1, 0, 'C', fill)
             self.cell(widths[2], 8, rest, 1, 0, 'C', fill)
-            self.cell(widths[3], 8, notes, 1, 0, 'L', fill)
+            self.wrapped_cell(widths[3], 8, notes, 'L', fill)
             self.ln()
         self.ln(3)
         
-        # Form cues - UPDATED for age 38 joint protection
         self.set_font('Helvetica', 'B', 9)
-        self.cell(0, 6, 'FORM CUES (AGE 38 JOINT PROTECTION):', 0, 1, 'L')
+        self.cell(0, 6, section['cues_title'], 0, 1, 'L')
         self.set_font('Helvetica', '', 8)
-        cues = [
-            'Push-ups: Hands slightly wider than shoulders, elbows at 45deg (not 90deg flared)',
-            'Pull-ups: Full dead hang, controlled descent (3s negative), vary grip weekly',
-            'Squats: Sit back into hips FIRST, knees track toes, stop if knee pain'
-        ]
-        for cue in cues:
-            self.cell(5, 5, '*', 0, 0, 'L')
-            self.cell(0, 5, cue, 0, 1, 'L')
+        self.add_bullets(section['cues'])
         self.ln(3)
         
-    def _get_pushup_progression(self, week):
-        # Target: 36 pushups - conservative progression for age 38
-        progressions = {
-            1: '3 x 12 = 36',      # Baseline: achieve 36 total
-            2: '4 x 10 = 40',      # Volume increase
-            3: '3 x 14 = 42',      # Rep increase per set
-            4: '4 x 12 = 48'       # Peak week
-        }
-        return progressions.get(week, '3 x 12 = 36')
-        
-    def _get_pullup_progression(self, week):
-        # Target: 15-20 pullups - realistic for 95kg at age 38
-        progressions = {
-            1: '3 x 5 = 15',       # Baseline: start conservative
-            2: '3 x 6 = 18',       # Add 1 rep per set
-            3: '4 x 5 = 20',       # Add a set
-            4: '3 x 7 = 21'        # Peak: rep quality over quantity
-        }
-        return progressions.get(week, '3 x 5 = 15')
-        
-    def _get_squat_progression(self, week):
-        # Target: 36 weighted squats - progressive loading for 180cm/95kg
-        progressions = {
-            1: '3 x 12 = 36 @ 12kg',   # Start moderate at 95kg BW
-            2: '3 x 12 = 36 @ 14kg',   # 2kg increment
-            3: '3 x 12 = 36 @ 16kg',   # 2kg increment
-            4: '4 x 10 = 40 @ 18kg'    # Volume + load peak
-        }
-        return progressions.get(week, '3 x 12 = 36 @ 12kg')
-        
-    def add_main_workout(self, exercises, science_note):
-        self.add_section_title('MAIN WORKOUT (60-75 min)', (30, 60, 114))
-        self.add_science_note(science_note)
+    def _render_main_workout(self, section):
+        self.add_section_title(section['title'], (30, 60, 114))
+        self.add_science_note(section['note'])
         
         widths = [55, 15, 25, 20, 75]
-        headers = ['Exercise', 'Sets', 'Reps/Tempo', 'Rest', 'Technique Notes']
-        
-        self.set_font('Helvetica', 'B', 8)
-        self.set_fill_color(30, 60, 114)
-        self.set_text_color(255, 255, 255)
-        for i, header in enumerate(headers):
-            self.cell(widths[i], 7, header, 1, 0, 'C', True)
-        self.ln()
+        self.add_table_header(section['headers'], widths, (30, 60, 114))
         
         self.set_font('Helvetica', '', 8)
         self.set_text_color(0, 0, 0)
-        for i, exercise in enumerate(exercises):
+        for i, exercise in enumerate(section['rows']):
             fill = i % 2 == 0
             self.set_fill_color(240, 248, 255) if fill else self.set_fill_color(255, 255, 255)
             for j, value in enumerate(exercise):
-                align = 'L' if j in [0, 4] else 'C'
-                self.cell(widths[j], 7, str(value), 1, 0, align, fill)
+                if j == 4:
+                    self.wrapped_cell(widths[j], 7, value, 'L', fill)
+                else:
+                    self.cell(widths[j], 7, value, 1, 0, 'L' if j == 0 else 'C', fill)
             self.ln()
         self.ln(3)
         
-    def add_post_workout_cardio(self, week_num):
-        """2KM walk + 1KM recovery walk - OPTIMIZED for body recomposition at 95kg"""
-        self.add_section_title('POST-WORKOUT CARDIO (35-45 min)', (23, 162, 184))
-        self.add_science_note('BODY RECOMPOSITION KEY: Post-workout LISS cardio maximizes fat oxidation '
-                             'without impairing muscle protein synthesis. At 95kg, walking burns ~85-95 kcal/km. '
-                             'This 3km adds ~270 kcal expenditure toward your 500-700 kcal deficit!')
-        
-        # Progressive walking pace - ADJUSTED for 95kg body weight
-        pace_progression = {
-            1: ('Moderate', '13-14 min/km', '15-16 min/km'),   # Conservative start
-            2: ('Moderate+', '12-13 min/km', '14-15 min/km'),  # Slight increase
-            3: ('Brisk', '11-12 min/km', '13-14 min/km'),      # Building
-            4: ('Brisk+', '10-11 min/km', '12-13 min/km')      # Peak pace
-        }
-        
-        pace, main_pace, recovery_pace = pace_progression.get(week_num, ('Moderate', '13-14 min/km', '15-16 min/km'))
+    def _render_cardio(self, section):
+        self.add_section_title(section['title'], (23, 162, 184))
+        self.add_science_note(section['note'])
         
         widths = [70, 40, 40, 40]
-        headers = ['Activity', 'Distance', 'Target Pace', 'Calories Burned']
-        
-        self.set_font('Helvetica', 'B', 8)
-        self.set_fill_color(23, 162, 184)
-        self.set_text_color(255, 255, 255)
-        for i, header in enumerate(headers):
-            self.cell(widths[i], 7, header, 1, 0, 'C', True)
-        self.ln()
+        self.add_table_header(section['headers'], widths, (23, 162, 184))
         
         self.set_font('Helvetica', '', 8)
         self.set_text_color(0, 0, 0)
         
-        cardio = [
-            (f'1. Main Walk ({pace})', '2.0 km', main_pace, '~170-190 kcal'),
-            ('2. Recovery Walk (Easy)', '1.0 km', recovery_pace, '~85-95 kcal'),
-            ('TOTAL', '3.0 km', '35-45 min', '~255-285 kcal'),
-        ]
-        
-        for i, (activity, distance, target_pace, cal) in enumerate(cardio):
-            fill = i % 2 == 0
-            if i == 2:  # Total row
+        rows = list(section['rows']) + [section['total']]
+        for i, (activity, distance, target_pace, cal) in enumerate(rows):
+            total = i == len(rows) - 1
+            fill = True if total else i % 2 == 0
+            if total:
                 self.set_fill_color(23, 162, 184)
                 self.set_text_color(255, 255, 255)
                 self.set_font('Helvetica', 'B', 8)
@@ -286,364 +321,470 @@ class EnhancedWorkoutPDF(FPDF):
                 self.set_fill_color(209, 236, 241) if fill else self.set_fill_color(255, 255, 255)
                 self.set_text_color(0, 0, 0)
                 self.set_font('Helvetica', '', 8)
-            self.cell(widths[0], 7, activity, 1, 0, 'L', True if i == 2 else fill)
-            self.cell(widths[1], 7, distance, 1, 0, 'C', True if i == 2 else fill)
-            self.cell(widths[2], 7, target_pace, 1, 0, 'C', True if i == 2 else fill)
-            self.cell(widths[3], 7, cal, 1, 0, 'C', True if i == 2 else fill)
+            self.cell(widths[0], 7, activity, 1, 0, 'L', fill)
+            self.cell(widths[1], 7, distance, 1, 0, 'C', fill)
+            self.cell(widths[2], 7, target_pace, 1, 0, 'C', fill)
+            self.cell(widths[3], 7, cal, 1, 0, 'C', fill)
             self.ln()
         
         self.set_text_color(0, 0, 0)
         self.ln(3)
         
-        # Tips - BODY RECOMP FOCUSED
         self.set_font('Helvetica', 'B', 9)
-        self.cell(0, 6, 'BODY RECOMPOSITION WALKING TIPS (95kg -> 80kg):', 0, 1, 'L')
+        self.cell(0, 6, section['tips_title'], 0, 1, 'L')
         self.set_font('Helvetica', '', 8)
-        tips = [
-            'Walking at 95kg burns 30% MORE calories than at 80kg - use this advantage!',
-            'Post-workout = peak fat oxidation window (glycogen depleted)',
-            'Add inclines or stairs when available for +50% calorie burn',
-            'Track steps: aim for 10,000+/day (including this walk)'
-        ]
-        for tip in tips:
-            self.cell(5, 5, '*', 0, 0, 'L')
-            self.cell(0, 5, tip, 0, 1, 'L')
+        self.add_bullets(section['tips'])
         self.ln(2)
         
-    def add_stretch_cooldown(self, stretches):
-        self.add_section_title('COOL-DOWN STRETCHING (10-15 min)', (100, 50, 100))
+    def _render_cooldown(self, section):
+        self.add_section_title(section['title'], (100, 50, 100))
         
         widths = [100, 40, 50]
-        headers = ['Stretch', 'Duration', 'Done']
-        
-        self.set_font('Helvetica', 'B', 8)
-        self.set_fill_color(100, 50, 100)
-        self.set_text_color(255, 255, 255)
-        for i, header in enumerate(headers):
-            self.cell(widths[i], 7, header, 1, 0, 'C', True)
-        self.ln()
+        self.add_table_header(section['headers'], widths, (100, 50, 100))
         
         self.set_font('Helvetica', '', 8)
         self.set_text_color(0, 0, 0)
-        for i, (stretch, duration) in enumerate(stretches):
+        for i, (stretch, duration) in enumerate(section['rows']):
             fill = i % 2 == 0
             self.set_fill_color(245, 240, 250) if fill else self.set_fill_color(255, 255, 255)
             self.cell(widths[0], 6, stretch, 1, 0, 'L', fill)
             self.cell(widths[1], 6, duration, 1, 0, 'C', fill)
-            self.cell(widths[2], 6, '[  ]', 1, 0, 'C', fill)
+            self.checkbox_cell(f'{self.field_prefix}.cooldown.{i + 1}', widths[2], 6, 0, 'C', 1, fill)
             self.ln()
         self.ln(2)
         
-    def add_tracking_section(self):
-        self.add_section_title('SESSION TRACKING', (100, 100, 100))
+    def _render_tracking(self, section):
+        self.add_section_title(section['title'], (100, 100, 100))
         self.set_font('Helvetica', '', 9)
         
-        fields = [
-            ('Date:', 50),
-            ('Start Time:', 30),
-            ('End Time:', 30),
-            ('Energy Level (1-10):', 20),
-            ('Workout Quality (1-10):', 20),
-            ('Sleep Last Night (hrs):', 20),
-            ('Pain/Discomfort (location):', 80),
-            ('Key Wins Today:', 100),
-        ]
-        
-        for label, line_width in fields:
+        for label, line_width, name in section['fields']:
             self.cell(55, 6, label, 0, 0, 'L')
-            self.cell(line_width, 6, '_' * (line_width // 3), 0, 1, 'L')
+            self.text_field_cell(f'{self.field_prefix}.{name}', line_width, 6, 1)
             
-    def add_recovery_day(self, activities, stretches, tips):
-        """For rest/mobility days"""
-        self.add_section_title('ACTIVE RECOVERY PROTOCOL', (40, 167, 69))
-        self.add_science_note('Active recovery with light movement promotes blood flow, reduces DOMS, '
-                             'and maintains mobility without impeding muscle repair.')
+    def _render_recovery(self, section):
+        self.add_section_title(section['title'], (40, 167, 69))
+        self.add_science_note(section['note'])
         
         self.set_font('Helvetica', 'B', 9)
-        self.cell(0, 6, 'RECOMMENDED ACTIVITIES (choose 1-2):', 0, 1, 'L')
+        self.cell(0, 6, section['activities_title'], 0, 1, 'L')
         self.set_font('Helvetica', '', 8)
-        for activity in activities:
-            self.cell(5, 5, '*', 0, 0, 'L')
-            self.cell(0, 5, activity, 0, 1, 'L')
+        self.add_bullets(section['activities'])
         self.ln(3)
         
-        self.add_section_title('MOBILITY ROUTINE', (23, 162, 184))
+        self.add_section_title(section['routine_title'], (23, 162, 184))
         widths = [100, 40, 50]
-        headers = ['Movement/Stretch', 'Duration', 'Done']
-        
-        self.set_font('Helvetica', 'B', 8)
-        self.set_fill_color(23, 162, 184)
-        self.set_text_color(255, 255, 255)
-        for i, header in enumerate(headers):
-            self.cell(widths[i], 7, header, 1, 0, 'C', True)
-        self.ln()
+        self.add_table_header(section['headers'], widths, (23, 162, 184))
         
         self.set_font('Helvetica', '', 8)
         self.set_text_color(0, 0, 0)
-        for i, (stretch, duration) in enumerate(stretches):
+        for i, (stretch, duration) in enumerate(section['rows']):
             fill = i % 2 == 0
             self.set_fill_color(209, 236, 241) if fill else self.set_fill_color(255, 255, 255)
             self.cell(widths[0], 6, stretch, 1, 0, 'L', fill)
             self.cell(widths[1], 6, duration, 1, 0, 'C', fill)
-            self.cell(widths[2], 6, '[  ]', 1, 0, 'C', fill)
+            self.checkbox_cell(f'{self.field_prefix}.mobility.{i + 1}', widths[2], 6, 0, 'C', 1, fill)
             self.ln()
         self.ln(3)
         
-        self.add_section_title('RECOVERY TIPS', (100, 100, 100))
+        self.add_section_title(section['tips_title'], (100, 100, 100))
         self.set_font('Helvetica', '', 8)
-        for tip in tips:
-            self.cell(5, 5, '*', 0, 0, 'L')
-            self.cell(0, 5, tip, 0, 1, 'L')
+        self.add_bullets(section['tips'])
         self.ln(2)
 
 
 # =============================================================================
-# WORKOUT CONTENT FOR EACH DAY
+# GENERATE ALL PDFS
 # =============================================================================
 
-def get_upper_push_exercises(week):
-    """Push-focused upper body: Chest, Shoulders, Triceps
-    META-ANALYSIS OPTIMIZED: MWS (5-9 sets) to HWS (10+ sets) per muscle group
-    TOTAL WEEKLY CHEST: ~16 sets | SHOULDERS: ~12 sets | TRICEPS: ~10 sets
+def create_document_pdf(document, locale=None, units=None):
+    """Render a day document (workout_document.py) in the given locale and unit system"""
+    with use_locale(locale), use_units(units):
+        pdf = EnhancedWorkoutPDF(document['week'], document['day'], document['title'], document['focus'],
+                                 document.get('date'))
+    pdf.render_document(document)
+    return pdf
+
+
+def create_training_day(week, day, title, focus, exercises_func, stretches, prescriptions=None, locale=None,
+                        units=None):
+    return create_document_pdf(build_training_day(week, day, title, focus, exercises_func(week), stretches,
+                                                   MAIN_WORKOUT_NOTE, prescriptions), locale, units)
+
+def create_recovery_day(week, day, title, locale=None, units=None):
+    return create_document_pdf(build_recovery_day(week, day, title), locale, units)
+
+
+def create_split_day(week, day, title, focus, kind, exercises_func, stretches_func, prescriptions=None,
+                     locale=None, units=None):
+    """Build the PDF for one entry of WEEKLY_SPLIT
+
+    prescriptions (progression.ProgressionEngine.prescriptions) replace the
+    fixed progression with the athlete's adaptive one.
     """
-    base = [
-        ('Barbell Bench Press', '4', '6-8 @2-1-2', '3min', 'Heavy compound - protect shoulders at 38'),
-        ('Incline Dumbbell Press', '4', '8-10 @2-1-2', '2min', '30deg angle, full stretch, joint-safe'),
-        ('Cable Flyes (Low to High)', '3', '12-15 @2-0-2', '60s', 'Constant tension, no joint stress'),
-        ('Seated DB Shoulder Press', '4', '8-10 @2-1-2', '2min', 'Neutral grip option for shoulders'),
-        ('Lateral Raises', '3', '12-15 @2-0-2', '60s', 'Light weight, control (shoulder health)'),
-        ('Rope Tricep Pushdowns', '3', '12-15 @2-0-2', '60s', 'Elbows pinned, full extension'),
-        ('Overhead Tricep Extension', '3', '12-15 @2-0-2', '60s', 'Stretch position - elbow care'),
-        ('Face Pulls', '3', '15-20 @2-0-2', '45s', 'Rear delt + rotator cuff health'),
-    ]
-    # Progressive overload: CONSERVATIVE 2.5% increase for age 38
-    if week >= 3:
-        base[0] = ('Barbell Bench Press', '4', '5-6 @2-1-2', '3min', 'Add 2.5kg from week 2 (age 38 safe)')
-        base[1] = ('Incline Dumbbell Press', '4', '6-8 @2-1-2', '2min', 'Add 1-2kg from week 2')
-    return base
-
-def get_lower_body_exercises(week):
-    """Legs: Quads, Hamstrings, Glutes, Calves
-    META-ANALYSIS OPTIMIZED: Target 16-20 sets/muscle for legs
-    At 95kg: Focus on controlled movements, knee health priority
+    if kind == 'training':
+        return create_training_day(week, day, title, focus, exercises_func, stretches_func(), prescriptions,
+                                   locale, units)
+    return create_recovery_day(week, day, title, locale, units)
+
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'PDFs', 'Daily_Exercises')
+
+
+def split_day_filename(week, day):
+    return f'Week{week}_Day{day}_{get_split_day(day)[1]}.pdf'
+
+
+def write_split_day(week, day, output_dir=OUTPUT_DIR, prescriptions=None, locale=None, units=None):
+    """Render one (week, day) of the split to its PDF and return the filename"""
+    day, slug, title, focus, kind, exercises_func, stretches_func = get_split_day(day)
+    pdf = create_split_day(week, day, title, focus, kind, exercises_func, stretches_func, prescriptions, locale,
+                           units)
+    filename = split_day_filename(week, day)
+    save(pdf, os.path.join(output_dir, filename))
+    return filename
+
+
+def _render_variant(job, dry=False, captured=False):
+    """Render a job's plan; dry / captured is the caller's mode, which a pooled worker
+    forked earlier re-enters"""
+    locale, units, plan, output_dir = job
+    with ExitStack() as stack:
+        if dry and not dry_running():
+            stack.enter_context(dry_run())
+        if captured and not capturing():
+            stack.enter_context(capture())
+        if writes_files():
+            os.makedirs(output_dir, exist_ok=True)
+        with collect() as reports, collect_files() as files:
+            for filename, document in plan:
+                save(create_document_pdf(document, locale, units), os.path.join(output_dir, filename))
+    return locale, len(plan), reports, files
+
+
+def _collected(results):
+    for locale, count, reports, files in results:
+        add_reports(reports)
+        add_files(files)
+        yield locale, count
+
+
+def _run_jobs(jobs, workers=None):
+    if workers == 1 or len(jobs) < 2:
+        yield from _collected(map(_render_variant, jobs))
+        return
+    render = partial(_render_variant, dry=dry_running(), captured=capturing())
+    yield from _collected(get_pool(workers).map(render, jobs))
+
+
+def _try_jobs(jobs, workers=None):
+    """Yield (job index, (locale, count) or the exception the job raised) as jobs finish"""
+    if workers == 1 or len(jobs) < 2:
+        for index, job in enumerate(jobs):
+            try:
+                result = _render_variant(job)
+            except Exception as error:
+                yield index, error
+                continue
+            yield index, next(_collected([result]))
+        return
+    render = partial(_render_variant, dry=dry_running(), captured=capturing())
+    futures = {get_pool(workers).submit(render, job): index for index, job in enumerate(jobs)}
+    for future in as_completed(futures):
+        error = future.exception()
+        yield futures[future], error or next(_collected([future.result()]))
+
+
+def render_locales(plan, locales, output_dir, workers=None, units=None):
+    """Yield (locale, count) as each locale's PDFs are written, one process per locale"""
+    precompile(locales)
+    yield from _run_jobs([(locale, units, plan, os.path.join(output_dir, locale)) for locale in locales], workers)
+
+
+def build_plan(weeks=range(1, 5), days=None, equipment=None, conditions=None):
+    """[(filename, day document)] for the selected weeks / days, for an equipment list (None: full gym)
+    and pain conditions (contraindications.py)
     """
-    base = [
-        ('Barbell Back Squat', '4', '6-8 @3-1-2', '3min', 'Below parallel IF mobility allows'),
-        ('Romanian Deadlift', '4', '8-10 @3-1-2', '2min', 'Hip hinge, hamstring stretch, no bounce'),
-        ('Walking Lunges', '3', '10 each @2-1-2', '90s', 'Shorter stride at 95kg for knee safety'),
-        ('Leg Press', '4', '10-12 @2-1-2', '90s', 'Feet high+wide for glutes, no knee lock'),
-        ('Leg Curl (Lying)', '3', '12-15 @2-1-2', '60s', '3s eccentric for hamstring TUT'),
-        ('Calf Raises (Seated)', '4', '15-20 @2-2-2', '45s', '2s pause at top, full stretch'),
-        ('Hip Thrusts', '4', '12-15 @2-2-2', '90s', 'Glute builder - critical at 38'),
-        ('Core: Dead Bug', '3', '10 each @3-0-3', '30s', 'Spine stability for heavy lifts'),
-    ]
-    if week >= 3:
-        base[0] = ('Barbell Back Squat', '4', '5-6 @3-1-2', '3min', 'Add 2.5kg from week 2')
-        base[1] = ('Romanian Deadlift', '4', '6-8 @3-1-2', '2min', 'Add 2.5kg from week 2')
-    return base
-
-def get_upper_pull_exercises(week):
-    """Pull-focused upper body: Back, Biceps, Rear Delts
-    META-ANALYSIS OPTIMIZED: High volume back (16+ sets/week)
-    At 38: Grip strength and lat engagement focus
+    return [(split_day_filename(week, entry[0]),
+             build_split_day(week, entry[0], equipment=equipment, conditions=conditions))
+            for week in weeks for entry in WEEKLY_SPLIT if not days or entry[0] in days]
+
+
+def generate_all_locales(locales=LOCALES, weeks=range(1, 5), days=None, output_dir=OUTPUT_DIR, workers=None,
+                         units=None, bundle=None, store=None):
+    """Render the selected days once per locale, into output_dir/<locale>/
+
+    The day documents are built once and shared by every locale. With
+    bundle (a bundle.py format) they stream into one archive of output_dir;
+    with store (a directory, store.py) into a content-addressed store.
     """
-    base = [
-        ('Barbell Bent Over Row', '4', '6-8 @2-1-2', '2min', '45deg torso, lower chest, squeeze'),
-        ('Lat Pulldown (Wide Grip)', '4', '10-12 @2-1-2', '90s', 'Lean back 15deg, chest up'),
-        ('Seated Cable Row (V-Bar)', '4', '10-12 @2-1-2', '90s', 'Pull to navel, retract scapula'),
-        ('Single Arm DB Row', '3', '10-12 each @2-1-2', '60s', 'Support on bench, full stretch'),
-        ('Barbell Curls', '3', '10-12 @2-1-2', '60s', 'No swing, control 3s negative'),
-        ('Incline DB Curls', '3', '12-15 @2-1-2', '60s', 'Stretch position, elbow health'),
-        ('Reverse Flyes', '3', '15 @2-1-2', '45s', 'Rear delts + posture correction'),
-        ('Shrugs (DB or Barbell)', '3', '12-15 @2-2-2', '60s', '2s hold at top, no neck strain'),
-    ]
-    return base
-
-def get_full_body_exercises(week):
-    """Full body compound focus
-    BODY RECOMPOSITION DAY: High calorie burn, compound movements
-    At 95kg: Maximum metabolic impact
+    with bundled(output_dir, bundle) as archive, stored(store, output_dir, per_locale=True):
+        for locale, count in render_locales(build_plan(weeks, days), locales, output_dir, workers, units):
+            where = archive_path(output_dir, bundle) + ':' + locale if archive else os.path.join(output_dir, locale)
+            print(f"  {locale}: {count} workout PDFs in {where}")
+
+
+def profile_variant(profile):
+    """(locale, units, mesocycle, equipment, conditions): what an athlete's PDFs depend on"""
+    equipment = profile.get('equipment')
+    return (profile.get('locale'), profile.get('units'), profile.get('mesocycle') or active_mesocycle(),
+            None if equipment is None else tuple(sorted(set(equipment))), conditions_for(profile.get('pain')))
+
+
+def logged_pain(profile, sessions):
+    """The profile with the pain reported in sessions (progression.reported_pain) added to its own"""
+    pain = profile.get('pain') or []
+    pain = [pain] if isinstance(pain, str) else list(pain)
+    reported = [location for location in reported_pain(sessions) if location not in pain]
+    return dict(profile, pain=pain + reported) if reported else profile
+
+
+def check_variants(variants):
+    """Fail on an unknown locale, unit system or equipment before rendering anything"""
+    index = get_index()
+    for locale, units, mesocycle, equipment, conditions in variants:
+        precompile([locale])
+        formatter(units)
+        index.equipment_mask(equipment)
+    precompute(variant[2] for variant in variants)    # the cohort's year, in one pass
+
+
+def _bundle_renders(files, paths, format, archive=None):
+    """Write the PDFs captured for paths[0] into every athlete's archive, or all into the cohort archive"""
+    for path in paths:
+        with ExitStack() as stack:
+            target = archive
+            if target is None:
+                target = stack.enter_context(Bundle(archive_path(path, format), root=path))
+            for source, data in files:
+                target.append((os.path.join(path, os.path.relpath(source, paths[0])), data))
+    files.clear()
+
+
+def _store_renders(files, paths, store, locale=None):
+    """Store the PDFs captured for paths[0] once and index them for every athlete"""
+    for source, data in files:
+        digest = store.put(data)
+        for path in paths:
+            key = document_key(os.path.join(path, os.path.relpath(source, paths[0])), store.output_dir,
+                               locale or '')
+            store.link(key, digest, len(data))
+    files.clear()
+
+
+def _copy_renders(paths, filenames):
+    """Copy the PDFs rendered into paths[0] to the other athletes sharing them"""
+    for path in paths[1:]:
+        if dry_running():    # the copies lay out as the first
+            break
+        os.makedirs(path, exist_ok=True)
+        for filename in filenames:
+            shutil.copyfile(os.path.join(paths[0], filename), os.path.join(path, filename))
+
+
+def generate_cohort(profiles, weeks=range(1, 5), days=None, output_dir=OUTPUT_DIR, workers=None, bundle=None,
+                    cohort_archive=False, store=None):
+    """Render the selected days for every athlete into output_dir/<athlete_id>/
+
+    Profiles (athletes.py) may set 'locale', 'units' (metric / imperial),
+    'mesocycle' (weeks per build-peak-deload block, periodization.py),
+    'equipment' (a list, substitution.py; default a full gym) and 'pain'
+    (reported pain locations, contraindications.py). Each distinct
+    preference is rendered once and copied to the other athletes sharing it.
+
+    With bundle (a bundle.py format) each athlete gets one archive,
+    output_dir/<athlete_id>.zip, instead of a directory; with
+    cohort_archive too, the whole cohort goes into output_dir.zip. With
+    store (a directory, store.py) each distinct PDF is stored once by its
+    hash and indexed for every athlete sharing it. Inside a capture
+    (layout.py) every athlete's copy goes to the capture instead.
     """
-    base = [
-        ('Trap Bar Deadlift', '4', '6-8 @3-1-2', '3min', 'Best deadlift variant for 38+ spine'),
-        ('Dumbbell Bench Press', '3', '10-12 @2-1-2', '2min', 'Full ROM, stretch at bottom'),
-        ('Front Squat (Goblet OK)', '3', '10-12 @2-1-2', '90s', 'Upright torso, quad focus'),
-        ('Seated Cable Row', '3', '10-12 @2-1-2', '90s', 'Posture correction day'),
-        ('Standing OHP (DB)', '3', '10-12 @2-1-2', '90s', 'Core engaged, no back lean'),
-        ('Bulgarian Split Squat', '3', '8 each @2-1-2', '60s', 'Glute/quad unilateral work'),
-        ('Farmers Walk', '3', '30 sec', '60s', 'Grip + core + metabolic boost'),
-        ('Plank Variations', '3', '45 sec', '30s', 'Front/Side/Front rotation'),
-    ]
-    return base
-
-def get_upper_stretches():
-    return [
-        ('Chest Doorway Stretch', '45 sec each side'),
-        ('Cross-Body Shoulder Stretch', '30 sec each'),
-        ('Overhead Tricep Stretch', '30 sec each'),
-        ('Cat-Cow', '10 reps slow'),
-        ('Childs Pose', '60 seconds'),
-        ('Thread the Needle', '30 sec each'),
-    ]
-
-def get_lower_stretches():
-    return [
-        ('Standing Quad Stretch', '45 sec each'),
-        ('Seated Hamstring Stretch', '45 sec each'),
-        ('Pigeon Pose', '60 sec each'),
-        ('Hip Flexor Stretch', '45 sec each'),
-        ('Calf Stretch Against Wall', '30 sec each'),
-        ('Figure 4 Stretch', '45 sec each'),
-    ]
-
-def get_full_body_stretches():
-    return [
-        ('Worlds Greatest Stretch', '30 sec each side'),
-        ('Downward Dog', '45 seconds'),
-        ('Cobra Stretch', '30 seconds'),
-        ('Supine Twist', '30 sec each side'),
-        ('Happy Baby', '45 seconds'),
-        ('Standing Forward Fold', '45 seconds'),
-    ]
-
-def get_recovery_stretches():
-    return [
-        ('Cat-Cow Flow', '2 min slow'),
-        ('Thread the Needle', '45 sec each'),
-        ('Childs Pose', '90 seconds'),
-        ('Supine Spinal Twist', '60 sec each'),
-        ('Hip 90/90 Stretch', '45 sec each'),
-        ('Foam Roll IT Band', '60 sec each'),
-        ('Foam Roll Upper Back', '60 seconds'),
-        ('Foam Roll Quads', '60 sec each'),
-        ('Deep Breathing', '3 minutes'),
-    ]
+    variants = {}
+    for profile in profiles:
+        variants.setdefault(profile_variant(profile), []).append(
+            os.path.join(output_dir, safe_filename(profile['athlete_id'])))
+    check_variants(variants)
 
+    plans = {}
+    for locale, units, *plan in variants:
+        if tuple(plan) not in plans:
+            mesocycle, equipment, conditions = plan
+            with use_mesocycle(mesocycle):
+                plans[tuple(plan)] = build_plan(weeks, days, equipment, conditions)
+    jobs = [(locale, units, plans[tuple(plan)], paths[0]) for (locale, units, *plan), paths in variants.items()]
+    with ExitStack() as stack:
+        sink = capture_sink()
+        files = None    # a variant's PDFs
+        if not dry_running() and (bundle or store or sink is not None):
+            files = stack.enter_context(capture())
+        archive = output_store = None
+        if files is not None and sink is not None:
+            archive = sink
+        elif files is not None and store:
+            output_store = stack.enter_context(OutputStore(store, output_dir))
+        elif files is not None and cohort_archive:
+            archive = stack.enter_context(Bundle(archive_path(output_dir, bundle), root=output_dir))
+        for ((locale, units, *plan), paths), (_, count) in zip(variants.items(), _run_jobs(jobs, workers)):
+            if output_store:
+                _store_renders(files, paths, output_store, locale)
+            elif files is not None:
+                _bundle_renders(files, paths, bundle, archive)
+            else:
+                _copy_renders(paths, [filename for filename, document in plans[tuple(plan)]])
+            mesocycle, equipment, conditions = plan
+            kit = 'full gym' if equipment is None else ', '.join(equipment) or 'bodyweight'
+            pain = f" / {', '.join(conditions)} pain" if conditions else ''
+            print(f"  {locale or DEFAULT_LOCALE} / {units or DEFAULT_SYSTEM} / {mesocycle}-week mesocycles / "
+                  f"{kit}{pain}: {count} workout PDFs for {len(paths)} athletes")
 
-# =============================================================================
-# GENERATE ALL PDFS
-# =============================================================================
 
-def create_training_day(week, day, title, focus, exercises_func, stretches):
-    pdf = EnhancedWorkoutPDF(week, day, title, focus)
-    pdf.add_page()
-    pdf.add_duration_box('30-40 min', '60-75 min', '40-50 min')
-    
-    pdf.add_pre_workout_protocol(week)
-    
-    # META-ANALYSIS BASED science note (PMC5684266)
-    science_note = ('META-ANALYSIS (PMC5684266): Medium-High Weekly Set volume (5-10+ sets/muscle) '
-                   'produces 15-23% greater strength gains. Tempo 2-1-2 (slower) protects joints at 38. '
-                   'Rest: 2-3min compounds (ATP), 60-90s isolation (metabolic stress). '
-                   'BODY RECOMP: Compound lifts preserve muscle in caloric deficit.')
-    pdf.add_main_workout(exercises_func(week), science_note)
-    
-    pdf.add_post_workout_cardio(week)
-    pdf.add_stretch_cooldown(stretches)
-    
-    pdf.add_page()
-    pdf.add_tracking_section()
-    
-    return pdf
+def generate_scheduled_cohort(profiles, week, log=None, today=None, default_start=None, output_dir=OUTPUT_DIR,
+                              workers=None):
+    """Place a week on every athlete's calendar and render only the days whose date moved
 
-def create_recovery_day(week, day, title):
-    pdf = EnhancedWorkoutPDF(week, day, title, 'Active Recovery')
-    pdf.add_page()
-    
-    activities = [
-        '20-30 min easy walking (Zone 1 cardio) - adds to daily step goal',
-        '15-20 min light swimming or aqua jogging - zero impact at 95kg',
-        '20 min easy cycling (low resistance) - active recovery for legs',
-        '15 min yoga flow (beginner level) - mobility at 38 is critical',
-    ]
-    
-    tips = [
-        'SLEEP: 7-9 hours MINIMUM - this is when testosterone peaks for muscle repair',
-        'PROTEIN: 1.8-2.2g/kg = 170-210g daily (critical in caloric deficit at 95kg)',
-        'HYDRATION: 3.5+ liters water - helps with appetite control too',
-        'CALORIC DEFICIT: Stay at 500-700 kcal deficit (2000-2300 kcal intake)',
-        'NO ALCOHOL: Impairs protein synthesis by up to 37% - serious impact at 38',
-        'NEAT: Non-exercise activity (stairs, standing, fidgeting) burns 200-500 kcal/day',
-        'FOAM ROLL: 10-15 min daily reduces DOMS and improves recovery by 20%',
-        'SUPPLEMENTS: Creatine 5g/day, Fish oil 2-3g/day, Vitamin D if deficient',
-    ]
-    
-    pdf.add_recovery_day(activities, get_recovery_stretches(), tips)
-    
-    pdf.add_page()
-    pdf.add_tracking_section()
-    
-    return pdf
+    Profiles may set 'start_date' (Week 1 Day 1, YYYY-MM-DD) and
+    'unavailable' (weekdays / dates, scheduler.py) besides the preferences
+    of generate_cohort. log (session_log.SessionLog) supplies the logged
+    sessions, and pain logged in the previous week is added to the
+    profile's; each athlete's schedule.json the dates the PDFs already show.
+    Athletes with the same preferences and the same date for a day share
+    one render.
+    """
+    renders, manifests = {}, {}    # (variant, day, date) -> [athlete directory]
+    for profile in profiles:
+        start = profile.get('start_date')
+        start_date = date.fromisoformat(start) if start else default_start
+        if start_date is None:
+            raise ValueError(f'No start date for athlete {profile["athlete_id"]}')
+        path = os.path.join(output_dir, safe_filename(profile['athlete_id']))
+        manifest = manifests[path] = read_manifest(path)
+        done = logged_days(log.sessions(profile['athlete_id'], (week, week))) if log else {}
+        if log and week > 1:
+            profile = logged_pain(profile, log.sessions(profile['athlete_id'], (week - 1, week - 1)))
+        variant = profile_variant(profile)
+        with use_mesocycle(variant[2]):
+            schedule = schedule_week(week, week_start(start_date, week), profile.get('unavailable'),
+                                     manifest.get(week), done, today)
+        for day in moved_days(manifest.get(week), schedule):
+            renders.setdefault((variant, day, schedule[day]), []).append(path)
+        manifest[week] = schedule
+    check_variants({variant for variant, day, when in renders})
 
+    documents = {}
+    for (locale, units, *plan), day, when in renders:
+        if (tuple(plan), day) not in documents:
+            mesocycle, equipment, conditions = plan
+            with use_mesocycle(mesocycle):
+                documents[tuple(plan), day] = build_split_day(week, day, equipment=equipment, conditions=conditions)
+    jobs = []
+    for ((locale, units, *plan), day, when), paths in renders.items():
+        document = documents[tuple(plan), day]
+        if when:
+            document = dict(document, date=when.isoformat())
+        jobs.append((locale, units, [(split_day_filename(week, day), document)], paths[0]))
+    rendered = copied = 0
+    for (key, paths), (_, count) in zip(renders.items(), _run_jobs(jobs, workers)):
+        _copy_renders(paths, [split_day_filename(week, key[1])])
+        rendered, copied = rendered + count, copied + len(paths) - 1
+    if not dry_running():
+        for path, manifest in manifests.items():
+            write_manifest(path, manifest)
+    print(f"  Week {week}: {rendered} workout PDFs rendered, {copied} copied, for {len(manifests)} athletes")
 
-def generate_all_pdfs():
-    """Generate all 28 daily workout PDFs"""
-    
-    # Create output directory
-    output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'PDFs', 'Daily_Exercises')
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Weekly schedule structure (4 training days + 3 recovery/rest)
-    # Day 1: Upper Push
-    # Day 2: Lower Body
-    # Day 3: Active Recovery
-    # Day 4: Upper Pull
-    # Day 5: Full Body
-    # Day 6: Active Recovery
-    # Day 7: Complete Rest
+
+def generate_journaled_cohort(profiles, journal, weeks=range(1, 5), days=None, output_dir=OUTPUT_DIR, workers=None,
+                              retries=RETRIES, backoff=BACKOFF, restart=False):
+    """generate_cohort, resumable: render only the (athlete, document) units the journal
+    (a batch.Journal path) has not recorded as done, retrying failures with backoff
+    """
+    if not writes_files():
+        raise ValueError('A journaled run writes files: no dry run, bundle or store')
+    weeks = list(weeks)
+    variants = {}
+    for profile in profiles:
+        variants.setdefault(profile_variant(profile), []).append(
+            (profile['athlete_id'], os.path.join(output_dir, safe_filename(profile['athlete_id']))))
+    check_variants(variants)
+    filenames = [split_day_filename(week, entry[0]) for week in weeks for entry in WEEKLY_SPLIT
+                 if not days or entry[0] in days]
+
+    with Journal(journal) as log:
+        log.begin(run_fingerprint(profiles, weeks, sorted(days or ()), os.path.abspath(output_dir),
+                                  active_mesocycle()), restart)
+        completed = log.completed()
+        pending = {}    # variant -> {(athlete_id, directory): [missing filename]}
+        for variant, athletes in variants.items():
+            for athlete_id, path in athletes:
+                missing = [filename for filename in filenames if filename not in completed.get(athlete_id, ())]
+                if missing:
+                    pending.setdefault(variant, {})[athlete_id, path] = missing
+        skipped = len(profiles) * len(filenames) - sum(len(missing) for athletes in pending.values()
+                                                       for missing in athletes.values())
+        done = 0
+        for attempt in range(retries + 1):
+            keys, jobs = list(pending), []
+            for locale, units, mesocycle, equipment, conditions in keys:
+                needed = set().union(*pending[locale, units, mesocycle, equipment, conditions].values())
+                with use_mesocycle(mesocycle):
+                    plan = [(filename, document) for filename, document
+                            in build_plan(weeks, days, equipment, conditions) if filename in needed]
+                first = next(iter(pending[locale, units, mesocycle, equipment, conditions]))[1]
+                jobs.append((locale, units, plan, first))
+            failed = {}
+            for index, outcome in _try_jobs(jobs, workers):
+                variant, source = keys[index], jobs[index][3]
+                for (athlete_id, path), missing in pending[variant].items():
+                    try:
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        if path != source:
+                            os.makedirs(path, exist_ok=True)
+                            for filename in missing:
+                                shutil.copyfile(os.path.join(source, filename), os.path.join(path, filename))
+                    except Exception as error:
+                        failed.setdefault(variant, {})[athlete_id, path] = missing
+                        log.failed(athlete_id, missing, error)
+                        continue
+                    log.done(athlete_id, missing)
+                    done += len(missing)
+            pending = failed
+            if not pending or attempt == retries:
+                break
+            delay = backoff * 2 ** attempt
+            print(f"  {sum(len(athletes) for athletes in failed.values())} athletes failed, retrying in {delay:g}s")
+            time.sleep(delay)
+    left = sum(len(missing) for athletes in pending.values() for missing in athletes.values())
+    print(f"  {done} workout PDFs done, {skipped} already done, {left} failed")
+    return left
+
+
+def generate_all_pdfs(weeks=range(1, 5), days=None, output_dir=OUTPUT_DIR, locale=None, units=None, bundle=None,
+                      store=None):
+    """Generate all 28 daily workout PDFs (or the selected weeks / days)
+
+    With bundle (a bundle.py format) they stream into one archive of
+    output_dir; with store (a directory, store.py) into a content-addressed
+    store.
+    """
     
-    for week in range(1, 5):
-        print(f"\nGenerating Week {week}...")
-        
-        # Day 1: Upper Body Push
-        pdf = create_training_day(week, 1, 'UPPER BODY - PUSH', 'Chest / Shoulders / Triceps',
-                                  get_upper_push_exercises, get_upper_stretches())
-        filename = f'Week{week}_Day1_Upper_Push.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 2: Lower Body
-        pdf = create_training_day(week, 2, 'LOWER BODY', 'Quads / Hamstrings / Glutes / Calves',
-                                  get_lower_body_exercises, get_lower_stretches())
-        filename = f'Week{week}_Day2_Lower_Body.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 3: Active Recovery
-        pdf = create_recovery_day(week, 3, 'ACTIVE RECOVERY')
-        filename = f'Week{week}_Day3_Recovery.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 4: Upper Body Pull
-        pdf = create_training_day(week, 4, 'UPPER BODY - PULL', 'Back / Biceps / Rear Delts',
-                                  get_upper_pull_exercises, get_upper_stretches())
-        filename = f'Week{week}_Day4_Upper_Pull.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 5: Full Body
-        pdf = create_training_day(week, 5, 'FULL BODY COMPOUNDS', 'Total Body Strength',
-                                  get_full_body_exercises, get_full_body_stretches())
-        filename = f'Week{week}_Day5_Full_Body.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 6: Active Recovery
-        pdf = create_recovery_day(week, 6, 'MOBILITY & RECOVERY')
-        filename = f'Week{week}_Day6_Mobility.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
-        
-        # Day 7: Complete Rest
-        pdf = create_recovery_day(week, 7, 'COMPLETE REST')
-        filename = f'Week{week}_Day7_Rest.pdf'
-        pdf.output(os.path.join(output_dir, filename))
-        print(f"  Created: {filename}")
+    count = 0
+    with bundled(output_dir, bundle) as archive, stored(store, output_dir) as output_store:
+        # Create output directory
+        if writes_files():
+            os.makedirs(output_dir, exist_ok=True)
+
+        for week in weeks:
+            print(f"\nGenerating Week {week}...")
+
+            for entry in WEEKLY_SPLIT:
+                if days and entry[0] not in days:
+                    continue
+                filename = write_split_day(week, entry[0], output_dir, locale=locale, units=units)
+                count += 1
+                print(f"  Created: {filename}")
     
     print(f"\n{'='*50}")
-    print(f"SUCCESS: Generated 28 workout PDFs in:")
-    print(f"{output_dir}")
+    print(f"SUCCESS: Generated {count} workout PDFs in:")
+    print(f"{archive_path(output_dir, bundle) if archive else store if output_store else output_dir}")
     print(f"{'='*50}")
 
 
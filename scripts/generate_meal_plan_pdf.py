@@ -4,11 +4,20 @@ Generates a comprehensive PDF for the evidence-based meal plan
 """
 
 from fpdf import FPDF
-from datetime import datetime
 import os
 
+from fonts import UnicodeFontMixin
+from graphics import GraphicsStateMixin
+from i18n import LocaleMixin, localized_filename, use_locale
+from layout import LayoutMixin, save
+from units import Measured, Quantity, UnitsMixin, units_filename, use_units
+from workout_program import START_WEIGHT, GOAL_WEIGHT
 
-class MealPlanPDF(FPDF):
+
+WEEKLY_LOSS = Quantity(0.5, 'kg', 1, None, True)    # 0.5-1 kg
+
+
+class MealPlanPDF(UnitsMixin, LocaleMixin, UnicodeFontMixin, LayoutMixin, GraphicsStateMixin, FPDF):
     """Generate a PDF for the nutrition and meal plan"""
     
     def __init__(self):
@@ -28,12 +37,13 @@ class MealPlanPDF(FPDF):
         self.set_y(-15)
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Page {self.page_no()} | Generated: {datetime.now().strftime("%Y-%m-%d")}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no()} | Generated: {self.render_date.strftime("%Y-%m-%d")}', 0, 0, 'C')
         
     def add_section_title(self, title, color=(34, 139, 34)):
         self.ln(5)
         self.set_font('Helvetica', 'B', 14)
         self.set_text_color(*color)
+        self.begin_section(title)
         self.cell(0, 10, title, 0, 1, 'L')
         self.set_text_color(0, 0, 0)
         
@@ -41,6 +51,7 @@ class MealPlanPDF(FPDF):
         self.ln(3)
         self.set_font('Helvetica', 'B', 11)
         self.set_text_color(*color)
+        self.begin_section(title)
         self.cell(0, 8, title, 0, 1, 'L')
         self.set_text_color(0, 0, 0)
         
@@ -73,7 +84,10 @@ class MealPlanPDF(FPDF):
             else:
                 self.set_fill_color(255, 255, 255)
             for i, cell in enumerate(row):
-                self.cell(widths[i], 6, str(cell), 1, 0, 'C', True)
+                if cell == '[ ]':
+                    self.box_cell(widths[i], 6, 0, 'C', 1, True)
+                else:
+                    self.cell(widths[i], 6, cell if isinstance(cell, str) else str(cell), 1, 0, 'C', True)
             self.ln()
             fill = not fill
         self.ln(3)
@@ -114,12 +128,14 @@ class MealPlanPDF(FPDF):
         
     def add_bullet_point(self, text):
         self.set_font('Helvetica', '', 9)
-        self.cell(5, 5, chr(149), 0, 0)  # Bullet character
+        self.cell(5, 5, '•', 0, 0)
         self.multi_cell(0, 5, text)
 
 
-def generate_meal_plan_pdf():
-    pdf = MealPlanPDF()
+def create_meal_plan_pdf(locale=None, units=None):
+    """Build the meal plan document without writing it"""
+    with use_locale(locale), use_units(units):
+        pdf = MealPlanPDF()
     
     # Page 1: Overview and Profile
     pdf.add_page()
@@ -127,10 +143,11 @@ def generate_meal_plan_pdf():
     pdf.add_section_title('YOUR PROFILE & DAILY TARGETS')
     
     profile_data = [
-        ['Current Weight', '95 kg', 'Target Weight', '80 kg'],
-        ['Timeline', '11 months', 'Weekly Loss', '0.5-1 kg'],
+        ['Current Weight', Measured('{}', START_WEIGHT._replace(space=True)),
+         'Target Weight', Measured('{}', GOAL_WEIGHT._replace(space=True))],
+        ['Timeline', '11 months', 'Weekly Loss', Measured('{}', WEEKLY_LOSS)],
         ['Daily Calories', '~2,000 kcal', 'Deficit', '20%'],
-        ['Daily Protein', '190g (2.0g/kg)', 'Meals', '5-6 per day'],
+        ['Daily Protein', Measured('190g ({})', Quantity(2.0, 'g/kg', places=1)), 'Meals', '5-6 per day'],
     ]
     
     pdf.set_font('Helvetica', '', 9)
@@ -148,8 +165,8 @@ def generate_meal_plan_pdf():
     pdf.add_section_title('EVIDENCE-BASED PRINCIPLES')
     
     principles = [
-        ['Protein for Recomposition', '1.6-2.4 g/kg/day', 'Morton et al., 2018'],
-        ['Protein per Meal', '0.4-0.6 g/kg', 'Moore et al., 2015'],
+        ['Protein for Recomposition', Measured('{}/day', Quantity(1.6, 'g/kg', 2.4, 1, True)), 'Morton et al., 2018'],
+        ['Protein per Meal', Measured('{}', Quantity(0.4, 'g/kg', 0.6, 1, True)), 'Moore et al., 2015'],
         ['Meal Spacing', '3-5 hours apart', 'Areta et al., 2013'],
         ['Pre-Sleep Protein', '30-40g casein', 'Snijders et al., 2015'],
         ['Caloric Deficit', '20-25% below TDEE', 'Longland et al., 2016'],
@@ -363,7 +380,7 @@ AVOID: Pork, Beef, Excessive Sugar"""
         "Clothes fitting differently (even if scale doesn't move)",
         "Strength increasing in workouts",
         "Body measurements changing",
-        "0.5-1 kg loss per week on average",
+        Measured('{} loss per week on average', WEEKLY_LOSS),
     ]
     for s in signs:
         pdf.add_bullet_point(s)
@@ -397,7 +414,7 @@ AVOID: Pork, Beef, Excessive Sugar"""
         "[ ] Workout completed",
     ]
     for item in checklist:
-        pdf.cell(0, 7, item, 0, 1)
+        pdf.fill_in_cell(0, 7, item, 1)
     
     pdf.ln(5)
     pdf.add_section_title('HYDRATION TARGETS')
@@ -410,10 +427,14 @@ AVOID: Pork, Beef, Excessive Sugar"""
         ['TOTAL', '3.5 liters', ''],
     ]
     pdf.add_table(['Time', 'Amount', 'Done'], hydration_data, [70, 60, 60])
-    
-    # Save PDF
-    output_path = os.path.join(os.path.dirname(__file__), 'NUTRITION_MEAL_PLAN.pdf')
-    pdf.output(output_path)
+    return pdf
+
+
+def generate_meal_plan_pdf(locale=None, units=None):
+    pdf = create_meal_plan_pdf(locale, units)
+    filename = units_filename(localized_filename('NUTRITION_MEAL_PLAN.pdf', locale), units)
+    output_path = os.path.join(os.path.dirname(__file__), filename)
+    save(pdf, output_path)
     print(f"PDF generated successfully: {output_path}")
     return output_path
 
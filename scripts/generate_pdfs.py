@@ -4,10 +4,48 @@ Generates Weekly Plan and Daily Exercise Tracker PDFs with injury prevention foc
 """
 
 from fpdf import FPDF
-from datetime import datetime, timedelta
+from datetime import timedelta
 import os
 
-class WeeklyPlanPDF(FPDF):
+from fonts import UnicodeFontMixin
+from graphics import GraphicsStateMixin
+from i18n import LocaleMixin, localized_filename, use_locale
+from layout import LayoutMixin, save, writes_files
+from pdf_forms import FormFieldsMixin
+from units import Measured, Quantity, UnitsMixin, units_filename, use_units
+from workout_program import canonical
+
+
+def _kg(value):
+    return Quantity(value, 'kg')
+
+
+KG = Quantity(None, 'kg')
+
+# Tracker rows named differently from the program exercise they log; their set
+# fields use the program's canonical name so form_extract.py and progression.py
+# see the same exercise
+PROGRAM_EXERCISES = {
+    'Bench Press': 'Barbell Bench Press',
+    'Incline DB Press': 'Incline Dumbbell Press',
+    'Overhead Press': 'Seated DB Shoulder Press',
+    'Tricep Extension': 'Overhead Tricep Extension',
+    'Barbell Rows': 'Barbell Bent Over Row',
+    'DB Row (each)': 'Single Arm DB Row',
+    'Squats': 'Barbell Back Squat',
+    'Romanian DL': 'Romanian Deadlift',
+    'Lunges (each)': 'Walking Lunges',
+    'Leg Curls': 'Leg Curl (Lying)',
+    'Calf Raise Seat': 'Calf Raises (Seated)',
+    'Farmer Walk': 'Farmers Walk',
+}
+
+
+def exercise_field(exercise):
+    """Set field key of a tracker row: the canonical name of the program exercise it logs"""
+    return canonical(PROGRAM_EXERCISES.get(exercise, exercise))
+
+class WeeklyPlanPDF(UnitsMixin, LocaleMixin, UnicodeFontMixin, LayoutMixin, GraphicsStateMixin, FPDF):
     """Generate a comprehensive weekly plan PDF with warm-up and flexibility focus"""
     
     def __init__(self):
@@ -27,11 +65,12 @@ class WeeklyPlanPDF(FPDF):
         self.set_y(-15)
         self.set_font('Helvetica', 'I', 8)
         self.set_text_color(128, 128, 128)
-        self.cell(0, 10, f'Page {self.page_no()} | Generated: {datetime.now().strftime("%Y-%m-%d")}', 0, 0, 'C')
+        self.cell(0, 10, f'Page {self.page_no()} | Generated: {self.render_date.strftime("%Y-%m-%d")}', 0, 0, 'C')
         
     def add_section_title(self, title, color=(30, 60, 114)):
         self.set_font('Helvetica', 'B', 14)
         self.set_text_color(*color)
+        self.begin_section(title)
         self.cell(0, 10, title, 0, 1, 'L')
         self.set_text_color(0, 0, 0)
         
@@ -218,12 +257,12 @@ class WeeklyPlanPDF(FPDF):
         self.ln(3)
         self.add_section_title('EXPECTED PROGRESS (Be Patient!)')
         progress = [
-            ('Month 1-2', '95kg -> 92kg', 'Build habits, improve mobility'),
-            ('Month 3-4', '92kg -> 88kg', 'Strength gains visible'),
-            ('Month 5-6', '88kg -> 85kg', 'Muscle definition'),
-            ('Month 7-8', '85kg -> 82kg', 'Peak strength phase'),
-            ('Month 9-10', '82kg -> 80kg', 'Mountain ready'),
-            ('Month 11', '80kg maintain', 'Final preparation'),
+            ('Month 1-2', Measured('{} → {}', _kg(95), _kg(92)), 'Build habits, improve mobility'),
+            ('Month 3-4', Measured('{} → {}', _kg(92), _kg(88)), 'Strength gains visible'),
+            ('Month 5-6', Measured('{} → {}', _kg(88), _kg(85)), 'Muscle definition'),
+            ('Month 7-8', Measured('{} → {}', _kg(85), _kg(82)), 'Peak strength phase'),
+            ('Month 9-10', Measured('{} → {}', _kg(82), _kg(80)), 'Mountain ready'),
+            ('Month 11', Measured('{} maintain', _kg(80)), 'Final preparation'),
         ]
         
         self.set_font('Helvetica', 'B', 9)
@@ -266,8 +305,13 @@ class WeeklyPlanPDF(FPDF):
             self.cell(40, 6, duration, 0, 1, 'L')
 
 
-class DailyTrackerPDF(FPDF):
-    """Generate daily exercise tracking sheets with warm-up and flexibility checkboxes"""
+class DailyTrackerPDF(FormFieldsMixin, UnitsMixin, LocaleMixin, UnicodeFontMixin, LayoutMixin,
+                      GraphicsStateMixin, FPDF):
+    """Generate daily exercise tracking sheets with warm-up and flexibility checkboxes
+
+    Every fill-in line and checkbox is a form field named 'w<week>d<day>.<field>'
+    (see form_extract.py); set fields are keyed by program exercise (exercise_field).
+    """
     
     def __init__(self):
         super().__init__()
@@ -285,13 +329,23 @@ class DailyTrackerPDF(FPDF):
         self.set_text_color(128, 128, 128)
         self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
         
-    def add_checkbox(self, label, checked=False):
-        box = '[X]' if checked else '[  ]'
-        self.cell(8, 5, box, 0, 0, 'L')
+    def add_checkbox(self, label, name=None, checked=False):
+        if name:
+            self.checkbox_cell(name, 8, 5, 0, 'L')
+        else:
+            self.box_cell(8, 5, 0, 'L', checked=checked)
         self.cell(0, 5, label, 0, 1, 'L')
         
-    def create_daily_tracker(self, weeks=4):
-        """Create daily tracking pages for specified number of weeks"""
+    def create_daily_tracker(self, weeks=4, start_date=None):
+        """Create daily tracking pages for specified number of weeks
+
+        When start_date is given, Week 1 Day 1 falls on that date and every
+        page gets its real date printed instead of a blank date line.
+        """
+        # Body weight and loads are logged in the athlete's units; form_extract.py
+        # converts the '_lb' fields of imperial trackers back to kg
+        weight_unit = self.format_units(Measured('{}', KG))
+        set_field = 'set' if weight_unit == 'kg' else f'set_{weight_unit}'
         
         day_templates = [
             {
@@ -472,22 +526,31 @@ class DailyTrackerPDF(FPDF):
         for week in range(1, weeks + 1):
             for day_idx, template in enumerate(day_templates):
                 self.add_page()
+                prefix = f'w{week}d{day_idx + 1}'
                 
                 # Week and Date header
                 self.set_font('Helvetica', 'B', 12)
                 self.set_fill_color(30, 60, 114)
                 self.set_text_color(255, 255, 255)
+                self.begin_section(f'Week {week} - {template["name"]}')
                 self.cell(0, 8, f'Week {week} - {template["name"]}', 0, 1, 'C', True)
                 self.set_text_color(0, 0, 0)
                 
                 # Date field
                 self.set_font('Helvetica', '', 10)
                 self.cell(20, 8, 'Date:', 0, 0)
-                self.cell(40, 8, '_____________', 0, 0)
+                if start_date:
+                    day_date = start_date + timedelta(days=(week - 1) * 7 + day_idx)
+                    self.cell(40, 8, day_date.strftime('%a %Y-%m-%d'), 0, 0)
+                else:
+                    self.text_field_cell(f'{prefix}.date', 35, 8)
+                    self.cell(5, 8, '', 0, 0)
                 self.cell(30, 8, 'Weight:', 0, 0)
-                self.cell(30, 8, '_______ kg', 0, 0)
+                self.text_field_cell(f'{prefix}.weight_{weight_unit}', 20, 8)
+                self.cell(10, 8, f' {weight_unit}', 0, 0)
                 self.cell(25, 8, 'Sleep:', 0, 0)
-                self.cell(30, 8, '______ hrs', 0, 1)
+                self.text_field_cell(f'{prefix}.sleep_hours', 18, 8)
+                self.cell(12, 8, ' hrs', 0, 1)
                 
                 self.ln(2)
                 
@@ -496,10 +559,10 @@ class DailyTrackerPDF(FPDF):
                 self.set_fill_color(255, 243, 205)
                 self.cell(0, 6, 'PRE-WORKOUT CHECKLIST (Must complete!)', 0, 1, 'L', True)
                 self.set_font('Helvetica', '', 9)
-                self.add_checkbox('Slept 7+ hours last night?')
-                self.add_checkbox('Ate 1-2 hours before?')
-                self.add_checkbox('Properly hydrated?')
-                self.add_checkbox('No pain or injury concerns?')
+                self.add_checkbox('Slept 7+ hours last night?', f'{prefix}.checklist.1')
+                self.add_checkbox('Ate 1-2 hours before?', f'{prefix}.checklist.2')
+                self.add_checkbox('Properly hydrated?', f'{prefix}.checklist.3')
+                self.add_checkbox('No pain or injury concerns?', f'{prefix}.checklist.4')
                 
                 self.ln(2)
                 
@@ -510,8 +573,8 @@ class DailyTrackerPDF(FPDF):
                     self.set_fill_color(209, 236, 241)
                     self.cell(0, 6, 'MOBILITY & RECOVERY ACTIVITIES', 0, 1, 'L', True)
                     self.set_font('Helvetica', '', 9)
-                    for activity in template['mobility']:
-                        self.add_checkbox(activity)
+                    for i, activity in enumerate(template['mobility']):
+                        self.add_checkbox(activity, f'{prefix}.mobility.{i + 1}')
                         
                 elif template.get('rest_activities'):
                     # Complete rest day
@@ -519,8 +582,8 @@ class DailyTrackerPDF(FPDF):
                     self.set_fill_color(200, 230, 200)
                     self.cell(0, 6, 'REST DAY ACTIVITIES', 0, 1, 'L', True)
                     self.set_font('Helvetica', '', 9)
-                    for activity in template['rest_activities']:
-                        self.add_checkbox(activity)
+                    for i, activity in enumerate(template['rest_activities']):
+                        self.add_checkbox(activity, f'{prefix}.rest.{i + 1}')
                         
                 else:
                     # Training day
@@ -529,8 +592,8 @@ class DailyTrackerPDF(FPDF):
                     self.set_fill_color(255, 200, 200)
                     self.cell(0, 6, 'WARM-UP (15-20 min) - DO NOT SKIP!', 0, 1, 'L', True)
                     self.set_font('Helvetica', '', 8)
-                    for item in template['warmup']:
-                        self.add_checkbox(item)
+                    for i, item in enumerate(template['warmup']):
+                        self.add_checkbox(item, f'{prefix}.warmup.{i + 1}')
                     
                     self.ln(2)
                     
@@ -546,10 +609,10 @@ class DailyTrackerPDF(FPDF):
                     self.cell(45, 7, 'Exercise', 1, 0, 'C', True)
                     self.cell(12, 7, 'Sets', 1, 0, 'C', True)
                     self.cell(16, 7, 'Reps', 1, 0, 'C', True)
-                    self.cell(27, 7, 'Set 1', 1, 0, 'C', True)
-                    self.cell(27, 7, 'Set 2', 1, 0, 'C', True)
-                    self.cell(27, 7, 'Set 3', 1, 0, 'C', True)
-                    self.cell(27, 7, 'Set 4', 1, 1, 'C', True)
+                    self.cell(27, 7, f'Set 1 (reps/{weight_unit})', 1, 0, 'C', True)
+                    self.cell(27, 7, f'Set 2 (reps/{weight_unit})', 1, 0, 'C', True)
+                    self.cell(27, 7, f'Set 3 (reps/{weight_unit})', 1, 0, 'C', True)
+                    self.cell(27, 7, f'Set 4 (reps/{weight_unit})', 1, 1, 'C', True)
                     
                     self.set_text_color(0, 0, 0)
                     self.set_font('Helvetica', '', 7)
@@ -561,7 +624,9 @@ class DailyTrackerPDF(FPDF):
                         
                         for i in range(4):
                             if i < sets:
-                                self.cell(27, 8, '___/___', 1, 0, 'C')
+                                self.add_text_field(f'{prefix}.{set_field}.{exercise_field(exercise)}.{i + 1}',
+                                                    self.get_x(), self.get_y(), 27, 8, 9)
+                                self.cell(27, 8, '', 1, 0, 'C')
                             else:
                                 self.cell(27, 8, '-', 1, 0, 'C')
                         self.ln()
@@ -573,8 +638,8 @@ class DailyTrackerPDF(FPDF):
                     self.set_fill_color(200, 230, 200)
                     self.cell(0, 6, 'COOL-DOWN & STRETCHING (15-20 min)', 0, 1, 'L', True)
                     self.set_font('Helvetica', '', 8)
-                    for stretch in template['cooldown']:
-                        self.add_checkbox(stretch)
+                    for i, stretch in enumerate(template['cooldown']):
+                        self.add_checkbox(stretch, f'{prefix}.cooldown.{i + 1}')
                 
                 self.ln(2)
                 
@@ -582,9 +647,9 @@ class DailyTrackerPDF(FPDF):
                 self.set_font('Helvetica', 'B', 10)
                 self.cell(0, 6, 'POST-WORKOUT', 0, 1, 'L')
                 self.set_font('Helvetica', '', 9)
-                self.add_checkbox('Cool-down/stretching completed?')
-                self.add_checkbox('Post-workout nutrition within 1 hour?')
-                self.add_checkbox('Logged all exercises above?')
+                self.add_checkbox('Cool-down/stretching completed?', f'{prefix}.post.1')
+                self.add_checkbox('Post-workout nutrition within 1 hour?', f'{prefix}.post.2')
+                self.add_checkbox('Logged all exercises above?', f'{prefix}.post.3')
                 
                 self.ln(2)
                 
@@ -594,46 +659,81 @@ class DailyTrackerPDF(FPDF):
                 
                 self.set_font('Helvetica', '', 9)
                 self.cell(40, 6, 'Energy Level (1-10):', 0, 0)
-                self.cell(20, 6, '______', 0, 0)
+                self.text_field_cell(f'{prefix}.energy', 15, 6)
+                self.cell(5, 6, '', 0, 0)
                 self.cell(40, 6, 'Pain/Discomfort?:', 0, 0)
-                self.cell(0, 6, '________________', 0, 1)
+                self.text_field_cell(f'{prefix}.pain', 0, 6, 1)
                 
                 self.cell(40, 6, 'Water Intake:', 0, 0)
-                self.cell(20, 6, '_____ L', 0, 0)
+                self.text_field_cell(f'{prefix}.water_l', 15, 6)
+                self.cell(5, 6, ' L', 0, 0)
                 self.cell(40, 6, 'Protein (approx):', 0, 0)
-                self.cell(0, 6, '_______ g', 0, 1)
+                self.text_field_cell(f'{prefix}.protein_g', 25, 6)
+                self.cell(0, 6, ' g', 0, 1)
                 
                 # Notes section
                 self.ln(2)
                 self.set_font('Helvetica', 'B', 9)
                 self.cell(0, 6, 'Notes / How do you feel?:', 0, 1)
                 self.set_font('Helvetica', '', 9)
-                self.cell(0, 5, '_' * 70, 0, 1)
-                self.cell(0, 5, '_' * 70, 0, 1)
+                x, y = self.get_x(), self.get_y()
+                self.add_text_field(f'{prefix}.notes', x, y, 135, 10, 9, multiline=True)
+                self.line(x, y + 4, x + 135, y + 4)
+                self.line(x, y + 9, x + 135, y + 9)
+                self.ln(10)
+
+
+def create_weekly_plan_pdf(locale=None, units=None):
+    with use_locale(locale), use_units(units):
+        weekly = WeeklyPlanPDF()
+    weekly.create_weekly_plan()
+    return weekly
+
+
+def create_daily_tracker_pdf(weeks=4, start_date=None, locale=None, units=None):
+    with use_locale(locale), use_units(units):
+        tracker = DailyTrackerPDF()
+    tracker.create_daily_tracker(weeks=weeks, start_date=start_date)
+    return tracker
+
+
+def generate_weekly_plan(output_dir=None, locale=None, units=None):
+    """Write Weekly_Plan.pdf and return its path"""
+    output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    if writes_files():
+        os.makedirs(output_dir, exist_ok=True)
+    weekly = create_weekly_plan_pdf(locale, units)
+    weekly_path = os.path.join(output_dir, units_filename(localized_filename('Weekly_Plan.pdf', locale), units))
+    save(weekly, weekly_path)
+    return weekly_path
+
+
+def generate_daily_tracker(output_dir=None, weeks=4, start_date=None, locale=None, units=None):
+    """Write Daily_Exercise_Tracker.pdf and return its path"""
+    output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    if writes_files():
+        os.makedirs(output_dir, exist_ok=True)
+    tracker = create_daily_tracker_pdf(weeks, start_date, locale, units)
+    filename = units_filename(localized_filename('Daily_Exercise_Tracker.pdf', locale), units)
+    tracker_path = os.path.join(output_dir, filename)
+    save(tracker, tracker_path)
+    return tracker_path
 
 
 def main():
     """Generate both PDFs"""
-    output_dir = os.path.dirname(os.path.abspath(__file__))
-    
     print("=" * 50)
     print("FITNESS TRACKER PDF GENERATOR (Age 37+ Edition)")
     print("=" * 50)
     
     # Generate Weekly Plan
     print("\n[1/2] Generating Weekly Plan PDF...")
-    weekly = WeeklyPlanPDF()
-    weekly.create_weekly_plan()
-    weekly_path = os.path.join(output_dir, 'Weekly_Plan.pdf')
-    weekly.output(weekly_path)
+    weekly_path = generate_weekly_plan()
     print(f"      Saved: {weekly_path}")
     
     # Generate Daily Tracker (4 weeks)
     print("\n[2/2] Generating Daily Exercise Tracker PDF (4 weeks)...")
-    tracker = DailyTrackerPDF()
-    tracker.create_daily_tracker(weeks=4)
-    tracker_path = os.path.join(output_dir, 'Daily_Exercise_Tracker.pdf')
-    tracker.output(tracker_path)
+    tracker_path = generate_daily_tracker(weeks=4)
     print(f"      Saved: {tracker_path}")
     
     print("\n" + "=" * 50)
@@ -0,0 +1,210 @@
+"""
+Graphics State Tracking
+Drops colour, line width and font operators that would not change what is
+drawn, before they reach the page content stream:
+
+    class WeeklyPlanPDF(..., LayoutMixin, GraphicsStateMixin, FPDF): ...
+
+    pdf.set_fill_color(240, 240, 240)            # zebra row ...
+    pdf.set_fill_color(255, 255, 255)            # ... overridden before any cell
+    pdf.cell(0, 8, 'Squat', 1, 1, 'L', True)     # only '1.000 g' is written
+    pdf.elided                                   # {'fill': 1}
+
+FPDF writes every set_fill_color / set_draw_color / set_line_width call and
+every font change straight to the page. The mixin holds them back until
+something that reads them is drawn (a filled cell reads the fill colour, a
+border the stroke colour and line width, text the font), then writes only
+those that differ from the state the page already has. Row loops that set
+the colours of every row, used or not, then cost nothing.
+
+cell(), rect() and line() say which state they read; anything else drawn
+first writes everything held back.
+
+Checkboxes and fill-in lines are vector marks rather than '[  ]' and '____'
+text. They are collected per page and written as one path when the page
+ends, so the boxes are uniform and a tracker page costs a few bytes per box:
+
+    pdf.box_cell(30, 6, 0, 'C', 1, fill)                      # a table's 'Done' column
+    pdf.rule_cell(50, 7, 1)                                   # a blank to write on
+    pdf.fill_in_cell(0, 7, '[ ] Water: _____/3.5L', 1)        # box, text, line, text
+"""
+
+from collections import Counter
+import re
+
+
+# state operator line -> graphics state it sets
+_STATE = re.compile(r'[\d.]+ (?:[\d.]+ [\d.]+ )?(?P<fill>r?g)$|[\d.]+ (?:[\d.]+ [\d.]+ )?(?P<stroke>R?G)$'
+                    r'|[\d.]+ (?P<width>w)$|BT /F\d+ [\d.]+ (?P<font>Tf) ET$')
+CHECKBOX_SIZE = 3.5    # mm
+MARK_WIDTH = 0.2       # mm, FPDF's default line width
+BOX_CELL_WIDTH = 8     # mm, a checkbox ahead of a label
+
+_BOX_PREFIX = re.compile(r'\[( +|X)\] ?')
+_BLANKS = re.compile(r'(_{3,})')
+_STATE_ENDINGS = (' g', ' G', 'rg', 'RG', ' w', 'Tf ET')    # cheap test before the pattern
+ALL_STATE = ('fill', 'stroke', 'width', 'font')
+STROKE = ('stroke', 'width')
+FILL_STROKE = ('fill', 'stroke', 'width')
+
+
+def state_kind(line):
+    """'fill', 'stroke', 'width' or 'font' for a state operator line, else None"""
+    match = _STATE.match(line)
+    return match and match.lastgroup
+
+
+class GraphicsStateMixin:
+    """Writes state operators to the page only when drawing needs them
+
+    Goes right before FPDF in the bases. elided counts the operators dropped
+    per kind over the whole document.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.elided = Counter()
+        self._pending = {}    # kind -> operator waiting for something that reads it
+        self._written = {}    # kind -> operator in effect on the page (unknown until written)
+        self._drawing = False
+        self._marks = []      # path segments of the page's checkboxes and fill-in lines
+        super().__init__(*args, **kwargs)
+
+    def _beginpage(self, orientation):
+        self._drop_pending()    # add_page() sets the state again on the new page
+        self._written = {}
+        super()._beginpage(orientation)
+
+    def _endpage(self):
+        self._drop_pending()
+        if self._marks:
+            super()._out(f'q 0 G {MARK_WIDTH * self.k:.2f} w\n' + '\n'.join(self._marks) + '\nS Q')
+            self._marks = []
+        super()._endpage()
+
+    def _drop_pending(self):
+        self.elided.update(self._pending.keys())
+        self._pending = {}
+
+    def _flush(self, kinds):
+        for kind in kinds:
+            line = self._pending.pop(kind, None)
+            if line is None:
+                continue
+            if self._written.get(kind) == line:
+                self.elided[kind] += 1
+            else:
+                self._written[kind] = line
+                super()._out(line)
+
+    def _out(self, s):
+        if self._drawing or self.state != 2 or not isinstance(s, str):
+            return super()._out(s)
+        kind = s.endswith(_STATE_ENDINGS) and state_kind(s)
+        if kind:
+            if kind in self._pending:
+                self.elided[kind] += 1    # set again before anything read it
+            self._pending[kind] = s
+            return
+        if self._pending:
+            self._flush(ALL_STATE)
+        if s == 'q' or s == 'Q':
+            self._written = {}    # the state between q and Q is not the page's
+        super()._out(s)
+
+    def _draw(self, kinds, draw, *args):
+        self._flush(kinds)
+        self._drawing = True
+        try:
+            return draw(*args)
+        finally:
+            self._drawing = False
+
+    def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=0, link=''):
+        if not self._pending or self._drawing or self.page == 0 or (
+                self.y + h > self.page_break_trigger and not self.in_footer and self.accept_page_break()):
+            # nothing held back, or a page break draws a footer and header in between
+            return super().cell(w, h, txt, border, ln, align, fill, link)
+        kinds = []
+        if fill or (txt != '' and not self.color_flag):    # text without a colour of its own is filled
+            kinds.append('fill')
+        if border:
+            kinds += STROKE
+        if txt != '':
+            kinds.append('font')
+        return self._draw(kinds, super().cell, w, h, txt, border, ln, align, fill, link)
+
+    def rect(self, x, y, w, h, style=''):
+        if not self._pending or self._drawing or self.page == 0:
+            return super().rect(x, y, w, h, style)
+        kinds = ('fill',) if style == 'F' else FILL_STROKE if style in ('FD', 'DF') else STROKE
+        return self._draw(kinds, super().rect, x, y, w, h, style)
+
+    def line(self, x1, y1, x2, y2):
+        if not self._pending or self._drawing or self.page == 0:
+            return super().line(x1, y1, x2, y2)
+        return self._draw(STROKE, super().line, x1, y1, x2, y2)
+
+    # -------------------------------------------------------------------------
+    # Checkboxes and fill-in lines (positions in user units, like cell())
+    # -------------------------------------------------------------------------
+
+    def checkbox(self, x, y, size=CHECKBOX_SIZE, checked=False):
+        """Checkbox with its top left corner at x, y, crossed when checked"""
+        k, top = self.k, self.h - y
+        self._marks.append(f'{x * k:.2f} {top * k:.2f} {size * k:.2f} {-size * k:.2f} re')
+        if checked:
+            left, right = (x + size * 0.2) * k, (x + size * 0.8) * k
+            high, low = (top - size * 0.2) * k, (top - size * 0.8) * k
+            self._marks.append(f'{left:.2f} {high:.2f} m {right:.2f} {low:.2f} l '
+                               f'{left:.2f} {low:.2f} m {right:.2f} {high:.2f} l')
+
+    def rule(self, x, y, w):
+        """Fill-in line from x to x + w at height y"""
+        k, y = self.k, (self.h - y) * self.k
+        self._marks.append(f'{x * k:.2f} {y:.2f} m {(x + w) * k:.2f} {y:.2f} l')
+
+    def _cell_origin(self, w, h):
+        """x, y and width of the next cell, after the page break it would cause"""
+        if self.y + h > self.page_break_trigger and not self.in_footer and self.accept_page_break():
+            x = self.x
+            self.add_page(self.cur_orientation)
+            self.x = x
+        if w == 0:
+            w = self.w - self.r_margin - self.x
+        return self.x, self.y, w
+
+    def box_cell(self, w, h, ln=0, align='C', border=0, fill=False, checked=False):
+        """Cell holding a checkbox, in place of a '[  ]' text cell; returns the box (x, y, size)"""
+        x, y, w = self._cell_origin(w, h)
+        self.cell(w, h, '', border, ln, align, fill)
+        size = min(CHECKBOX_SIZE, h - 1)
+        box_x = x + (w - size) / 2 if align == 'C' else x + 1
+        box_y = y + (h - size) / 2
+        self.checkbox(box_x, box_y, size, checked)
+        return box_x, box_y, size
+
+    def rule_cell(self, w, h, ln=0):
+        """Cell with a fill-in line along its foot, in place of a cell of underscores; returns (x, y, w)"""
+        x, y, w = self._cell_origin(w, h)
+        self.rule(x, y + h - 1, w)
+        self.cell(w, h, '', 0, ln)
+        return x, y, w
+
+    def fill_in_cell(self, w, h, txt, ln=0):
+        """Left-aligned text cell with its '[ ] ' prefix and runs of underscores drawn as marks"""
+        x, y, w = self._cell_origin(w, h)
+        box = _BOX_PREFIX.match(txt)
+        if box:
+            self.box_cell(BOX_CELL_WIDTH, h, 0, 'L', checked=box.group(1) == 'X')
+            txt = txt[box.end():]
+        cursor = self.x + self.c_margin
+        for i, part in enumerate(_BLANKS.split(txt)):
+            width = self.get_string_width(part)
+            if i % 2:
+                self.rule(cursor, y + h - 1, width)
+            elif part:
+                self.x = cursor - self.c_margin
+                self.cell(width + 2 * self.c_margin, h, part, 0, 0, 'L')
+            cursor += width
+        self.x = x
+        self.cell(w, h, '', 0, ln)
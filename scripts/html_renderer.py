@@ -0,0 +1,208 @@
+"""
+HTML Day Plan Renderer
+Renders the workout day document model (workout_document.py) as HTML for
+in-browser previews, section by section so responses can be streamed.
+
+    python html_renderer.py --week 2 --day 4 > preview.html
+    python html_renderer.py --week 2 --day 4 --locale es > vista.html
+    python html_renderer.py --week 2 --day 4 --units imperial > preview.html
+    python html_renderer.py --serve 8000      # http://localhost:8000/week/2/day/4?locale=de&units=imperial
+"""
+
+from html import escape
+from itertools import chain
+from urllib.parse import parse_qs
+import argparse
+import re
+
+from i18n import localize_document, translator
+from units import format_document, formatter
+from workout_document import build_split_day
+from workout_program import day_subtitle
+
+
+# Templates are plain format strings, compiled once at import
+PAGE_HEAD = '''<!DOCTYPE html>
+<html lang="{lang}"><head><meta charset="utf-8">
+<title>{page_title}: {title}</title>
+<style>
+body{{font-family:Helvetica,Arial,sans-serif;max-width:800px;margin:2em auto;color:#000}}
+header{{text-align:center}} h1{{color:#1e3c72;margin:0}} h2{{color:#dc3545;margin:.2em}}
+header p{{color:#646464;font-style:italic}}
+section{{margin:1em 0}} section h3{{border-bottom:1px solid;padding-bottom:2px}}
+table{{border-collapse:collapse;width:100%;font-size:12px}}
+th,td{{border:1px solid #000;padding:3px 5px}} th{{color:#fff}}
+tbody tr:nth-child(odd){{background:var(--zebra)}}
+.science{{background:#fff3cd;border:1px solid #ffc107;color:#856404;font-style:italic;font-size:11px;padding:4px}}
+.duration{{display:flex;color:#fff;font-weight:bold;text-align:center}}
+.duration div{{flex:1;padding:6px;border:1px solid #000}}
+.total td{{background:#17a2b8;color:#fff;font-weight:bold}}
+.fields dt{{float:left;width:14em;clear:left}} .fields dd{{border-bottom:1px solid #000;margin:0 0 6px 14em;height:1.2em}}
+.pre_workout{{--c:#28a745;--zebra:#e8f5e9}} .main_workout{{--c:#1e3c72;--zebra:#f0f8ff}}
+.cardio{{--c:#17a2b8;--zebra:#d1ecf1}} .cooldown{{--c:#643264;--zebra:#f5f0fa}}
+.recovery{{--c:#28a745;--zebra:#d1ecf1}} .tracking{{--c:#646464}}
+section h3{{color:var(--c)}} th{{background:var(--c)}}
+</style></head><body>
+<header><h1>{heading}</h1><h2>{title}</h2>
+<p>{subtitle}</p>{date}</header>
+'''
+PAGE_FOOT = '</body></html>\n'
+
+SECTION_OPEN = '<section class="{type}"><h3>{title}</h3>\n'
+SECTION_CLOSE = '</section>\n'
+SCIENCE_NOTE = '<p class="science">{note}</p>\n'
+DURATION_BOX = ('<div class="duration"><div style="background:#28a745">{}</div>'
+                '<div style="background:#1e3c72">{}</div><div style="background:#17a2b8">{}</div></div>\n')
+SUBTITLE = '<h4>{}</h4>\n'
+CHECKBOX = '<input type="checkbox">'
+
+
+def _table(headers, rows, total=None):
+    parts = ['<table><thead><tr>']
+    parts += [f'<th>{escape(header)}</th>' for header in headers]
+    parts.append('</tr></thead><tbody>\n')
+    for row in rows:
+        parts.append('<tr>' + ''.join(f'<td>{cell}</td>' for cell in row) + '</tr>\n')
+    parts.append('</tbody>')
+    if total:
+        parts.append('<tfoot><tr class="total">' + ''.join(f'<td>{escape(cell)}</td>' for cell in total)
+                     + '</tr></tfoot>')
+    parts.append('</table>\n')
+    return ''.join(parts)
+
+
+def _escaped_rows(rows):
+    return [[escape(str(cell)) for cell in row] for row in rows]
+
+
+def _checklist_rows(rows):
+    return [[escape(name), escape(duration), CHECKBOX] for name, duration in rows]
+
+
+def _bullets(items):
+    return '<ul>' + ''.join(f'<li>{escape(item)}</li>' for item in items) + '</ul>\n'
+
+
+def _open(section):
+    return SECTION_OPEN.format(type=section['type'], title=escape(section['title']))
+
+
+def _render_duration(section, _):
+    return DURATION_BOX.format(*(escape(_(f'{label}: {value}')) for label, value in section['cells']))
+
+
+def _render_page_break(section, _):
+    return ''
+
+
+def _render_pre_workout(section, _):
+    return (_open(section) + SCIENCE_NOTE.format(note=escape(_(f"SCIENCE: {section['note']}")))
+            + _table(section['headers'], _escaped_rows(section['rows']))
+            + SUBTITLE.format(escape(section['cues_title'])) + _bullets(section['cues'])
+            + SECTION_CLOSE)
+
+
+def _render_main_workout(section, _):
+    return (_open(section) + SCIENCE_NOTE.format(note=escape(_(f"SCIENCE: {section['note']}")))
+            + _table(section['headers'], _escaped_rows(section['rows'])) + SECTION_CLOSE)
+
+
+def _render_cardio(section, _):
+    return (_open(section) + SCIENCE_NOTE.format(note=escape(_(f"SCIENCE: {section['note']}")))
+            + _table(section['headers'], _escaped_rows(section['rows']), section['total'])
+            + SUBTITLE.format(escape(section['tips_title'])) + _bullets(section['tips'])
+            + SECTION_CLOSE)
+
+
+def _render_cooldown(section, _):
+    return _open(section) + _table(section['headers'], _checklist_rows(section['rows'])) + SECTION_CLOSE
+
+
+def _render_tracking(section, _):
+    fields = ''.join(f'<dt>{escape(label)}</dt><dd></dd>' for label, line_width, name in section['fields'])
+    return _open(section) + f'<dl class="fields">{fields}</dl>\n' + SECTION_CLOSE
+
+
+def _render_recovery(section, _):
+    return (_open(section) + SCIENCE_NOTE.format(note=escape(_(f"SCIENCE: {section['note']}")))
+            + SUBTITLE.format(escape(section['activities_title'])) + _bullets(section['activities'])
+            + SUBTITLE.format(escape(section['routine_title']))
+            + _table(section['headers'], _checklist_rows(section['rows']))
+            + SUBTITLE.format(escape(section['tips_title'])) + _bullets(section['tips'])
+            + SECTION_CLOSE)
+
+
+SECTION_RENDERERS = {
+    'duration': _render_duration,
+    'page_break': _render_page_break,
+    'pre_workout': _render_pre_workout,
+    'main_workout': _render_main_workout,
+    'cardio': _render_cardio,
+    'cooldown': _render_cooldown,
+    'tracking': _render_tracking,
+    'recovery': _render_recovery,
+}
+
+
+def iter_html(document, locale=None, units=None):
+    """Yield the page in chunks: head, one chunk per section, foot"""
+    _ = translator(locale)
+    document = localize_document(format_document(document, units), locale)
+    page_title = _(f"Week {document['week']} - Day {document['day']}")
+    heading = _(f"WEEK {document['week']} - DAY {document['day']}")
+    subtitle = _(formatter(units)(day_subtitle(document['focus'])))
+    date = f"<p><b>{escape(document['date'])}</b></p>" if document.get('date') else ''
+    yield PAGE_HEAD.format(lang=locale or 'en', page_title=escape(page_title), heading=escape(heading),
+                           title=escape(document['title']), subtitle=escape(subtitle), date=date)
+    for section in document['sections']:
+        chunk = SECTION_RENDERERS[section['type']](section, _)
+        if chunk:
+            yield chunk
+    yield PAGE_FOOT
+
+
+def render_html(document, locale=None, units=None):
+    return ''.join(iter_html(document, locale, units))
+
+
+DAY_PATH = re.compile(r'^/week/(\d+)/day/([1-7])/?$')
+
+
+def preview_app(environ, start_response):
+    """WSGI app streaming /week/<week>/day/<day> previews"""
+    match = DAY_PATH.match(environ.get('PATH_INFO', ''))
+    if not match:
+        start_response('404 Not Found', [('Content-Type', 'text/plain; charset=utf-8')])
+        return [b'Use /week/<week>/day/<1-7>\n']
+    query = parse_qs(environ.get('QUERY_STRING', ''))
+    try:
+        document = iter_html(build_split_day(int(match.group(1)), int(match.group(2))),
+                             query.get('locale', [None])[0], query.get('units', [None])[0])
+        head = next(document)
+    except ValueError as exc:
+        start_response('404 Not Found', [('Content-Type', 'text/plain; charset=utf-8')])
+        return [f'{exc}\n'.encode('utf-8')]
+    start_response('200 OK', [('Content-Type', 'text/html; charset=utf-8')])
+    return (chunk.encode('utf-8') for chunk in chain([head], document))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render a day plan as HTML')
+    parser.add_argument('--week', type=int, default=1)
+    parser.add_argument('--day', type=int, default=1)
+    parser.add_argument('--locale', help='label language (en, de, es, fr)')
+    parser.add_argument('--units', help='metric (default) or imperial')
+    parser.add_argument('--serve', type=int, metavar='PORT', help='serve streaming previews on PORT')
+    args = parser.parse_args()
+
+    if args.serve:
+        from wsgiref.simple_server import make_server
+        print(f'Serving previews on http://localhost:{args.serve}/week/1/day/1')
+        make_server('', args.serve, preview_app).serve_forever()
+    else:
+        for chunk in iter_html(build_split_day(args.week, args.day), args.locale, args.units):
+            print(chunk, end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Localization
+Translates the labels the generators print, using the catalogs in
+translations.py. The English literals in the render methods are the
+message ids, so render code stays as it is:
+
+    with use_locale('es'):
+        pdf = EnhancedWorkoutPDF(...)      # every cell() is translated
+
+    _ = translator('de')
+    _('SESSION TRACKING')                  # 'TRAININGSPROTOKOLL'
+    _('WEEK 2 - DAY 4')                    # 'WOCHE 2 - TAG 4'
+
+Catalog keys containing {placeholders} match formatted text ('WEEK 2 - DAY
+4'); the captured values are translated too when the catalog has them.
+Each catalog is compiled once per process into a lookup dict and a single
+regular expression for its templates. Text without a translation is left
+in English.
+"""
+
+import os
+import re
+from contextlib import contextmanager
+
+from translations import CATALOGS
+
+
+DEFAULT_LOCALE = 'en'
+LOCALES = (DEFAULT_LOCALE,) + tuple(sorted(CATALOGS))
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+_translators = {}
+_active = [DEFAULT_LOCALE]
+
+
+def _identity(text):
+    return text
+
+
+def _compile(catalog):
+    """catalog dict -> translate(text) function"""
+    exact = {source: target for source, target in catalog.items() if not _PLACEHOLDER.search(source)}
+    # Most literal text first, so 'Page {page} | Generated: {date}' wins over 'Page {page}'
+    templated = sorted((source for source in catalog if source not in exact),
+                       key=lambda source: -len(_PLACEHOLDER.sub('', source)))
+    patterns, templates = [], []
+    for source in templated:
+        target = catalog[source]
+        i = len(templates)
+        names = _PLACEHOLDER.findall(source)
+        parts = _PLACEHOLDER.split(source)
+        # split() alternates literal text and placeholder names
+        regex = ''.join(re.escape(part) if j % 2 == 0 else f'(?P<t{i}_{part}>.+?)'
+                        for j, part in enumerate(parts))
+        patterns.append(f'(?P<t{i}>{regex})')
+        templates.append((target, names))
+    pattern = re.compile('|'.join(patterns), re.S) if patterns else None
+
+    def translate(text):
+        found = exact.get(text)
+        if found is not None:
+            return found
+        if pattern is None or not isinstance(text, str):
+            return text
+        match = pattern.fullmatch(text)
+        if not match:
+            return text
+        i = int(match.lastgroup[1:])
+        target, names = templates[i]
+        values = {}
+        for name in names:
+            value = match.group(f't{i}_{name}')
+            values[name] = exact.get(value, value)
+        return target.format(**values)
+
+    return translate
+
+
+def translator(locale=None):
+    """The translate(text) function for a locale, compiled on first use"""
+    locale = locale or DEFAULT_LOCALE
+    if locale not in _translators:
+        if locale == DEFAULT_LOCALE:
+            _translators[locale] = _identity
+        elif locale in CATALOGS:
+            _translators[locale] = _compile(CATALOGS[locale])
+        else:
+            raise ValueError(f'Unknown locale: {locale} (available: {", ".join(LOCALES)})')
+    return _translators[locale]
+
+
+def precompile(locales=LOCALES):
+    """Compile catalogs up front, e.g. before forking worker processes"""
+    for locale in locales:
+        translator(locale)
+
+
+def active_locale():
+    return _active[-1]
+
+
+@contextmanager
+def use_locale(locale):
+    """Documents created inside the block print in this locale"""
+    translator(locale)    # fail early on unknown locales
+    _active.append(locale or DEFAULT_LOCALE)
+    try:
+        yield
+    finally:
+        _active.pop()
+
+
+def localized_filename(filename, locale=None):
+    """'Weekly_Plan.pdf' -> 'Weekly_Plan_es.pdf' for non-default locales"""
+    if not locale or locale == DEFAULT_LOCALE:
+        return filename
+    base, ext = os.path.splitext(filename)
+    return f'{base}_{locale}{ext}'
+
+
+def localize_document(document, locale=None):
+    """Translated copy of a day document (workout_document.py)"""
+    translate = translator(locale)
+    if translate is _identity:
+        return document
+    return _localize(document, translate)
+
+
+def _localize(value, translate):
+    if isinstance(value, str):
+        return translate(value)
+    if isinstance(value, dict):
+        localized = {}
+        for key, item in value.items():
+            if key in ('type', 'kind', 'cells'):    # duration cells are translated with their value
+                localized[key] = item
+            elif key == 'fields':    # (label, line width, form field name)
+                localized[key] = [(translate(label), width, name) for label, width, name in item]
+            else:
+                localized[key] = _localize(item, translate)
+        return localized
+    if isinstance(value, (list, tuple)):
+        return type(value)(_localize(item, translate) for item in value)
+    return value
+
+
+class LocaleMixin:
+    """Translates the text of every cell() / multi_cell() of an FPDF class
+
+    The locale is the one active (use_locale) when the document is created.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.locale = active_locale()
+        self.translate = translator(self.locale)
+        super().__init__(*args, **kwargs)
+
+    def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=0, link=''):
+        super().cell(w, h, self.translate(txt), border, ln, align, fill, link)
+
+    def multi_cell(self, w, h, txt='', border=0, align='J', fill=0, split_only=False):
+        return super().multi_cell(w, h, self.translate(txt), border, align, fill, split_only)
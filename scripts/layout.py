@@ -0,0 +1,231 @@
+"""
+Layout Dry Run
+Lays documents out without drawing or writing them, and reports per
+document the page count, cells whose text is wider than the cell, and
+sections that run across a page break:
+
+    python fitness_tracker.py workouts --dry-run
+    python fitness_tracker.py workouts --cohort cohort.json --dry-run
+    python fitness_tracker.py tracker --weeks 12 --dry-run
+
+    with dry_run() as reports:
+        generate_all_pdfs()                # nothing is written
+    for report in reports:
+        print('\\n'.join(format_report(report)))
+
+In a dry run cell() only moves the cursor, breaking pages exactly as FPDF
+does, so no page content is formatted and nothing is compressed, subset
+or written. The generators hand their documents to save() instead of
+calling output() themselves.
+
+The same hook keeps documents off the filesystem: inside capture() save()
+hands (path, PDF bytes) to a list or an archive (bundle.py) instead.
+
+Documents are dated by day (render_date(); SOURCE_DATE_EPOCH pins it), in
+their footers and their CreationDate alike, so rendering the same document
+twice gives the same bytes.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import os
+
+
+_active = [None]      # report list of the innermost dry run
+_captures = [None]    # (path, PDF bytes) sink of the innermost capture
+
+
+@contextmanager
+def dry_run():
+    """Documents created inside the block are laid out only; yields their reports"""
+    reports = []
+    _active.append(reports)
+    try:
+        yield reports
+    finally:
+        _active.pop()
+
+
+def dry_running():
+    return _active[-1] is not None
+
+
+@contextmanager
+def collect():
+    """Yields the reports of the documents saved inside the block (none outside
+    a dry run), for process pool workers to hand back with their results"""
+    if not dry_running():
+        yield []
+        return
+    with dry_run() as reports:
+        yield reports
+
+
+def add_reports(reports):
+    """Add reports collected in a worker to the enclosing dry run"""
+    if dry_running():
+        _active[-1].extend(reports)
+
+
+@contextmanager
+def capture(sink=None):
+    """Documents saved inside the block are appended to sink (a new list by default) as
+    (path, PDF bytes) instead of written; yields the sink"""
+    sink = [] if sink is None else sink
+    _captures.append(sink)
+    try:
+        yield sink
+    finally:
+        _captures.pop()
+
+
+def capturing():
+    return _captures[-1] is not None
+
+
+def capture_sink():
+    """The sink of the innermost capture, or None"""
+    return _captures[-1]
+
+
+def writes_files():
+    """Whether save() writes to the filesystem (not in a dry run or a capture)"""
+    return not dry_running() and not capturing()
+
+
+@contextmanager
+def collect_files():
+    """Yields the (path, PDF bytes) of the documents saved inside the block when
+    capturing (none otherwise), for process pool workers to hand back"""
+    if not capturing():
+        yield []
+        return
+    with capture() as files:
+        yield files
+
+
+def add_files(files):
+    """Hand documents captured in a worker to the enclosing capture"""
+    if capturing():
+        for item in files:
+            _captures[-1].append(item)
+
+
+def render_date():
+    """Midnight of the day documents are dated: the day of SOURCE_DATE_EPOCH (UTC) when set, else today"""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    when = datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None) if epoch else datetime.now()
+    return when.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def reset():
+    """Leave every dry run and capture, e.g. in a worker forked inside one"""
+    del _active[1:], _captures[1:]
+
+
+def pdf_bytes(pdf):
+    data = pdf.output(dest='S')
+    return data.encode('latin-1') if isinstance(data, str) else bytes(data)    # PyFPDF 1.7 returns str
+
+
+def save(pdf, path):
+    """pdf.output(path), or in a dry run add the layout report for path, or when
+    capturing hand the PDF bytes to the capture"""
+    if not pdf.dry_run:
+        if capturing():
+            _captures[-1].append((path, pdf_bytes(pdf)))
+        else:
+            pdf.output(path)
+        return
+    pdf.finish_layout()
+    _active[-1].append({
+        'path': path,
+        'pages': pdf.page,
+        'overflows': pdf.overflows,
+        'splits': [(title, first, last) for title, first, last in pdf.sections
+                   if first is not None and last > first],
+    })
+
+
+def format_report(report):
+    """Report lines for one document"""
+    overflows, splits = report['overflows'], report['splits']
+    lines = [f'{os.path.relpath(report["path"])}: {report["pages"]} pages, '
+             f'{len(overflows)} overflowing cells, {len(splits)} split sections']
+    for page, room, width, text in overflows:
+        lines.append(f'  page {page}: {width:.1f} mm of text in a {room:.1f} mm cell: {text[:60]!r}')
+    for title, first, last in splits:
+        lines.append(f'  pages {first}-{last}: section {title!r} runs across a page break')
+    return lines
+
+
+class LayoutMixin:
+    """Lays out without drawing in a dry run and records what does not fit
+
+    Goes last before FPDF in the bases so it sees the final (translated,
+    converted) text of every cell. The classes call begin_section() from
+    their section titles.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.dry_run = dry_running()
+        self.overflows = []    # (page, cell width, text width, text)
+        self.sections = []     # [title, first page, last page]
+        self._page_chrome = False
+        self.render_date = render_date()    # one date for every page and the document information
+        super().__init__(*args, **kwargs)
+
+    def begin_section(self, title):
+        self.sections.append([title, None, None])    # pages set by its first cell
+
+    def add_page(self, orientation=''):
+        chrome, self._page_chrome = self._page_chrome, True    # footer and header are not section content
+        try:
+            super().add_page(orientation)
+        finally:
+            self._page_chrome = chrome
+
+    def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=0, link=''):
+        if not self.dry_run:
+            return super().cell(w, h, txt, border, ln, align, fill, link)
+        # FPDF.cell without the drawing
+        if self.y + h > self.page_break_trigger and not self.in_footer and self.accept_page_break():
+            x = self.x
+            self.add_page(self.cur_orientation)
+            self.x = x
+        if w == 0:
+            w = self.w - self.r_margin - self.x
+        if txt:
+            room = w - 2 * self.c_margin
+            width = self.get_string_width(txt)
+            if width > room + 0.01:
+                self.overflows.append((self.page, room, width, txt))
+        if self.sections and not (self._page_chrome or self.in_footer):
+            section = self.sections[-1]
+            if section[1] is None:
+                section[1] = self.page
+            section[2] = self.page
+        self.lasth = h
+        if ln > 0:
+            self.y += h
+            if ln == 1:
+                self.x = self.l_margin
+        else:
+            self.x += w
+
+    def _putinfo(self):
+        """FPDF's document information, created on render_date rather than at output()"""
+        from fpdf.fpdf import FPDF_VERSION
+        self._out('/Producer ' + self._textstring('PyFPDF ' + FPDF_VERSION + ' http://pyfpdf.googlecode.com/'))
+        for name in ('title', 'subject', 'author', 'keywords', 'creator'):
+            if hasattr(self, name):
+                self._out(f'/{name.capitalize()} ' + self._textstring(getattr(self, name)))
+        self._out('/CreationDate ' + self._textstring('D:' + self.render_date.strftime('%Y%m%d%H%M%S')))
+
+    def finish_layout(self):
+        """The last page footer, as output() would draw it"""
+        if self.page == 0:
+            self.add_page()
+        self.in_footer = 1
+        self.footer()
+        self.in_footer = 0
@@ -0,0 +1,186 @@
+"""
+Fillable PDF Form Fields
+AcroForm text fields and checkboxes for FPDF documents.
+
+Fields get stable dotted names such as 'w2d4.energy' or 'w2d4.cooldown.3';
+each dot starts a level of the field hierarchy, as the PDF spec requires,
+so any viewer reports the full name back. form_extract.py reads the values
+out of returned PDFs.
+
+FPDF 1.7 has no form support, so the mixin adds the widget annotations to
+the page dictionaries and the /AcroForm entry to the catalog while the
+document is written. The boxes and lines under the fields are the vector
+marks of graphics.py:
+
+    class TrackerPDF(FormFieldsMixin, GraphicsStateMixin, FPDF): ...
+"""
+
+from fpdf import FPDF
+
+from graphics import CHECKBOX_SIZE
+
+
+FIELD_FONT = 'Helv'
+CHECK_FONT = 'ZaDb'    # checkbox captions (/MK /CA), drawn in ZapfDingbats
+
+
+class FormFieldsMixin:
+    """Adds add_text_field / add_checkbox_field and friends to an FPDF class"""
+
+    def _fields(self):
+        if not hasattr(self, '_form_fields'):
+            self._form_fields = []
+            self._form_names = set()
+        return self._form_fields
+
+    def _register_field(self, name, kind, x, y, w, h, font_size=0, multiline=False):
+        fields = self._fields()
+        if name in self._form_names:
+            raise ValueError(f'Duplicate form field name: {name}')
+        self._form_names.add(name)
+        k = self.k
+        rect = (x * k, (self.h - y - h) * k, (x + w) * k, (self.h - y) * k)
+        fields.append({'name': name, 'kind': kind, 'page': self.page, 'rect': rect,
+                       'size': (w * k, h * k), 'font_size': font_size, 'multiline': multiline})
+
+    # -------------------------------------------------------------------------
+    # Drawing helpers (positions in user units, like cell())
+    # -------------------------------------------------------------------------
+
+    def add_text_field(self, name, x, y, w, h, font_size=9, multiline=False):
+        self._register_field(name, 'text', x, y, w, h, font_size, multiline)
+
+    def add_checkbox_field(self, name, x, y, size=CHECKBOX_SIZE):
+        self.checkbox(x, y, size)
+        self._register_field(name, 'checkbox', x, y, size, size)
+
+    def text_field_cell(self, name, w, h, ln=0):
+        """Underlined fill-in field in place of a cell of underscores"""
+        x, y, w = self.rule_cell(w, h, ln)
+        self.add_text_field(name, x, y, w, h - 1, self.font_size_pt)
+
+    def checkbox_cell(self, name, w, h, ln=0, align='C', border=0, fill=False):
+        """Cell holding a checkbox, in place of a '[  ]' text cell"""
+        x, y, size = self.box_cell(w, h, ln, align, border, fill)
+        self._register_field(name, 'checkbox', x, y, size, size)
+
+    # -------------------------------------------------------------------------
+    # PDF output
+    # -------------------------------------------------------------------------
+
+    def _plan_form(self, first_id):
+        """Assign object ids to widgets, field hierarchy nodes and resources"""
+        next_id = first_id
+        for field in self._form_fields:
+            field['id'] = next_id
+            next_id += 1
+
+        # Non-terminal fields for every name prefix: 'w2d4' -> 'w2d4.cooldown'
+        self._form_nodes = {}
+        for field in self._form_fields:
+            parts = field['name'].split('.')
+            for depth in range(1, len(parts)):
+                prefix = '.'.join(parts[:depth])
+                if prefix not in self._form_nodes:
+                    self._form_nodes[prefix] = {'id': next_id, 'kids': []}
+                    next_id += 1
+        for prefix, node in self._form_nodes.items():
+            parent = prefix.rpartition('.')[0]
+            if parent:
+                self._form_nodes[parent]['kids'].append(node['id'])
+        for field in self._form_fields:
+            parent = field['name'].rpartition('.')[0]
+            if parent:
+                self._form_nodes[parent]['kids'].append(field['id'])
+
+        self._form_font_id = next_id
+        self._form_check_font_id = next_id + 1
+        next_id += 2
+        self._form_appearances = {}
+        for field in self._form_fields:
+            if field['kind'] == 'checkbox' and field['size'] not in self._form_appearances:
+                self._form_appearances[field['size']] = (next_id, next_id + 1)
+                next_id += 2
+
+    def _putpages(self):
+        if not getattr(self, '_form_fields', None):
+            return FPDF._putpages(self)
+        # Pages are objects 3, 5, 7, ...; form objects follow the page contents
+        self._plan_form(3 + 2 * self.page)
+        annots = {}
+        for field in self._form_fields:
+            annots.setdefault(field['page'], []).append(f'{field["id"]} 0 R')
+
+        out = self._out
+        pages = iter(range(1, self.page + 1))
+
+        def page_out(line):
+            out(line)
+            if line == '/Resources 2 0 R':
+                page_annots = annots.get(next(pages))
+                if page_annots:
+                    out('/Annots [' + ' '.join(page_annots) + ']')
+
+        self._out = page_out
+        try:
+            FPDF._putpages(self)
+        finally:
+            del self._out
+
+    def _putresources(self):
+        if getattr(self, '_form_fields', None):
+            self._putformfields()
+        FPDF._putresources(self)
+
+    def _putformobj(self, expected_id, body):
+        self._newobj()
+        assert self.n == expected_id, 'form object numbering out of sync'
+        self._out(body)
+        self._out('endobj')
+
+    def _putformfields(self):
+        for field in self._form_fields:
+            partial = field['name'].rpartition('.')[2]
+            parent = field['name'].rpartition('.')[0]
+            body = ('<</Type /Annot /Subtype /Widget /F 4 /Rect [%.2f %.2f %.2f %.2f]' % field['rect']
+                    + f' /P {1 + 2 * field["page"]} 0 R /T {self._textstring(partial)}')
+            if parent:
+                body += f' /Parent {self._form_nodes[parent]["id"]} 0 R'
+            if field['kind'] == 'text':
+                body += f' /FT /Tx /DA (/{FIELD_FONT} {field["font_size"]:g} Tf 0 g)'
+                body += ' /Ff 4096>>' if field['multiline'] else '>>'
+            else:
+                on, off = self._form_appearances[field['size']]
+                body += (f' /FT /Btn /V /Off /AS /Off /MK <</CA (8)>> /DA (/{CHECK_FONT} 0 Tf 0 g)'
+                         f' /AP <</N <</Yes {on} 0 R /Off {off} 0 R>>>>>>')
+            self._putformobj(field['id'], body)
+
+        for prefix, node in self._form_nodes.items():
+            parent = prefix.rpartition('.')[0]
+            body = f'<</T {self._textstring(prefix.rpartition(".")[2])} /Kids [{" ".join(f"{kid} 0 R" for kid in node["kids"])}]'
+            if parent:
+                body += f' /Parent {self._form_nodes[parent]["id"]} 0 R'
+            self._putformobj(node['id'], body + '>>')
+
+        self._putformobj(self._form_font_id,
+                         '<</Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding>>')
+        self._putformobj(self._form_check_font_id, '<</Type /Font /Subtype /Type1 /BaseFont /ZapfDingbats>>')
+
+        for (w, h), (on, off) in self._form_appearances.items():
+            # Checked: a cross inside the printed box
+            cross = f'q 0 G 1 w 1 1 m {w - 1:.2f} {h - 1:.2f} l S 1 {h - 1:.2f} m {w - 1:.2f} 1 l S Q'
+            for obj_id, stream in ((on, cross), (off, '')):
+                self._newobj()
+                assert self.n == obj_id, 'form object numbering out of sync'
+                self._out(f'<</Type /XObject /Subtype /Form /BBox [0 0 {w:.2f} {h:.2f}] /Length {len(stream)}>>')
+                self._putstream(stream)
+                self._out('endobj')
+
+    def _putcatalog(self):
+        FPDF._putcatalog(self)
+        if getattr(self, '_form_fields', None):
+            roots = [f'{node["id"]} 0 R' for prefix, node in self._form_nodes.items() if '.' not in prefix]
+            roots += [f'{field["id"]} 0 R' for field in self._form_fields if '.' not in field['name']]
+            fonts = f'/{FIELD_FONT} {self._form_font_id} 0 R /{CHECK_FONT} {self._form_check_font_id} 0 R'
+            self._out(f'/AcroForm <</Fields [{" ".join(roots)}] /NeedAppearances true'
+                      f' /DR <</Font <<{fonts}>>>> /DA (/{FIELD_FONT} 0 Tf 0 g)>>')
@@ -0,0 +1,377 @@
+"""
+Golden Output Snapshots
+Renders every document of the four generators in memory, reads the text
+runs, boxes, lines and form fields of each page back out of the PDF bytes
+and compares them with the golden files in tests/golden/.
+
+    python pdf_snapshot.py                          # compare and report differences
+    python pdf_snapshot.py --update                 # accept the current output
+    python pdf_snapshot.py --only workouts/ --workers 4
+    python -m pytest tests                          # the same check as a test suite
+
+A golden file is one line per drawing operation, so a report is a plain
+unified diff:
+
+    text 228.63 793.97 F1 18.00 0.118 0.235 0.447 rg (WEEK 1 - DAY 1)
+    rect 28.35 737.00 178.58 -22.68 B 0.157 0.655 0.271 rg 0 G 0.57
+    line 28.35 677.48 566.93 677.48 S 0.157 0.655 0.271 RG 0.57
+    field w1d1.cooldown.1 Btn 491.11 593.15 501.03 603.07
+
+Documents are rendered in a process pool, one task per document. The
+configured TTF font (FITNESS_TRACKER_FONT) is ignored so text stays
+readable, and the render date (page footers) is masked.
+"""
+
+import argparse
+import difflib
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from form_extract import Ref, parse_value
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+GOLDEN_DIR = os.path.join(os.path.dirname(SCRIPTS_DIR), 'tests', 'golden')
+TRACKER_START = '2026-11-02'
+DIFF_LINES = 40    # per document in the report
+
+_OBJECT = re.compile(rb'(\d+)\s+0\s+obj\b')
+_STREAM = re.compile(rb'\s*stream\r?\n')
+_TOKEN = re.compile(rb'\((?:\\.|[^\\)])*\)|<[0-9A-Fa-f\s]*>|/[^\s/\[\]()<>{}%]+'
+                    rb'|[-+]?(?:\d+\.?\d*|\.\d+)|[A-Za-z\'"*]+|\[|\]', re.S)
+_ESCAPE = re.compile(rb'\\([nrtbf()\\]|[0-7]{1,3})')
+_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f'}
+_PAINT = {'S', 's', 'f', 'F', 'f*', 'B', 'B*', 'b', 'b*', 'n'}
+
+
+# =============================================================================
+# DOCUMENTS
+# =============================================================================
+
+def render_workout(week, day, locale=None, units=None, equipment=None, conditions=None, day_date=None):
+    from generate_improved_workout_pdfs import create_document_pdf
+    from workout_document import build_split_day
+    document = build_split_day(week, day, equipment=equipment, conditions=conditions)
+    if day_date:
+        document = dict(document, date=day_date)
+    return create_document_pdf(document, locale, units)
+
+
+def render_daily(week, day):
+    import generate_daily_pdfs
+    return getattr(generate_daily_pdfs, f'create_week{week}_day{day}')()
+
+
+def render_meal_plan(locale=None, units=None):
+    from generate_meal_plan_pdf import create_meal_plan_pdf
+    return create_meal_plan_pdf(locale, units)
+
+
+def render_weekly_plan(locale=None, units=None):
+    from generate_pdfs import create_weekly_plan_pdf
+    return create_weekly_plan_pdf(locale, units)
+
+
+def render_tracker(weeks=4, start=None, locale=None, units=None):
+    from generate_pdfs import create_daily_tracker_pdf
+    return create_daily_tracker_pdf(weeks, date.fromisoformat(start) if start else None, locale, units)
+
+
+def render_diff(from_week, to_week):
+    from generate_diff_pdf import create_diff_pdf
+    from program_diff import week_diff
+    return create_diff_pdf(week_diff(from_week, to_week))
+
+
+def documents():
+    """[(name, render function, args)] for every golden document"""
+    from workout_program import WEEKLY_SPLIT
+    jobs = []
+    for week in range(1, 5):
+        for day, slug, *_ in WEEKLY_SPLIT:
+            jobs.append((f'workouts/Week{week}_Day{day}_{slug}', 'render_workout', (week, day)))
+    jobs.append(('workouts/Week1_Day1_Upper_Push_es_imperial', 'render_workout', (1, 1, 'es', 'imperial')))
+    jobs.append(('workouts/Week1_Day4_Upper_Pull_bodyweight', 'render_workout', (1, 4, None, None, ())))
+    jobs.append(('workouts/Week1_Day2_Lower_Body_knee', 'render_workout', (1, 2, None, None, None, ('knee',))))
+    jobs.append(('workouts/Week1_Day4_Upper_Pull_scheduled', 'render_workout',
+                 (1, 4, None, None, None, None, '2026-11-06')))
+    for week in range(1, 5):
+        for day in range(1, 8):
+            jobs.append((f'daily/Week_{week}/Day_{day}', 'render_daily', (week, day)))
+    jobs += [
+        ('meal_plan/NUTRITION_MEAL_PLAN', 'render_meal_plan', ()),
+        ('meal_plan/NUTRITION_MEAL_PLAN_fr_imperial', 'render_meal_plan', ('fr', 'imperial')),
+        ('weekly/Weekly_Plan', 'render_weekly_plan', ()),
+        ('tracker/Daily_Exercise_Tracker', 'render_tracker', ()),
+        ('tracker/Daily_Exercise_Tracker_dated', 'render_tracker', (1, TRACKER_START)),
+        ('tracker/Daily_Exercise_Tracker_de_imperial', 'render_tracker', (1, None, 'de', 'imperial')),
+        ('diff/Week1_to_Week2', 'render_diff', (1, 2)),
+        ('diff/Week4_to_Week5', 'render_diff', (4, 5)),
+    ]
+    return jobs
+
+
+# =============================================================================
+# LAYOUT EXTRACTION
+# =============================================================================
+
+def _number(token):
+    return f'{float(token):.2f}'
+
+
+def _unescape(match):
+    code = match.group(1)
+    if code[:1].isdigit():
+        return bytes([int(code, 8) & 0xFF])
+    return _ESCAPES.get(code, code)
+
+
+def _string(token):
+    """(literal) as latin-1 text; <hex> (TTF glyph ids) is kept as hex"""
+    if token.startswith(b'<'):
+        return '<' + re.sub(rb'\s', b'', token[1:-1]).decode('ascii').upper() + '>'
+    return '(' + _ESCAPE.sub(_unescape, token[1:-1]).decode('latin-1') + ')'
+
+
+def _color(operands, op):
+    return ' '.join(f'{float(value):.3f}' if b'.' in value else value.decode() for value in operands) + ' ' + op
+
+
+def read_pdf(data):
+    """{object number: (value, decoded stream or None)}"""
+    objects = {}
+    for match in _OBJECT.finditer(data):
+        try:
+            value, end = parse_value(data, match.end())
+        except (ValueError, IndexError):
+            continue
+        stream = None
+        start = _STREAM.match(data, end)
+        if start and isinstance(value, dict):
+            length = value.get('Length')
+            if not isinstance(length, int) or isinstance(length, Ref):
+                length = data.index(b'endstream', start.end()) - start.end()
+            stream = data[start.end():start.end() + length]
+            if value.get('Filter') in ('FlateDecode', ['FlateDecode']):
+                stream = zlib.decompress(stream)
+        objects[int(match.group(1))] = (value, stream)
+    return objects
+
+
+def _subpaths(path):
+    """Split a path's segments at each moveto"""
+    subpaths = []
+    for segment, values in path:
+        if segment == 'm' or not subpaths:
+            subpaths.append([])
+        subpaths[-1].append((segment, values))
+    return subpaths
+
+
+def content_lines(stream):
+    """Text runs, boxes and lines of one page content stream"""
+    lines, operands, path = [], [], []
+    state = {'fill': '0 g', 'stroke': '0 G', 'width': '0.57', 'font': '- 0.00'}
+    saved = []
+    position = ('0.00', '0.00')
+    for match in _TOKEN.finditer(stream):
+        token = match.group()
+        if not (token[:1].isalpha() or token[:1] in b'\'"'):
+            operands.append(token)
+            continue
+        op = token.decode()
+        if op == 'q':
+            saved.append(dict(state))
+        elif op == 'Q' and saved:
+            state = saved.pop()
+        elif op in ('g', 'rg', 'k'):
+            state['fill'] = _color(operands, op)
+        elif op in ('G', 'RG', 'K'):
+            state['stroke'] = _color(operands, op)
+        elif op == 'w' and operands:
+            state['width'] = _number(operands[-1])
+        elif op == 'Tf' and len(operands) >= 2:
+            state['font'] = f'{operands[-2].decode()[1:]} {_number(operands[-1])}'
+        elif op in ('Td', 'TD') and len(operands) >= 2:
+            position = (_number(operands[-2]), _number(operands[-1]))
+        elif op == 'Tm' and len(operands) >= 6:
+            position = (_number(operands[-2]), _number(operands[-1]))
+        elif op in ('Tj', "'", '"') and operands:
+            lines.append(f'text {position[0]} {position[1]} {state["font"]} {state["fill"]} {_string(operands[-1])}')
+        elif op == 'TJ':
+            parts = [_string(token)[1:-1] for token in operands if token[:1] in b'(<']
+            lines.append(f'text {position[0]} {position[1]} {state["font"]} {state["fill"]} ({"".join(parts)})')
+        elif op in ('m', 'l', 'c', 'v', 'y', 're', 'h'):
+            path.append((op, [_number(value) for value in operands]))
+        elif op in _PAINT:
+            colors = {'f': state['fill'], 'F': state['fill'], 'f*': state['fill'], 'S': state['stroke'],
+                      's': state['stroke']}.get(op, f'{state["fill"]} {state["stroke"]}')
+            rest = []
+            for segment, values in path:
+                if segment == 're':
+                    lines.append(f'rect {" ".join(values)} {op} {colors} {state["width"]}')
+                else:
+                    rest.append((segment, values))
+            for subpath in _subpaths(rest):
+                if [segment for segment, values in subpath] == ['m', 'l']:
+                    lines.append(f'line {" ".join(subpath[0][1] + subpath[1][1])} {op} {colors} {state["width"]}')
+                else:
+                    points = ' '.join(segment + ' ' + ' '.join(values) for segment, values in subpath)
+                    lines.append(f'path {points} {op} {colors} {state["width"]}')
+            path = []
+        elif op == 'Do' and operands:
+            lines.append(f'image {operands[-1].decode()[1:]}')
+        operands = []
+    return lines
+
+
+def _field_name(annot, objects):
+    parts = []
+    while isinstance(annot, dict):
+        if 'T' in annot:
+            parts.append(str(annot['T']))
+        parent = annot.get('Parent')
+        annot = objects.get(parent, (None,))[0] if isinstance(parent, Ref) else parent
+    return '.'.join(reversed(parts))
+
+
+def extract_layout(data, mask=None):
+    """[[line, ...] per page] for the PDF bytes; mask text is replaced with '<masked>'"""
+    objects = read_pdf(data)
+    root = next(value for value, stream in objects.values()
+                if isinstance(value, dict) and value.get('Type') == 'Pages' and 'Parent' not in value)
+    pages = []
+    for kid in root['Kids']:
+        page = objects[kid][0]
+        contents = page.get('Contents')
+        contents = contents if isinstance(contents, list) else [contents]
+        stream = b'\n'.join(objects[ref][1] or b'' for ref in contents if ref in objects)
+        lines = content_lines(stream)
+        for ref in page.get('Annots', []):
+            annot = objects[ref][0] if isinstance(ref, Ref) else ref
+            if annot.get('Subtype') == 'Widget':
+                field_type = annot.get('FT') or objects.get(annot.get('Parent'), ({},))[0].get('FT', '')
+                lines.append(f'field {_field_name(annot, objects)} {field_type} '
+                             + ' '.join(_number(value) for value in annot['Rect']))
+            else:
+                lines.append(f'annot {annot.get("Subtype")} ' + ' '.join(_number(value) for value in annot['Rect']))
+        if mask:
+            lines = [line.replace(mask, '<masked>') for line in lines]
+        pages.append(lines)
+    return pages
+
+
+def format_snapshot(pages):
+    out = []
+    for i, lines in enumerate(pages, 1):
+        out.append(f'# page {i}')
+        out.extend(lines)
+    return '\n'.join(out) + '\n'
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def _init_worker():
+    os.environ.pop('FITNESS_TRACKER_FONT', None)
+
+
+def render_snapshot(job):
+    """(name, snapshot text) for one documents() entry"""
+    name, render, args = job
+    pdf = globals()[render](*args)
+    data = pdf.output('', 'S')
+    if isinstance(data, str):
+        data = data.encode('latin-1')
+    return name, format_snapshot(extract_layout(data, pdf.render_date.strftime('%Y-%m-%d')))
+
+
+def render_all(jobs=None, workers=None):
+    """Yield (name, snapshot text) for each document, rendered in a process pool"""
+    jobs = documents() if jobs is None else jobs
+    if workers == 1 or len(jobs) < 2:
+        _init_worker()
+        yield from map(render_snapshot, jobs)
+        return
+    chunksize = max(1, len(jobs) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        yield from pool.map(render_snapshot, jobs, chunksize=chunksize)
+
+
+def golden_path(name):
+    return os.path.join(GOLDEN_DIR, *name.split('/')) + '.txt'
+
+
+def golden_name(path):
+    return os.path.relpath(path, GOLDEN_DIR)[:-len('.txt')].replace(os.sep, '/')
+
+
+def golden_files():
+    for root, dirs, files in os.walk(GOLDEN_DIR):
+        for name in files:
+            if name.endswith('.txt'):
+                yield os.path.join(root, name)
+
+
+def read_golden(name):
+    try:
+        with open(golden_path(name), encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def write_golden(name, snapshot):
+    path = golden_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(snapshot)
+
+
+def diff(expected, actual, name):
+    """Unified diff lines between a golden snapshot and the current one"""
+    return list(difflib.unified_diff(expected.splitlines(), actual.splitlines(),
+                                     f'golden/{name}', f'current/{name}', n=1, lineterm=''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare every generated document with its golden snapshot')
+    parser.add_argument('--update', action='store_true', help='write the current output as the new goldens')
+    parser.add_argument('--only', action='append', help='name prefix to check (repeatable), e.g. workouts/')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    args = parser.parse_args()
+
+    jobs = [job for job in documents() if not args.only or any(job[0].startswith(p) for p in args.only)]
+    start = time.perf_counter()
+    failed, missing = [], []
+    for name, snapshot in render_all(jobs, args.workers):
+        expected = read_golden(name)
+        if args.update:
+            if expected != snapshot:
+                write_golden(name, snapshot)
+                print(f'Updated: {name}')
+        elif expected is None:
+            missing.append(name)
+        elif expected != snapshot:
+            failed.append(name)
+            lines = diff(expected, snapshot, name)
+            print('\n'.join(lines[:DIFF_LINES]))
+            if len(lines) > DIFF_LINES:
+                print(f'... {len(lines) - DIFF_LINES} more diff lines')
+
+    for name in missing:
+        print(f'Missing golden: {name} (run with --update)')
+    print(f'{len(jobs)} documents in {time.perf_counter() - start:.1f} s: '
+          f'{len(jobs) - len(failed) - len(missing)} match, {len(failed)} differ, {len(missing)} missing')
+    if failed or missing:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
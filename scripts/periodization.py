@@ -0,0 +1,111 @@
+"""
+Periodization
+Maps program weeks onto mesocycles of build, peak and deload weeks:
+
+    training_week(4)                 # TrainingWeek(week=4, cycle=1, step=4, phase='peak', level=4, start=1)
+    training_week(5).phase           # 'deload' (default: 3 build weeks, a peak week, a deload week)
+
+    with use_mesocycle(6):           # programs built inside use 6-week blocks
+        build_plan(range(1, 53))
+
+The progression tables in workout_program.py have four levels, the four
+weeks of the original program. Build weeks climb levels 1-3, the peak week
+is level 4 and the deload week drops back to level 1 with fewer sets at a
+lighter load. Each completed mesocycle starts the next one a step higher
+(see the *_CYCLE_STEP constants in workout_program.py).
+
+A year of weeks is laid out in one pass the first time a mesocycle length
+is used, by tiling one mesocycle; precompute() does this for every length
+a cohort asks for before rendering, so building documents only indexes
+into the schedule.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import math
+
+
+DEFAULT_MESOCYCLE = 5     # weeks: 3 build, 1 peak, 1 deload
+WEEKS_PER_YEAR = 52
+PEAK_LEVEL = 4
+LOAD_STEP = 0.5           # Smallest load change we prescribe (kg)
+DELOAD_LOAD = 0.90
+DELOAD_SETS = 0.60
+
+_schedules = {}
+_active = [DEFAULT_MESOCYCLE]
+
+
+class TrainingWeek(namedtuple('TrainingWeek', 'week cycle step phase level start')):
+    """One program week: its mesocycle (cycle, from 1), position in it (step,
+    from 1), phase ('build', 'peak' or 'deload'), progression table level
+    (1-4) and the first week of its mesocycle (start)
+    """
+
+
+def deload_sets(sets):
+    return max(2, math.ceil(sets * DELOAD_SETS))
+
+
+def deload_load(load):
+    """Deload load in kg, rounded down to the load step"""
+    return math.floor(load * DELOAD_LOAD / LOAD_STEP + 1e-9) * LOAD_STEP
+
+
+def _mesocycle(length):
+    """The TrainingWeek of each step of a mesocycle (week and start relative to it)"""
+    if not isinstance(length, int) or length < 3:
+        raise ValueError(f'A mesocycle needs at least 3 weeks (build, peak, deload), got {length!r}')
+    builds = length - 2
+    phases = [('build', 1 + (step * 2) // max(1, builds - 1)) for step in range(builds)]
+    phases += [('peak', PEAK_LEVEL), ('deload', 1)]
+    return [TrainingWeek(step, 0, step, phase, level, 1) for step, (phase, level) in enumerate(phases, 1)]
+
+
+def schedule(length=None, weeks=WEEKS_PER_YEAR):
+    """TrainingWeek of program weeks 1..weeks for a mesocycle length (default: the active one)"""
+    length = length or active_mesocycle()
+    cached = _schedules.get(length)
+    if cached is None or len(cached) < weeks:
+        template = _mesocycle(length)
+        cached = _schedules[length] = tuple(
+            template[(week - 1) % length]._replace(week=week, cycle=(week - 1) // length + 1,
+                                                   start=week - (week - 1) % length)
+            for week in range(1, weeks + 1))
+    return cached
+
+
+def precompute(lengths, weeks=WEEKS_PER_YEAR):
+    """Lay out the schedule of every mesocycle length once (None: the default);
+    fails on invalid lengths before anything is rendered
+    """
+    for length in set(lengths):
+        schedule(length, weeks)
+
+
+def training_week(week, length=None):
+    """The TrainingWeek of a program week (1-based)"""
+    weeks = schedule(length)
+    if week > len(weeks):    # past the precomputed year
+        weeks = schedule(length, week)
+    return weeks[max(week, 1) - 1]
+
+
+def is_deload_week(week):
+    return training_week(week).phase == 'deload'
+
+
+def active_mesocycle():
+    return _active[-1]
+
+
+@contextmanager
+def use_mesocycle(length):
+    """Programs built inside the block use mesocycles of this many weeks (None: the default)"""
+    length = length or DEFAULT_MESOCYCLE
+    schedule(length)    # fail early on invalid lengths
+    _active.append(length)
+    try:
+        yield
+    finally:
+        _active.pop()
@@ -0,0 +1,85 @@
+"""
+Pipe Mode
+Runs the cohort generator as a pipeline stage: newline-delimited JSON
+athlete profiles on stdin, a TAR stream of the PDFs on stdout and
+newline-delimited JSON progress on stderr:
+
+    python fitness_tracker.py pipe --week 1 < cohort.ndjson | zstd > week1.tar.zst
+    cat cohort.ndjson | python fitness_tracker.py pipe --format tar.gz | aws s3 cp - s3://bucket/week1.tar.gz
+
+Members are named <athlete_id>/Week1_Day4_Upper_Pull.pdf. Nothing
+touches the local disk: save() hands each PDF to the archive through
+layout.capture(), and the archive is written to stdout in stream mode
+(bundle.py). stdin is read one line at a time and each athlete's PDFs are
+written, and stdout flushed, before the next line is read, so the
+archive grows while the profiles are still arriving. The first athlete of
+a cohort variant renders it; the PDFs are kept in memory and copied for
+later athletes sharing it. stdout carries nothing but the archive;
+stderr carries one JSON object per event:
+
+    {"event": "start", "format": "tar"}
+    {"event": "document", "member": "A-001/Week1_Day1_Upper_Push.pdf", "bytes": 48211}
+    {"event": "done", "athletes": 2, "documents": 14, "bytes": 671043, "seconds": 1.8}
+    {"event": "error", "error": "ValueError: Unknown locale: xx (available: en, de, es, fr)"}
+"""
+
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import time
+
+from athletes import iter_profiles, safe_filename
+from bundle import Bundle
+from generate_improved_workout_pdfs import generate_cohort, profile_variant
+from layout import capture
+
+
+def emit(stream, event):
+    stream.write(json.dumps(event) + '\n')
+    stream.flush()
+
+
+class _Progress:
+    """Capture sink that adds each document to the archive, flushes it and reports it"""
+
+    def __init__(self, archive, output, stream):
+        self.archive = archive
+        self.output = output
+        self.stream = stream
+        self.count = self.size = 0
+
+    def append(self, item):
+        path, data = item
+        self.archive.append(item)
+        self.output.flush()
+        self.count, self.size = self.count + 1, self.size + len(data)
+        emit(self.stream, {'event': 'document', 'member': self.archive.member(path), 'bytes': len(data)})
+
+
+def run_pipe(stdin, stdout, stderr, weeks=range(1, 5), days=None, format='tar'):
+    """Render the profiles read from stdin into an archive written to stdout (a binary
+    file object); returns the number of documents. Errors are reported on stderr and raised."""
+    started = time.monotonic()
+    athletes = 0
+    rendered = {}    # profile variant -> [(name under the athlete directory, PDF bytes)]
+    try:
+        emit(stderr, {'event': 'start', 'format': format})
+        with Bundle(stdout, format, root=os.curdir) as archive, redirect_stdout(io.StringIO()):
+            progress = _Progress(archive, stdout, stderr)
+            for profile in iter_profiles(stdin):
+                directory = os.path.join(os.curdir, safe_filename(profile['athlete_id']))
+                variant = profile_variant(profile)
+                if variant not in rendered:
+                    with capture() as files:    # the generator's summary lines are replaced by the events
+                        generate_cohort([profile], weeks, days, os.curdir, workers=1)
+                    rendered[variant] = [(os.path.relpath(path, directory), data) for path, data in files]
+                for name, data in rendered[variant]:
+                    progress.append((os.path.join(directory, name), data))
+                athletes += 1
+    except Exception as error:
+        emit(stderr, {'event': 'error', 'error': f'{type(error).__name__}: {error}'})
+        raise
+    emit(stderr, {'event': 'done', 'athletes': athletes, 'documents': progress.count, 'bytes': progress.size,
+                  'seconds': round(time.monotonic() - started, 1)})
+    return progress.count
@@ -0,0 +1,173 @@
+"""
+Week-over-Week Program Diff
+Exercises added, removed and modified between two weeks of the program,
+with their changes in sets, reps, rest and load:
+
+    python program_diff.py 1 2                         # fixed program
+    python program_diff.py 4 5 --json
+    python program_diff.py 1 2 --pdf Week1_to_Week2.pdf
+    python program_diff.py --weeks 52 --db logs.db --json   # every athlete, week over week
+
+Weeks are compared as records built from the program data (one per
+exercise and training day, the pre-workout protocol as day 0), not as
+rendered documents. The fixed program's records and diffs are computed once
+per week; an athlete's adaptive prescriptions (progression.py) are laid
+over them only for the weeks that have any.
+"""
+
+import argparse
+from collections import namedtuple
+import json
+
+from periodization import active_mesocycle
+from progression import ProgressionEngine, parse_pre_workout
+from session_log import SessionLog
+from workout_program import WEEKLY_SPLIT, canonical, get_pre_workout_exercises, get_split_day
+
+
+PRE_WORKOUT_DAY = 0
+FIELDS = ('sets', 'reps', 'rest', 'load_kg')
+
+
+class Entry(namedtuple('Entry', 'day exercise sets reps rest load_kg')):
+    """One exercise of a week: day 0 is the pre-workout protocol of every training day"""
+
+
+_records = {}    # (mesocycle, week) -> fixed program records
+_diffs = {}      # (mesocycle, week, week) -> diff of the fixed program
+
+
+def _reps(low, high):
+    return f'{low}-{high}' if high != low else str(low)
+
+
+def program_records(week):
+    """{(day, canonical name): Entry} of the fixed program for a week"""
+    key = (active_mesocycle(), week)
+    if key not in _records:
+        records = {}
+        for name, text, rest, notes in get_pre_workout_exercises(week):
+            parsed = parse_pre_workout(name, text)
+            records[PRE_WORKOUT_DAY, canonical(name)] = Entry(
+                PRE_WORKOUT_DAY, name, parsed['sets'], str(parsed['reps_low']), rest, parsed['load_kg'])
+        for day, slug, title, focus, kind, exercises_func, stretches_func in WEEKLY_SPLIT:
+            if kind != 'training':
+                continue
+            for row in exercises_func(week):
+                sets = int(row[1]) if row[1].isdigit() else row[1]
+                records[day, canonical(row[0])] = Entry(day, row[0], sets, row[2].split('@')[0].strip(), row[3],
+                                                        None)
+        _records[key] = records
+    return _records[key]
+
+
+def apply_prescriptions(records, prescriptions):
+    """Records with adaptive prescriptions laid over them, as the documents print them"""
+    records = dict(records)
+    for (day, key), entry in records.items():
+        prescription = prescriptions.get(key)
+        if not prescription or (day != PRE_WORKOUT_DAY and prescription['action'] == 'program'):
+            continue
+        reps = (str(prescription['reps_low']) if day == PRE_WORKOUT_DAY else
+                _reps(prescription['reps_low'], prescription['reps_high']))
+        records[day, key] = entry._replace(sets=prescription['sets'], reps=reps, load_kg=prescription['load_kg'])
+    return records
+
+
+def diff_records(before, after):
+    """{'added': [entry], 'removed': [entry], 'modified': [{'day', 'exercise', 'changes'}]}
+
+    changes maps each changed field to [before, after].
+    """
+    added, modified = [], []
+    for key, entry in after.items():
+        old = before.get(key)
+        if old is None:
+            added.append(entry._asdict())
+        elif old != entry:
+            changes = {field: [getattr(old, field), getattr(entry, field)] for field in FIELDS
+                       if getattr(old, field) != getattr(entry, field)}
+            if changes:
+                modified.append({'day': entry.day, 'exercise': entry.exercise, 'changes': changes})
+    removed = [entry._asdict() for key, entry in before.items() if key not in after]
+    return {'added': added, 'removed': removed, 'modified': modified}
+
+
+def week_diff(from_week, to_week, prescriptions=None):
+    """Diff of two weeks; prescriptions maps a week to its adaptive prescriptions"""
+    prescriptions = prescriptions or {}
+    if from_week not in prescriptions and to_week not in prescriptions:
+        key = (active_mesocycle(), from_week, to_week)
+        if key not in _diffs:
+            _diffs[key] = diff_records(program_records(from_week), program_records(to_week))
+        return dict(_diffs[key], from_week=from_week, to_week=to_week)
+    records = [program_records(week) for week in (from_week, to_week)]
+    records = [apply_prescriptions(week_records, prescriptions[week]) if week in prescriptions else week_records
+               for week, week_records in zip((from_week, to_week), records)]
+    return dict(diff_records(*records), from_week=from_week, to_week=to_week)
+
+
+def day_label(day):
+    return 'Pre-workout' if day == PRE_WORKOUT_DAY else f'Day {day} {get_split_day(day)[2]}'
+
+
+def format_value(field, value):
+    if value is None:
+        return '-'
+    return f'{value:g}kg' if field == 'load_kg' else str(value)
+
+
+def format_change(field, before, after):
+    return f'{field[:4]} {format_value(field, before)} -> {format_value(field, after)}'
+
+
+def _print_diff(title, report):
+    counts = {kind: len(report[kind]) for kind in ('modified', 'added', 'removed')}
+    print(f'{title}Week {report["from_week"]} -> Week {report["to_week"]}: '
+          + ', '.join(f'{count} {kind}' for kind, count in counts.items()))
+    for change in report['modified']:
+        changes = ', '.join(format_change(field, *values) for field, values in change['changes'].items())
+        print(f'  ~ {day_label(change["day"])}: {change["exercise"]}: {changes}')
+    for sign, kind in (('+', 'added'), ('-', 'removed')):
+        for entry in report[kind]:
+            print(f'  {sign} {day_label(entry["day"])}: {entry["exercise"]} '
+                  f'({entry["sets"]} x {entry["reps"]}, rest {entry["rest"]})')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Week-over-week program changes')
+    parser.add_argument('week', type=int, nargs='*', help='the two weeks to compare (default: every week against '
+                                                          'the one before it, see --weeks)')
+    parser.add_argument('--weeks', type=int, default=4, help='without two weeks: compare weeks 1..N (default 4)')
+    parser.add_argument('--db', help='session log database: diff every athlete\'s adaptive program')
+    parser.add_argument('--athlete', help='with --db, a single athlete (default: all)')
+    parser.add_argument('--json', action='store_true', help='print NDJSON reports')
+    parser.add_argument('--pdf', metavar='PATH', help='with two weeks: write the diff as a one-page PDF')
+    args = parser.parse_args()
+
+    if args.week and len(args.week) != 2:
+        parser.error('give two weeks to compare, or none')
+    pairs = [tuple(args.week)] if args.week else [(week, week + 1) for week in range(1, args.weeks)]
+
+    athletes = {None: {}}
+    if args.db:
+        with SessionLog(args.db) as log:
+            athletes = ProgressionEngine(log).stored_prescriptions(args.athlete)
+
+    reports = [dict(week_diff(*pair, prescriptions), athlete_id=athlete_id)
+               for athlete_id, prescriptions in athletes.items() for pair in pairs]
+    for report in reports:
+        if args.json:
+            print(json.dumps(report))
+        else:
+            _print_diff(f'{report["athlete_id"]} - ' if report['athlete_id'] else '', report)
+
+    if args.pdf:
+        if len(reports) != 1:
+            parser.error('--pdf needs two weeks and at most one athlete')
+        from generate_diff_pdf import write_diff_pdf
+        print(f'Saved: {write_diff_pdf(reports[0], args.pdf)}')
+
+
+if __name__ == '__main__':
+    main()
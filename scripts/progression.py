@@ -0,0 +1,360 @@
+"""
+Adaptive Progression Engine
+Computes next week's prescriptions from logged performance (session_log.py)
+instead of the fixed week-by-week progression tables.
+
+    python progression.py logs.db                      # recompute athletes with new logs
+    python progression.py logs.db --show A-001 --week 3
+
+Rules, applied per exercise to the sets logged in the current week:
+    pain      pain logged on a day the lift was done -> regress: -10% load
+              (or -20% reps for bodyweight work) and one set fewer
+    deload    scheduled deload week, or 2 consecutive stalls -> ~60% of the
+              sets at -10% load
+    progress  every prescribed set reached the top of the rep range at
+              RPE <= 8 -> load +2.5% max (age 38 cap, rounded down to 0.5kg);
+              bodyweight work or loads too light for a 0.5kg step add 1 rep/set
+    hold      reps missed or RPE >= 9.5 -> same prescription, counts as a stall
+Exercises with no logged sets carry their prescription forward (load and
+stall count); until an exercise has been adapted the fixed program applies.
+"""
+
+import argparse
+import json
+import math
+import re
+
+from periodization import LOAD_STEP, active_mesocycle, deload_load, deload_sets, training_week
+from session_log import SessionLog
+from units import Measured, Quantity, measured
+from workout_program import WEEKLY_SPLIT, canonical, get_pre_workout_exercises
+
+
+LOAD_CAP = 0.025          # Conservative 2.5% weekly increase (age 38)
+REGRESSION_LOAD = 0.90
+STALLS_BEFORE_DELOAD = 2
+PROGRESS_MAX_RPE = 8.0
+HOLD_MIN_RPE = 9.5
+NO_PAIN = {'', 'no', 'none', 'n/a', '-', '0', 'nil'}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS prescriptions (
+    athlete_id TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    exercise TEXT NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    sets INTEGER NOT NULL,
+    reps_low INTEGER NOT NULL,
+    reps_high INTEGER NOT NULL,
+    load_kg REAL,
+    action TEXT NOT NULL,
+    stalls INTEGER NOT NULL,
+    note TEXT NOT NULL,
+    PRIMARY KEY (athlete_id, week, exercise)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS progression_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+'''
+
+PRESCRIPTION_COLUMNS = ['name', 'kind', 'sets', 'reps_low', 'reps_high', 'load_kg', 'action', 'stalls', 'note']
+
+_ROW_REPS = re.compile(r'^(\d+)(?:-(\d+))?(?!\s*(?:sec|min))')
+_PRE_WORKOUT = re.compile(r'(\d+)\s*x\s*(\d+)(?:.*@\s*([\d.]+)\s*kg)?')
+
+
+def _round_down(load):
+    return math.floor(load / LOAD_STEP + 1e-9) * LOAD_STEP
+
+
+def _load(load):
+    return Quantity(load, 'kg', places=None)
+
+
+# =============================================================================
+# PROGRAM DEFAULTS
+# =============================================================================
+
+def parse_main_row(row):
+    """Main workout row -> prescription dict, None for timed work ('45 sec')"""
+    name, sets, reps_tempo = row[0], row[1], row[2]
+    match = _ROW_REPS.match(reps_tempo.split('@')[0].strip())
+    if not match or not str(sets).isdigit():
+        return None
+    low = int(match.group(1))
+    return {'name': name, 'kind': 'main', 'sets': int(sets), 'reps_low': low,
+            'reps_high': int(match.group(2) or low), 'load_kg': None,
+            'action': 'program', 'stalls': 0, 'note': row[4]}
+
+
+def parse_pre_workout(name, text):
+    """'3 x 12 = 36 @ 12kg' -> prescription dict"""
+    sets, reps, load = _PRE_WORKOUT.match(text).groups()
+    return {'name': name, 'kind': 'pre_workout', 'sets': int(sets), 'reps_low': int(reps),
+            'reps_high': int(reps), 'load_kg': float(load) if load else None,
+            'action': 'program', 'stalls': 0, 'note': ''}
+
+
+def program_prescriptions(week):
+    """The fixed program of a week as {canonical name: prescription}"""
+    prescriptions = {}
+    for name, text, rest, notes in get_pre_workout_exercises(week):
+        prescriptions[canonical(name)] = parse_pre_workout(name, text)
+    for day, slug, title, focus, kind, exercises_func, stretches_func in WEEKLY_SPLIT:
+        if kind != 'training':
+            continue
+        for row in exercises_func(week):
+            prescription = parse_main_row(row)
+            if prescription:
+                prescriptions.setdefault(canonical(row[0]), prescription)
+    return prescriptions
+
+
+# =============================================================================
+# RULES
+# =============================================================================
+
+def next_prescription(current, logged_sets, pain=None, deload=False):
+    """Apply the progression rules to one exercise
+
+    logged_sets is a list of (reps, load_kg, rpe) tuples for the current
+    week; pain is the pain location logged on those days, if any.
+    """
+    new = dict(current, action='carry')
+    if not logged_sets:
+        return new
+
+    sets, low, high = current['sets'], current['reps_low'], current['reps_high']
+    reps = [r or 0 for r, load, rpe in logged_sets]
+    loads = [load for r, load, rpe in logged_sets if load]
+    rpes = [rpe for r, load, rpe in logged_sets if rpe is not None]
+    load = max(loads) if loads else current['load_kg']
+    rpe = max(rpes) if rpes else None
+    hit_top = len(logged_sets) >= sets and min(reps) >= high
+    missed = len(logged_sets) < sets or min(reps) < low
+    new['load_kg'] = load
+
+    if pain:
+        new.update(action='regress', sets=max(2, sets - 1), stalls=0)
+        if load:
+            new['load_kg'] = _round_down(load * REGRESSION_LOAD)
+            new['note'] = Measured('Pain ({pain}): {}, pain-free range only', _load(new['load_kg']), pain=pain)
+        else:
+            new['reps_low'] = max(1, int(low * 0.8))
+            new['reps_high'] = max(new['reps_low'], int(high * 0.8))
+            new['note'] = f'Pain ({pain}): fewer reps, pain-free range only'
+        return new
+
+    stalled = missed or (rpe is not None and rpe >= HOLD_MIN_RPE)
+    stalls = current['stalls'] + 1 if stalled else 0
+    if deload or stalls >= STALLS_BEFORE_DELOAD:
+        new.update(action='deload', sets=deload_sets(sets), stalls=0)
+        if load:
+            new['load_kg'] = deload_load(load)
+        new['note'] = Measured('Deload: fewer sets @ {}', _load(new['load_kg'])) if load else 'Deload: fewer sets'
+        return new
+
+    if stalled:
+        new.update(action='hold', stalls=stalls)
+        reason = 'reps missed' if missed else f'RPE {rpe:g}'
+        new['note'] = Measured('Hold {}: {reason}', _load(load), reason=reason) if load else f'Hold: {reason}'
+        return new
+
+    new['stalls'] = 0
+    if hit_top and (rpe is None or rpe <= PROGRESS_MAX_RPE):
+        increased = _round_down(load * (1 + LOAD_CAP)) if load else None
+        if increased and increased > load:
+            new.update(action='progress', load_kg=increased)
+            new['note'] = Measured('Target {} (+{percent:.1f}%)', _load(increased),
+                                   percent=(increased / load - 1) * 100)
+        else:
+            new.update(action='progress', reps_low=low + 1, reps_high=high + 1)
+            new['note'] = Measured('+1 rep per set @ {}', _load(load)) if load else '+1 rep per set'
+        return new
+
+    new['action'] = 'hold'
+    new['note'] = (f'Same load, build to {high} reps' if load is None else
+                   Measured('{}, build to {high} reps', _load(load), high=high))
+    return new
+
+
+def reported_pain(sessions):
+    """Pain locations logged in sessions, in order (contraindications.py rewrites the next week around them)"""
+    pain = []
+    for session in sessions:
+        location = (session.get('pain') or '').strip()
+        if location.lower() not in NO_PAIN and location not in pain:
+            pain.append(location)
+    return pain
+
+
+def compute_next_week(current, set_rows, session_rows, deload=False):
+    """Next week's prescriptions from this week's logged sets and sessions"""
+    pain_by_day = {}
+    for session in session_rows:
+        pain = (session.get('pain') or '').strip()
+        if pain.lower() not in NO_PAIN:
+            pain_by_day[session['day']] = pain
+
+    logged, pain = {}, {}
+    for row in set_rows:
+        key = canonical(row['exercise'])
+        logged.setdefault(key, []).append((row['reps'], row['load_kg'], row['rpe']))
+        if row['day'] in pain_by_day:
+            pain[key] = pain_by_day[row['day']]
+
+    return {key: next_prescription(prescription, logged.get(key), pain.get(key), deload)
+            for key, prescription in current.items()}
+
+
+# =============================================================================
+# FORMATTING (used by workout_document.py)
+# =============================================================================
+
+def format_pre_workout(prescription):
+    reps = prescription['reps_low']
+    text = f'{prescription["sets"]} x {reps} = {prescription["sets"] * reps}'
+    if prescription['load_kg']:
+        return Measured(text + ' @ {}', Quantity(prescription['load_kg'], 'kg', places=None))
+    return text
+
+
+def apply_to_pre_workout(rows, prescriptions):
+    result = []
+    for name, text, rest, notes in rows:
+        prescription = prescriptions.get(canonical(name))
+        if prescription:
+            text = format_pre_workout(prescription)
+        result.append((name, text, rest, notes))
+    return result
+
+
+def apply_to_main_workout(rows, prescriptions):
+    result = []
+    for row in rows:
+        prescription = prescriptions.get(canonical(row[0]))
+        if prescription and prescription['action'] != 'program':
+            name, sets, reps_tempo, rest, notes = row
+            reps, _, tempo = reps_tempo.partition('@')
+            low, high = prescription['reps_low'], prescription['reps_high']
+            reps = f'{low}-{high}' if high != low else str(low)
+            row = (name, str(prescription['sets']), f'{reps} @{tempo}' if tempo else reps, rest,
+                   measured(prescription['note']))    # a plain str once read back from the database
+        result.append(row)
+    return result
+
+
+# =============================================================================
+# COHORT ENGINE
+# =============================================================================
+
+class ProgressionEngine:
+    """Stores computed prescriptions next to the session log
+
+    is_deload_week(week) decides scheduled deloads; by default they are the
+    deload weeks of the mesocycle active when the engine is created
+    (periodization.py), on top of the deloads from repeated stalls.
+    """
+
+    def __init__(self, log, is_deload_week=None):
+        self.log = log
+        self.conn = log.conn
+        length = active_mesocycle()
+        self.is_deload_week = is_deload_week or (lambda week: training_week(week, length).phase == 'deload')
+        self.conn.executescript(SCHEMA)
+
+    def prescriptions(self, athlete_id, week):
+        """Prescriptions for a week: computed ones over the program defaults"""
+        prescriptions = program_prescriptions(week)
+        cursor = self.conn.execute(
+            f'SELECT exercise, {", ".join(PRESCRIPTION_COLUMNS)} FROM prescriptions '
+            'WHERE athlete_id = ? AND week = ?', (athlete_id, week))
+        for row in cursor:
+            prescriptions[row[0]] = dict(zip(PRESCRIPTION_COLUMNS, row[1:]))
+        return prescriptions
+
+    def stored_prescriptions(self, athlete_id=None):
+        """{athlete_id: {week: {exercise: prescription}}} of the computed prescriptions
+        (all athletes in the log by default), in one query
+        """
+        athletes = {athlete_id: {} for athlete_id in ([athlete_id] if athlete_id else self.log.athletes())}
+        where, params = ('WHERE athlete_id = ?', (athlete_id,)) if athlete_id else ('', ())
+        for row in self.conn.execute(f'SELECT athlete_id, week, exercise, {", ".join(PRESCRIPTION_COLUMNS)} '
+                                     f'FROM prescriptions {where}', params):
+            weeks = athletes.setdefault(row[0], {})
+            weeks.setdefault(row[1], {})[row[2]] = dict(zip(PRESCRIPTION_COLUMNS, row[3:]))
+        return athletes
+
+    def reported_pain(self, athlete_id, week):
+        """Pain locations logged in a week's sessions"""
+        return reported_pain(self.log.sessions(athlete_id, (week, week)))
+
+    def recompute(self, athlete_id, from_week=1):
+        """Recompute prescriptions for every logged week >= from_week"""
+        last_week = self.conn.execute(
+            'SELECT MAX(week) FROM sets WHERE athlete_id = ?', (athlete_id,)).fetchone()[0]
+        if last_week is None:
+            return 0
+        rows = []
+        current = self.prescriptions(athlete_id, from_week)
+        for week in range(from_week, last_week + 1):
+            upcoming = compute_next_week(current, self.log.sets(athlete_id, (week, week)),
+                                         self.log.sessions(athlete_id, (week, week)),
+                                         self.is_deload_week(week + 1))
+            defaults = program_prescriptions(week + 1)
+            for key, prescription in upcoming.items():
+                if prescription['action'] == 'carry' and current[key]['action'] == 'program' and key in defaults:
+                    # Nothing logged and nothing adapted yet: the fixed program still applies
+                    upcoming[key] = prescription = defaults[key]
+                rows.append((athlete_id, week + 1, key) + tuple(prescription[c] for c in PRESCRIPTION_COLUMNS))
+            current = upcoming
+        with self.conn:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO prescriptions (athlete_id, week, exercise, {", ".join(PRESCRIPTION_COLUMNS)}) '
+                f'VALUES ({", ".join("?" * (3 + len(PRESCRIPTION_COLUMNS)))})', rows)
+        return last_week - from_week + 1
+
+    def recompute_cohort(self):
+        """Recompute only athletes with log batches newer than the last run
+
+        Returns {athlete_id: weeks recomputed}.
+        """
+        row = self.conn.execute("SELECT value FROM progression_meta WHERE key = 'last_batch'").fetchone()
+        watermark = row[0] if row else 0
+        latest = self.conn.execute('SELECT MAX(batch) FROM batches').fetchone()[0] or 0
+        if latest <= watermark:
+            return {}
+
+        dirty = {}
+        for table in ('sets', 'sessions'):
+            for athlete_id, week in self.conn.execute(
+                    f'SELECT athlete_id, MIN(week) FROM {table} WHERE batch > ? GROUP BY athlete_id', (watermark,)):
+                dirty[athlete_id] = min(week, dirty.get(athlete_id, week))
+
+        done = {athlete_id: self.recompute(athlete_id, from_week) for athlete_id, from_week in sorted(dirty.items())}
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO progression_meta VALUES ('last_batch', ?)", (latest,))
+        return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Adaptive progression from logged sessions')
+    parser.add_argument('db', help='session log database (session_log.py)')
+    parser.add_argument('--show', metavar='ATHLETE', help='print prescriptions for an athlete')
+    parser.add_argument('--week', type=int, default=2, help='week to show (default 2)')
+    args = parser.parse_args()
+
+    with SessionLog(args.db) as log:
+        engine = ProgressionEngine(log)
+        if args.show:
+            for key, prescription in engine.prescriptions(args.show, args.week).items():
+                print(json.dumps(dict(prescription, exercise=key)))
+            return
+        done = engine.recompute_cohort()
+        print(f'Recomputed {len(done)} athletes ({sum(done.values())} athlete-weeks)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Training Calendar
+Places the weekly split on real dates around the days an athlete cannot
+train, and reflows the rest of the week when a session is missed:
+
+    python scheduler.py --start 2026-11-02 --unavailable sat,2026-11-05
+    python scheduler.py --start 2026-11-02 --week 2 --db logs.db --athlete A-001 --today 2026-11-12
+    python scheduler.py --cohort cohort.json --week 2 --db logs.db --today 2026-11-12 --output-dir PDFs/Athletes
+
+Training sessions keep their split order and go on their split day (day N
+on the week's Nth date) or the next date that is free and leaves 48h
+(MIN_RECOVERY_HOURS) between two sessions loading the same muscle, an
+earlier one when nothing later is left; the recovery and rest days fill
+the available dates left over. A day that does not fit in its week is
+unscheduled (no date).
+
+Rescheduling keeps every date before today and every logged session, and
+reflows the missed sessions with the rest of the week from today. With
+--output-dir each athlete's schedule.json remembers the dates already
+rendered, so only the PDFs whose date moved are rendered again; athletes
+of the same profile and dates share one render.
+
+The muscles a session loads are computed once per program week, and a
+placement is memoized per (sessions, free dates, logged sessions) as
+bitmasks, so a cohort's rescheduling costs a dict lookup per athlete once
+a week's situation has been seen.
+"""
+
+import argparse
+from datetime import date, timedelta
+import json
+import os
+
+from exercise_catalog import EXERCISE_MUSCLES, MUSCLES
+from periodization import active_mesocycle
+from workout_program import WEEKLY_SPLIT, canonical, get_split_day
+
+
+MIN_RECOVERY_HOURS = 48    # between same muscle groups (generate_improved_workout_pdfs.py)
+MIN_GAP_DAYS = -(-MIN_RECOVERY_HOURS // 24)    # sessions start at the same time of day
+LOADED_SETS = 6            # hard sets that make a muscle one of a session's targets
+WEEKDAYS = ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+MANIFEST = 'schedule.json'
+
+_loads = {}         # (mesocycle, week) -> ((day, loaded muscle mask), ...)
+_placements = {}    # (sessions, free mask, fixed, first) -> offsets
+
+
+def session_loads(week):
+    """((day, mask of the muscles it loads), ...) of a week's training days, in split order"""
+    key = (active_mesocycle(), week)
+    if key not in _loads:
+        bits = {muscle: 1 << i for i, muscle in enumerate(MUSCLES)}
+        loads = []
+        for day, slug, title, focus, kind, exercises_func, stretches_func in WEEKLY_SPLIT:
+            if kind != 'training':
+                continue
+            sets = {}
+            for row in exercises_func(week):
+                primary = EXERCISE_MUSCLES.get(canonical(row[0]), ((), ()))[0]
+                for muscle in primary if row[1].isdigit() else ():
+                    sets[muscle] = sets.get(muscle, 0) + int(row[1])
+            mask = 0
+            for muscle, count in sets.items():
+                if count >= LOADED_SETS:
+                    mask |= bits[muscle]
+            loads.append((day, mask))
+        _loads[key] = tuple(loads)
+    return _loads[key]
+
+
+def _search(sessions, free, placed, after):
+    """(count, offsets) placing the most sessions after offset `after`, each from its split day on
+    (day N on the week's Nth date), or as close before it as there is room
+    """
+    if not sessions:
+        return 0, ()
+    (day, mask), rest = sessions[0], sessions[1:]
+    best = None
+    preferred = max(after + 1, day - 1)
+    for offset in list(range(preferred, 7)) + list(range(preferred - 1, after, -1)):
+        if not free >> offset & 1 or any(abs(offset - other) < MIN_GAP_DAYS
+                                         for other, other_mask in placed if mask & other_mask):
+            continue
+        count, offsets = _search(rest, free & ~(1 << offset), placed + ((offset, mask),), offset)
+        if best is None or count + 1 > best[0]:
+            best = (count + 1, (offset,) + offsets)
+            if best[0] == len(sessions):
+                return best
+    count, offsets = _search(rest, free, placed, after)
+    if best is None or count > best[0]:
+        best = (count, (None,) + offsets)
+    return best
+
+
+def place(sessions, free, fixed=(), first=0):
+    """Offsets into the week (None: no room) of sessions ((day, mask), ...) over the free offsets
+    (a bitmask) from `first`, 48h away from the fixed ((offset, mask), ...) ones
+    """
+    key = (sessions, free, fixed, first)
+    if key not in _placements:
+        _placements[key] = _search(sessions, free, fixed, first - 1)[1]
+    return _placements[key]
+
+
+def unavailable_mask(start, unavailable):
+    """Offsets of a week starting on start the athlete cannot train on: weekdays ('sat') or ISO dates"""
+    mask = 0
+    for item in unavailable or ():
+        item = str(item).strip().lower()
+        if item[:3] in WEEKDAYS and not item[:1].isdigit():
+            weekday = WEEKDAYS.index(item[:3])
+            mask |= 1 << ((weekday - start.weekday()) % 7)
+        else:
+            offset = (date.fromisoformat(item) - start).days
+            if 0 <= offset < 7:
+                mask |= 1 << offset
+    return mask
+
+
+def schedule_week(week, start, unavailable=(), previous=None, done=None, today=None):
+    """{day: date or None} placing a program week on the 7 dates from start
+
+    previous is the schedule being reflowed: its dates before today are
+    kept. done maps the logged days to the date they were done on (None:
+    their previous date); they stay where they are. Training sessions
+    before today that were not done are missed and placed again, with the
+    rest of the week, from today.
+    """
+    previous, done = previous or {}, done or {}
+    first = max(0, min(7, (today - start).days)) if today else 0
+    kept = {}
+    for day in [entry[0] for entry in WEEKLY_SPLIT]:
+        when = previous.get(day)
+        if day in done:
+            kept[day] = done[day] or when
+        elif when is not None and (when - start).days < first and get_split_day(day)[4] != 'training':
+            kept[day] = when
+
+    taken = 0
+    for when in kept.values():
+        if when is not None and 0 <= (when - start).days < 7:
+            taken |= 1 << (when - start).days
+    loads = dict(session_loads(week))
+    fixed = tuple(sorted(((when - start).days, loads[day]) for day, when in kept.items()
+                         if day in loads and when is not None))
+    sessions = tuple((day, mask) for day, mask in session_loads(week) if day not in kept)
+    available = 0b1111111 & ~unavailable_mask(start, unavailable)
+    free = available & ~taken
+
+    schedule = dict(kept)
+    for (day, mask), offset in zip(sessions, place(sessions, free, fixed, first)):
+        schedule[day] = None if offset is None else start + timedelta(days=offset)
+        if offset is not None:
+            taken |= 1 << offset
+    left = [offset for offset in range(first, 7) if available >> offset & 1 and not taken >> offset & 1]
+    for entry in WEEKLY_SPLIT:
+        if entry[0] not in schedule:
+            schedule[entry[0]] = start + timedelta(days=left.pop(0)) if left else None
+    return dict(sorted(schedule.items()))
+
+
+def week_start(start_date, week):
+    return start_date + timedelta(days=7 * (week - 1))
+
+
+def logged_days(sessions):
+    """{day: date or None} of logged session rows (session_log.py)"""
+    return {session['day']: date.fromisoformat(session['date']) if session.get('date') else None
+            for session in sessions}
+
+
+def moved_days(before, after):
+    """Days whose date differs between two schedules (every day without a previous one)"""
+    return [day for day, when in after.items() if before is None or before.get(day, False) != when]
+
+
+# =============================================================================
+# MANIFEST (the dates an athlete's PDFs were rendered with)
+# =============================================================================
+
+def read_manifest(directory):
+    """{week: {day: date or None}} from directory/schedule.json, empty without one"""
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        weeks = json.load(f)
+    return {int(week): {int(day): date.fromisoformat(when) if when else None for day, when in days.items()}
+            for week, days in weeks.items()}
+
+
+def write_manifest(directory, weeks):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump({str(week): {str(day): when.isoformat() if when else None for day, when in days.items()}
+                   for week, days in sorted(weeks.items())}, f, indent=1)
+
+
+def _print_schedule(title, week, schedule, moved=None):
+    print(f'{title}Week {week}')
+    for day, when in schedule.items():
+        marker = ' *' if moved and day in moved else ''
+        print(f'  {when.strftime("%a %Y-%m-%d") if when else "unscheduled   "}  Day {day} '
+              f'{get_split_day(day)[2]}{marker}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Place the weekly split on calendar dates')
+    parser.add_argument('--start', type=date.fromisoformat,
+                        help='date of Week 1 Day 1 (YYYY-MM-DD); cohort default when profiles omit it')
+    parser.add_argument('--week', type=int, default=1)
+    parser.add_argument('--unavailable', default='', help='weekdays / dates without training, e.g. sat,2026-11-05')
+    parser.add_argument('--today', type=date.fromisoformat, help='reschedule: keep the dates before today')
+    parser.add_argument('--db', help='session log database: logged sessions stay, missed ones are reflowed')
+    parser.add_argument('--athlete', default='athlete', help='athlete id in the session log')
+    parser.add_argument('--cohort', help='JSON / NDJSON file of athlete profiles (batch mode)')
+    parser.add_argument('--output-dir', help='with --cohort: render the PDFs whose date moved')
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+
+    if args.cohort:
+        from athletes import load_profiles
+        from generate_improved_workout_pdfs import generate_scheduled_cohort, OUTPUT_DIR
+        log = None
+        if args.db:
+            from session_log import SessionLog
+            log = SessionLog(args.db)
+        try:
+            generate_scheduled_cohort(load_profiles(args.cohort), args.week, log, args.today, args.start,
+                                      args.output_dir or OUTPUT_DIR, args.workers)
+        finally:
+            if log:
+                log.close()
+        return
+
+    if args.start is None:
+        parser.error('--start is required without --cohort')
+    start = week_start(args.start, args.week)
+    unavailable = [item for item in args.unavailable.split(',') if item]
+    done = {}
+    if args.db:
+        from session_log import SessionLog
+        with SessionLog(args.db) as log:
+            done = logged_days(log.sessions(args.athlete, (args.week, args.week)))
+    planned = schedule_week(args.week, start, unavailable)
+    if args.today is None:
+        _print_schedule('', args.week, schedule_week(args.week, start, unavailable, done=done))
+        return
+    schedule = schedule_week(args.week, start, unavailable, planned, done, args.today)
+    _print_schedule('', args.week, schedule, moved_days(planned, schedule))
+
+
+if __name__ == '__main__':
+    main()
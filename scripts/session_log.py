@@ -0,0 +1,293 @@
+"""
+Session Log Store
+Ingests filled-in tracking data (CSV / JSON / NDJSON) into an indexed
+SQLite store keyed by athlete, week and day.
+
+    python session_log.py ingest logs.db week1.csv sets.csv more.ndjson
+    python session_log.py query logs.db --athlete A-001 --weeks 1-4
+
+Session records carry the fields of the tracking sections (energy, workout
+quality, sleep, pain, water, protein, ...). Set records carry one logged
+set: exercise, set number, reps, load and RPE. A JSON session may embed
+its sets under a 'sets' key; CSV files are told apart by their columns.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sqlite3
+import sys
+from datetime import datetime
+
+
+# (column, type) - order is the column order of the sessions table
+SESSION_FIELDS = [
+    ('date', str),
+    ('start_time', str),
+    ('end_time', str),
+    ('weight_kg', float),
+    ('sleep_hours', float),
+    ('energy', int),
+    ('workout_quality', int),
+    ('pain', str),
+    ('water_l', float),
+    ('protein_g', float),
+    ('key_wins', str),
+    ('notes', str),
+]
+
+SET_FIELDS = [
+    ('reps', int),
+    ('load_kg', float),
+    ('rpe', float),
+]
+
+# Labels used on the paper forms / common spreadsheet headers
+ALIASES = {
+    'athlete': 'athlete_id',
+    'energy_level': 'energy',
+    'quality': 'workout_quality',
+    'sleep': 'sleep_hours',
+    'sleep_last_night': 'sleep_hours',
+    'weight': 'weight_kg',
+    'pain_discomfort': 'pain',
+    'water': 'water_l',
+    'water_intake': 'water_l',
+    'protein': 'protein_g',
+    'set': 'set_no',
+    'load': 'load_kg',
+}
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS batches (
+    batch INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    sets INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    athlete_id TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    {session_columns},
+    batch INTEGER NOT NULL,
+    PRIMARY KEY (athlete_id, week, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_by_date ON sessions (athlete_id, date);
+CREATE INDEX IF NOT EXISTS sessions_on_date ON sessions (date);
+CREATE INDEX IF NOT EXISTS sessions_by_batch ON sessions (batch, athlete_id);
+CREATE TABLE IF NOT EXISTS sets (
+    athlete_id TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    exercise TEXT NOT NULL,
+    set_no INTEGER NOT NULL,
+    {set_columns},
+    batch INTEGER NOT NULL,
+    PRIMARY KEY (athlete_id, week, day, exercise, set_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sets_by_exercise ON sets (athlete_id, exercise, week);
+CREATE INDEX IF NOT EXISTS sets_by_batch ON sets (batch, athlete_id);
+'''
+
+_SQL_TYPES = {str: 'TEXT', int: 'INTEGER', float: 'REAL'}
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def _column_defs(fields):
+    return ',\n    '.join(f'{name} {_SQL_TYPES[kind]}' for name, kind in fields)
+
+
+def _convert(value, kind):
+    """Blank -> None; numbers are pulled out of text such as '3.5 L' or '150g'"""
+    if value is None:
+        return None
+    if kind is str:
+        value = str(value).strip()
+        return value or None
+    if isinstance(value, (int, float)):
+        return kind(value)
+    match = _NUMBER.search(str(value))
+    if not match:
+        return None
+    return kind(float(match.group())) if kind is int else float(match.group())
+
+
+def _normalize(record):
+    normalized = {}
+    for key, value in record.items():
+        key = key.strip().lower().replace(' ', '_').replace('/', '_')
+        normalized[ALIASES.get(key, key)] = value
+    return normalized
+
+
+def _key(record):
+    athlete_id = _convert(record.get('athlete_id'), str)
+    week = _convert(record.get('week'), int)
+    day = _convert(record.get('day'), int)
+    if athlete_id is None or week is None or day is None:
+        raise ValueError(f'Record needs athlete_id, week and day: {record}')
+    return athlete_id, week, day
+
+
+def read_records(path):
+    """Yield raw records from a CSV, JSON (list) or NDJSON file"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8', newline='') as f:
+        if ext == '.csv':
+            yield from csv.DictReader(f)
+        elif ext in ('.jsonl', '.ndjson'):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            yield from (data if isinstance(data, list) else [data])
+
+
+class SessionLog:
+    """Indexed SQLite store of logged sessions and sets"""
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA.format(session_columns=_column_defs(SESSION_FIELDS),
+                                              set_columns=_column_defs(SET_FIELDS)))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Ingestion
+    # -------------------------------------------------------------------------
+
+    def ingest_records(self, records, source='<records>'):
+        """Upsert session and set records in one transaction; returns the batch id
+
+        Re-ingesting a corrected sheet replaces the earlier values.
+        """
+        session_rows, set_rows = [], []
+        for record in records:
+            record = _normalize(record)
+            key = _key(record)
+            if 'exercise' in record:
+                set_rows.append(self._set_row(key, record))
+                continue
+            session_rows.append(key + tuple(_convert(record.get(name), kind) for name, kind in SESSION_FIELDS))
+            for logged_set in record.get('sets') or []:
+                set_rows.append(self._set_row(key, _normalize(logged_set)))
+
+        with self.conn:
+            batch = self.conn.execute(
+                'INSERT INTO batches (source, ingested_at, sessions, sets) VALUES (?, ?, ?, ?)',
+                (source, datetime.now().isoformat(timespec='seconds'), len(session_rows), len(set_rows)),
+            ).lastrowid
+            if session_rows:
+                columns = ['athlete_id', 'week', 'day'] + [name for name, kind in SESSION_FIELDS] + ['batch']
+                self.conn.executemany(
+                    f'INSERT OR REPLACE INTO sessions ({", ".join(columns)}) '
+                    f'VALUES ({", ".join("?" * len(columns))})',
+                    [row + (batch,) for row in session_rows],
+                )
+            if set_rows:
+                columns = ['athlete_id', 'week', 'day', 'exercise', 'set_no'] + [name for name, kind in SET_FIELDS] + ['batch']
+                self.conn.executemany(
+                    f'INSERT OR REPLACE INTO sets ({", ".join(columns)}) '
+                    f'VALUES ({", ".join("?" * len(columns))})',
+                    [row + (batch,) for row in set_rows],
+                )
+        return batch
+
+    def _set_row(self, key, record):
+        exercise = _convert(record.get('exercise'), str)
+        set_no = _convert(record.get('set_no'), int)
+        if exercise is None or set_no is None:
+            raise ValueError(f'Set record needs exercise and set_no: {record}')
+        return key + (exercise, set_no) + tuple(_convert(record.get(name), kind) for name, kind in SET_FIELDS)
+
+    def ingest_file(self, path):
+        return self.ingest_records(read_records(path), source=os.path.abspath(path))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def _select(self, table, athlete_id=None, weeks=None, dates=None, extra=None):
+        clauses, params = [], []
+        if athlete_id is not None:
+            clauses.append('athlete_id = ?')
+            params.append(athlete_id)
+        if weeks is not None:
+            clauses.append('week BETWEEN ? AND ?')
+            params += list(weeks)
+        if dates is not None:
+            clauses.append('date BETWEEN ? AND ?')
+            params += list(dates)
+        for column, value in (extra or {}).items():
+            clauses.append(f'{column} = ?')
+            params.append(value)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        cursor = self.conn.execute(f'SELECT * FROM {table}{where} ORDER BY athlete_id, week, day', params)
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def sessions(self, athlete_id=None, weeks=None, dates=None):
+        """Sessions as dicts; weeks / dates are inclusive (first, last) ranges"""
+        return self._select('sessions', athlete_id, weeks, dates)
+
+    def sets(self, athlete_id=None, weeks=None, exercise=None):
+        return self._select('sets', athlete_id, weeks, extra={'exercise': exercise} if exercise else None)
+
+    def athletes(self):
+        return [row[0] for row in self.conn.execute('SELECT DISTINCT athlete_id FROM sessions ORDER BY 1')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Session log store')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    ingest = commands.add_parser('ingest', help='load CSV / JSON / NDJSON logs')
+    ingest.add_argument('db')
+    ingest.add_argument('files', nargs='+')
+
+    query = commands.add_parser('query', help='print logged sessions as NDJSON')
+    query.add_argument('db')
+    query.add_argument('--athlete')
+    query.add_argument('--weeks', help='inclusive range, e.g. 1-4')
+    query.add_argument('--dates', help='inclusive range, e.g. 2026-01-01..2026-03-31')
+    query.add_argument('--sets', action='store_true', help='print logged sets instead')
+    args = parser.parse_args()
+
+    with SessionLog(args.db) as log:
+        if args.command == 'ingest':
+            for path in args.files:
+                batch = log.ingest_file(path)
+                print(f'Ingested: {path} (batch {batch})')
+            return
+
+        weeks = None
+        if args.weeks:
+            first, _, last = args.weeks.partition('-')
+            weeks = (int(first), int(last or first))
+        if args.sets:
+            rows = log.sets(args.athlete, weeks)
+        else:
+            dates = tuple(args.dates.split('..')) if args.dates else None
+            rows = log.sessions(args.athlete, weeks, dates)
+        for row in rows:
+            sys.stdout.write(json.dumps(row) + '\n')
+
+
+if __name__ == '__main__':
+    main()
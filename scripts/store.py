@@ -0,0 +1,211 @@
+"""
+Content-Addressed Output Store
+Keeps generated documents by content hash instead of at fixed paths, with
+an index from (athlete, locale, week, day, document) to the hash:
+
+    python fitness_tracker.py workouts --cohort cohort.json --store PDFs/store
+    python store.py PDFs/store get A-001 1 4 --output Week1_Day4.pdf
+    python store.py PDFs/store get '' 1 4 --locale es    # generate_all_locales
+    python store.py PDFs/store stats
+    python store.py PDFs/store prune            # objects no index entry points to
+
+    <store>/objects/3f/a2/3fa2...e1.pdf   SHA-256 of the bytes, two levels of 256 shards
+    <store>/index.db                       SQLite: (athlete_id, locale, week, day, doc) -> hash
+
+The store takes documents from layout.capture() like an archive
+(bundle.py), so a generator saving to output_dir/<athlete_id>/Week1_Day4_
+Upper_Pull.pdf indexes (athlete_id, locale, 1, 4, 'workout'). Per-locale
+output (output_dir/<locale>/, generate_all_locales) is indexed under the
+locale with athlete ''. A PDF shared by the athletes of one cohort variant
+is hashed and written once and indexed for each of them. Objects are written to a temporary name and renamed, so a
+reader never sees half an object; index rows are written in one
+transaction per flush.
+
+Documents are dated by day (layout.render_date(), in the footer and the
+CreationDate), so a document re-rendered with the same content the same
+day, or with SOURCE_DATE_EPOCH set, is the same object. Changed documents
+are new objects; prune() removes the ones no longer indexed.
+"""
+
+import argparse
+from contextlib import contextmanager
+from datetime import datetime
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+
+from layout import capture, dry_running
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS documents (
+    athlete_id TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    doc TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at TEXT NOT NULL,
+    PRIMARY KEY (athlete_id, locale, week, day, doc)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS documents_by_hash ON documents (hash);
+'''
+
+# Week1_Day4_Upper_Pull.pdf (generate_improved_workout_pdfs.split_day_filename)
+_DAY_FILE = re.compile(r'^Week(\d+)_Day(\d+)_[^/]+\.pdf$')
+
+
+def document_key(path, root, locale='', per_locale=False):
+    """(athlete_id, locale, week, day, doc) of a generated path: the directory under root is
+    the athlete ('' for a single program), or the locale with per_locale; other documents
+    are keyed by name with week and day 0"""
+    relative = os.path.relpath(path, root).replace(os.sep, '/')
+    directory, _, name = relative.rpartition('/')
+    athlete_id, locale = ('', directory) if per_locale else (directory, locale)
+    match = _DAY_FILE.match(name)
+    if match:
+        return athlete_id, locale, int(match.group(1)), int(match.group(2)), 'workout'
+    return athlete_id, locale, 0, 0, os.path.splitext(name)[0]
+
+
+class OutputStore:
+    """Sharded object directory plus SQLite index; takes (path, data) like the list of a capture"""
+
+    def __init__(self, root, output_dir=None, per_locale=False):
+        self.root = root
+        self.output_dir = output_dir    # generated paths are keyed relative to it
+        self.per_locale = per_locale    # its directories are locales, not athletes
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, 'index.db'))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._known = set()    # hashes written or seen this session
+        self._pending = []     # index rows not yet committed
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:4], digest + '.pdf')
+
+    def put(self, data):
+        """Store bytes once; returns their hash"""
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self._known:
+            path = self.object_path(digest)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temporary = f'{path}.{os.getpid()}.tmp'
+                with open(temporary, 'wb') as f:
+                    f.write(data)
+                os.replace(temporary, path)
+            self._known.add(digest)
+        return digest
+
+    def link(self, key, digest, size):
+        """Index key -> digest (committed by flush())"""
+        self._pending.append(tuple(key) + (digest, size, datetime.now().isoformat(timespec='seconds')))
+
+    def add(self, key, data):
+        digest = self.put(data)
+        self.link(key, digest, len(data))
+        return digest
+
+    def append(self, item):
+        path, data = item
+        self.add(document_key(path, self.output_dir or os.path.dirname(path), per_locale=self.per_locale), data)
+
+    def flush(self):
+        if self._pending:
+            with self.conn:
+                self.conn.executemany('INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                                      self._pending)
+            self._pending = []
+
+    def lookup(self, athlete_id, week, day, doc='workout', locale=''):
+        """Object path of a document, or None"""
+        self.flush()
+        row = self.conn.execute('SELECT hash FROM documents WHERE athlete_id = ? AND locale = ? AND week = ? '
+                                'AND day = ? AND doc = ?', (athlete_id, locale, week, day, doc)).fetchone()
+        return self.object_path(row[0]) if row else None
+
+    def stats(self):
+        self.flush()
+        documents, objects, size = self.conn.execute(
+            'SELECT COUNT(*), COUNT(DISTINCT hash), '
+            '(SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT hash, size FROM documents)) '
+            'FROM documents').fetchone()
+        return {'documents': documents, 'objects': objects, 'bytes': size}
+
+    def prune(self):
+        """Delete objects no index entry points to; returns how many"""
+        self.flush()
+        indexed = {row[0] for row in self.conn.execute('SELECT DISTINCT hash FROM documents')}
+        removed = 0
+        for directory, subdirectories, filenames in os.walk(os.path.join(self.root, 'objects')):
+            for filename in filenames:
+                if filename.endswith('.pdf') and filename[:-4] not in indexed:
+                    os.remove(os.path.join(directory, filename))
+                    self._known.discard(filename[:-4])
+                    removed += 1
+        return removed
+
+
+@contextmanager
+def stored(root, output_dir, per_locale=False):
+    """save() inside the block goes into the store at root (keys relative to output_dir) when
+    root is given; yields the OutputStore, or None for loose files"""
+    if not root or dry_running():
+        yield None
+        return
+    with OutputStore(root, output_dir, per_locale) as store, capture(store):
+        yield store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Content-addressed store of generated documents')
+    parser.add_argument('root', help='store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+    get = commands.add_parser('get', help='copy a document out of the store')
+    get.add_argument('athlete', help="athlete id ('' for a single program)")
+    get.add_argument('week', type=int)
+    get.add_argument('day', type=int)
+    get.add_argument('--doc', default='workout')
+    get.add_argument('--locale', default='', help="locale of the document ('' for the profile's default)")
+    get.add_argument('--output', help='file to write (default: stdout)')
+    commands.add_parser('stats', help='documents, distinct objects and bytes stored')
+    commands.add_parser('prune', help='delete objects no longer indexed')
+    args = parser.parse_args()
+
+    with OutputStore(args.root) as store:
+        if args.command == 'stats':
+            print(', '.join(f'{value} {name}' for name, value in store.stats().items()))
+        elif args.command == 'prune':
+            print(f'Removed {store.prune()} objects')
+        else:
+            path = store.lookup(args.athlete, args.week, args.day, args.doc, args.locale)
+            if path is None:
+                sys.exit(f'Not in the store: {args.athlete} {args.locale} week {args.week} day {args.day} '
+                         f'{args.doc}')
+            with open(path, 'rb') as f:
+                data = f.read()
+            if args.output:
+                with open(args.output, 'wb') as f:
+                    f.write(data)
+            else:
+                sys.stdout.buffer.write(data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+Equipment Substitution
+Swaps program exercises for the closest alternative an athlete's equipment
+allows, using the catalog in exercise_catalog.py:
+
+    index = SubstitutionIndex()
+    mask = index.equipment_mask(['dumbbells', 'bench'])
+    index.substitute('Barbell Bench Press', mask)        # 'dumbbellbenchpress'
+    apply_substitutions(rows, ['dumbbells', 'bands'])     # program rows, names swapped
+
+Equipment, movement patterns and muscles are bits. Each catalog exercise
+compiles to an equipment mask, a pattern bit and primary / all-muscle masks,
+and every exercise's candidates are ranked once when the index is built:
+same movement pattern first, then most shared primary muscles, most shared
+muscles overall and most equipment used (the closest to the gym version).
+A lookup takes the candidates whose equipment mask fits inside the
+athlete's and is memoized per (exercise, equipment mask), so personalizing
+a cohort is a dict lookup per row once an equipment set has been seen.
+
+Exercises the athlete can already do are kept; the ones with no
+alternative the equipment allows are dropped. A swapped row keeps the
+sets, reps, rest and progression of the program row; its note names the
+exercise it replaces. When the only alternative left is an exercise
+already in the day, its sets are added to that row (up to MAX_SETS)
+instead of repeating it.
+"""
+
+import re
+
+from exercise_catalog import EQUIPMENT, EXERCISE_MOVEMENTS, EXERCISE_MUSCLES, EXERCISE_NAMES, MOVEMENT_PATTERNS
+from workout_program import canonical
+
+
+FULL_GYM = EQUIPMENT
+MAX_SETS = 6    # per exercise, when repeats are merged
+
+_NUMBER = re.compile(r'^\d+\.\s*')
+
+
+def _bits(names, positions):
+    mask = 0
+    for name in names:
+        mask |= 1 << positions[name]
+    return mask
+
+
+class SubstitutionIndex:
+    """Exercise bitsets and ranked candidates, compiled once"""
+
+    def __init__(self, movements=EXERCISE_MOVEMENTS, muscles=EXERCISE_MUSCLES, names=EXERCISE_NAMES,
+                 equipment=EQUIPMENT, patterns=MOVEMENT_PATTERNS):
+        self.equipment = {item: i for i, item in enumerate(equipment)}
+        pattern_bit = {pattern: i for i, pattern in enumerate(patterns)}
+        muscle_bit = {}
+        for primary, secondary in muscles.values():
+            for muscle in primary + secondary:
+                muscle_bit.setdefault(muscle, len(muscle_bit))
+
+        # canonical name -> (equipment mask, pattern bit, primary muscle mask, all muscle mask)
+        self.exercises = {}
+        for key, (pattern, needs) in movements.items():
+            primary, secondary = muscles[key]
+            self.exercises[key] = (_bits(needs, self.equipment), 1 << pattern_bit[pattern],
+                                   _bits(primary, muscle_bit), _bits(primary + secondary, muscle_bit))
+        self.names = names
+        self.ranked = {key: self._rank(key) for key in self.exercises}
+        self._resolved = {}
+        self._fitting = {}
+
+    def _rank(self, key):
+        """Printable alternatives sharing the movement pattern or a primary muscle, closest first"""
+        needs, pattern, primary, muscles = self.exercises[key]
+        scored = []
+        for i, (other, (other_needs, other_pattern, other_primary, other_muscles)) in enumerate(
+                self.exercises.items()):
+            if other == key or other not in self.names or not (pattern == other_pattern or primary & other_primary):
+                continue
+            scored.append(((pattern == other_pattern, bin(primary & other_primary).count('1'),
+                            bin(muscles & other_muscles).count('1'), bin(other_needs).count('1'), -i), other))
+        return tuple(other for score, other in sorted(scored, reverse=True))
+
+    def equipment_mask(self, equipment):
+        """Mask of an athlete's equipment list; None is a full gym"""
+        if equipment is None:
+            equipment = FULL_GYM
+        unknown = set(equipment) - set(self.equipment)
+        if unknown:
+            raise ValueError(f'Unknown equipment: {", ".join(sorted(unknown))} '
+                             f'(available: {", ".join(self.equipment)})')
+        return _bits(equipment, self.equipment)
+
+    def key(self, name):
+        # canonical() is a few regexes; names repeat across days, weeks and athletes
+        if name not in self._resolved:
+            self._resolved[name] = canonical(name)
+        return self._resolved[name]
+
+    def candidates(self, key, mask):
+        """The exercise itself if the mask allows it, else the alternatives that fit, closest first"""
+        fitting = self._fitting.get((key, mask))
+        if fitting is None:
+            entry = self.exercises.get(key)
+            if entry is None or not entry[0] & ~mask:
+                fitting = (key,)    # not in the catalog, or already possible
+            else:
+                fitting = tuple(other for other in self.ranked[key] if not self.exercises[other][0] & ~mask)
+            self._fitting[key, mask] = fitting
+        return fitting
+
+    def substitute(self, name, mask, taken=()):
+        """Canonical name of what to do instead of an exercise, skipping taken ones;
+        None when nothing fits
+        """
+        fitting = self.candidates(self.key(name), mask)
+        for key in fitting:
+            if key not in taken:
+                return key
+        return fitting[0] if fitting else None
+
+
+_index = []
+
+
+def get_index():
+    """The SubstitutionIndex of the catalog, built on first use"""
+    if not _index:
+        _index.append(SubstitutionIndex())
+    return _index[0]
+
+
+def replace_exercise(row, key, note=None):
+    """A program row with another catalog exercise in it; the note defaults to naming the replaced one"""
+    name = row[0]
+    number = _NUMBER.match(name)
+    if number:    # pre-workout rows: '2. PULL-UPS (Mixed Grip OK)'
+        substitute = number.group(0) + get_index().names[key].upper()
+    else:
+        substitute = get_index().names[key]
+    return (substitute,) + tuple(row[1:-1]) + (note or f'Instead of {_NUMBER.sub("", name)}',)
+
+
+def merge_row(result, positions, row, key):
+    """Append a row to result, or add its sets to the earlier row of the same exercise
+    (positions: key -> index in result); a repeat without a set count is dropped"""
+    if key not in positions:
+        positions[key] = len(result)
+        result.append(row)
+        return
+    earlier = result[positions[key]]
+    if str(earlier[1]).isdigit() and str(row[1]).isdigit():
+        sets = min(MAX_SETS, int(earlier[1]) + int(row[1]))
+        result[positions[key]] = (earlier[0], str(sets)) + tuple(earlier[2:])
+
+
+def apply_substitutions(rows, equipment):
+    """Program rows (name first, note last) with each exercise the equipment rules out swapped,
+    or dropped when nothing fits; an exercise appears once, its repeats merged into it
+    """
+    if equipment is None:
+        return list(rows)
+    index = get_index()
+    mask = index.equipment_mask(equipment)
+    result, positions, taken = [], {}, {index.key(row[0]) for row in rows}
+    for row in rows:
+        key = index.substitute(row[0], mask, taken)
+        if key is None:
+            continue    # nothing the equipment allows
+        if key != index.key(row[0]):
+            row = replace_exercise(row, key)
+        taken.add(key)
+        merge_row(result, positions, row, key)
+    return result
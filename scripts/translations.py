@@ -0,0 +1,523 @@
+"""
+Translation Catalogs
+Labels printed by the generators, keyed by their English text (see i18n.py).
+
+{name} placeholders stand for values formatted into the text; a target
+must use the same placeholders. Exercise names, notes and tips are not
+translated yet and stay in English.
+"""
+
+
+CATALOGS = {
+    # =========================================================================
+    # SPANISH
+    # =========================================================================
+    'es': {
+        # Day PDFs (generate_improved_workout_pdfs.py, workout_program.py)
+        'WEEK {week} - DAY {day}': 'SEMANA {week} - DÍA {day}',
+        'Week {week} - Day {day}': 'Semana {week} - Día {day}',
+        '{focus} | Age 38 Optimized | Body Recomposition ({start} → {goal})':
+            '{focus} | Optimizado para 38 años | Recomposición corporal ({start} → {goal})',
+        'Page {page} | Total Duration: 2-3 Hours | {date}': 'Página {page} | Duración total: 2-3 horas | {date}',
+        'SCIENCE: {note}': 'CIENCIA: {note}',
+        'Pre-Workout': 'Pre-entreno',
+        'Main': 'Principal',
+        'Post-Workout': 'Post-entreno',
+        'Pre-Workout: {duration}': 'Pre-entreno: {duration}',
+        'Main: {duration}': 'Principal: {duration}',
+        'Post-Workout: {duration}': 'Post-entreno: {duration}',
+        'UPPER BODY - PUSH': 'TREN SUPERIOR - EMPUJE',
+        'LOWER BODY': 'TREN INFERIOR',
+        'ACTIVE RECOVERY': 'RECUPERACIÓN ACTIVA',
+        'UPPER BODY - PULL': 'TREN SUPERIOR - TRACCIÓN',
+        'FULL BODY COMPOUNDS': 'CUERPO COMPLETO - COMPUESTOS',
+        'MOBILITY & RECOVERY': 'MOVILIDAD Y RECUPERACIÓN',
+        'COMPLETE REST': 'DESCANSO COMPLETO',
+        'Chest / Shoulders / Triceps': 'Pecho / Hombros / Tríceps',
+        'Quads / Hamstrings / Glutes / Calves': 'Cuádriceps / Isquiotibiales / Glúteos / Gemelos',
+        'Back / Biceps / Rear Delts': 'Espalda / Bíceps / Deltoides posterior',
+        'Total Body Strength': 'Fuerza de cuerpo completo',
+        'Active Recovery': 'Recuperación activa',
+        'PRE-WORKOUT FOUNDATION PROTOCOL (30-40 min)': 'PROTOCOLO BASE PRE-ENTRENO (30-40 min)',
+        'FORM CUES (AGE 38 JOINT PROTECTION):': 'CLAVES DE TÉCNICA (PROTECCIÓN ARTICULAR A LOS 38):',
+        'MAIN WORKOUT (60-75 min)': 'ENTRENAMIENTO PRINCIPAL (60-75 min)',
+        'POST-WORKOUT CARDIO (35-45 min)': 'CARDIO POST-ENTRENO (35-45 min)',
+        'BODY RECOMPOSITION WALKING TIPS ({start} → {goal}):':
+            'CONSEJOS DE CAMINATA PARA RECOMPOSICIÓN ({start} → {goal}):',
+        'COOL-DOWN STRETCHING (10-15 min)': 'ESTIRAMIENTOS DE VUELTA A LA CALMA (10-15 min)',
+        'SESSION TRACKING': 'REGISTRO DE LA SESIÓN',
+        'ACTIVE RECOVERY PROTOCOL': 'PROTOCOLO DE RECUPERACIÓN ACTIVA',
+        'RECOMMENDED ACTIVITIES (choose 1-2):': 'ACTIVIDADES RECOMENDADAS (elige 1-2):',
+        'MOBILITY ROUTINE': 'RUTINA DE MOVILIDAD',
+        'RECOVERY TIPS': 'CONSEJOS DE RECUPERACIÓN',
+        'Exercise': 'Ejercicio',
+        'Sets': 'Series',
+        'Sets x Reps': 'Series x Reps',
+        'Reps': 'Reps',
+        'Reps/Tempo': 'Reps/Tempo',
+        'Rest': 'Descanso',
+        'Age 38 Progression Notes': 'Notas de progresión (38 años)',
+        'Technique Notes': 'Notas de técnica',
+        'Activity': 'Actividad',
+        'Distance': 'Distancia',
+        'Target Pace': 'Ritmo objetivo',
+        'Calories Burned': 'Calorías quemadas',
+        'Stretch': 'Estiramiento',
+        'Movement/Stretch': 'Movimiento/Estiramiento',
+        'Duration': 'Duración',
+        'Done': 'Hecho',
+        '1. Main Walk ({pace})': '1. Caminata principal ({pace})',
+        '2. Recovery Walk (Easy)': '2. Caminata de recuperación (suave)',
+        'Moderate': 'Moderado',
+        'Moderate+': 'Moderado+',
+        'Brisk': 'Rápido',
+        'Brisk+': 'Rápido+',
+        'TOTAL': 'TOTAL',
+        'Date:': 'Fecha:',
+        'Start Time:': 'Hora de inicio:',
+        'End Time:': 'Hora de fin:',
+        'Energy Level (1-10):': 'Nivel de energía (1-10):',
+        'Workout Quality (1-10):': 'Calidad del entreno (1-10):',
+        'Sleep Last Night (hrs):': 'Sueño anoche (h):',
+        'Pain/Discomfort (location):': 'Dolor/molestia (zona):',
+        'Key Wins Today:': 'Logros de hoy:',
+
+        # Meal plan (generate_meal_plan_pdf.py)
+        'EVIDENCE-BASED NUTRITION & MEAL PLAN': 'PLAN DE NUTRICIÓN Y COMIDAS BASADO EN EVIDENCIA',
+        'Optimized for Fat Loss + Muscle Gain (Body Recomposition)':
+            'Optimizado para perder grasa y ganar músculo (recomposición corporal)',
+        'Page {page} | Generated: {date}': 'Página {page} | Generado: {date}',
+        'YOUR PROFILE & DAILY TARGETS': 'TU PERFIL Y OBJETIVOS DIARIOS',
+        'EVIDENCE-BASED PRINCIPLES': 'PRINCIPIOS BASADOS EN EVIDENCIA',
+        'YOUR AVAILABLE FOODS': 'TUS ALIMENTOS DISPONIBLES',
+        'TRAINING DAY MEAL PLAN': 'PLAN DE COMIDAS PARA DÍAS DE ENTRENO',
+        'TRAINING DAY MEALS (Continued)': 'COMIDAS DE DÍAS DE ENTRENO (continuación)',
+        'PERI-WORKOUT NUTRITION (3:00-5:30 PM)': 'NUTRICIÓN PERI-ENTRENO (15:00-17:30)',
+        'DAILY NUTRITION SUMMARY': 'RESUMEN NUTRICIONAL DIARIO',
+        'REST DAY MEAL PLAN': 'PLAN DE COMIDAS PARA DÍAS DE DESCANSO',
+        'SUPPLEMENT TIMING PROTOCOL': 'PROTOCOLO DE SUPLEMENTACIÓN',
+        'INDIAN MEAL OPTIONS': 'OPCIONES DE COMIDA INDIA',
+        'Breakfast Options': 'Opciones de desayuno',
+        'Lunch Options': 'Opciones de almuerzo',
+        'Dinner Options': 'Opciones de cena',
+        'PROTEIN QUICK REFERENCE': 'REFERENCIA RÁPIDA DE PROTEÍNAS',
+        'IMPORTANT GUIDELINES': 'PAUTAS IMPORTANTES',
+        'For Optimal Fat Loss + Muscle Gain:': 'Para perder grasa y ganar músculo:',
+        'Signs of Progress:': 'Señales de progreso:',
+        'Avoid These Mistakes:': 'Evita estos errores:',
+        'DAILY CHECKLIST': 'LISTA DIARIA',
+        'HYDRATION TARGETS': 'OBJETIVOS DE HIDRATACIÓN',
+        'Food': 'Alimento',
+        'Item': 'Producto',
+        'Quantity': 'Cantidad',
+        'Protein': 'Proteína',
+        'Calories': 'Calorías',
+        'Time': 'Hora',
+        'Amount': 'Cantidad',
+        '{grams}g protein': '{grams}g proteína',
+
+        # Weekly plan and daily tracker (generate_pdfs.py)
+        'WEEKLY FITNESS PLAN (Age 37+ Safe Edition)': 'PLAN SEMANAL DE ENTRENAMIENTO (edición segura 37+)',
+        'Injury Prevention | Gradual Progression | Flexibility Focus':
+            'Prevención de lesiones | Progresión gradual | Enfoque en flexibilidad',
+        'KEY RULES FOR 37+ TRAINING': 'REGLAS CLAVE PARA ENTRENAR A PARTIR DE LOS 37',
+        'WEEKLY SCHEDULE': 'HORARIO SEMANAL',
+        'MANDATORY WARM-UP PROTOCOL (15-20 min)': 'PROTOCOLO DE CALENTAMIENTO OBLIGATORIO (15-20 min)',
+        'DAY 1: PUSH EXERCISES': 'DÍA 1: EJERCICIOS DE EMPUJE',
+        'DAY 2: PULL EXERCISES': 'DÍA 2: EJERCICIOS DE TRACCIÓN',
+        'DAY 4: LEGS + CORE': 'DÍA 4: PIERNAS + CORE',
+        'DAY 6: FULL BODY + MOUNTAIN PREP': 'DÍA 6: CUERPO COMPLETO + PREPARACIÓN DE MONTAÑA',
+        'DAILY FLEXIBILITY PROTOCOL (NON-NEGOTIABLE)': 'PROTOCOLO DIARIO DE FLEXIBILIDAD (INNEGOCIABLE)',
+        'NUTRITION QUICK REFERENCE': 'REFERENCIA RÁPIDA DE NUTRICIÓN',
+        'EXPECTED PROGRESS (Be Patient!)': 'PROGRESO ESPERADO (¡ten paciencia!)',
+        'DAILY FITNESS TRACKER (Age 37+ Safe Training)': 'REGISTRO DIARIO DE ENTRENAMIENTO (seguro 37+)',
+        'Page {page}': 'Página {page}',
+        'Week {week} - {day}': 'Semana {week} - {day}',
+        'Day 1: PUSH (Chest/Shoulders/Triceps)': 'Día 1: EMPUJE (pecho/hombros/tríceps)',
+        'Day 2: PULL (Back/Biceps) + Flexibility': 'Día 2: TRACCIÓN (espalda/bíceps) + flexibilidad',
+        'Day 3: REST + MOBILITY': 'Día 3: DESCANSO + MOVILIDAD',
+        'Day 4: LEGS + CORE': 'Día 4: PIERNAS + CORE',
+        'Day 5: REST + LIGHT STRETCHING': 'Día 5: DESCANSO + ESTIRAMIENTOS SUAVES',
+        'Day 6: FULL BODY + MOUNTAIN PREP': 'Día 6: CUERPO COMPLETO + PREPARACIÓN DE MONTAÑA',
+        'Day 7: COMPLETE REST': 'Día 7: DESCANSO COMPLETO',
+        'Weight:': 'Peso:',
+        'Sleep:': 'Sueño:',
+        'PRE-WORKOUT CHECKLIST (Must complete!)': 'LISTA PRE-ENTRENO (¡obligatoria!)',
+        'Slept 7+ hours last night?': '¿Dormiste 7+ horas anoche?',
+        'Ate 1-2 hours before?': '¿Comiste 1-2 horas antes?',
+        'Properly hydrated?': '¿Bien hidratado?',
+        'No pain or injury concerns?': '¿Sin dolor ni lesiones?',
+        'MOBILITY & RECOVERY ACTIVITIES': 'ACTIVIDADES DE MOVILIDAD Y RECUPERACIÓN',
+        'REST DAY ACTIVITIES': 'ACTIVIDADES DEL DÍA DE DESCANSO',
+        'WARM-UP (15-20 min) - DO NOT SKIP!': 'CALENTAMIENTO (15-20 min) - ¡NO TE LO SALTES!',
+        'MAIN WORKOUT': 'ENTRENAMIENTO PRINCIPAL',
+        'Set {n} (reps/{unit})': 'Serie {n} (reps/{unit})',
+        'COOL-DOWN & STRETCHING (15-20 min)': 'VUELTA A LA CALMA Y ESTIRAMIENTOS (15-20 min)',
+        'POST-WORKOUT': 'POST-ENTRENO',
+        'Cool-down/stretching completed?': '¿Vuelta a la calma/estiramientos hechos?',
+        'Post-workout nutrition within 1 hour?': '¿Comida post-entreno en menos de 1 hora?',
+        'Logged all exercises above?': '¿Registraste todos los ejercicios?',
+        'DAILY TRACKING': 'REGISTRO DIARIO',
+        'Pain/Discomfort?:': '¿Dolor/molestia?:',
+        'Water Intake:': 'Agua ingerida:',
+        'Protein (approx):': 'Proteína (aprox.):',
+        'Notes / How do you feel?:': 'Notas / ¿Cómo te sientes?:',
+
+        # Week_N/Day_M PDFs (generate_daily_pdfs.py)
+        'Foundation Phase - Age 37+ Safe Training': 'Fase base - entrenamiento seguro 37+',
+        'Total Duration: {duration}': 'Duración total: {duration}',
+        'Duration/Reps': 'Duración/Reps',
+        'Notes': 'Notas',
+        'Notes:': 'Notas:',
+        'Any Pain/Discomfort:': 'Dolor/molestia:',
+        'Warm-Up Protocol (20 minutes)': 'Protocolo de calentamiento (20 minutos)',
+        'Main Workout': 'Entrenamiento principal',
+        'Cool-Down & Flexibility (15-20 min)': 'Vuelta a la calma y flexibilidad (15-20 min)',
+        'Completion Checklist': 'Lista de finalización',
+        'Session Notes': 'Notas de la sesión',
+        'Light Stretching Routine': 'Rutina de estiramientos suaves',
+        'Recovery Tips': 'Consejos de recuperación',
+        'Recommended Activities': 'Actividades recomendadas',
+    },
+
+    # =========================================================================
+    # GERMAN
+    # =========================================================================
+    'de': {
+        # Day PDFs (generate_improved_workout_pdfs.py, workout_program.py)
+        'WEEK {week} - DAY {day}': 'WOCHE {week} - TAG {day}',
+        'Week {week} - Day {day}': 'Woche {week} - Tag {day}',
+        '{focus} | Age 38 Optimized | Body Recomposition ({start} → {goal})':
+            '{focus} | Optimiert für 38 Jahre | Körperumbau ({start} → {goal})',
+        'Page {page} | Total Duration: 2-3 Hours | {date}': 'Seite {page} | Gesamtdauer: 2-3 Stunden | {date}',
+        'SCIENCE: {note}': 'WISSENSCHAFT: {note}',
+        'Pre-Workout': 'Vor dem Training',
+        'Main': 'Haupttraining',
+        'Post-Workout': 'Nach dem Training',
+        'Pre-Workout: {duration}': 'Vor dem Training: {duration}',
+        'Main: {duration}': 'Haupttraining: {duration}',
+        'Post-Workout: {duration}': 'Nach dem Training: {duration}',
+        'UPPER BODY - PUSH': 'OBERKÖRPER - DRÜCKEN',
+        'LOWER BODY': 'UNTERKÖRPER',
+        'ACTIVE RECOVERY': 'AKTIVE ERHOLUNG',
+        'UPPER BODY - PULL': 'OBERKÖRPER - ZIEHEN',
+        'FULL BODY COMPOUNDS': 'GANZKÖRPER - GRUNDÜBUNGEN',
+        'MOBILITY & RECOVERY': 'MOBILITÄT & ERHOLUNG',
+        'COMPLETE REST': 'VOLLSTÄNDIGE PAUSE',
+        'Chest / Shoulders / Triceps': 'Brust / Schultern / Trizeps',
+        'Quads / Hamstrings / Glutes / Calves': 'Quadrizeps / Beinbeuger / Gesäß / Waden',
+        'Back / Biceps / Rear Delts': 'Rücken / Bizeps / hintere Schulter',
+        'Total Body Strength': 'Ganzkörperkraft',
+        'Active Recovery': 'Aktive Erholung',
+        'PRE-WORKOUT FOUNDATION PROTOCOL (30-40 min)': 'GRUNDPROTOKOLL VOR DEM TRAINING (30-40 min)',
+        'FORM CUES (AGE 38 JOINT PROTECTION):': 'TECHNIKHINWEISE (GELENKSCHUTZ MIT 38):',
+        'MAIN WORKOUT (60-75 min)': 'HAUPTTRAINING (60-75 min)',
+        'POST-WORKOUT CARDIO (35-45 min)': 'CARDIO NACH DEM TRAINING (35-45 min)',
+        'BODY RECOMPOSITION WALKING TIPS ({start} → {goal}):': 'GEH-TIPPS FÜR DEN KÖRPERUMBAU ({start} → {goal}):',
+        'COOL-DOWN STRETCHING (10-15 min)': 'COOL-DOWN-DEHNUNG (10-15 min)',
+        'SESSION TRACKING': 'TRAININGSPROTOKOLL',
+        'ACTIVE RECOVERY PROTOCOL': 'PROTOKOLL AKTIVE ERHOLUNG',
+        'RECOMMENDED ACTIVITIES (choose 1-2):': 'EMPFOHLENE AKTIVITÄTEN (1-2 wählen):',
+        'MOBILITY ROUTINE': 'MOBILITÄTSROUTINE',
+        'RECOVERY TIPS': 'ERHOLUNGSTIPPS',
+        'Exercise': 'Übung',
+        'Sets': 'Sätze',
+        'Sets x Reps': 'Sätze x Wdh.',
+        'Reps': 'Wdh.',
+        'Reps/Tempo': 'Wdh./Tempo',
+        'Rest': 'Pause',
+        'Age 38 Progression Notes': 'Progression (38 Jahre)',
+        'Technique Notes': 'Technikhinweise',
+        'Activity': 'Aktivität',
+        'Distance': 'Strecke',
+        'Target Pace': 'Zieltempo',
+        'Calories Burned': 'Verbrannte Kalorien',
+        'Stretch': 'Dehnung',
+        'Movement/Stretch': 'Bewegung/Dehnung',
+        'Duration': 'Dauer',
+        'Done': 'Erledigt',
+        '1. Main Walk ({pace})': '1. Hauptspaziergang ({pace})',
+        '2. Recovery Walk (Easy)': '2. Erholungsspaziergang (locker)',
+        'Moderate': 'Mäßig',
+        'Moderate+': 'Mäßig+',
+        'Brisk': 'Zügig',
+        'Brisk+': 'Zügig+',
+        'TOTAL': 'GESAMT',
+        'Date:': 'Datum:',
+        'Start Time:': 'Beginn:',
+        'End Time:': 'Ende:',
+        'Energy Level (1-10):': 'Energielevel (1-10):',
+        'Workout Quality (1-10):': 'Trainingsqualität (1-10):',
+        'Sleep Last Night (hrs):': 'Schlaf letzte Nacht (Std.):',
+        'Pain/Discomfort (location):': 'Schmerzen/Beschwerden (wo):',
+        'Key Wins Today:': 'Erfolge heute:',
+
+        # Meal plan (generate_meal_plan_pdf.py)
+        'EVIDENCE-BASED NUTRITION & MEAL PLAN': 'EVIDENZBASIERTER ERNÄHRUNGS- & MAHLZEITENPLAN',
+        'Optimized for Fat Loss + Muscle Gain (Body Recomposition)':
+            'Optimiert für Fettabbau + Muskelaufbau (Körperumbau)',
+        'Page {page} | Generated: {date}': 'Seite {page} | Erstellt: {date}',
+        'YOUR PROFILE & DAILY TARGETS': 'DEIN PROFIL & TAGESZIELE',
+        'EVIDENCE-BASED PRINCIPLES': 'EVIDENZBASIERTE GRUNDSÄTZE',
+        'YOUR AVAILABLE FOODS': 'DEINE VERFÜGBAREN LEBENSMITTEL',
+        'TRAINING DAY MEAL PLAN': 'MAHLZEITENPLAN FÜR TRAININGSTAGE',
+        'TRAINING DAY MEALS (Continued)': 'MAHLZEITEN AN TRAININGSTAGEN (Fortsetzung)',
+        'PERI-WORKOUT NUTRITION (3:00-5:30 PM)': 'ERNÄHRUNG RUND UMS TRAINING (15:00-17:30)',
+        'DAILY NUTRITION SUMMARY': 'TÄGLICHE NÄHRWERTÜBERSICHT',
+        'REST DAY MEAL PLAN': 'MAHLZEITENPLAN FÜR RUHETAGE',
+        'SUPPLEMENT TIMING PROTOCOL': 'SUPPLEMENT-ZEITPLAN',
+        'INDIAN MEAL OPTIONS': 'INDISCHE MAHLZEITEN',
+        'Breakfast Options': 'Frühstücksoptionen',
+        'Lunch Options': 'Mittagsoptionen',
+        'Dinner Options': 'Abendessenoptionen',
+        'PROTEIN QUICK REFERENCE': 'PROTEIN-KURZÜBERSICHT',
+        'IMPORTANT GUIDELINES': 'WICHTIGE RICHTLINIEN',
+        'For Optimal Fat Loss + Muscle Gain:': 'Für optimalen Fettabbau + Muskelaufbau:',
+        'Signs of Progress:': 'Anzeichen für Fortschritt:',
+        'Avoid These Mistakes:': 'Diese Fehler vermeiden:',
+        'DAILY CHECKLIST': 'TÄGLICHE CHECKLISTE',
+        'HYDRATION TARGETS': 'TRINKZIELE',
+        'Food': 'Lebensmittel',
+        'Item': 'Produkt',
+        'Quantity': 'Menge',
+        'Protein': 'Protein',
+        'Calories': 'Kalorien',
+        'Time': 'Uhrzeit',
+        'Amount': 'Menge',
+        '{grams}g protein': '{grams}g Protein',
+
+        # Weekly plan and daily tracker (generate_pdfs.py)
+        'WEEKLY FITNESS PLAN (Age 37+ Safe Edition)': 'WOCHENTRAININGSPLAN (sichere Ausgabe 37+)',
+        'Injury Prevention | Gradual Progression | Flexibility Focus':
+            'Verletzungsprävention | Schrittweise Steigerung | Fokus Beweglichkeit',
+        'KEY RULES FOR 37+ TRAINING': 'GRUNDREGELN FÜR TRAINING AB 37',
+        'WEEKLY SCHEDULE': 'WOCHENPLAN',
+        'MANDATORY WARM-UP PROTOCOL (15-20 min)': 'PFLICHT-AUFWÄRMPROTOKOLL (15-20 min)',
+        'DAY 1: PUSH EXERCISES': 'TAG 1: DRÜCKÜBUNGEN',
+        'DAY 2: PULL EXERCISES': 'TAG 2: ZUGÜBUNGEN',
+        'DAY 4: LEGS + CORE': 'TAG 4: BEINE + RUMPF',
+        'DAY 6: FULL BODY + MOUNTAIN PREP': 'TAG 6: GANZKÖRPER + BERGVORBEREITUNG',
+        'DAILY FLEXIBILITY PROTOCOL (NON-NEGOTIABLE)': 'TÄGLICHES BEWEGLICHKEITSPROTOKOLL (PFLICHT)',
+        'NUTRITION QUICK REFERENCE': 'ERNÄHRUNG KURZ & KNAPP',
+        'EXPECTED PROGRESS (Be Patient!)': 'ERWARTETER FORTSCHRITT (Geduld!)',
+        'DAILY FITNESS TRACKER (Age 37+ Safe Training)': 'TÄGLICHES TRAININGSPROTOKOLL (sicher ab 37)',
+        'Page {page}': 'Seite {page}',
+        'Week {week} - {day}': 'Woche {week} - {day}',
+        'Day 1: PUSH (Chest/Shoulders/Triceps)': 'Tag 1: DRÜCKEN (Brust/Schultern/Trizeps)',
+        'Day 2: PULL (Back/Biceps) + Flexibility': 'Tag 2: ZIEHEN (Rücken/Bizeps) + Beweglichkeit',
+        'Day 3: REST + MOBILITY': 'Tag 3: PAUSE + MOBILITÄT',
+        'Day 4: LEGS + CORE': 'Tag 4: BEINE + RUMPF',
+        'Day 5: REST + LIGHT STRETCHING': 'Tag 5: PAUSE + LEICHTES DEHNEN',
+        'Day 6: FULL BODY + MOUNTAIN PREP': 'Tag 6: GANZKÖRPER + BERGVORBEREITUNG',
+        'Day 7: COMPLETE REST': 'Tag 7: VOLLSTÄNDIGE PAUSE',
+        'Weight:': 'Gewicht:',
+        'Sleep:': 'Schlaf:',
+        'PRE-WORKOUT CHECKLIST (Must complete!)': 'CHECKLISTE VOR DEM TRAINING (Pflicht!)',
+        'Slept 7+ hours last night?': 'Letzte Nacht 7+ Stunden geschlafen?',
+        'Ate 1-2 hours before?': '1-2 Stunden vorher gegessen?',
+        'Properly hydrated?': 'Ausreichend getrunken?',
+        'No pain or injury concerns?': 'Keine Schmerzen oder Verletzungen?',
+        'MOBILITY & RECOVERY ACTIVITIES': 'MOBILITÄTS- & ERHOLUNGSAKTIVITÄTEN',
+        'REST DAY ACTIVITIES': 'AKTIVITÄTEN AM RUHETAG',
+        'WARM-UP (15-20 min) - DO NOT SKIP!': 'AUFWÄRMEN (15-20 min) - NICHT AUSLASSEN!',
+        'MAIN WORKOUT': 'HAUPTTRAINING',
+        'Set {n} (reps/{unit})': 'Satz {n} (Wdh./{unit})',
+        'COOL-DOWN & STRETCHING (15-20 min)': 'COOL-DOWN & DEHNEN (15-20 min)',
+        'POST-WORKOUT': 'NACH DEM TRAINING',
+        'Cool-down/stretching completed?': 'Cool-down/Dehnen erledigt?',
+        'Post-workout nutrition within 1 hour?': 'Mahlzeit innerhalb 1 Stunde nach dem Training?',
+        'Logged all exercises above?': 'Alle Übungen oben eingetragen?',
+        'DAILY TRACKING': 'TAGESPROTOKOLL',
+        'Pain/Discomfort?:': 'Schmerzen/Beschwerden?:',
+        'Water Intake:': 'Wassermenge:',
+        'Protein (approx):': 'Protein (ca.):',
+        'Notes / How do you feel?:': 'Notizen / Wie fühlst du dich?:',
+
+        # Week_N/Day_M PDFs (generate_daily_pdfs.py)
+        'Foundation Phase - Age 37+ Safe Training': 'Grundlagenphase - sicheres Training ab 37',
+        'Total Duration: {duration}': 'Gesamtdauer: {duration}',
+        'Duration/Reps': 'Dauer/Wdh.',
+        'Notes': 'Notizen',
+        'Notes:': 'Notizen:',
+        'Any Pain/Discomfort:': 'Schmerzen/Beschwerden:',
+        'Warm-Up Protocol (20 minutes)': 'Aufwärmprotokoll (20 Minuten)',
+        'Main Workout': 'Haupttraining',
+        'Cool-Down & Flexibility (15-20 min)': 'Cool-down & Beweglichkeit (15-20 min)',
+        'Completion Checklist': 'Abschluss-Checkliste',
+        'Session Notes': 'Trainingsnotizen',
+        'Light Stretching Routine': 'Leichte Dehnroutine',
+        'Recovery Tips': 'Erholungstipps',
+        'Recommended Activities': 'Empfohlene Aktivitäten',
+    },
+
+    # =========================================================================
+    # FRENCH
+    # =========================================================================
+    'fr': {
+        # Day PDFs (generate_improved_workout_pdfs.py, workout_program.py)
+        'WEEK {week} - DAY {day}': 'SEMAINE {week} - JOUR {day}',
+        'Week {week} - Day {day}': 'Semaine {week} - Jour {day}',
+        '{focus} | Age 38 Optimized | Body Recomposition ({start} → {goal})':
+            '{focus} | Adapté à 38 ans | Recomposition corporelle ({start} → {goal})',
+        'Page {page} | Total Duration: 2-3 Hours | {date}': 'Page {page} | Durée totale : 2-3 heures | {date}',
+        'SCIENCE: {note}': 'SCIENCE : {note}',
+        'Pre-Workout': 'Échauffement',
+        'Main': 'Séance',
+        'Post-Workout': 'Après séance',
+        'Pre-Workout: {duration}': 'Échauffement : {duration}',
+        'Main: {duration}': 'Séance : {duration}',
+        'Post-Workout: {duration}': 'Après séance : {duration}',
+        'UPPER BODY - PUSH': 'HAUT DU CORPS - POUSSÉE',
+        'LOWER BODY': 'BAS DU CORPS',
+        'ACTIVE RECOVERY': 'RÉCUPÉRATION ACTIVE',
+        'UPPER BODY - PULL': 'HAUT DU CORPS - TIRAGE',
+        'FULL BODY COMPOUNDS': 'CORPS ENTIER - POLYARTICULAIRES',
+        'MOBILITY & RECOVERY': 'MOBILITÉ & RÉCUPÉRATION',
+        'COMPLETE REST': 'REPOS COMPLET',
+        'Chest / Shoulders / Triceps': 'Pectoraux / Épaules / Triceps',
+        'Quads / Hamstrings / Glutes / Calves': 'Quadriceps / Ischios / Fessiers / Mollets',
+        'Back / Biceps / Rear Delts': 'Dos / Biceps / Deltoïdes postérieurs',
+        'Total Body Strength': 'Force corps entier',
+        'Active Recovery': 'Récupération active',
+        'PRE-WORKOUT FOUNDATION PROTOCOL (30-40 min)': "PROTOCOLE DE BASE AVANT L'ENTRAÎNEMENT (30-40 min)",
+        'FORM CUES (AGE 38 JOINT PROTECTION):': 'CONSIGNES TECHNIQUES (PROTECTION ARTICULAIRE À 38 ANS) :',
+        'MAIN WORKOUT (60-75 min)': 'SÉANCE PRINCIPALE (60-75 min)',
+        'POST-WORKOUT CARDIO (35-45 min)': 'CARDIO APRÈS SÉANCE (35-45 min)',
+        'BODY RECOMPOSITION WALKING TIPS ({start} → {goal}):':
+            'CONSEILS DE MARCHE POUR LA RECOMPOSITION ({start} → {goal}) :',
+        'COOL-DOWN STRETCHING (10-15 min)': 'ÉTIREMENTS DE RETOUR AU CALME (10-15 min)',
+        'SESSION TRACKING': 'SUIVI DE SÉANCE',
+        'ACTIVE RECOVERY PROTOCOL': 'PROTOCOLE DE RÉCUPÉRATION ACTIVE',
+        'RECOMMENDED ACTIVITIES (choose 1-2):': 'ACTIVITÉS RECOMMANDÉES (en choisir 1-2) :',
+        'MOBILITY ROUTINE': 'ROUTINE DE MOBILITÉ',
+        'RECOVERY TIPS': 'CONSEILS DE RÉCUPÉRATION',
+        'Exercise': 'Exercice',
+        'Sets': 'Séries',
+        'Sets x Reps': 'Séries x Rép.',
+        'Reps': 'Rép.',
+        'Reps/Tempo': 'Rép./Tempo',
+        'Rest': 'Repos',
+        'Age 38 Progression Notes': 'Progression (38 ans)',
+        'Technique Notes': 'Consignes techniques',
+        'Activity': 'Activité',
+        'Distance': 'Distance',
+        'Target Pace': 'Allure cible',
+        'Calories Burned': 'Calories brûlées',
+        'Stretch': 'Étirement',
+        'Movement/Stretch': 'Mouvement/Étirement',
+        'Duration': 'Durée',
+        'Done': 'Fait',
+        '1. Main Walk ({pace})': '1. Marche principale ({pace})',
+        '2. Recovery Walk (Easy)': '2. Marche de récupération (facile)',
+        'Moderate': 'Modérée',
+        'Moderate+': 'Modérée+',
+        'Brisk': 'Rapide',
+        'Brisk+': 'Rapide+',
+        'TOTAL': 'TOTAL',
+        'Date:': 'Date :',
+        'Start Time:': 'Début :',
+        'End Time:': 'Fin :',
+        'Energy Level (1-10):': "Niveau d'énergie (1-10) :",
+        'Workout Quality (1-10):': 'Qualité de la séance (1-10) :',
+        'Sleep Last Night (hrs):': 'Sommeil la nuit dernière (h) :',
+        'Pain/Discomfort (location):': 'Douleur/gêne (zone) :',
+        'Key Wins Today:': 'Réussites du jour :',
+
+        # Meal plan (generate_meal_plan_pdf.py)
+        'EVIDENCE-BASED NUTRITION & MEAL PLAN': 'PLAN NUTRITIONNEL ET REPAS FONDÉS SUR LES PREUVES',
+        'Optimized for Fat Loss + Muscle Gain (Body Recomposition)':
+            'Optimisé pour la perte de graisse + la prise de muscle (recomposition corporelle)',
+        'Page {page} | Generated: {date}': 'Page {page} | Généré le : {date}',
+        'YOUR PROFILE & DAILY TARGETS': 'VOTRE PROFIL & OBJECTIFS QUOTIDIENS',
+        'EVIDENCE-BASED PRINCIPLES': 'PRINCIPES FONDÉS SUR LES PREUVES',
+        'YOUR AVAILABLE FOODS': 'VOS ALIMENTS DISPONIBLES',
+        'TRAINING DAY MEAL PLAN': "REPAS DES JOURS D'ENTRAÎNEMENT",
+        'TRAINING DAY MEALS (Continued)': "REPAS DES JOURS D'ENTRAÎNEMENT (suite)",
+        'PERI-WORKOUT NUTRITION (3:00-5:30 PM)': 'NUTRITION AUTOUR DE LA SÉANCE (15h00-17h30)',
+        'DAILY NUTRITION SUMMARY': 'BILAN NUTRITIONNEL QUOTIDIEN',
+        'REST DAY MEAL PLAN': 'REPAS DES JOURS DE REPOS',
+        'SUPPLEMENT TIMING PROTOCOL': 'PROTOCOLE DE PRISE DES COMPLÉMENTS',
+        'INDIAN MEAL OPTIONS': 'OPTIONS DE REPAS INDIENS',
+        'Breakfast Options': 'Options de petit-déjeuner',
+        'Lunch Options': 'Options de déjeuner',
+        'Dinner Options': 'Options de dîner',
+        'PROTEIN QUICK REFERENCE': 'AIDE-MÉMOIRE PROTÉINES',
+        'IMPORTANT GUIDELINES': 'RECOMMANDATIONS IMPORTANTES',
+        'For Optimal Fat Loss + Muscle Gain:': 'Pour perdre du gras et gagner du muscle :',
+        'Signs of Progress:': 'Signes de progrès :',
+        'Avoid These Mistakes:': 'Erreurs à éviter :',
+        'DAILY CHECKLIST': 'LISTE QUOTIDIENNE',
+        'HYDRATION TARGETS': "OBJECTIFS D'HYDRATATION",
+        'Food': 'Aliment',
+        'Item': 'Produit',
+        'Quantity': 'Quantité',
+        'Protein': 'Protéines',
+        'Calories': 'Calories',
+        'Time': 'Moment',
+        'Amount': 'Quantité',
+        '{grams}g protein': '{grams}g protéines',
+
+        # Weekly plan and daily tracker (generate_pdfs.py)
+        'WEEKLY FITNESS PLAN (Age 37+ Safe Edition)': "PLAN D'ENTRAÎNEMENT HEBDOMADAIRE (édition sûre 37+)",
+        'Injury Prevention | Gradual Progression | Flexibility Focus':
+            'Prévention des blessures | Progression graduelle | Priorité à la souplesse',
+        'KEY RULES FOR 37+ TRAINING': "RÈGLES CLÉS POUR S'ENTRAÎNER APRÈS 37 ANS",
+        'WEEKLY SCHEDULE': 'PROGRAMME DE LA SEMAINE',
+        'MANDATORY WARM-UP PROTOCOL (15-20 min)': "PROTOCOLE D'ÉCHAUFFEMENT OBLIGATOIRE (15-20 min)",
+        'DAY 1: PUSH EXERCISES': 'JOUR 1 : EXERCICES DE POUSSÉE',
+        'DAY 2: PULL EXERCISES': 'JOUR 2 : EXERCICES DE TIRAGE',
+        'DAY 4: LEGS + CORE': 'JOUR 4 : JAMBES + GAINAGE',
+        'DAY 6: FULL BODY + MOUNTAIN PREP': 'JOUR 6 : CORPS ENTIER + PRÉPARATION MONTAGNE',
+        'DAILY FLEXIBILITY PROTOCOL (NON-NEGOTIABLE)': 'PROTOCOLE QUOTIDIEN DE SOUPLESSE (INDISPENSABLE)',
+        'NUTRITION QUICK REFERENCE': 'AIDE-MÉMOIRE NUTRITION',
+        'EXPECTED PROGRESS (Be Patient!)': 'PROGRÈS ATTENDUS (soyez patient !)',
+        'DAILY FITNESS TRACKER (Age 37+ Safe Training)': "SUIVI QUOTIDIEN D'ENTRAÎNEMENT (sûr après 37 ans)",
+        'Page {page}': 'Page {page}',
+        'Week {week} - {day}': 'Semaine {week} - {day}',
+        'Day 1: PUSH (Chest/Shoulders/Triceps)': 'Jour 1 : POUSSÉE (pectoraux/épaules/triceps)',
+        'Day 2: PULL (Back/Biceps) + Flexibility': 'Jour 2 : TIRAGE (dos/biceps) + souplesse',
+        'Day 3: REST + MOBILITY': 'Jour 3 : REPOS + MOBILITÉ',
+        'Day 4: LEGS + CORE': 'Jour 4 : JAMBES + GAINAGE',
+        'Day 5: REST + LIGHT STRETCHING': 'Jour 5 : REPOS + ÉTIREMENTS LÉGERS',
+        'Day 6: FULL BODY + MOUNTAIN PREP': 'Jour 6 : CORPS ENTIER + PRÉPARATION MONTAGNE',
+        'Day 7: COMPLETE REST': 'Jour 7 : REPOS COMPLET',
+        'Weight:': 'Poids :',
+        'Sleep:': 'Sommeil :',
+        'PRE-WORKOUT CHECKLIST (Must complete!)': 'CHECK-LIST AVANT SÉANCE (obligatoire !)',
+        'Slept 7+ hours last night?': 'Dormi 7 h ou plus cette nuit ?',
+        'Ate 1-2 hours before?': 'Mangé 1 à 2 h avant ?',
+        'Properly hydrated?': 'Bien hydraté ?',
+        'No pain or injury concerns?': 'Aucune douleur ni blessure ?',
+        'MOBILITY & RECOVERY ACTIVITIES': 'ACTIVITÉS DE MOBILITÉ & RÉCUPÉRATION',
+        'REST DAY ACTIVITIES': 'ACTIVITÉS DU JOUR DE REPOS',
+        'WARM-UP (15-20 min) - DO NOT SKIP!': 'ÉCHAUFFEMENT (15-20 min) - NE PAS SAUTER !',
+        'MAIN WORKOUT': 'SÉANCE PRINCIPALE',
+        'Set {n} (reps/{unit})': 'Série {n} (rép./{unit})',
+        'COOL-DOWN & STRETCHING (15-20 min)': 'RETOUR AU CALME & ÉTIREMENTS (15-20 min)',
+        'POST-WORKOUT': 'APRÈS LA SÉANCE',
+        'Cool-down/stretching completed?': 'Retour au calme/étirements faits ?',
+        'Post-workout nutrition within 1 hour?': "Repas dans l'heure après la séance ?",
+        'Logged all exercises above?': 'Tous les exercices notés ci-dessus ?',
+        'DAILY TRACKING': 'SUIVI QUOTIDIEN',
+        'Pain/Discomfort?:': 'Douleur/gêne ? :',
+        'Water Intake:': "Apport d'eau :",
+        'Protein (approx):': 'Protéines (env.) :',
+        'Notes / How do you feel?:': 'Notes / Comment vous sentez-vous ? :',
+
+        # Week_N/Day_M PDFs (generate_daily_pdfs.py)
+        'Foundation Phase - Age 37+ Safe Training': 'Phase de base - entraînement sûr après 37 ans',
+        'Total Duration: {duration}': 'Durée totale : {duration}',
+        'Duration/Reps': 'Durée/Rép.',
+        'Notes': 'Notes',
+        'Notes:': 'Notes :',
+        'Any Pain/Discomfort:': 'Douleur/gêne :',
+        'Warm-Up Protocol (20 minutes)': "Protocole d'échauffement (20 minutes)",
+        'Main Workout': 'Séance principale',
+        'Cool-Down & Flexibility (15-20 min)': 'Retour au calme & souplesse (15-20 min)',
+        'Completion Checklist': 'Check-list de fin de séance',
+        'Session Notes': 'Notes de séance',
+        'Light Stretching Routine': "Routine d'étirements légers",
+        'Recovery Tips': 'Conseils de récupération',
+        'Recommended Activities': 'Activités recommandées',
+    },
+}
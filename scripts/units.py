@@ -0,0 +1,230 @@
+"""
+Units of Measure
+Loads, distances, paces and body weights are kept as typed quantities and
+printed in the athlete's unit system when a document is rendered:
+
+    load = Quantity(12, 'kg')
+    text = Measured('3 x 12 = 36 @ {}', load)
+    text                                   # '3 x 12 = 36 @ 12kg'
+    formatter('imperial')(text)            # '3 x 12 = 36 @ 26lb'
+
+    with use_units('imperial'):
+        pdf = EnhancedWorkoutPDF(...)      # every cell() is converted
+
+Measured is a str holding the metric text the program was written in, so
+code that reads the program data (progression.py, the JSON export, watch
+mode) keeps working; UnitsMixin and format_document() re-render it for
+imperial athletes. Each system's formatter is built once per process and
+caches the text it produces. Notes and tips are Measured too; text that
+only survives as a plain str (progression notes read back from SQLite)
+becomes Measured again with measured().
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import os
+import re
+
+
+DEFAULT_SYSTEM = 'metric'
+
+# unit -> (imperial unit, factor, rounding step)
+CONVERSIONS = {
+    'kg': ('lb', 2.20462, 1),
+    'km': ('mi', 0.621371, 0.1),
+    'min/km': ('min/mi', 1.609344, 1),
+    'g/kg': ('g/lb', 1 / 2.20462, 0.1),
+    'cm': ('in', 0.393701, 1),
+    'kcal/km': ('kcal/mi', 1.609344, 1),
+    'L': ('fl oz', 33.814, 1),
+}
+SYSTEMS = {
+    'metric': {},
+    'imperial': CONVERSIONS,
+}
+# imperial unit -> (metric unit, factor), for values athletes log on imperial forms
+TO_METRIC = {target: (unit, factor) for unit, (target, factor, step) in CONVERSIONS.items()}
+
+_formatters = {}
+_active = [DEFAULT_SYSTEM]
+
+# '61.5kg', '85-95 kcal/km': number, optional range end, blank, metric unit
+_METRIC_TEXT = re.compile(r'(?<![\w.])(\d+(?:\.\d+)?)(?:-(\d+(?:\.\d+)?))?( ?)(%s)(?![\w/])'
+                          % '|'.join(re.escape(unit) for unit in sorted(CONVERSIONS, key=len, reverse=True)))
+
+
+class Quantity(namedtuple('Quantity', 'value unit high places space')):
+    """A value (or value-high range) in a metric unit
+
+    places is the number of decimals printed (None: as short as possible),
+    space puts a blank between number and unit ('2.0 km' rather than '12kg').
+    A value of None is the bare unit, for labels such as 'reps/kg'.
+    """
+
+    def __new__(cls, value, unit, high=None, places=0, space=False):
+        return super().__new__(cls, value, unit, high, places, space)
+
+
+def _number(value, places):
+    return f'{value:g}' if places is None else f'{value:.{places}f}'
+
+
+def _text(quantity):
+    value, unit, high, places, space = quantity
+    if value is None:
+        return unit
+    number = _number(value, places)
+    if high is not None:
+        number += '-' + _number(high, places)
+    return number + (' ' if space else '') + unit
+
+
+class Measured(str):
+    """Text with typed quantities in it, printing as its metric text
+
+    Positional {} fields of the template take the quantities, named fields
+    take plain text: Measured('{focus} ({} → {})', start, goal, focus=focus).
+    """
+
+    def __new__(cls, template, *quantities, **fields):
+        text = super().__new__(cls, template.format(*map(_text, quantities), **fields))
+        text.template = template
+        text.quantities = quantities
+        text.fields = fields
+        return text
+
+    def __getnewargs_ex__(self):
+        return (self.template,) + self.quantities, self.fields
+
+    def key(self):
+        return self.template, self.quantities, tuple(sorted(self.fields.items()))
+
+
+def measured(text):
+    """Metric text as Measured, each quantity in it typed (Measured text is returned as is)"""
+    if isinstance(text, Measured) or not isinstance(text, str) or not _METRIC_TEXT.search(text):
+        return text
+    quantities = []
+
+    def field(match):
+        low, high, space, unit = match.groups()
+        quantities.append(Quantity(float(low), unit, float(high) if high else None, None, bool(space)))
+        return '{}'
+
+    template = _METRIC_TEXT.sub(field, text.replace('{', '{{').replace('}', '}}'))
+    return Measured(template, *quantities)
+
+
+def _identity(text):
+    return text
+
+
+def _converter(target, factor, step):
+    places = 0 if step >= 1 else len(f'{step:g}'.split('.')[1])
+
+    def convert(quantity):
+        value, unit, high, _, space = quantity
+        if value is None:
+            return Quantity(None, target)
+        value = round(value * factor / step) * step
+        if high is not None:
+            high = round(high * factor / step) * step
+        return Quantity(value, target, high, places, space)
+
+    return convert
+
+
+def _compile(conversions):
+    """{unit: (target, factor, step)} -> format(text) function"""
+    converters = {unit: _converter(*conversion) for unit, conversion in conversions.items()}
+    cache = {}
+
+    def convert(quantity):
+        converter = converters.get(quantity.unit)
+        return _text(converter(quantity) if converter else quantity)
+
+    def format(text):
+        if not isinstance(text, Measured):
+            return text
+        key = text.key()
+        found = cache.get(key)
+        if found is None:
+            found = cache[key] = text.template.format(*map(convert, text.quantities), **text.fields)
+        return found
+
+    return format
+
+
+def formatter(system=None):
+    """The format(text) function for a unit system, built on first use"""
+    system = system or DEFAULT_SYSTEM
+    if system not in _formatters:
+        if system not in SYSTEMS:
+            raise ValueError(f'Unknown unit system: {system} (available: {", ".join(SYSTEMS)})')
+        _formatters[system] = _compile(SYSTEMS[system]) if SYSTEMS[system] else _identity
+    return _formatters[system]
+
+
+def active_units():
+    return _active[-1]
+
+
+@contextmanager
+def use_units(system):
+    """Documents created inside the block print in this unit system"""
+    formatter(system)    # fail early on unknown systems
+    _active.append(system or DEFAULT_SYSTEM)
+    try:
+        yield
+    finally:
+        _active.pop()
+
+
+def to_metric(value, unit):
+    """A value in an imperial unit, in the metric unit: to_metric(209, 'lb') -> 94.8 (kg)"""
+    return value / TO_METRIC[unit][1]
+
+
+def units_filename(filename, system=None):
+    """'Weekly_Plan.pdf' -> 'Weekly_Plan_imperial.pdf' for non-default systems"""
+    if not system or system == DEFAULT_SYSTEM:
+        return filename
+    base, ext = os.path.splitext(filename)
+    return f'{base}_{system}{ext}'
+
+
+def format_document(document, system=None):
+    """Copy of a day document (workout_document.py) printed in a unit system"""
+    format = formatter(system)
+    if format is _identity:
+        return document
+    return _format(document, format)
+
+
+def _format(value, format):
+    if isinstance(value, str):
+        return format(value)
+    if isinstance(value, dict):
+        return {key: _format(item, format) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_format(item, format) for item in value)
+    return value
+
+
+class UnitsMixin:
+    """Prints the Measured text of every cell() / multi_cell() in a unit system
+
+    The system is the one active (use_units) when the document is created.
+    Goes before LocaleMixin, so the catalogs see the converted text.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.units = active_units()
+        self.format_units = formatter(self.units)
+        super().__init__(*args, **kwargs)
+
+    def cell(self, w, h=0, txt='', border=0, ln=0, align='', fill=0, link=''):
+        super().cell(w, h, self.format_units(txt), border, ln, align, fill, link)
+
+    def multi_cell(self, w, h, txt='', border=0, align='J', fill=0, split_only=False):
+        return super().multi_cell(w, h, self.format_units(txt), border, align, fill, split_only)
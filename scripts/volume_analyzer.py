@@ -0,0 +1,211 @@
+"""
+Weekly Volume Analyzer
+Hard sets per muscle group per week, checked against the MWS / HWS bands
+and against the weekly targets claimed in the workout_program docstrings
+(within CLAIM_TOLERANCE).
+
+    python volume_analyzer.py                        # fixed program, weeks 1-4
+    python volume_analyzer.py --with-pre-workout --json
+    python volume_analyzer.py --db logs.db --strict  # every athlete's program
+
+A set counts fully for its primary muscles and SECONDARY_WEIGHT for its
+secondary muscles (exercise_catalog.py). Only main-workout sets count by
+default: the bands are for hard training sets, and the daily pre-workout
+protocol (push-ups, pull-ups, squats every day) would put nearly every
+muscle over MAX_WEEKLY_SETS. --with-pre-workout counts it too.
+"""
+
+import argparse
+import json
+import re
+import sys
+
+from exercise_catalog import EXERCISE_MUSCLES, MUSCLES
+from workout_document import build_split_day
+from workout_program import (
+    WEEKLY_SPLIT, canonical,
+    get_upper_push_exercises, get_lower_body_exercises, get_upper_pull_exercises,
+)
+
+
+SECONDARY_WEIGHT = 0.5
+
+# Weekly hard sets per muscle (meta-analysis notes in generate_improved_workout_pdfs.py)
+MWS_MIN = 5               # MWS: 5-9
+HWS_MIN = 10              # HWS: 10+
+MAX_WEEKLY_SETS = 20      # Target: 12-20 working sets/muscle group/week
+CLAIM_TOLERANCE = 0.25    # a docstring '~N sets' holds within 25% of N
+
+_CLAIM = re.compile(r'([A-Z]+): ~(\d+) sets')
+
+
+def band(sets):
+    """'LOW' and 'HIGH' are outside the MWS / HWS bands"""
+    if sets < MWS_MIN:
+        return 'LOW'
+    if sets < HWS_MIN:
+        return 'MWS'
+    if sets <= MAX_WEEKLY_SETS:
+        return 'HWS'
+    return 'HIGH'
+
+
+def docstring_claims():
+    """{muscle: sets} from 'TOTAL WEEKLY CHEST: ~16 sets | SHOULDERS: ~12 sets'"""
+    claims = {}
+    for func in (get_upper_push_exercises, get_lower_body_exercises, get_upper_pull_exercises):
+        for muscle, sets in _CLAIM.findall(func.__doc__ or ''):
+            if muscle.lower() in MUSCLES:
+                claims[muscle.lower()] = int(sets)
+    return claims
+
+
+# =============================================================================
+# INCIDENCE MATRIX
+# =============================================================================
+
+class VolumeMatrix:
+    """Exercise x muscle incidence table, compiled once
+
+    Each exercise row is a sparse list of (muscle column, weight), so the
+    weekly volume of a program is one pass over its (exercise, sets) pairs.
+    """
+
+    def __init__(self, catalog=EXERCISE_MUSCLES, muscles=MUSCLES, secondary_weight=SECONDARY_WEIGHT):
+        self.muscles = list(muscles)
+        column = {muscle: i for i, muscle in enumerate(self.muscles)}
+        self.rows = {}
+        for key, (primary, secondary) in catalog.items():
+            self.rows[key] = ([(column[m], 1.0) for m in primary]
+                              + [(column[m], secondary_weight) for m in secondary])
+        self._resolved = {}
+
+    def _row(self, name):
+        # canonical() is a few regexes; names repeat across athletes and weeks
+        if name not in self._resolved:
+            self._resolved[name] = self.rows.get(canonical(name))
+        return self._resolved[name]
+
+    def volume(self, exercise_sets):
+        """[(name, sets)] -> ([sets per muscle column], [unmapped names])"""
+        totals = [0.0] * len(self.muscles)
+        unmapped = []
+        for name, sets in exercise_sets:
+            row = self._row(name)
+            if row is None:
+                unmapped.append(name)
+                continue
+            for column, weight in row:
+                totals[column] += sets * weight
+        return totals, unmapped
+
+    def batch(self, programs):
+        """{key: [(name, sets)]} -> {key: ([sets per muscle column], [unmapped names])}"""
+        return {key: self.volume(exercise_sets) for key, exercise_sets in programs.items()}
+
+
+# =============================================================================
+# PROGRAMS
+# =============================================================================
+
+def document_sets(document, include_pre_workout=False):
+    """(exercise, hard sets) pairs of a day document, as it will be rendered"""
+    for section in document['sections']:
+        if section['type'] == 'main_workout':
+            for row in section['rows']:
+                if row[1].isdigit():
+                    yield row[0], int(row[1])
+        elif section['type'] == 'pre_workout' and include_pre_workout:
+            for row in section['rows']:
+                yield row[0], int(row[1].split('x')[0])
+
+
+def weekly_sets(week, prescriptions=None, include_pre_workout=False):
+    """All (exercise, hard sets) pairs of a program week"""
+    exercise_sets = []
+    for entry in WEEKLY_SPLIT:
+        document = build_split_day(week, entry[0], prescriptions)
+        exercise_sets += document_sets(document, include_pre_workout)
+    return exercise_sets
+
+
+def analyze(programs, matrix=None, claims=None):
+    """{key: [(name, sets)]} -> {key: report}
+
+    A report has 'sets' and 'band' per muscle, the muscles outside the
+    MWS / HWS bands under 'flagged', the muscles more than CLAIM_TOLERANCE
+    off their claimed sets (docstring_claims by default) under
+    'deviations' as {muscle: claimed sets}, and any exercise the catalog
+    lacks under 'unmapped'.
+    """
+    matrix = matrix or VolumeMatrix()
+    claims = docstring_claims() if claims is None else claims
+    reports = {}
+    for key, (totals, unmapped) in matrix.batch(programs).items():
+        sets = dict(zip(matrix.muscles, totals))
+        bands = {muscle: band(value) for muscle, value in sets.items()}
+        reports[key] = {
+            'sets': sets,
+            'band': bands,
+            'flagged': [muscle for muscle, value in bands.items() if value in ('LOW', 'HIGH')],
+            'deviations': {muscle: claimed for muscle, claimed in claims.items()
+                           if abs(sets[muscle] - claimed) > claimed * CLAIM_TOLERANCE},
+            'unmapped': unmapped,
+        }
+    return reports
+
+
+def _print_report(title, report, claims):
+    print(title)
+    for muscle in MUSCLES:
+        sets, muscle_band = report['sets'][muscle], report['band'][muscle]
+        marker = ' <--' if muscle in report['flagged'] or muscle in report['deviations'] else ''
+        claim = f'  (docstring: ~{claims[muscle]})' if muscle in claims else ''
+        if muscle in report['deviations']:
+            claim += ' off claim'
+        print(f'  {muscle:<11} {sets:5.1f}  {muscle_band:<4}{claim}{marker}')
+    if report['unmapped']:
+        print(f'  unmapped: {", ".join(sorted(set(report["unmapped"])))}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Weekly hard sets per muscle group')
+    parser.add_argument('--weeks', type=int, default=4)
+    parser.add_argument('--with-pre-workout', action='store_true', help='count the pre-workout protocol too')
+    parser.add_argument('--db', help='session log database: analyze personalized programs')
+    parser.add_argument('--athlete', help='with --db, a single athlete (default: all)')
+    parser.add_argument('--json', action='store_true', help='print NDJSON reports')
+    parser.add_argument('--strict', action='store_true',
+                        help='exit 1 when any week is flagged or off the docstring claims')
+    args = parser.parse_args()
+
+    include_pre_workout = args.with_pre_workout
+    weeks = range(1, args.weeks + 1)
+    programs = {}
+    if args.db:
+        from progression import ProgressionEngine
+        from session_log import SessionLog
+        with SessionLog(args.db) as log:
+            engine = ProgressionEngine(log)
+            for athlete_id in ([args.athlete] if args.athlete else log.athletes()):
+                for week in weeks:
+                    programs[(athlete_id, week)] = weekly_sets(
+                        week, engine.prescriptions(athlete_id, week), include_pre_workout)
+    else:
+        for week in weeks:
+            programs[(None, week)] = weekly_sets(week, include_pre_workout=include_pre_workout)
+
+    claims = docstring_claims()
+    reports = analyze(programs, claims=claims)
+    for (athlete_id, week), report in reports.items():
+        if args.json:
+            print(json.dumps(dict(report, athlete_id=athlete_id, week=week)))
+        else:
+            _print_report(f'{athlete_id + " - " if athlete_id else ""}Week {week}', report, claims)
+
+    if args.strict and any(report['flagged'] or report['deviations'] for report in reports.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Watch Mode for the Day PDFs
+Keeps fpdf loaded, polls the program sources and re-renders only the
+(week, day) PDFs whose content changed.
+
+    python watch.py
+    python fitness_tracker.py workouts --watch --week 2
+
+After an edit the program modules are reloaded in this process and every
+day document (workout_document.py) is rebuilt - that takes well under a
+millisecond per day - and compared with the previous build; only days
+whose document differs are rendered again. An edit to the PDF renderer
+itself re-renders every day.
+
+The watched modules are the scripts workout_document and the generator
+import, directly or not (watch_modules()); those the day documents are
+built from are data, the rest render. Each is reloaded after the
+modules it imports.
+"""
+
+import argparse
+import ast
+import importlib
+import os
+import sys
+import time
+
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DOCUMENT_MODULE = 'workout_document'
+GENERATOR_MODULE = 'generate_improved_workout_pdfs'
+
+
+def sibling_imports(name):
+    """The modules of SCRIPTS_DIR that name.py imports, at any level"""
+    with open(os.path.join(SCRIPTS_DIR, name + '.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    return [name for name in names if os.path.exists(os.path.join(SCRIPTS_DIR, name + '.py'))]
+
+
+def import_order(*roots):
+    """The roots and every sibling module they import, each after the modules it imports"""
+    order, seen = [], set()
+
+    def visit(name):
+        if name not in seen:
+            seen.add(name)
+            for dependency in sibling_imports(name):
+                visit(dependency)
+            order.append(name)
+
+    for root in roots:
+        visit(root)
+    return order
+
+
+def watch_modules():
+    """(data modules, render modules), each list in reload order"""
+    data = import_order(DOCUMENT_MODULE)
+    return data, [name for name in import_order(DOCUMENT_MODULE, GENERATOR_MODULE) if name not in data]
+
+
+class Watcher:
+    def __init__(self, weeks=range(1, 5), days=None, output_dir=None, interval=0.2):
+        self.weeks = list(weeks)
+        self.days = days
+        self.interval = interval
+        self.generator = importlib.import_module(GENERATOR_MODULE)
+        self.output_dir = output_dir or self.generator.OUTPUT_DIR
+        self.data_modules, self.render_modules = watch_modules()
+        self.mtimes = self._mtimes()
+        self.documents = self._documents()
+
+    def _mtimes(self):
+        mtimes = {}
+        for name in self.data_modules + self.render_modules:
+            path = os.path.join(SCRIPTS_DIR, name + '.py')
+            if os.path.exists(path):
+                mtimes[name] = os.stat(path).st_mtime_ns
+        return mtimes
+
+    def _keys(self):
+        split = importlib.import_module('workout_program').WEEKLY_SPLIT
+        return [(week, entry[0]) for week in self.weeks for entry in split
+                if not self.days or entry[0] in self.days]
+
+    def _documents(self):
+        build_split_day = importlib.import_module(DOCUMENT_MODULE).build_split_day
+        return {key: build_split_day(*key) for key in self._keys()}
+
+    def _reload(self):
+        for name in self.data_modules + self.render_modules:
+            if name in sys.modules:
+                importlib.reload(sys.modules[name])
+        self.generator = sys.modules[GENERATOR_MODULE]
+        self.data_modules, self.render_modules = watch_modules()    # the edit may have changed the imports
+
+    def render(self, keys):
+        os.makedirs(self.output_dir, exist_ok=True)
+        for week, day in keys:
+            start = time.perf_counter()
+            filename = self.generator.write_split_day(week, day, self.output_dir)
+            print(f'  Rendered: {filename} ({(time.perf_counter() - start) * 1000:.0f} ms)')
+
+    def poll(self):
+        """Check the sources once; returns the (week, day) keys re-rendered"""
+        mtimes = self._mtimes()
+        changed = [name for name, mtime in mtimes.items() if self.mtimes.get(name) != mtime]
+        if not changed:
+            return []
+        self.mtimes = mtimes
+        start = time.perf_counter()
+        try:
+            self._reload()
+            self.mtimes = self._mtimes()
+            documents = self._documents()
+        except Exception as exc:    # a half-saved edit; wait for the next save
+            print(f'Changed: {", ".join(changed)} - not reloaded: {exc!r}')
+            return []
+
+        if set(changed) & set(self.render_modules):
+            keys = list(documents)
+        else:
+            keys = [key for key, document in documents.items() if self.documents.get(key) != document]
+        self.documents = documents
+        print(f'Changed: {", ".join(changed)} - {len(keys)} of {len(documents)} days affected')
+        self.render(keys)
+        if keys:
+            print(f'  Done in {(time.perf_counter() - start) * 1000:.0f} ms')
+        return keys
+
+    def run(self):
+        print(f'Watching {len(self.mtimes)} source files, writing to {self.output_dir} (Ctrl+C to stop)')
+        try:
+            while True:
+                self.poll()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            print('\nStopped.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-render day PDFs when the program changes')
+    parser.add_argument('--week', type=int, action='append', help='week to watch (repeatable, default 1-4)')
+    parser.add_argument('--day', type=int, action='append', help='day to watch (repeatable, default 1-7)')
+    parser.add_argument('--output-dir')
+    parser.add_argument('--interval', type=float, default=0.2, help='polling interval in seconds')
+    parser.add_argument('--initial', action='store_true', help='render every watched day before watching')
+    args = parser.parse_args()
+
+    watcher = Watcher(args.week or range(1, 5), args.day, args.output_dir, args.interval)
+    if args.initial:
+        watcher.render(list(watcher.documents))
+    watcher.run()
+
+
+if __name__ == '__main__':
+    main()
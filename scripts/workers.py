@@ -0,0 +1,105 @@
+"""
+Prefork Worker Pool
+Renders in worker processes forked from a warmed-up parent instead of
+starting each worker cold:
+
+    pool = get_pool(workers)           # created once, reused by every batch
+    for result in pool.map(render, jobs):
+        ...
+
+warm() imports fpdf and the generator modules, compiles the locale and
+unit catalogs, the default periodization year and the substitution /
+contraindication indexes, and loads the configured TTF metrics. It then
+moves those objects to the garbage collector's permanent generation
+(gc.freeze()), so collections in the workers never touch, and un-share,
+the pages they live on. Workers are forked after that ('fork' start
+method) and share it all copy-on-write. Where fork is unavailable a
+forkserver preloads PRELOAD, and spawned workers warm up in their
+initializer.
+
+A pool lives until shutdown() or exit, so a batch after the first (watch
+mode, a cohort re-render, the batch runner) costs a pickled task per job
+rather than a process start per worker. A pooled worker may have been
+forked inside or outside a dry run or capture (layout.py), so workers
+start outside both and jobs carry the caller's mode with them instead.
+"""
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+import gc
+import importlib
+import multiprocessing
+import os
+
+from layout import reset
+
+
+# Modules every render needs, imported before forking
+PRELOAD = (
+    'fpdf', 'layout', 'fonts', 'i18n', 'units', 'periodization', 'substitution', 'contraindications',
+    'workout_document', 'generate_improved_workout_pdfs', 'generate_daily_pdfs',
+)
+
+_warmed = []
+_pools = {}    # worker count -> ProcessPoolExecutor
+
+
+def warm():
+    """Import and precompute what workers share, once per process"""
+    if _warmed:
+        return
+    for name in PRELOAD:
+        importlib.import_module(name)
+    from contraindications import get_index as contraindication_index
+    from fonts import font_variants, load_metrics
+    from i18n import precompile
+    from periodization import DEFAULT_MESOCYCLE, precompute
+    from substitution import get_index as substitution_index
+    from units import SYSTEMS, formatter
+    precompile()
+    for system in SYSTEMS:
+        formatter(system)
+    precompute([DEFAULT_MESOCYCLE])
+    substitution_index()
+    contraindication_index()
+    for path in font_variants().values():
+        load_metrics(path)
+    gc.collect()
+    gc.freeze()
+    _warmed.append(True)
+
+
+def _init_worker():
+    """A worker starts warm and outside any dry run or capture the parent was in when it forked"""
+    warm()
+    reset()
+
+
+def start_method():
+    """'fork' where the platform has it, else 'forkserver', else 'spawn'"""
+    methods = multiprocessing.get_all_start_methods()
+    return next(method for method in ('fork', 'forkserver', 'spawn') if method in methods)
+
+
+def get_pool(workers=None):
+    """The process pool of this size (default: one worker per CPU), forked from a warmed parent"""
+    workers = workers or os.cpu_count() or 1
+    pool = _pools.get(workers)
+    if pool is None or pool._broken:    # a worker died: replace the pool
+        warm()
+        method = start_method()
+        context = multiprocessing.get_context(method)
+        if method == 'forkserver':
+            context.set_forkserver_preload(list(PRELOAD))
+        pool = _pools[workers] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=context, initializer=_init_worker)
+    return pool
+
+
+def shutdown():
+    """Stop the pooled workers (also done at exit)"""
+    while _pools:
+        _pools.popitem()[1].shutdown()
+
+
+atexit.register(shutdown)
@@ -0,0 +1,173 @@
+"""
+Workout Day Document Model
+Backend-neutral description of a day plan, shared by the PDF and HTML renderers.
+
+A document is a dict with the day header fields (and the calendar 'date',
+ISO, once scheduler.py has placed it) and an ordered list of sections.
+Each section is a dict whose 'type' selects the renderer:
+
+    duration      pre / main / post-workout duration box
+    pre_workout   foundation protocol table + form cues
+    main_workout  main lift table
+    cardio        post-workout walk table + tips
+    cooldown      stretch checklist
+    recovery      activities, mobility routine and tips for rest days
+    page_break    start a new page (ignored by continuous backends)
+    tracking      session tracking fields
+
+Every section except duration and page_break carries the title (and
+science note where the PDF prints one) so both backends show the same text.
+"""
+
+from workout_program import (
+    TRAINING_DURATIONS,
+    PRE_WORKOUT_TITLE, PRE_WORKOUT_NOTE, PRE_WORKOUT_HEADERS, FORM_CUES_TITLE, FORM_CUES,
+    get_pre_workout_exercises,
+    MAIN_WORKOUT_TITLE, MAIN_WORKOUT_HEADERS, MAIN_WORKOUT_NOTE,
+    CARDIO_TITLE, CARDIO_NOTE, CARDIO_HEADERS, CARDIO_TOTAL, WALKING_TIPS_TITLE, WALKING_TIPS,
+    get_cardio_rows,
+    COOLDOWN_TITLE, COOLDOWN_HEADERS,
+    TRACKING_TITLE, TRACKING_FIELDS,
+    RECOVERY_TITLE, RECOVERY_NOTE, RECOVERY_ACTIVITIES_TITLE, RECOVERY_ACTIVITIES,
+    MOBILITY_TITLE, MOBILITY_HEADERS, RECOVERY_TIPS_TITLE, RECOVERY_TIPS,
+    get_recovery_stretches, get_split_day,
+)
+from progression import apply_to_pre_workout, apply_to_main_workout
+from substitution import apply_substitutions
+from contraindications import apply_contraindications
+
+
+PAGE_BREAK = {'type': 'page_break'}
+
+
+def duration_section(pre_workout, main_workout, post_workout):
+    return {'type': 'duration', 'cells': [
+        ('Pre-Workout', pre_workout),
+        ('Main', main_workout),
+        ('Post-Workout', post_workout),
+    ]}
+
+
+def pre_workout_section(week, prescriptions=None, equipment=None, conditions=None):
+    rows = get_pre_workout_exercises(week)
+    if prescriptions:
+        rows = apply_to_pre_workout(rows, prescriptions)
+    if equipment is not None:
+        rows = apply_substitutions(rows, equipment)
+    if conditions:
+        rows = apply_contraindications(rows, conditions, equipment)
+    return {
+        'type': 'pre_workout',
+        'title': PRE_WORKOUT_TITLE,
+        'note': PRE_WORKOUT_NOTE,
+        'headers': PRE_WORKOUT_HEADERS,
+        'rows': rows,
+        'cues_title': FORM_CUES_TITLE,
+        'cues': FORM_CUES,
+    }
+
+
+def main_workout_section(exercises, science_note=MAIN_WORKOUT_NOTE):
+    return {
+        'type': 'main_workout',
+        'title': MAIN_WORKOUT_TITLE,
+        'note': science_note,
+        'headers': MAIN_WORKOUT_HEADERS,
+        'rows': [tuple(value if isinstance(value, str) else str(value) for value in exercise)    # keep Measured
+                 for exercise in exercises],
+    }
+
+
+def cardio_section(week):
+    return {
+        'type': 'cardio',
+        'title': CARDIO_TITLE,
+        'note': CARDIO_NOTE,
+        'headers': CARDIO_HEADERS,
+        'rows': get_cardio_rows(week),
+        'total': CARDIO_TOTAL,
+        'tips_title': WALKING_TIPS_TITLE,
+        'tips': WALKING_TIPS,
+    }
+
+
+def cooldown_section(stretches):
+    return {
+        'type': 'cooldown',
+        'title': COOLDOWN_TITLE,
+        'headers': COOLDOWN_HEADERS,
+        'rows': list(stretches),
+    }
+
+
+def tracking_section():
+    return {'type': 'tracking', 'title': TRACKING_TITLE, 'fields': TRACKING_FIELDS}
+
+
+def recovery_section(activities, stretches, tips):
+    return {
+        'type': 'recovery',
+        'title': RECOVERY_TITLE,
+        'note': RECOVERY_NOTE,
+        'activities_title': RECOVERY_ACTIVITIES_TITLE,
+        'activities': list(activities),
+        'routine_title': MOBILITY_TITLE,
+        'headers': MOBILITY_HEADERS,
+        'rows': list(stretches),
+        'tips_title': RECOVERY_TIPS_TITLE,
+        'tips': list(tips),
+    }
+
+
+def build_training_day(week, day, title, focus, exercises, stretches, science_note=MAIN_WORKOUT_NOTE,
+                       prescriptions=None, equipment=None, conditions=None):
+    """prescriptions: adaptive overrides from progression.py, keyed by canonical name
+    equipment: the athlete's equipment (substitution.py), None for a full gym
+    conditions: the athlete's reported pain conditions (contraindications.py)
+    """
+    if prescriptions:
+        exercises = apply_to_main_workout(exercises, prescriptions)
+    if equipment is not None:
+        exercises = apply_substitutions(exercises, equipment)
+    if conditions:
+        exercises = apply_contraindications(exercises, conditions, equipment)
+    return {
+        'week': week,
+        'day': day,
+        'title': title,
+        'focus': focus,
+        'kind': 'training',
+        'sections': [
+            duration_section(*TRAINING_DURATIONS),
+            pre_workout_section(week, prescriptions, equipment, conditions),
+            main_workout_section(exercises, science_note),
+            cardio_section(week),
+            cooldown_section(stretches),
+            PAGE_BREAK,
+            tracking_section(),
+        ],
+    }
+
+
+def build_recovery_day(week, day, title):
+    return {
+        'week': week,
+        'day': day,
+        'title': title,
+        'focus': 'Active Recovery',
+        'kind': 'recovery',
+        'sections': [
+            recovery_section(RECOVERY_ACTIVITIES, get_recovery_stretches(), RECOVERY_TIPS),
+            PAGE_BREAK,
+            tracking_section(),
+        ],
+    }
+
+
+def build_split_day(week, day, prescriptions=None, equipment=None, conditions=None):
+    """Build the document for one (week, day) of the weekly split"""
+    day, slug, title, focus, kind, exercises_func, stretches_func = get_split_day(day)
+    if kind == 'training':
+        return build_training_day(week, day, title, focus, exercises_func(week), stretches_func(),
+                                  prescriptions=prescriptions, equipment=equipment, conditions=conditions)
+    return build_recovery_day(week, day, title)
@@ -0,0 +1,413 @@
+"""
+Evidence-Based Workout Program Content
+Exercise prescriptions, progressions and section texts for the 7-day split.
+
+This module holds data only (no fpdf import) so schedules, previews and
+analysis tools can read the program without loading the PDF backend.
+See generate_improved_workout_pdfs.py for the research notes behind it.
+"""
+
+import re
+
+from periodization import deload_load, deload_sets, training_week
+from units import Measured, Quantity
+
+
+def canonical(name):
+    """Exercise key shared by the logs and catalogs:
+    '1. PUSH-UPS (Full ROM)' and 'Push-ups' -> 'pushups'
+    """
+    name = re.sub(r'^\d+\.\s*', '', name)
+    name = re.sub(r'\(.*?\)', '', name)
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+# Body recomposition goal (95kg → 80kg)
+START_WEIGHT = Quantity(95, 'kg')
+GOAL_WEIGHT = Quantity(80, 'kg')
+
+
+def day_subtitle(focus):
+    """Header line under the day title"""
+    return Measured('{focus} | Age 38 Optimized | Body Recomposition ({} → {})', START_WEIGHT, GOAL_WEIGHT,
+                    focus=focus)
+
+
+# =============================================================================
+# WORKOUT CONTENT FOR EACH DAY
+# =============================================================================
+
+DELOAD_NOTE = 'Deload: fewer sets, ~90% load'
+
+
+def periodized(rows, plan):
+    """Main workout rows for a TrainingWeek (periodization.py): deload weeks
+    drop sets and ease the load
+    """
+    if plan.phase != 'deload':
+        return rows
+    return [(name, str(deload_sets(int(sets))), reps, rest, DELOAD_NOTE) if sets.isdigit() else
+            (name, sets, reps, rest, note) for name, sets, reps, rest, note in rows]
+
+
+def get_upper_push_exercises(week):
+    """Push-focused upper body: Chest, Shoulders, Triceps
+    META-ANALYSIS OPTIMIZED: MWS (5-9 sets) to HWS (10+ sets) per muscle group
+    TOTAL WEEKLY CHEST: ~16 sets | SHOULDERS: ~12 sets | TRICEPS: ~10 sets
+    """
+    base = [
+        ('Barbell Bench Press', '4', '6-8 @2-1-2', '3min', 'Heavy compound - protect shoulders at 38'),
+        ('Incline Dumbbell Press', '4', '8-10 @2-1-2', '2min', '30° angle, full stretch, joint-safe'),
+        ('Cable Flyes (Low to High)', '3', '12-15 @2-0-2', '60s', 'Constant tension, no joint stress'),
+        ('Seated DB Shoulder Press', '4', '8-10 @2-1-2', '2min', 'Neutral grip option for shoulders'),
+        ('Lateral Raises', '3', '12-15 @2-0-2', '60s', 'Light weight, control (shoulder health)'),
+        ('Rope Tricep Pushdowns', '3', '12-15 @2-0-2', '60s', 'Elbows pinned, full extension'),
+        ('Overhead Tricep Extension', '3', '12-15 @2-0-2', '60s', 'Stretch position - elbow care'),
+        ('Face Pulls', '3', '15-20 @2-0-2', '45s', 'Rear delt + rotator cuff health'),
+    ]
+    # Progressive overload: CONSERVATIVE 2.5% increase for age 38
+    plan = training_week(week)
+    if plan.level >= 3:
+        base[0] = ('Barbell Bench Press', '4', '5-6 @2-1-2', '3min',
+                   Measured('Add {} from week {week} (age 38 safe)', Quantity(2.5, 'kg', places=None),
+                            week=plan.start + 1))
+        base[1] = ('Incline Dumbbell Press', '4', '6-8 @2-1-2', '2min',
+                   Measured('Add {} from week {week}', Quantity(1, 'kg', 2), week=plan.start + 1))
+    return periodized(base, plan)
+
+def get_lower_body_exercises(week):
+    """Legs: Quads, Hamstrings, Glutes, Calves
+    META-ANALYSIS OPTIMIZED: Target 16-20 sets/muscle for legs
+    At 95kg: Focus on controlled movements, knee health priority
+    """
+    base = [
+        ('Barbell Back Squat', '4', '6-8 @3-1-2', '3min', 'Below parallel IF mobility allows'),
+        ('Romanian Deadlift', '4', '8-10 @3-1-2', '2min', 'Hip hinge, hamstring stretch, no bounce'),
+        ('Walking Lunges', '3', '10 each @2-1-2', '90s',
+         Measured('Shorter stride at {} for knee safety', START_WEIGHT)),
+        ('Leg Press', '4', '10-12 @2-1-2', '90s', 'Feet high+wide for glutes, no knee lock'),
+        ('Leg Curl (Lying)', '3', '12-15 @2-1-2', '60s', '3s eccentric for hamstring TUT'),
+        ('Calf Raises (Seated)', '4', '15-20 @2-2-2', '45s', '2s pause at top, full stretch'),
+        ('Hip Thrusts', '4', '12-15 @2-2-2', '90s', 'Glute builder - critical at 38'),
+        ('Core: Dead Bug', '3', '10 each @3-0-3', '30s', 'Spine stability for heavy lifts'),
+    ]
+    plan = training_week(week)
+    if plan.level >= 3:
+        increase = Measured('Add {} from week {week}', Quantity(2.5, 'kg', places=None), week=plan.start + 1)
+        base[0] = ('Barbell Back Squat', '4', '5-6 @3-1-2', '3min', increase)
+        base[1] = ('Romanian Deadlift', '4', '6-8 @3-1-2', '2min', increase)
+    return periodized(base, plan)
+
+def get_upper_pull_exercises(week):
+    """Pull-focused upper body: Back, Biceps, Rear Delts
+    META-ANALYSIS OPTIMIZED: High volume back (16+ sets/week)
+    At 38: Grip strength and lat engagement focus
+    """
+    base = [
+        ('Barbell Bent Over Row', '4', '6-8 @2-1-2', '2min', '45° torso, lower chest, squeeze'),
+        ('Lat Pulldown (Wide Grip)', '4', '10-12 @2-1-2', '90s', 'Lean back 15°, chest up'),
+        ('Seated Cable Row (V-Bar)', '4', '10-12 @2-1-2', '90s', 'Pull to navel, retract scapula'),
+        ('Single Arm DB Row', '3', '10-12 each @2-1-2', '60s', 'Support on bench, full stretch'),
+        ('Barbell Curls', '3', '10-12 @2-1-2', '60s', 'No swing, control 3s negative'),
+        ('Incline DB Curls', '3', '12-15 @2-1-2', '60s', 'Stretch position, elbow health'),
+        ('Reverse Flyes', '3', '15 @2-1-2', '45s', 'Rear delts + posture correction'),
+        ('Shrugs (DB or Barbell)', '3', '12-15 @2-2-2', '60s', '2s hold at top, no neck strain'),
+    ]
+    return periodized(base, training_week(week))
+
+def get_full_body_exercises(week):
+    """Full body compound focus
+    BODY RECOMPOSITION DAY: High calorie burn, compound movements
+    At 95kg: Maximum metabolic impact
+    """
+    base = [
+        ('Trap Bar Deadlift', '4', '6-8 @3-1-2', '3min', 'Best deadlift variant for 38+ spine'),
+        ('Dumbbell Bench Press', '3', '10-12 @2-1-2', '2min', 'Full ROM, stretch at bottom'),
+        ('Front Squat (Goblet OK)', '3', '10-12 @2-1-2', '90s', 'Upright torso, quad focus'),
+        ('Seated Cable Row', '3', '10-12 @2-1-2', '90s', 'Posture correction day'),
+        ('Standing OHP (DB)', '3', '10-12 @2-1-2', '90s', 'Core engaged, no back lean'),
+        ('Bulgarian Split Squat', '3', '8 each @2-1-2', '60s', 'Glute/quad unilateral work'),
+        ('Farmers Walk', '3', '30 sec', '60s', 'Grip + core + metabolic boost'),
+        ('Plank Variations', '3', '45 sec', '30s', 'Front/Side/Front rotation'),
+    ]
+    return periodized(base, training_week(week))
+
+def get_upper_stretches():
+    return [
+        ('Chest Doorway Stretch', '45 sec each side'),
+        ('Cross-Body Shoulder Stretch', '30 sec each'),
+        ('Overhead Tricep Stretch', '30 sec each'),
+        ('Cat-Cow', '10 reps slow'),
+        ('Childs Pose', '60 seconds'),
+        ('Thread the Needle', '30 sec each'),
+    ]
+
+def get_lower_stretches():
+    return [
+        ('Standing Quad Stretch', '45 sec each'),
+        ('Seated Hamstring Stretch', '45 sec each'),
+        ('Pigeon Pose', '60 sec each'),
+        ('Hip Flexor Stretch', '45 sec each'),
+        ('Calf Stretch Against Wall', '30 sec each'),
+        ('Figure 4 Stretch', '45 sec each'),
+    ]
+
+def get_full_body_stretches():
+    return [
+        ('Worlds Greatest Stretch', '30 sec each side'),
+        ('Downward Dog', '45 seconds'),
+        ('Cobra Stretch', '30 seconds'),
+        ('Supine Twist', '30 sec each side'),
+        ('Happy Baby', '45 seconds'),
+        ('Standing Forward Fold', '45 seconds'),
+    ]
+
+def get_recovery_stretches():
+    return [
+        ('Cat-Cow Flow', '2 min slow'),
+        ('Thread the Needle', '45 sec each'),
+        ('Childs Pose', '90 seconds'),
+        ('Supine Spinal Twist', '60 sec each'),
+        ('Hip 90/90 Stretch', '45 sec each'),
+        ('Foam Roll IT Band', '60 sec each'),
+        ('Foam Roll Upper Back', '60 seconds'),
+        ('Foam Roll Quads', '60 sec each'),
+        ('Deep Breathing', '3 minutes'),
+    ]
+
+
+# =============================================================================
+# PRE-WORKOUT FOUNDATION PROTOCOL
+# =============================================================================
+
+PRE_WORKOUT_TITLE = 'PRE-WORKOUT FOUNDATION PROTOCOL (30-40 min)'
+PRE_WORKOUT_NOTE = ('At age 38, extended sport-specific warm-ups are CRITICAL. Research shows: '
+                    '1) Reduces injury risk by 50%+, 2) Improves neural drive and force production, '
+                    '3) Increases joint synovial fluid for better mobility. Never skip!')
+PRE_WORKOUT_HEADERS = ['Exercise', 'Sets x Reps', 'Rest', 'Age 38 Progression Notes']
+
+# Progression tables: level (periodization.py) -> (sets, reps) or (sets, reps, load kg).
+# Levels 1-3 are build weeks, 4 the peak week; deload weeks use level 1 with
+# fewer sets. Each completed mesocycle adds the *_CYCLE_STEP (reps or kg).
+
+# Target: 36 pushups - conservative progression for age 38
+PUSHUP_PROGRESSION = {
+    1: (3, 12),      # Baseline: achieve 36 total
+    2: (4, 10),      # Volume increase
+    3: (3, 14),      # Rep increase per set
+    4: (4, 12),      # Peak week
+}
+PUSHUP_CYCLE_STEP = 1    # rep per set
+
+# Target: 15-20 pullups - realistic for 95kg at age 38
+PULLUP_PROGRESSION = {
+    1: (3, 5),       # Baseline: start conservative
+    2: (3, 6),       # Add 1 rep per set
+    3: (4, 5),       # Add a set
+    4: (3, 7),       # Peak: rep quality over quantity
+}
+PULLUP_CYCLE_STEP = 1    # rep per set
+
+# Target: 36 weighted squats - progressive loading for 180cm/95kg
+SQUAT_PROGRESSION = {
+    1: (3, 12, 12),  # Start moderate at 95kg BW
+    2: (3, 12, 14),  # 2kg increment
+    3: (3, 12, 16),  # 2kg increment
+    4: (4, 10, 18),  # Volume + load peak
+}
+SQUAT_CYCLE_STEP = 2     # kg
+
+
+def _progression(table, cycle_step, week):
+    """'3 x 12 = 36' (@ load) of a progression table for a program week"""
+    plan = training_week(week)
+    sets, reps, load = (table[plan.level] + (None,))[:3]
+    if load is None:
+        reps += cycle_step * (plan.cycle - 1)
+    else:
+        load += cycle_step * (plan.cycle - 1)
+    if plan.phase == 'deload':
+        sets = deload_sets(sets)
+        load = load and deload_load(load)
+    text = f'{sets} x {reps} = {sets * reps}'
+    if load:
+        return Measured(text + ' @ {}', Quantity(load, 'kg', places=None))
+    return text
+
+
+def get_pushup_progression(week):
+    return _progression(PUSHUP_PROGRESSION, PUSHUP_CYCLE_STEP, week)
+
+
+def get_pullup_progression(week):
+    return _progression(PULLUP_PROGRESSION, PULLUP_CYCLE_STEP, week)
+
+
+def get_squat_progression(week):
+    return _progression(SQUAT_PROGRESSION, SQUAT_CYCLE_STEP, week)
+
+
+def get_pre_workout_exercises(week):
+    # Progressive reps based on the week's level - OPTIMIZED for 36 pushups, 15-20 pullups, 36 weighted squats
+    return [
+        ('1. PUSH-UPS (Full ROM)', get_pushup_progression(week), '30-45s', 'Chest to floor, protect shoulders'),
+        ('2. PULL-UPS (Mixed Grip OK)', get_pullup_progression(week), '60-90s', 'Dead hang, control eccentric'),
+        ('3. WEIGHTED SQUATS (Goblet)', get_squat_progression(week), '45-60s', 'Below parallel, knee health'),
+    ]
+
+
+# Form cues - UPDATED for age 38 joint protection
+FORM_CUES_TITLE = 'FORM CUES (AGE 38 JOINT PROTECTION):'
+FORM_CUES = [
+    'Push-ups: Hands slightly wider than shoulders, elbows at 45° (not 90° flared)',
+    'Pull-ups: Full dead hang, controlled descent (3s negative), vary grip weekly',
+    'Squats: Sit back into hips FIRST, knees track toes, stop if knee pain'
+]
+
+
+# =============================================================================
+# MAIN WORKOUT
+# =============================================================================
+
+MAIN_WORKOUT_TITLE = 'MAIN WORKOUT (60-75 min)'
+MAIN_WORKOUT_HEADERS = ['Exercise', 'Sets', 'Reps/Tempo', 'Rest', 'Technique Notes']
+
+# META-ANALYSIS BASED science note (PMC5684266)
+MAIN_WORKOUT_NOTE = ('META-ANALYSIS (PMC5684266): Medium-High Weekly Set volume (5-10+ sets/muscle) '
+                     'produces 15-23% greater strength gains. Tempo 2-1-2 (slower) protects joints at 38. '
+                     'Rest: 2-3min compounds (ATP), 60-90s isolation (metabolic stress). '
+                     'BODY RECOMP: Compound lifts preserve muscle in caloric deficit.')
+
+
+# =============================================================================
+# POST-WORKOUT CARDIO
+# =============================================================================
+
+CARDIO_TITLE = 'POST-WORKOUT CARDIO (35-45 min)'
+CARDIO_NOTE = Measured('BODY RECOMPOSITION KEY: Post-workout LISS cardio maximizes fat oxidation '
+                       'without impairing muscle protein synthesis. At {}, walking burns ~{}. '
+                       'This {} adds ~270 kcal expenditure toward your 500-700 kcal deficit!',
+                       START_WEIGHT, Quantity(85, 'kcal/km', 95, space=True), Quantity(3, 'km', places=None))
+CARDIO_HEADERS = ['Activity', 'Distance', 'Target Pace', 'Calories Burned']
+
+# Progressive walking pace by level - ADJUSTED for 95kg body weight
+def _pace(low, high):
+    return Measured('{}', Quantity(low, 'min/km', high, space=True))
+
+
+def _distance(km):
+    return Measured('{}', Quantity(km, 'km', places=1, space=True))
+
+
+PACE_PROGRESSION = {
+    1: ('Moderate', _pace(13, 14), _pace(15, 16)),   # Conservative start
+    2: ('Moderate+', _pace(12, 13), _pace(14, 15)),  # Slight increase
+    3: ('Brisk', _pace(11, 12), _pace(13, 14)),      # Building
+    4: ('Brisk+', _pace(10, 11), _pace(12, 13))      # Peak pace
+}
+
+
+def get_cardio_rows(week):
+    """2KM walk + 1KM recovery walk - OPTIMIZED for body recomposition at 95kg"""
+    pace, main_pace, recovery_pace = PACE_PROGRESSION[training_week(week).level]
+    return [
+        (f'1. Main Walk ({pace})', _distance(2), main_pace, '~170-190 kcal'),
+        ('2. Recovery Walk (Easy)', _distance(1), recovery_pace, '~85-95 kcal'),
+    ]
+
+
+CARDIO_TOTAL = ('TOTAL', _distance(3), '35-45 min', '~255-285 kcal')
+
+# Tips - BODY RECOMP FOCUSED
+WALKING_TIPS_TITLE = Measured('BODY RECOMPOSITION WALKING TIPS ({} → {}):', START_WEIGHT, GOAL_WEIGHT)
+WALKING_TIPS = [
+    Measured('Walking at {} burns 30% MORE calories than at {} - use this advantage!', START_WEIGHT, GOAL_WEIGHT),
+    'Post-workout = peak fat oxidation window (glycogen depleted)',
+    'Add inclines or stairs when available for +50% calorie burn',
+    'Track steps: aim for 10,000+/day (including this walk)'
+]
+
+
+# =============================================================================
+# COOL-DOWN, TRACKING AND RECOVERY DAYS
+# =============================================================================
+
+COOLDOWN_TITLE = 'COOL-DOWN STRETCHING (10-15 min)'
+COOLDOWN_HEADERS = ['Stretch', 'Duration', 'Done']
+
+TRACKING_TITLE = 'SESSION TRACKING'
+
+# (label, line width in mm)
+# (label, line width, form field / session log column)
+TRACKING_FIELDS = [
+    ('Date:', 50, 'date'),
+    ('Start Time:', 30, 'start_time'),
+    ('End Time:', 30, 'end_time'),
+    ('Energy Level (1-10):', 20, 'energy'),
+    ('Workout Quality (1-10):', 20, 'workout_quality'),
+    ('Sleep Last Night (hrs):', 20, 'sleep_hours'),
+    ('Pain/Discomfort (location):', 80, 'pain'),
+    ('Key Wins Today:', 100, 'key_wins'),
+]
+
+RECOVERY_TITLE = 'ACTIVE RECOVERY PROTOCOL'
+RECOVERY_NOTE = ('Active recovery with light movement promotes blood flow, reduces DOMS, '
+                 'and maintains mobility without impeding muscle repair.')
+RECOVERY_ACTIVITIES_TITLE = 'RECOMMENDED ACTIVITIES (choose 1-2):'
+MOBILITY_TITLE = 'MOBILITY ROUTINE'
+MOBILITY_HEADERS = ['Movement/Stretch', 'Duration', 'Done']
+RECOVERY_TIPS_TITLE = 'RECOVERY TIPS'
+
+RECOVERY_ACTIVITIES = [
+    '20-30 min easy walking (Zone 1 cardio) - adds to daily step goal',
+    Measured('15-20 min light swimming or aqua jogging - zero impact at {}', START_WEIGHT),
+    '20 min easy cycling (low resistance) - active recovery for legs',
+    '15 min yoga flow (beginner level) - mobility at 38 is critical',
+]
+
+RECOVERY_TIPS = [
+    'SLEEP: 7-9 hours MINIMUM - this is when testosterone peaks for muscle repair',
+    Measured('PROTEIN: {} = 170-210g daily (critical in caloric deficit at {})',
+             Quantity(1.8, 'g/kg', 2.2, places=1), START_WEIGHT),
+    Measured('HYDRATION: at least {} of water - helps with appetite control too', Quantity(3.5, 'L', places=1, space=True)),
+    'CALORIC DEFICIT: Stay at 500-700 kcal deficit (2000-2300 kcal intake)',
+    'NO ALCOHOL: Impairs protein synthesis by up to 37% - serious impact at 38',
+    'NEAT: Non-exercise activity (stairs, standing, fidgeting) burns 200-500 kcal/day',
+    'FOAM ROLL: 10-15 min daily reduces DOMS and improves recovery by 20%',
+    'SUPPLEMENTS: Creatine 5g/day, Fish oil 2-3g/day, Vitamin D if deficient',
+]
+
+
+# =============================================================================
+# WEEKLY SPLIT
+# =============================================================================
+
+# Weekly schedule structure (4 training days + 3 recovery/rest):
+# (day, file slug, title, focus, kind, exercises_func, stretches_func)
+WEEKLY_SPLIT = [
+    (1, 'Upper_Push', 'UPPER BODY - PUSH', 'Chest / Shoulders / Triceps', 'training',
+     get_upper_push_exercises, get_upper_stretches),
+    (2, 'Lower_Body', 'LOWER BODY', 'Quads / Hamstrings / Glutes / Calves', 'training',
+     get_lower_body_exercises, get_lower_stretches),
+    (3, 'Recovery', 'ACTIVE RECOVERY', 'Active Recovery', 'recovery', None, None),
+    (4, 'Upper_Pull', 'UPPER BODY - PULL', 'Back / Biceps / Rear Delts', 'training',
+     get_upper_pull_exercises, get_upper_stretches),
+    (5, 'Full_Body', 'FULL BODY COMPOUNDS', 'Total Body Strength', 'training',
+     get_full_body_exercises, get_full_body_stretches),
+    (6, 'Mobility', 'MOBILITY & RECOVERY', 'Active Recovery', 'recovery', None, None),
+    (7, 'Rest', 'COMPLETE REST', 'Active Recovery', 'rest', None, None),
+]
+
+# Duration box contents: (pre-workout, main, post-workout)
+TRAINING_DURATIONS = ('30-40 min', '60-75 min', '40-50 min')
+
+# Recovery days have no duration box; matches the weekly plan's mobility slot
+RECOVERY_DURATION = '30-45 min'
+
+
+def get_split_day(day):
+    """Return the WEEKLY_SPLIT entry for a day number (1-7)"""
+    for entry in WEEKLY_SPLIT:
+        if entry[0] == day:
+            return entry
+    raise ValueError(f'No day {day} in the weekly split')
@@ -0,0 +1,55 @@
+"""
+Batch journal tests
+A journaled cohort run resumes with the units it has not done and retries failures with backoff.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+import generate_improved_workout_pdfs
+from batch import Journal
+from generate_improved_workout_pdfs import generate_journaled_cohort
+
+
+PROFILES = [{'athlete_id': 'A-001'}, {'athlete_id': 'A-002'}, {'athlete_id': 'A-003', 'locale': 'es'}]
+
+
+def test_resume_renders_only_missing_units(tmp_path, capsys):
+    journal, output_dir = str(tmp_path / 'run.db'), str(tmp_path / 'athletes')
+    assert generate_journaled_cohort(PROFILES, journal, [1], [1, 2], output_dir, workers=1) == 0
+    assert '6 workout PDFs done, 0 already done, 0 failed' in capsys.readouterr().out
+
+    with sqlite3.connect(journal) as conn:    # stopped before A-002's units were committed
+        conn.execute("DELETE FROM units WHERE athlete_id = 'A-002'")
+    os.remove(os.path.join(output_dir, 'A-002', 'Week1_Day2_Lower_Body.pdf'))
+    generate_journaled_cohort(PROFILES, journal, [1], [1, 2], output_dir, workers=1)
+    assert '2 workout PDFs done, 4 already done, 0 failed' in capsys.readouterr().out
+    assert os.path.exists(os.path.join(output_dir, 'A-002', 'Week1_Day2_Lower_Body.pdf'))
+
+    with pytest.raises(ValueError):
+        generate_journaled_cohort(PROFILES, journal, [2], [1, 2], output_dir, workers=1)
+
+
+def test_failures_are_retried_and_journaled(tmp_path, monkeypatch, capsys):
+    journal, output_dir = str(tmp_path / 'run.db'), str(tmp_path / 'athletes')
+    render = generate_improved_workout_pdfs.create_document_pdf
+    calls = []
+
+    def flaky(document, locale=None, units=None):
+        calls.append(locale)
+        if locale == 'es' and len(calls) < 6:
+            raise OSError('disk full')
+        return render(document, locale, units)
+
+    monkeypatch.setattr(generate_improved_workout_pdfs, 'create_document_pdf', flaky)
+    assert generate_journaled_cohort(PROFILES, journal, [1], [1], output_dir, workers=1, retries=1, backoff=0) == 1
+    with Journal(journal) as log:
+        assert log.failures() == [('A-003', 'Week1_Day1_Upper_Push.pdf', 2, 'OSError: disk full')]
+
+    capsys.readouterr()
+    assert generate_journaled_cohort(PROFILES, journal, [1], [1], output_dir, workers=1, retries=3, backoff=0) == 0
+    assert '1 workout PDFs done, 2 already done, 0 failed' in capsys.readouterr().out
+    with Journal(journal) as log:
+        assert log.progress() == {'done': 3} and log.failures() == []
@@ -0,0 +1,51 @@
+"""
+Archive bundle tests
+Documents stream into one ZIP / TAR archive per athlete or per cohort instead of loose files.
+"""
+
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from bundle import Bundle, archive_path, bundled
+from generate_improved_workout_pdfs import generate_all_pdfs, generate_cohort
+from layout import dry_run
+
+
+PROFILES = [{'athlete_id': 'A-001'}, {'athlete_id': 'A-002'}, {'athlete_id': 'A-003', 'locale': 'es'}]
+
+
+def test_bundled_pdfs_stream_into_one_archive(tmp_path):
+    output_dir = str(tmp_path / 'Daily_Exercises')
+    generate_all_pdfs(weeks=[1], days=[1, 3], output_dir=output_dir, bundle='zip')
+    assert os.listdir(tmp_path) == ['Daily_Exercises.zip']
+    with zipfile.ZipFile(archive_path(output_dir, 'zip')) as archive:
+        assert archive.namelist() == ['Week1_Day1_Upper_Push.pdf', 'Week1_Day3_Recovery.pdf']
+        assert archive.read('Week1_Day1_Upper_Push.pdf').startswith(b'%PDF')
+
+
+def test_cohort_gets_one_archive_per_athlete_or_one_for_all(tmp_path):
+    generate_cohort(PROFILES, [1], [1], str(tmp_path / 'athletes'), workers=1, bundle='zip')
+    assert sorted(os.listdir(tmp_path / 'athletes')) == ['A-001.zip', 'A-002.zip', 'A-003.zip']
+    with zipfile.ZipFile(tmp_path / 'athletes' / 'A-002.zip') as archive:
+        assert archive.namelist() == ['Week1_Day1_Upper_Push.pdf']
+
+    generate_cohort(PROFILES, [1], [1, 2], str(tmp_path / 'cohort'), workers=1, bundle='tar.gz', cohort_archive=True)
+    with tarfile.open(tmp_path / 'cohort.tar.gz') as archive:
+        names = archive.getnames()
+    assert len(names) == 6 and 'A-003/Week1_Day2_Lower_Body.pdf' in names
+    assert not os.path.exists(tmp_path / 'cohort')
+
+
+def test_dry_run_writes_no_archive(tmp_path):
+    with dry_run() as reports, bundled(str(tmp_path / 'out'), 'zip') as archive:
+        generate_all_pdfs(weeks=[1], days=[1], output_dir=str(tmp_path / 'out'))
+    assert archive is None and len(reports) == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_format_fails(tmp_path):
+    with pytest.raises(ValueError):
+        Bundle(str(tmp_path / 'out.rar'))
@@ -0,0 +1,47 @@
+"""
+CLI tests
+--help and the data exports start without the PDF backend; the generators create their output directory.
+"""
+
+import os
+
+import pytest
+
+from fitness_tracker import HEAVY_MODULES, PDF_BACKEND, _import_times, build_parser
+from generate_pdfs import generate_daily_tracker, generate_weekly_plan
+
+
+def test_help_does_not_import_the_program_or_pdf_backend():
+    for argv in (['--help'], ['workouts', '--help'], ['weekly', '--help']):
+        ms, modules = _import_times(argv)
+        assert not set(HEAVY_MODULES) & modules, argv
+
+
+def test_data_exports_do_not_import_the_pdf_backend():
+    for argv in (['export', 'ics', '--start', '2026-11-02', '--help'], ['export', 'html', '--help']):
+        ms, modules = _import_times(argv)
+        assert PDF_BACKEND not in modules, argv
+
+
+def test_bench_passes_the_measured_command_line_through():
+    args, extra = build_parser().parse_known_args(
+        ['bench', '--runs', '1', 'startup', 'export', 'ics', '--start', '2026-11-02'])
+    assert args.argv == ['export', 'ics', '--start', '2026-11-02'] and args.runs == 1 and not extra
+
+
+def test_generators_create_the_output_directory(tmp_path):
+    weekly = generate_weekly_plan(str(tmp_path / 'weekly'))
+    tracker = generate_daily_tracker(str(tmp_path / 'tracker'), weeks=1)
+    assert os.path.dirname(weekly) == str(tmp_path / 'weekly') and os.path.isfile(weekly)
+    assert os.path.dirname(tracker) == str(tmp_path / 'tracker') and os.path.isfile(tracker)
+
+
+def test_bench_runs_the_command_in_a_scratch_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ms, modules = _import_times(['export', 'ics', '--start', '2026-11-02'])
+    assert 'export_ics' in modules and not os.listdir(tmp_path)
+
+
+def test_bench_fails_on_a_failing_command():
+    with pytest.raises(RuntimeError, match='exit status 2'):
+        _import_times(['nosuchcommand'])
@@ -0,0 +1,50 @@
+"""
+Pain contraindication tests
+Exercises a reported condition rules out are swapped, the rest get technique notes.
+"""
+
+import pytest
+
+from contraindications import apply_contraindications, conditions_for
+from workout_program import get_lower_body_exercises, get_pre_workout_exercises, get_upper_push_exercises
+
+
+def _names(rows):
+    return [row[0] for row in rows]
+
+
+def test_pain_locations_map_to_conditions():
+    assert conditions_for(['Left knee', 'lumbar area']) == ('knee', 'lower_back')
+    assert conditions_for(['rotator cuff', 'Back']) == ('lower_back', 'shoulder')
+    assert conditions_for(['elbow']) == ()
+    assert conditions_for(None) == ()
+    assert conditions_for('left knee') == ('knee',)
+
+
+def test_no_conditions_keep_the_program():
+    rows = get_lower_body_exercises(1)
+    assert apply_contraindications(rows, ()) == rows
+
+
+def test_avoided_exercises_are_swapped_and_the_rest_modified():
+    original = get_lower_body_exercises(1)
+    rows = apply_contraindications(original, ['knee'])
+    names = _names(rows)
+    assert 'Walking Lunges' not in names
+    assert rows[2] == ('Reverse Lunges', '3', '10 each @2-1-2', '90s', 'Knee: pain-free depth, slow lowering')
+    assert [row[1:4] for row in rows] == [row[1:4] for row in original]
+    assert rows[0][0] == original[0][0]
+    assert rows[0][-1] == f'{original[0][-1]}; Knee: pain-free depth, slow lowering'
+
+
+def test_alternatives_respect_the_equipment():
+    rows = apply_contraindications(get_upper_push_exercises(1), ['shoulder'], [])
+    assert 'Prone Y-T Raises' in _names(rows)
+    assert 'Standing OHP (DB)' not in _names(rows)
+    pre_workout = apply_contraindications(get_pre_workout_exercises(1), ['shoulder'])
+    assert _names(pre_workout) == _names(get_pre_workout_exercises(1))
+
+
+def test_unknown_condition_fails():
+    with pytest.raises(ValueError):
+        apply_contraindications(get_lower_body_exercises(1), ['elbow'])
@@ -0,0 +1,64 @@
+"""
+iCalendar export tests
+One event per program day on the athlete's dates, as RFC 5545 content lines.
+"""
+
+from datetime import date, time
+import os
+
+import pytest
+
+from export_ics import build_calendar, parse_minutes, write_cohort_calendars
+
+
+START = date(2026, 11, 2)
+STAMP = '20261019T120000Z'
+
+
+def _events(text):
+    """[{property: value}] of the unfolded VEVENTs"""
+    lines = text.replace('\r\n ', '').split('\r\n')
+    events = []
+    for line in lines:
+        if line == 'BEGIN:VEVENT':
+            events.append({})
+        elif events and line != 'END:VEVENT' and ':' in line:
+            name, _, value = line.partition(':')
+            events[-1].setdefault(name, value)
+    return events
+
+
+def test_durations_use_the_upper_bound():
+    assert (parse_minutes('30-40 min'), parse_minutes('2-3 hours'), parse_minutes('45 min')) == (40, 180, 45)
+
+
+def test_calendar_has_one_event_per_day_on_real_dates():
+    text = build_calendar(START, 'A-001', 'Ana, Coach; Team', time(6, 30), weeks=4, stamp=STAMP)
+    assert text.startswith('BEGIN:VCALENDAR\r\n') and text.endswith('END:VCALENDAR\r\n')
+    assert 'X-WR-CALNAME:Training Program - Ana\\, Coach\\; Team\r\n' in text
+    assert all(len(line.encode('utf-8')) <= 75 for line in text.split('\r\n'))
+
+    events = _events(text)
+    assert len(events) == 28 and len({event['UID'] for event in events}) == 28
+    push, recovery, rest, last = events[0], events[2], events[6], events[27]
+    assert push['UID'] == 'A-001-w1d1@fitness-tracker' and push['DTSTAMP'] == STAMP
+    assert push['DTSTART'] == '20261102T063000' and push['DURATION'] == 'PT2H45M'
+    assert push['SUMMARY'] == 'Week 1 Day 1: UPPER BODY - PUSH'
+    assert push['DESCRIPTION'].endswith('\\nPDF: Week1_Day1_Upper_Push.pdf')
+    assert recovery['DTSTART'] == '20261104T063000' and recovery['DURATION'] == 'PT45M'
+    assert rest['DTSTART;VALUE=DATE'] == '20261108' and rest['DTEND;VALUE=DATE'] == '20261109'
+    assert 'DURATION' not in rest and rest['TRANSP'] == 'TRANSPARENT'
+    assert last['UID'] == 'A-001-w4d7@fitness-tracker' and last['DTSTART;VALUE=DATE'] == '20261129'
+
+
+def test_cohort_calendars_use_each_athletes_start(tmp_path):
+    profiles = [{'athlete_id': 'A-001'}, {'athlete_id': 'B/002', 'start_date': '2026-11-09', 'start_time': '18:00'}]
+    paths = write_cohort_calendars(profiles, str(tmp_path), weeks=1, default_start=START)
+    assert [os.path.basename(path) for path in paths] == ['A-001.ics', 'B_002.ics']
+    starts = []
+    for path in paths:
+        with open(path, encoding='utf-8', newline='') as f:
+            starts.append(_events(f.read())[0]['DTSTART'])
+    assert starts == ['20261102T070000', '20261109T180000']
+    with pytest.raises(ValueError, match='No start date'):
+        write_cohort_calendars([{'athlete_id': 'A-001'}], str(tmp_path))
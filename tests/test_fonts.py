@@ -0,0 +1,55 @@
+"""
+Unicode font tests
+Core-font text mapping, font variant lookup and the metrics cache.
+"""
+
+import os
+import shutil
+
+import pytest
+
+import fonts
+from fonts import core_font_text, font_variants, load_metrics
+from generate_improved_workout_pdfs import create_split_day
+from workout_program import get_split_day
+
+
+DEJAVU = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+needs_ttf = pytest.mark.skipif(not os.path.exists(DEJAVU), reason='DejaVu Sans not installed')
+
+
+def test_core_fonts_get_windows_1252_with_ascii_stand_ins():
+    assert core_font_text('Café 95kg') == 'Café 95kg'
+    assert core_font_text('95kg → 80kg ≤ 2') == '95kg -> 80kg <= 2'
+    assert core_font_text('“quoted” – ok') == '\x93quoted\x94 \x96 ok'
+
+
+def test_style_variants_are_found_by_name(tmp_path):
+    for name in ('Sans.ttf', 'Sans-Bold.ttf', 'SansItalic.ttf'):
+        (tmp_path / name).write_bytes(b'')
+    regular = str(tmp_path / 'Sans.ttf')
+    assert font_variants(regular) == {'': regular, 'B': str(tmp_path / 'Sans-Bold.ttf'),
+                                      'I': str(tmp_path / 'SansItalic.ttf')}
+    assert font_variants('') == {}
+    with pytest.raises(RuntimeError, match='TTF font not found'):
+        font_variants(str(tmp_path / 'Missing.ttf'))
+
+
+@needs_ttf
+def test_metrics_are_cached_on_disk_by_font_hash(tmp_path, monkeypatch):
+    path = shutil.copy(DEJAVU, tmp_path / 'DejaVuSans.ttf')
+    monkeypatch.setattr(fonts, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(fonts, '_metrics', {})
+    metrics = load_metrics(str(path))
+    assert os.listdir(tmp_path / 'cache') == [fonts.font_hash(str(path)) + '.pkl']
+    fonts._metrics.clear()
+    monkeypatch.setattr(fonts, '_parse_metrics', lambda path: pytest.fail('parsed again'))
+    assert load_metrics(str(path)) == metrics and metrics['name'] == 'DejaVuSans'
+
+
+@needs_ttf
+def test_configured_font_is_embedded(monkeypatch):
+    monkeypatch.setenv(fonts.FONT_ENV, DEJAVU)
+    day, slug, *entry = get_split_day(1)
+    data = create_split_day(1, day, *entry).output(dest='S').encode('latin-1')
+    assert b'/FontFile2' in data and b'/BaseFont /Helvetica\n' not in data
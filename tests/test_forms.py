@@ -0,0 +1,74 @@
+"""
+Form field tests
+Tracker fields filled in a viewer come back through form_extract.py as session-log records keyed like the program.
+"""
+
+import re
+
+from form_extract import _full_name, extract_records, read_objects
+from generate_pdfs import create_daily_tracker_pdf
+from layout import pdf_bytes
+from progression import ProgressionEngine, program_prescriptions
+from session_log import SessionLog
+
+
+def _fill(pdf, path, values):
+    """Write pdf to path with an incremental update setting the fields in values
+    ({full name: text, or True to check a box}), as a viewer saves a filled form"""
+    data = pdf_bytes(pdf)
+    objects = read_objects(data)
+    update = b''
+    for number, obj in objects.items():
+        if not isinstance(obj, dict) or _full_name(obj, objects) not in values:
+            continue
+        body = re.search(rb'\n%d 0 obj\n(.*?)\nendobj' % number, data, re.S).group(1)
+        value = values[_full_name(obj, objects)]
+        if value is True:
+            body = body.replace(b'/V /Off /AS /Off', b'/V /Yes /AS /Yes')
+        else:
+            body = body[:-2] + b' /V (' + value.encode('latin-1') + b')>>'
+        update += b'\n%d 0 obj\n%s\nendobj\n' % (number, body)
+    with open(path, 'wb') as f:
+        f.write(data + update)
+    return path
+
+
+def test_checkbox_font_is_in_the_form_resources():
+    data = pdf_bytes(create_daily_tracker_pdf(1))
+    resources = re.search(rb'/AcroForm <<.*?/DR <</Font <<(.*?)>>>>', data).group(1)
+    assert b'/Helv ' in resources and b'/ZaDb ' in resources
+    assert b'/BaseFont /ZapfDingbats' in data
+
+
+def test_tracker_set_fields_use_the_program_exercise_keys():
+    objects = read_objects(pdf_bytes(create_daily_tracker_pdf(1)))
+    names = {_full_name(obj, objects) for obj in objects.values() if isinstance(obj, dict) and 'FT' in obj}
+    exercises = {name.split('.')[2] for name in names if name.startswith('w1d1.set.')}
+    assert {'barbellbenchpress', 'inclinedumbbellpress', 'overheadtricepextension'} <= exercises
+    assert 'benchpress' not in exercises
+
+
+def test_filled_tracker_round_trips_into_progression(tmp_path):
+    path = _fill(create_daily_tracker_pdf(1), str(tmp_path / 'tracker.pdf'), {
+        **{f'w1d1.set.barbellbenchpress.{n}': '12/60 @8' for n in range(1, 5)},
+        'w1d1.energy': '7', 'w1d1.warmup.1': True,
+    })
+    records = extract_records(path, 'A-001')
+    assert len(records) == 1 and records[0]['energy'] == '7' and records[0]['completed'] == ['warmup.1']
+    assert {(s['exercise'], s['reps'], s['load_kg'], s['rpe']) for s in records[0]['sets']} == {
+        ('barbellbenchpress', 12, 60.0, 8.0)}
+
+    with SessionLog(str(tmp_path / 'logs.db')) as log:
+        log.ingest_records(records)
+        engine = ProgressionEngine(log, is_deload_week=lambda week: False)
+        engine.recompute('A-001')
+        bench = engine.prescriptions('A-001', 2)['barbellbenchpress']
+    assert bench['action'] == 'progress' and bench['load_kg'] > 60.0
+    assert bench['sets'] == program_prescriptions(2)['barbellbenchpress']['sets']
+
+
+def test_imperial_tracker_loads_come_back_in_kg(tmp_path):
+    path = _fill(create_daily_tracker_pdf(1, units='imperial'), str(tmp_path / 'tracker.pdf'),
+                 {'w1d4.set_lb.barbellbacksquat.1': '10/225'})
+    sets = extract_records(path, 'A-001')[0]['sets']
+    assert sets == [{'exercise': 'barbellbacksquat', 'set_no': 1, 'reps': 10, 'load_kg': 102.1, 'rpe': None}]
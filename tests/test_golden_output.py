@@ -0,0 +1,60 @@
+"""
+Golden output regression tests
+Every generated document must match its snapshot in tests/golden/. After an
+intended output change, accept it with:
+
+    python scripts/pdf_snapshot.py --update
+"""
+
+from fpdf import FPDF
+import pytest
+
+import pdf_snapshot
+
+
+DOCUMENTS = pdf_snapshot.documents()
+
+
+@pytest.fixture(scope='session')
+def snapshots():
+    """Every document rendered once, in parallel"""
+    return dict(pdf_snapshot.render_all(DOCUMENTS))
+
+
+@pytest.mark.parametrize('name', [name for name, render, args in DOCUMENTS])
+def test_matches_golden(snapshots, name):
+    expected = pdf_snapshot.read_golden(name)
+    assert expected is not None, f'no golden snapshot for {name}: run python scripts/pdf_snapshot.py --update'
+    assert expected == snapshots[name], '\n'.join(pdf_snapshot.diff(expected, snapshots[name], name))
+
+
+def test_every_golden_has_a_document():
+    names = {name for name, render, args in DOCUMENTS}
+    stale = [path for path in pdf_snapshot.golden_files() if pdf_snapshot.golden_name(path) not in names]
+    assert not stale, f'golden files without a document: {stale}'
+
+
+def _sample_pdf():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font('Helvetica', 'B', 12)
+    pdf.set_fill_color(30, 60, 114)
+    pdf.set_text_color(255, 255, 255)
+    pdf.cell(40, 10, 'Week (1)', 1, 1, 'L', True)
+    pdf.set_draw_color(255, 0, 0)
+    pdf.line(10, 30, 50, 30)
+    return pdf.output('', 'S').encode('latin-1')
+
+
+def test_extract_layout_reads_text_boxes_and_lines():
+    [page] = pdf_snapshot.extract_layout(_sample_pdf())
+    assert page == [
+        'rect 28.35 813.54 113.39 -28.35 B 0.118 0.235 0.447 rg 0 G 0.57',
+        'text 31.19 795.77 F1 12.00 1.000 1.000 1.000 rg (Week (1))',
+        'line 28.35 756.85 141.73 756.85 S 1.000 0.000 0.000 RG 0.57',
+    ]
+
+
+def test_extract_layout_masks_text():
+    [page] = pdf_snapshot.extract_layout(_sample_pdf(), mask='(1)')
+    assert 'text 31.19 795.77 F1 12.00 1.000 1.000 1.000 rg (Week <masked>)' in page
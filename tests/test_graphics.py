@@ -0,0 +1,79 @@
+"""
+Graphics state tracking tests
+State operators nothing reads, or that repeat the page's state, are dropped.
+"""
+
+from fpdf import FPDF
+
+from graphics import GraphicsStateMixin, state_kind
+
+
+class _Document(GraphicsStateMixin, FPDF):
+    pass
+
+
+def _zebra(rows):
+    pdf = _Document()
+    pdf.add_page()
+    pdf.set_font('Helvetica', '', 10)
+    for i in range(rows):
+        pdf.set_fill_color(245, 245, 245) if i % 2 == 0 else pdf.set_fill_color(255, 255, 255)
+        pdf.cell(60, 6, f'row {i}', 1, 1, 'L', i % 2 == 0)
+    return pdf
+
+
+def _state_lines(pdf):
+    return [line for line in pdf.pages[1].split('\n') if state_kind(line)]
+
+
+def test_unread_and_repeated_state_is_dropped():
+    pdf = _zebra(6)
+    assert _state_lines(pdf).count('0.961 0.961 0.961 rg') == 1
+    assert '1.000 1.000 1.000 rg' not in _state_lines(pdf)    # the white rows are not filled
+    assert pdf.elided['fill'] == 4    # the last white is still held back
+
+
+def test_state_is_written_before_the_drawing_that_reads_it():
+    pdf = _Document()
+    pdf.add_page()
+    pdf.set_font('Helvetica', '', 10)
+    pdf.set_draw_color(255, 0, 0)
+    pdf.set_fill_color(0, 0, 255)
+    pdf.line(10, 10, 50, 10)
+    pdf.rect(10, 20, 10, 10, 'F')
+    lines = pdf.pages[1].split('\n')
+    assert lines.index('1.000 0.000 0.000 RG') < next(i for i, line in enumerate(lines) if line.endswith(' l S'))
+    assert lines.index('0.000 0.000 1.000 rg') < next(i for i, line in enumerate(lines) if line.endswith(' re f'))
+
+
+def test_new_page_starts_from_unknown_state():
+    pdf = _zebra(1)
+    pdf.add_page()
+    pdf.cell(60, 6, 'row', 1, 1, 'L', True)
+    assert '0.961 0.961 0.961 rg' in pdf.pages[2].split('\n')
+
+
+def test_marks_are_one_path_per_page():
+    pdf = _Document()
+    pdf.add_page()
+    pdf.set_font('Helvetica', '', 9)
+    pdf.box_cell(8, 6, 0, 'L')
+    pdf.box_cell(8, 6, 0, 'L', checked=True)
+    pdf.rule_cell(40, 6, 1)
+    pdf.close()
+    lines = pdf.pages[1].split('\n')
+    start = lines.index('q 0 G 0.57 w')
+    marks = lines[start + 1:lines.index('S Q')]
+    assert [line.split()[-1] for line in marks] == ['re', 're', 'l', 'l']
+    assert not any('[' in line for line in lines)
+
+
+def test_fill_in_cell_draws_blanks_as_rules():
+    pdf = _Document()
+    pdf.add_page()
+    pdf.set_font('Helvetica', '', 9)
+    pdf.fill_in_cell(0, 7, '[ ] Water: _____/3.5L', 1)
+    text = [line for line in pdf.pages[1].split('\n') if line.endswith('Tj ET')]
+    assert [line.split('(')[1].split(')')[0] for line in text] == ['Water: ', '/3.5L']
+    assert len(pdf._marks) == 2    # the box and the line
+    assert pdf.get_y() == pdf.t_margin + 7
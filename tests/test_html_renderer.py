@@ -0,0 +1,38 @@
+"""
+HTML renderer tests
+Day documents render as escaped, streamed HTML, localized and unit-converted on request.
+"""
+
+import re
+
+from html_renderer import iter_html, preview_app, render_html
+from workout_document import build_split_day
+
+
+def test_page_has_one_section_per_document_section():
+    document = build_split_day(2, 4)
+    chunks = list(iter_html(document))
+    assert chunks[0].startswith('<!DOCTYPE html>') and chunks[-1] == '</body></html>\n'
+    assert '<h1>WEEK 2 - DAY 4</h1>' in chunks[0]
+    html = ''.join(chunks)
+    assert html.count('<section ') == sum(section['type'] not in ('duration', 'page_break')
+                                          for section in document['sections'])
+    assert 'lang="en"' in html and '<script' not in html
+
+
+def test_labels_are_localized():
+    assert '<h1>WOCHE 1 - TAG 1</h1>' in render_html(build_split_day(1, 1), 'de')
+
+
+def test_units_are_converted():
+    imperial = render_html(build_split_day(1, 1), units='imperial')
+    assert '(209lb → 176lb)' in imperial and not re.search(r'\dkg\b', imperial)
+
+
+def test_preview_app_streams_and_rejects_bad_paths():
+    statuses = []
+    body = preview_app({'PATH_INFO': '/week/1/day/3', 'QUERY_STRING': 'locale=es'},
+                       lambda status, headers: statuses.append(status))
+    assert b'lang="es"' in b''.join(body)
+    preview_app({'PATH_INFO': '/week/1/day/9'}, lambda status, headers: statuses.append(status))
+    assert statuses == ['200 OK', '404 Not Found']
@@ -0,0 +1,36 @@
+"""
+Localization tests
+Catalog lookups, {placeholder} templates, filenames and unknown locales.
+"""
+
+import pytest
+
+from i18n import active_locale, localize_document, localized_filename, translator, use_locale
+from workout_document import build_split_day
+
+
+def test_labels_and_templates_are_translated():
+    _ = translator('de')
+    assert _('SESSION TRACKING') == 'TRAININGSPROTOKOLL'
+    assert _('WEEK 2 - DAY 4') == 'WOCHE 2 - TAG 4'
+    assert _('Not in any catalog') == 'Not in any catalog'
+    assert translator('en')('SESSION TRACKING') == 'SESSION TRACKING'
+
+
+def test_locale_scope_and_filenames():
+    with use_locale('es'):
+        assert active_locale() == 'es'
+    assert active_locale() == 'en'
+    assert localized_filename('Weekly_Plan.pdf', 'es') == 'Weekly_Plan_es.pdf'
+    assert localized_filename('Weekly_Plan.pdf') == 'Weekly_Plan.pdf'
+    with pytest.raises(ValueError, match='Unknown locale: xx'):
+        with use_locale('xx'):
+            pass
+
+
+def test_documents_are_localized_without_touching_the_original():
+    document = build_split_day(1, 1)
+    localized = localize_document(document, 'fr')
+    types = [section['type'] for section in document['sections']]
+    assert [section['type'] for section in localized['sections']] == types
+    assert localized != document and localize_document(document) is document
@@ -0,0 +1,53 @@
+"""
+Dry run layout tests
+A dry run must break pages exactly where the real render does.
+"""
+
+from fpdf import FPDF
+import pytest
+
+import pdf_snapshot
+from layout import LayoutMixin, dry_run, save
+
+
+@pytest.mark.parametrize('name, render, args', pdf_snapshot.documents(),
+                         ids=[name for name, render, args in pdf_snapshot.documents()])
+def test_dry_run_page_count(name, render, args):
+    render = getattr(pdf_snapshot, render)
+    pdf = render(*args)
+    pdf.output('', 'S')
+    with dry_run() as reports:
+        save(render(*args), name + '.pdf')
+    assert reports[0]['pages'] == pdf.page
+
+
+class _Document(LayoutMixin, FPDF):
+    pass
+
+
+def _lay_out():
+    with dry_run() as reports:
+        pdf = _Document()
+        pdf.add_page()
+        pdf.set_font('Helvetica', '', 10)
+        pdf.begin_section('Notes')
+        pdf.cell(20, 8, 'A note far too long for its cell', 0, 1)
+        for _ in range(40):
+            pdf.cell(0, 8, 'row', 0, 1)
+        save(pdf, 'notes.pdf')
+    return reports[0]
+
+
+def test_dry_run_reports_overflow_and_split():
+    report = _lay_out()
+    assert report['pages'] == 2
+    assert [text for page, room, width, text in report['overflows']] == ['A note far too long for its cell']
+    assert report['splits'] == [('Notes', 1, 2)]
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    with dry_run():
+        pdf = _Document()
+        pdf.add_page()
+        save(pdf, str(tmp_path / 'out.pdf'))
+    assert not list(tmp_path.iterdir())
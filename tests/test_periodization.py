@@ -0,0 +1,45 @@
+"""
+Periodization tests
+Weeks map onto build / peak / deload mesocycles; the program follows them.
+"""
+
+import pytest
+
+from periodization import schedule, training_week, use_mesocycle
+from progression import program_prescriptions
+from workout_program import get_pushup_progression, get_squat_progression, get_upper_push_exercises
+
+
+def test_default_mesocycle_keeps_the_original_four_weeks_and_deloads_the_fifth():
+    phases = [(week.phase, week.level) for week in schedule()[:10]]
+    assert phases == [('build', 1), ('build', 2), ('build', 3), ('peak', 4), ('deload', 1)] * 2
+    assert str(get_squat_progression(4)) == '4 x 10 = 40 @ 18kg'
+    assert str(get_squat_progression(5)) == '2 x 12 = 24 @ 10.5kg'
+
+
+def test_any_length_has_one_peak_and_one_deload_per_cycle():
+    weeks = schedule(8, 16)
+    assert [week.phase for week in weeks].count('deload') == 2
+    assert [week.level for week in weeks[:8]] == [1, 1, 1, 2, 2, 3, 4, 1]
+    assert weeks[8].cycle == 2 and weeks[8].start == 9
+    with pytest.raises(ValueError):
+        schedule(2)
+
+
+def test_later_cycles_start_a_step_higher():
+    assert get_pushup_progression(6) == '3 x 13 = 39'
+    assert str(get_squat_progression(6)) == '3 x 12 = 36 @ 14kg'
+    assert get_upper_push_exercises(8)[0][4] == 'Add 2.5kg from week 7 (age 38 safe)'
+
+
+def test_deload_week_drops_sets_in_the_program():
+    sets = {row[0]: row[1] for row in get_upper_push_exercises(5)}
+    assert sets['Barbell Bench Press'] == '3' and sets['Lateral Raises'] == '2'
+    assert program_prescriptions(5)['barbellbenchpress']['sets'] == 3
+
+
+def test_active_mesocycle_applies_inside_the_block():
+    with use_mesocycle(4):
+        assert training_week(4).phase == 'deload'
+        assert training_week(60).cycle == 15    # past the precomputed year
+    assert training_week(4).phase == 'peak'
@@ -0,0 +1,55 @@
+"""
+Pipe mode tests
+NDJSON profiles in, a TAR stream out, JSON progress events on stderr, nothing on disk.
+"""
+
+import io
+import json
+import os
+import tarfile
+
+import pytest
+
+from pipe import run_pipe
+
+
+STDIN = '{"athlete_id": "A-001"}\n\n{"athlete_id": "A-002"}\n{"athlete_id": "A-003", "locale": "es"}\n'
+
+
+def test_profiles_in_archive_out(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stdout, stderr = io.BytesIO(), io.StringIO()
+    assert run_pipe(io.StringIO(STDIN), stdout, stderr, [1], [1, 2]) == 6
+    assert os.listdir(tmp_path) == []
+
+    with tarfile.open(fileobj=io.BytesIO(stdout.getvalue())) as archive:
+        names = archive.getnames()
+        assert archive.extractfile('A-002/Week1_Day2_Lower_Body.pdf').read().startswith(b'%PDF')
+    assert len(names) == 6 and 'A-003/Week1_Day1_Upper_Push.pdf' in names
+
+    events = [json.loads(line) for line in stderr.getvalue().splitlines()]
+    assert events[0] == {'event': 'start', 'format': 'tar'}
+    assert [event['member'] for event in events[1:-1]] == names
+    assert events[-1]['event'] == 'done' and (events[-1]['athletes'], events[-1]['documents']) == (3, 6)
+
+
+def test_each_line_is_written_before_the_next_is_read(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stdout = io.BytesIO()
+    seen = []
+
+    def stdin():
+        for athlete_id in ('A-001', 'A-002'):
+            seen.append(stdout.getvalue().count(b'Week1_Day1_Upper_Push.pdf'))
+            yield json.dumps({'athlete_id': athlete_id}) + '\n'
+        seen.append(stdout.getvalue().count(b'Week1_Day1_Upper_Push.pdf'))
+
+    assert run_pipe(stdin(), stdout, io.StringIO(), [1], [1]) == 2
+    assert seen == [0, 1, 2]
+
+
+def test_errors_are_reported_as_events():
+    stderr = io.StringIO()
+    with pytest.raises(ValueError):
+        run_pipe(io.StringIO('{"locale": "es"}\n'), io.BytesIO(), stderr, [1], [1])
+    assert json.loads(stderr.getvalue().splitlines()[-1])['event'] == 'error'
@@ -0,0 +1,42 @@
+"""
+Program diff tests
+Weeks are compared as structured records, with adaptive prescriptions laid over them.
+"""
+
+from program_diff import PRE_WORKOUT_DAY, diff_records, program_records, week_diff
+
+
+def _changes(report):
+    return {(change['day'], change['exercise']): change['changes'] for change in report['modified']}
+
+
+def test_week_one_to_two_changes_only_the_pre_workout_protocol():
+    report = week_diff(1, 2)
+    changes = _changes(report)
+    assert report['added'] == report['removed'] == []
+    assert changes[PRE_WORKOUT_DAY, '1. PUSH-UPS (Full ROM)'] == {'sets': [3, 4], 'reps': ['12', '10']}
+    assert changes[PRE_WORKOUT_DAY, '3. WEIGHTED SQUATS (Goblet)'] == {'load_kg': [12.0, 14.0]}
+    assert all(day == PRE_WORKOUT_DAY for day, exercise in changes)
+
+
+def test_deload_week_drops_sets_across_the_program():
+    changes = _changes(week_diff(4, 5))
+    assert changes[1, 'Barbell Bench Press'] == {'sets': [4, 3], 'reps': ['5-6', '6-8']}
+    assert changes[PRE_WORKOUT_DAY, '3. WEIGHTED SQUATS (Goblet)']['load_kg'] == [18.0, 10.5]
+
+
+def test_added_and_removed_exercises():
+    before, after = dict(program_records(1)), dict(program_records(1))
+    removed = after.pop((1, 'facepulls'))
+    after[1, 'dips'] = removed._replace(exercise='Dips')
+    report = diff_records(before, after)
+    assert [entry['exercise'] for entry in report['added']] == ['Dips']
+    assert [entry['exercise'] for entry in report['removed']] == ['Face Pulls']
+    assert report['modified'] == []
+
+
+def test_prescriptions_are_laid_over_the_program():
+    prescription = {'sets': 3, 'reps_low': 8, 'reps_high': 8, 'load_kg': 60.0, 'action': 'progress'}
+    report = week_diff(1, 2, {2: {'barbellbenchpress': prescription}})
+    assert _changes(report)[1, 'Barbell Bench Press'] == {'sets': [4, 3], 'reps': ['6-8', '8'],
+                                                          'load_kg': [None, 60.0]}
@@ -0,0 +1,57 @@
+"""
+Progression rule tests
+Logged sets move each exercise to progress, hold, deload or regress; unlogged weeks carry it forward.
+"""
+
+from progression import STALLS_BEFORE_DELOAD, ProgressionEngine, next_prescription, program_prescriptions
+from session_log import SessionLog
+
+
+BENCH = dict(program_prescriptions(1)['barbellbenchpress'], load_kg=60.0)
+
+
+def _sets(reps, load=60.0, rpe=8.0, count=4):
+    return [(reps, load, rpe)] * count
+
+
+def test_top_of_range_progresses_load_by_the_cap():
+    new = next_prescription(BENCH, _sets(8))
+    assert new['action'] == 'progress' and new['load_kg'] == 61.5 and new['stalls'] == 0
+
+
+def test_bodyweight_work_adds_a_rep():
+    pushups = program_prescriptions(1)['pushups']
+    new = next_prescription(pushups, _sets(12, None, 7.0, 3))
+    assert new['action'] == 'progress' and (new['reps_low'], new['reps_high']) == (13, 13)
+
+
+def test_pain_regresses_load_and_a_set():
+    new = next_prescription(BENCH, _sets(8), pain='shoulder')
+    assert new['action'] == 'regress' and new['load_kg'] == 54.0 and new['sets'] == 3
+    assert 'shoulder' in new['note']
+
+
+def test_stall_counter_is_updated_before_the_deload_check():
+    first = next_prescription(BENCH, _sets(8, rpe=9.5))
+    assert first['action'] == 'hold' and first['stalls'] == 1
+    second = next_prescription(first, _sets(8, rpe=10.0))
+    assert second['action'] == 'deload' and second['stalls'] == 0 and STALLS_BEFORE_DELOAD == 2
+    assert second['load_kg'] == 54.0 and second['sets'] < BENCH['sets']
+
+    # a successful week after one stall resets the counter instead of deloading
+    recovered = next_prescription(first, _sets(8))
+    assert recovered['action'] == 'progress' and recovered['stalls'] == 0
+
+
+def test_unlogged_weeks_carry_the_adapted_prescription(tmp_path):
+    with SessionLog(str(tmp_path / 'logs.db')) as log:
+        log.ingest_records([{'athlete_id': 'A-001', 'week': 1, 'day': 1, 'exercise': 'Barbell Bench Press',
+                             'set_no': n, 'reps': 8, 'load_kg': 60, 'rpe': 9.5} for n in range(1, 5)]
+                           + [{'athlete_id': 'A-001', 'week': 3, 'day': 4, 'exercise': 'Lat Pulldown',
+                               'set_no': 1, 'reps': 10, 'load_kg': 50, 'rpe': 8}])
+        engine = ProgressionEngine(log, is_deload_week=lambda week: False)
+        assert engine.recompute('A-001') == 3
+        week2, week4 = engine.prescriptions('A-001', 2), engine.prescriptions('A-001', 4)
+    assert week2['barbellbenchpress']['action'] == 'hold' and week2['barbellbenchpress']['stalls'] == 1
+    assert week4['barbellbenchpress']['load_kg'] == 60.0 and week4['barbellbenchpress']['stalls'] == 1
+    assert week4['inclinedumbbellpress'] == program_prescriptions(4)['inclinedumbbellpress']
@@ -0,0 +1,89 @@
+"""
+Scheduler tests
+The split goes on real dates around unavailable days and 48h recovery;
+missed sessions reflow the rest of the week and only moved days re-render.
+"""
+
+from datetime import date, timedelta
+import json
+import os
+
+from generate_improved_workout_pdfs import generate_scheduled_cohort
+from scheduler import MIN_GAP_DAYS, moved_days, schedule_week, session_loads
+
+
+MONDAY = date(2026, 11, 2)
+
+
+def _weekdays(schedule):
+    return {day: when.strftime('%a') if when else None for day, when in schedule.items()}
+
+
+def _recovered(schedule, week=1):
+    loads = dict(session_loads(week))
+    training = [(when, loads[day]) for day, when in schedule.items() if day in loads and when]
+    return all(abs((a - b).days) >= MIN_GAP_DAYS for i, (a, mask) in enumerate(training)
+               for b, other in training[i + 1:] if mask & other)
+
+
+def test_a_free_week_keeps_the_split():
+    schedule = schedule_week(1, MONDAY)
+    assert schedule == {day: MONDAY + timedelta(days=day - 1) for day in range(1, 8)}
+
+
+def test_unavailable_days_shift_sessions_without_breaking_recovery():
+    schedule = schedule_week(1, MONDAY, ['thu'])
+    assert _weekdays(schedule) == {1: 'Mon', 2: 'Tue', 3: 'Wed', 4: 'Fri', 5: 'Sat', 6: 'Sun', 7: None}
+    tight = schedule_week(1, MONDAY, ['wed', 'thu', 'fri', 'sat'])
+    assert _recovered(tight)
+    assert sum(1 for day in (1, 2, 4, 5) if tight[day]) == 3
+
+
+def test_missed_session_reflows_the_rest_of_the_week():
+    planned = schedule_week(1, MONDAY, ['sat', 'sun'])
+    today = MONDAY + timedelta(days=2)
+    schedule = schedule_week(1, MONDAY, ['sat', 'sun'], planned, {1: None}, today)
+    assert schedule[1] == MONDAY
+    assert _weekdays(schedule)[2] == 'Wed'
+    assert all(when is None or when >= today for day, when in schedule.items() if day != 1)
+    assert _recovered(schedule)
+    assert moved_days(planned, schedule) == [2, 3]
+
+
+def test_recovery_and_rest_days_skip_unavailable_dates():
+    for unavailable in (['thu'], ['sat', 'sun'], ['wed', 'thu', 'fri', 'sat']):
+        schedule = schedule_week(1, MONDAY, unavailable)
+        weekdays = {when for when in _weekdays(schedule).values() if when}
+        assert not weekdays & {day.title() for day in unavailable}
+
+
+def test_cohort_renders_only_the_days_that_moved(tmp_path, capsys):
+    profiles = [{'athlete_id': athlete_id, 'start_date': MONDAY.isoformat(), 'unavailable': ['sat', 'sun']}
+                for athlete_id in ('A-001', 'A-002')]
+    generate_scheduled_cohort(profiles, 1, output_dir=str(tmp_path), workers=1)
+    assert '7 workout PDFs rendered, 7 copied' in capsys.readouterr().out
+    assert len(os.listdir(tmp_path / 'A-002')) == 8    # 7 PDFs + schedule.json
+
+    class Log:
+        def sessions(self, athlete_id, weeks):
+            return [{'day': 1, 'date': MONDAY.isoformat()}] if athlete_id == 'A-001' else []
+
+    generate_scheduled_cohort(profiles, 1, Log(), MONDAY + timedelta(days=1), output_dir=str(tmp_path), workers=1)
+    assert '3 workout PDFs rendered, 0 copied' in capsys.readouterr().out
+    with open(tmp_path / 'A-002' / 'schedule.json') as f:
+        assert json.load(f)['1']['1'] == '2026-11-03'
+
+
+def test_pain_logged_last_week_shapes_this_week(tmp_path, capsys):
+    profiles = [{'athlete_id': athlete_id, 'start_date': MONDAY.isoformat()} for athlete_id in ('A-001', 'A-002')]
+
+    class Log:
+        def sessions(self, athlete_id, weeks):
+            if weeks == (1, 1) and athlete_id == 'A-001':
+                return [{'day': 2, 'date': (MONDAY + timedelta(days=1)).isoformat(), 'pain': 'left knee'}]
+            return []
+
+    generate_scheduled_cohort(profiles, 2, Log(), output_dir=str(tmp_path), workers=1)
+    assert '14 workout PDFs rendered, 0 copied' in capsys.readouterr().out
+    generate_scheduled_cohort(profiles, 1, Log(), output_dir=str(tmp_path / 'week1'), workers=1)
+    assert '7 workout PDFs rendered, 7 copied' in capsys.readouterr().out
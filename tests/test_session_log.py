@@ -0,0 +1,39 @@
+"""
+Session log tests
+CSV / JSON / NDJSON logs are normalized and upserted by athlete, week and day.
+"""
+
+import json
+
+import pytest
+
+from session_log import SessionLog
+
+
+def test_sheets_are_normalized_and_sets_embedded(tmp_path):
+    sheet = tmp_path / 'week1.csv'
+    sheet.write_text('Athlete,Week,Day,Energy Level,Water Intake,Protein,Pain/Discomfort\n'
+                     'A-001,1,1,7,3.5 L,150g,\n', encoding='utf-8')
+    sets = tmp_path / 'sets.ndjson'
+    sets.write_text(json.dumps({'athlete_id': 'A-001', 'week': 1, 'day': 2, 'pain': ' knee ', 'sets': [
+        {'exercise': 'Leg Press', 'set': 1, 'reps': '12', 'load': '100 kg', 'rpe': 8}]}) + '\n', encoding='utf-8')
+    with SessionLog(str(tmp_path / 'logs.db')) as log:
+        log.ingest_file(str(sheet))
+        log.ingest_file(str(sets))
+        first, second = log.sessions('A-001')
+        assert (first['energy'], first['water_l'], first['protein_g'], first['pain']) == (7, 3.5, 150.0, None)
+        assert second['pain'] == 'knee' and log.athletes() == ['A-001']
+        assert [(s['exercise'], s['set_no'], s['reps'], s['load_kg'], s['rpe']) for s in log.sets('A-001')] == [
+            ('Leg Press', 1, 12, 100.0, 8.0)]
+
+
+def test_reingesting_replaces_and_queries_filter(tmp_path):
+    with SessionLog(str(tmp_path / 'logs.db')) as log:
+        log.ingest_records([{'athlete_id': 'A-001', 'week': week, 'day': 1, 'date': f'2026-11-{week:02d}',
+                             'energy': 5} for week in (1, 2, 3)] + [{'athlete_id': 'A-002', 'week': 1, 'day': 1}])
+        batch = log.ingest_records([{'athlete_id': 'A-001', 'week': 2, 'day': 1, 'energy': 9}])
+        assert [s['week'] for s in log.sessions('A-001', weeks=(2, 3))] == [2, 3]
+        assert log.sessions('A-001', weeks=(2, 2))[0]['energy'] == 9 and batch == 2
+        assert [s['week'] for s in log.sessions(dates=('2026-11-01', '2026-11-03'))] == [1, 3]
+        with pytest.raises(ValueError, match='needs athlete_id, week and day'):
+            log.ingest_records([{'athlete_id': 'A-001', 'week': 1}])
@@ -0,0 +1,79 @@
+"""
+Output store tests
+Each distinct PDF is stored once under its hash and indexed per athlete, locale, week and day.
+"""
+
+import os
+
+from generate_improved_workout_pdfs import generate_all_locales, generate_all_pdfs, generate_cohort
+from store import OutputStore, document_key
+
+
+PROFILES = [{'athlete_id': 'A-001'}, {'athlete_id': 'A-002'}, {'athlete_id': 'A-003', 'locale': 'es'}]
+
+
+def test_document_keys():
+    root = os.path.join('PDFs', 'Athletes')
+    path = os.path.join(root, 'A-001', 'Week2_Day4_Upper_Pull.pdf')
+    assert document_key(path, root) == ('A-001', '', 2, 4, 'workout')
+    assert document_key(path, root, 'es') == ('A-001', 'es', 2, 4, 'workout')
+    assert document_key(os.path.join(root, 'Meal_Plan.pdf'), root) == ('', '', 0, 0, 'Meal_Plan')
+    path = os.path.join(root, 'de', 'Week2_Day4_Upper_Pull.pdf')
+    assert document_key(path, root, per_locale=True) == ('', 'de', 2, 4, 'workout')
+
+
+def test_objects_are_sharded_and_written_once(tmp_path):
+    with OutputStore(str(tmp_path)) as store:
+        digest = store.add(('A-001', '', 1, 1, 'workout'), b'%PDF one')
+        assert store.add(('A-002', '', 1, 1, 'workout'), b'%PDF one') == digest
+        store.add(('A-002', '', 1, 2, 'workout'), b'%PDF two')
+        path = store.lookup('A-002', 1, 1)
+        assert path == str(tmp_path / 'objects' / digest[:2] / digest[2:4] / f'{digest}.pdf')
+        assert store.stats() == {'documents': 3, 'objects': 2, 'bytes': 16}
+        assert store.lookup('A-003', 1, 1) is None
+
+
+def test_cohort_variants_share_objects(tmp_path):
+    root = str(tmp_path / 'store')
+    generate_cohort(PROFILES, [1], [1, 2], str(tmp_path / 'athletes'), workers=1, store=root)
+    assert not os.path.exists(tmp_path / 'athletes')
+    with OutputStore(root) as store:
+        assert store.stats()['documents'] == 6 and store.stats()['objects'] == 4
+        assert store.lookup('A-001', 1, 2) == store.lookup('A-002', 1, 2) != store.lookup('A-003', 1, 2, locale='es')
+        assert store.lookup('A-003', 1, 2) is None
+        with open(store.lookup('A-003', 1, 1, locale='es'), 'rb') as f:
+            assert f.read().startswith(b'%PDF')
+
+
+def test_locale_directories_are_indexed_by_locale(tmp_path):
+    root = str(tmp_path / 'store')
+    generate_all_locales(['en', 'es'], [1], [1], str(tmp_path / 'locales'), workers=1, store=root)
+    with OutputStore(root) as store:
+        assert store.stats()['documents'] == 2
+        english, spanish = store.lookup('', 1, 1, locale='en'), store.lookup('', 1, 1, locale='es')
+        assert english and spanish and english != spanish
+        assert store.lookup('es', 1, 1) is None
+
+
+def test_prune_removes_objects_no_longer_indexed(tmp_path):
+    root = str(tmp_path / 'store')
+    with OutputStore(root) as store:
+        store.add(('A-001', '', 1, 1, 'workout'), b'%PDF old')
+        store.add(('A-001', '', 1, 1, 'workout'), b'%PDF new')
+        assert store.prune() == 1
+        with open(store.lookup('A-001', 1, 1), 'rb') as f:
+            assert f.read() == b'%PDF new'
+    generate_all_pdfs(weeks=[1], days=[3], output_dir=str(tmp_path / 'out'), store=root)
+    with OutputStore(root) as store:
+        assert store.lookup('', 1, 3) is not None and store.stats()['documents'] == 2
+
+
+def test_rerendered_documents_are_the_same_object(tmp_path, monkeypatch):
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1792800000')
+    root = str(tmp_path / 'store')
+    for run in ('first', 'second'):
+        generate_all_pdfs(weeks=[1], days=[4], output_dir=str(tmp_path / run), store=root)
+    with OutputStore(root) as store:
+        assert store.stats()['objects'] == 1 and store.prune() == 0
+        with open(store.lookup('', 1, 4), 'rb') as f:
+            assert b'(D:20261024000000)' in f.read()
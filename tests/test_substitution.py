@@ -0,0 +1,60 @@
+"""
+Equipment substitution tests
+Exercises the equipment rules out are swapped for the closest alternative.
+"""
+
+import pytest
+
+from substitution import MAX_SETS, SubstitutionIndex, apply_substitutions
+from workout_program import get_pre_workout_exercises, get_upper_pull_exercises, get_upper_push_exercises
+
+
+def _names(rows):
+    return [row[0] for row in rows]
+
+
+def test_full_gym_keeps_the_program():
+    rows = get_upper_push_exercises(1)
+    assert apply_substitutions(rows, None) == rows
+    assert apply_substitutions(rows, ['barbell', 'dumbbells', 'bench', 'cable']) == rows
+
+
+def test_same_movement_pattern_is_preferred():
+    index = SubstitutionIndex()
+    mask = index.equipment_mask(['dumbbells', 'bench'])
+    assert index.substitute('Barbell Bench Press', mask) == 'dumbbellbenchpress'
+    assert index.substitute('Trap Bar Deadlift', mask) == 'dumbbelldeadlift'
+    assert index.substitute('Cable Flyes (Low to High)', index.equipment_mask(['bands'])) == 'bandchestfly'
+    assert index.substitute('Incline DB Curls', mask) == 'inclinedbcurls'    # already possible
+
+
+def test_swapped_rows_keep_the_prescription_and_name_the_original():
+    rows = apply_substitutions(get_upper_pull_exercises(1), ['dumbbells', 'bench'])
+    original = get_upper_pull_exercises(1)
+    assert rows[0] == ('Dumbbell Bent Over Row', '4', '6-8 @2-1-2', '2min', 'Instead of Barbell Bent Over Row')
+    assert [row[1:4] for row in rows] == [row[1:4] for row in original]
+    pre_workout = _names(apply_substitutions(get_pre_workout_exercises(1), []))
+    assert pre_workout == ['1. PUSH-UPS (Full ROM)', '2. DOORFRAME ROW', '3. TEMPO BODYWEIGHT SQUAT']
+
+
+def test_alternatives_are_not_repeated_while_others_fit():
+    names = _names(apply_substitutions(get_upper_push_exercises(1), ['bands']))
+    assert names[:4] == ['Push-ups', 'Wide-Grip Push-ups', 'Band Chest Fly', 'Band Overhead Press']
+    assert len(set(names)) == len(names)
+
+
+def test_repeats_are_merged_and_impossible_rows_dropped():
+    rows = apply_substitutions(get_upper_pull_exercises(1), [])
+    names = _names(rows)
+    assert len(set(names)) == len(names)
+    assert not any('Shrugs' in name for name in names)    # nothing without dumbbells or bands
+    assert rows[0][:2] == ('Doorframe Row', str(MAX_SETS))    # 4 + 4 + 4 + 3 sets, capped
+    assert len(set(_names(apply_substitutions(get_upper_push_exercises(1), [])))) == len(
+        apply_substitutions(get_upper_push_exercises(1), []))
+    band_names = _names(apply_substitutions(get_upper_pull_exercises(1), ['bands']))
+    assert band_names.count('Band Row') == 1
+
+
+def test_unknown_equipment_fails():
+    with pytest.raises(ValueError):
+        apply_substitutions(get_upper_push_exercises(1), ['kettlebell'])
@@ -0,0 +1,56 @@
+"""
+Unit tests
+Typed quantities print in the athlete's system, including notes, tips and progression notes.
+"""
+
+import re
+
+from generate_improved_workout_pdfs import build_plan
+from progression import apply_to_main_workout, next_prescription, program_prescriptions
+from units import Measured, Quantity, format_document, formatter, measured, to_metric
+from workout_program import get_upper_push_exercises
+
+METRIC = re.compile(r'\d\s?(kg|km|g/kg|kcal/km|min/km|cm|L)\b|liters')
+
+
+def _texts(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _texts(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _texts(item)
+
+
+def test_quantities_convert_and_round():
+    imperial = formatter('imperial')
+    assert imperial(Measured('3 x 12 = 36 @ {}', Quantity(12, 'kg'))) == '3 x 12 = 36 @ 26lb'
+    assert imperial(Measured('{}', Quantity(13, 'min/km', 14, space=True))) == '21-23 min/mi'
+    assert imperial(Measured('{}', Quantity(2, 'km', places=1, space=True))) == '1.2 mi'
+    assert formatter('metric')(Measured('{}', Quantity(2, 'km', places=1, space=True))) == '2.0 km'
+    assert round(to_metric(209, 'lb'), 1) == 94.8
+
+
+def test_measured_types_plain_metric_text():
+    text = measured('Hold 60kg: reps missed, ~85-95 kcal/km over {3km}')
+    assert text == 'Hold 60kg: reps missed, ~85-95 kcal/km over {3km}'
+    assert formatter('imperial')(text) == 'Hold 132lb: reps missed, ~137-153 kcal/mi over {1.9mi}'
+    assert measured('Week 3, 12 reps') == 'Week 3, 12 reps'
+
+
+def test_imperial_documents_have_no_metric_quantities():
+    for week in (1, 4):
+        for filename, document in build_plan([week]):
+            leftovers = [text for text in _texts(format_document(document, 'imperial')) if METRIC.search(text)]
+            assert leftovers == [], filename
+
+
+def test_progression_notes_convert_after_a_database_round_trip():
+    bench = dict(program_prescriptions(1)['barbellbenchpress'], load_kg=60.0)
+    new = next_prescription(bench, [(8, 60.0, 8.0)] * 4)
+    assert formatter('imperial')(new['note']) == 'Target 136lb (+2.5%)'
+    stored = dict(new, note=str(new['note']))    # as read back from SQLite
+    row = apply_to_main_workout(get_upper_push_exercises(1), {'barbellbenchpress': stored})[0]
+    assert formatter('imperial')(row[4]) == 'Target 136lb (+2.5%)'
@@ -0,0 +1,30 @@
+"""
+Volume analyzer tests
+Weekly hard sets count main-workout sets by default; the pre-workout protocol is opt-in;
+muscles off the docstring claims are reported.
+"""
+
+from volume_analyzer import HWS_MIN, MAX_WEEKLY_SETS, analyze, band, docstring_claims, weekly_sets
+
+
+def test_bands():
+    assert [band(sets) for sets in (4, 5, HWS_MIN, MAX_WEEKLY_SETS, MAX_WEEKLY_SETS + 0.5)] == [
+        'LOW', 'MWS', 'HWS', 'HWS', 'HIGH']
+
+
+def test_pre_workout_sets_are_opt_in():
+    main = weekly_sets(1)
+    everything = weekly_sets(1, include_pre_workout=True)
+    assert set(main) < set(everything) and not any(name[0].isdigit() for name, sets in main)
+    reports = analyze({'main': main, 'everything': everything})
+    assert reports['main']['sets']['chest'] < reports['everything']['sets']['chest']
+    assert len(reports['main']['flagged']) < len(reports['everything']['flagged'])
+    assert not reports['main']['unmapped']
+
+
+def test_sets_off_the_docstring_claims_are_reported():
+    assert docstring_claims()['shoulders'] == 12
+    report = analyze({1: weekly_sets(1)})[1]
+    assert report['sets']['shoulders'] == 23.5 and report['deviations']['shoulders'] == 12
+    assert 'chest' not in report['deviations']
+    assert not analyze({1: weekly_sets(1)}, claims={'shoulders': 24})[1]['deviations']
@@ -0,0 +1,52 @@
+"""
+Watch mode tests
+A source change re-renders only the days whose document changed; renderer changes re-render every day.
+"""
+
+import importlib
+import os
+
+from watch import Watcher, watch_modules
+
+
+def _watcher(tmp_path, monkeypatch):
+    watcher = Watcher(weeks=[1], days=[1, 4], output_dir=str(tmp_path))
+    monkeypatch.setattr(watcher, '_reload', lambda: None)    # the sources did not really change
+    return watcher
+
+
+def test_only_days_whose_document_changed_are_rendered(tmp_path, monkeypatch):
+    watcher = _watcher(tmp_path, monkeypatch)
+    assert watcher.poll() == [] and not os.listdir(tmp_path)
+    watcher.mtimes['workout_program'] -= 1
+    watcher.documents[(1, 4)] = {}
+    assert watcher.poll() == [(1, 4)]
+    assert os.listdir(tmp_path) == ['Week1_Day4_Upper_Pull.pdf']
+    assert watcher.poll() == []
+
+
+def test_renderer_changes_render_every_day(tmp_path, monkeypatch):
+    watcher = _watcher(tmp_path, monkeypatch)
+    watcher.mtimes['generate_improved_workout_pdfs'] -= 1
+    assert watcher.poll() == [(1, 1), (1, 4)] and len(os.listdir(tmp_path)) == 2
+
+
+def test_modules_are_watched_from_the_import_graph():
+    data, render = watch_modules()
+    assert {'periodization', 'substitution', 'contraindications', 'exercise_catalog'} <= set(data)
+    assert {'i18n', 'translations', 'layout', 'graphics', 'fonts'} <= set(render) and not set(data) & set(render)
+    assert data.index('periodization') < data.index('workout_program') < data.index('workout_document')
+    assert data.index('exercise_catalog') < data.index('substitution') and data[-1] == 'workout_document'
+    assert render.index('translations') < render.index('i18n') and render[-1] == 'generate_improved_workout_pdfs'
+
+
+def test_unlisted_imports_are_reloaded_in_dependency_order(tmp_path, monkeypatch):
+    watcher = Watcher(weeks=[1], days=[1], output_dir=str(tmp_path))
+    reloaded = []
+    monkeypatch.setattr(importlib, 'reload', lambda module: reloaded.append(module.__name__))
+    watcher.mtimes['periodization'] -= 1
+    assert watcher.poll() == []    # nothing really changed
+    assert reloaded.index('periodization') < reloaded.index('workout_program')
+    assert reloaded.index('exercise_catalog') < reloaded.index('workout_document') < reloaded.index('layout')
+    watcher.mtimes['translations'] -= 1
+    assert watcher.poll() == [(1, 1)]
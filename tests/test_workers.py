@@ -0,0 +1,40 @@
+"""
+Worker pool tests
+Workers are forked once from a warmed parent and reused; each job runs in its caller's dry run / capture mode.
+"""
+
+import gc
+import os
+
+import i18n
+from generate_improved_workout_pdfs import generate_cohort
+from layout import capture, dry_run
+from workers import get_pool
+
+
+PROFILES = [{'athlete_id': 'A-001'}, {'athlete_id': 'A-002', 'locale': 'es'}]
+
+
+def _worker_state(_):
+    return os.getpid(), sorted(i18n._translators), gc.get_freeze_count() > 0
+
+
+def test_pool_is_created_once_and_forked_warm():
+    pool = get_pool(2)
+    assert get_pool(2) is pool
+    pid, locales, frozen = pool.submit(_worker_state, None).result()
+    assert pid != os.getpid() and locales == sorted(i18n.LOCALES) and frozen
+
+
+def test_pooled_workers_follow_the_callers_mode(tmp_path):
+    output_dir = str(tmp_path / 'athletes')
+    with dry_run() as reports:
+        generate_cohort(PROFILES, [1], [1], output_dir, workers=2)
+    assert len(reports) == 2 and not os.path.exists(output_dir)
+
+    with capture() as files:
+        generate_cohort(PROFILES, [1], [1], output_dir, workers=2)
+    assert len(files) == 2 and not os.path.exists(output_dir)
+
+    generate_cohort(PROFILES, [1], [1], output_dir, workers=2)
+    assert sorted(os.listdir(output_dir)) == ['A-001', 'A-002']